@@ -14,8 +14,10 @@ from .core.babel_compat import is_babel_available
 type CacheComponentName = Literal[
     "parsing.currency",
     "parsing.dates",
+    "parsing.numbers",
     "locale",
     "runtime.locale_context",
+    "runtime.plural",
     "introspection.message",
     "introspection.iso",
 ]
@@ -26,7 +28,9 @@ _KNOWN_CACHE_COMPONENTS: frozenset[CacheComponentName] = frozenset({
     "locale",
     "parsing.currency",
     "parsing.dates",
+    "parsing.numbers",
     "runtime.locale_context",
+    "runtime.plural",
 })
 
 __all__ = ["clear_module_caches"]
@@ -64,8 +68,10 @@ def clear_module_caches(
 
     - ``'parsing.currency'``: CLDR currency data caches
     - ``'parsing.dates'``: CLDR date/datetime pattern caches
+    - ``'parsing.numbers'``: Per-locale bulk number parsing patterns
     - ``'locale'``: Babel locale object cache (locale_utils)
     - ``'runtime.locale_context'``: LocaleContext instance cache
+    - ``'runtime.plural'``: Per-locale plural selector and category memo cache
     - ``'introspection.message'``: Message introspection result cache
     - ``'introspection.iso'``: ISO territory/currency introspection cache
 
@@ -116,6 +122,13 @@ def clear_module_caches(
 
         clear_date_caches()
 
+    if babel_available and _want("parsing.numbers"):
+        from .parsing.numbers import (  # noqa: PLC0415 - imported only when Babel is available
+            clear_number_caches,
+        )
+
+        clear_number_caches()
+
     if _want("locale"):
         from .core.locale_utils import (  # noqa: PLC0415 - imported only when cache clearing runs
             clear_locale_cache,
@@ -130,6 +143,13 @@ def clear_module_caches(
 
         LocaleContext.clear_cache()
 
+    if _want("runtime.plural"):
+        from .runtime.plural_rules import (  # noqa: PLC0415 - imported only when cache clearing runs
+            clear_plural_selector_cache,
+        )
+
+        clear_plural_selector_cache()
+
     if _want("introspection.message"):
         from .introspection import (  # noqa: PLC0415 - imported only when cache clearing runs
             clear_introspection_cache,
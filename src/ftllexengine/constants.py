@@ -10,6 +10,7 @@ Constants are grouped by domain:
 - Input limits: DoS prevention via size constraints
 - Parser limits: Token length bounds and lookahead distance
 - Fallback strings: Error message templates
+- Bidi isolation: Unicode isolate marks wrapped around interpolated values
 - ISO 4217: Currency decimal digit specifications
 
 Python 3.13+. Zero external dependencies.
@@ -25,6 +26,8 @@ __all__ = [
     "MAX_LOCALE_CACHE_SIZE",
     "MAX_TERRITORY_CACHE_SIZE",
     "MAX_CURRENCY_CACHE_SIZE",
+    "MAX_PLURAL_MEMO_SIZE",
+    "MAX_NUMBER_PATTERN_CACHE_SIZE",
     "DEFAULT_CACHE_SIZE",
     "DEFAULT_MAX_ENTRY_WEIGHT",
     # Input limits
@@ -46,6 +49,9 @@ __all__ = [
     "FALLBACK_MISSING_VARIABLE",
     "FALLBACK_MISSING_TERM",
     "FALLBACK_FUNCTION_ERROR",
+    # Bidi isolation
+    "UNICODE_FSI",
+    "UNICODE_PDI",
     # ISO 4217 currency data
     "ISO_4217_DECIMAL_DIGITS",
     "ISO_4217_DEFAULT_DECIMALS",
@@ -125,6 +131,16 @@ MAX_TERRITORY_CACHE_SIZE: int = 300
 # of currency-specific vs territory-specific caches.
 MAX_CURRENCY_CACHE_SIZE: int = 300
 
+# Maximum memoized plural categories per locale PluralSelector.
+# Keyed by (operand, precision, ordinal). Count selectors repeat a small set of
+# operands; 1024 bounds memory when operands are high-cardinality amounts.
+MAX_PLURAL_MEMO_SIZE: int = 1024
+
+# Maximum parsed Babel number patterns cached per LocaleContext.
+# Keys are pattern strings built from NUMBER options or taken from custom
+# patterns; catalogs use a handful of each, so 256 is ample headroom.
+MAX_NUMBER_PATTERN_CACHE_SIZE: int = 256
+
 # Default maximum cache entries for format results.
 # 1000 entries is sufficient for most applications (typical UI has <500 messages).
 DEFAULT_CACHE_SIZE: int = 1000
@@ -289,6 +305,15 @@ FALLBACK_MISSING_TERM: str = "{{-{name}}}"  # -> {-brand}
 # makes function errors immediately identifiable in output without ambiguity.
 FALLBACK_FUNCTION_ERROR: str = "{{!{name}}}"  # -> {!NUMBER}
 
+# ============================================================================
+# BIDI ISOLATION
+# ============================================================================
+
+# Unicode bidirectional isolation characters per Unicode TR9.
+# Used to prevent RTL/LTR text interference when interpolating values.
+UNICODE_FSI: str = "\u2068"  # U+2068 FIRST STRONG ISOLATE
+UNICODE_PDI: str = "\u2069"  # U+2069 POP DIRECTIONAL ISOLATE
+
 # ============================================================================
 # ISO 4217 CURRENCY DECIMAL DIGITS
 # ============================================================================
@@ -31,10 +31,12 @@ from ftllexengine.localization.orchestrator import FluentLocalization
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
+    from concurrent.futures import Executor
 
     from ftllexengine.core.semantic_types import MessageId
     from ftllexengine.introspection import MessageVariableValidationResult
     from ftllexengine.runtime.cache_config import CacheConfig
+    from ftllexengine.runtime.resource_cache import ResourceCache
 
 __all__ = ["LocalizationBootConfig"]
 
@@ -76,6 +78,10 @@ class LocalizationBootConfig:
         cache: Cache configuration, or None to disable (default: None).
         on_fallback: Callback invoked when a message is resolved from a
             fallback locale (optional). Receives a FallbackInfo instance.
+        resource_cache: On-disk ResourceCache for parsed resources, or None
+            to parse every resource on each boot (default: None).
+        executor: ``concurrent.futures`` executor that loads and parses
+            resources in parallel, or None for sequential loading (default: None).
 
     Example:
         >>> config = LocalizationBootConfig(  # doctest: +SKIP
@@ -98,6 +104,8 @@ class LocalizationBootConfig:
     use_isolating: bool = True
     cache: CacheConfig | None = None
     on_fallback: Callable[[FallbackInfo], None] | None = None
+    resource_cache: ResourceCache | None = None
+    executor: Executor | None = None
     # One-shot guard: False until boot() is called, then permanently True.
     # object.__setattr__ is used in boot() to bypass the frozen constraint for
     # this single transition. Config fields (locales, resource_ids, etc.) remain
@@ -255,6 +263,8 @@ class LocalizationBootConfig:
             cache=self.cache,
             on_fallback=self.on_fallback,
             strict=self.strict,
+            resource_cache=self.resource_cache,
+            executor=self.executor,
         )
 
         summary = l10n.require_clean()
@@ -307,6 +317,8 @@ class LocalizationBootConfig:
         use_isolating: bool = True,
         cache: CacheConfig | None = None,
         on_fallback: Callable[[FallbackInfo], None] | None = None,
+        resource_cache: ResourceCache | None = None,
+        executor: Executor | None = None,
     ) -> LocalizationBootConfig:
         """Construct a LocalizationBootConfig from a path template.
 
@@ -327,6 +339,8 @@ class LocalizationBootConfig:
             use_isolating: Unicode bidi isolation marks (default: True).
             cache: Cache configuration, or None to disable.
             on_fallback: Fallback event callback.
+            resource_cache: On-disk ResourceCache for parsed resources.
+            executor: Executor for parallel resource loading.
 
         Returns:
             LocalizationBootConfig ready for boot().
@@ -346,4 +360,6 @@ class LocalizationBootConfig:
             use_isolating=use_isolating,
             cache=cache,
             on_fallback=on_fallback,
+            resource_cache=resource_cache,
+            executor=executor,
         )
@@ -33,6 +33,7 @@ Python 3.13+.
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
 from ftllexengine.core.locale_utils import require_locale_code
@@ -45,12 +46,14 @@ from ftllexengine.runtime.rwlock import RWLock
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
+    from concurrent.futures import Executor
 
-    from ftllexengine.core.semantic_types import LocaleCode, ResourceId
+    from ftllexengine.core.semantic_types import LocaleCode, MessageId, ResourceId
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.localization.loading import FallbackInfo, ResourceLoader, ResourceLoadResult
     from ftllexengine.runtime.bundle import FluentBundle
     from ftllexengine.runtime.cache_config import CacheConfig
+    from ftllexengine.runtime.resource_cache import ResourceCache
 
 __all__ = ["FluentLocalization", "LocalizationCacheStats"]
 
@@ -113,8 +116,11 @@ class FluentLocalization(
         "_on_fallback",
         "_pending_functions",
         "_primary_locale",
+        "_resource_cache",
         "_resource_ids",
         "_resource_loader",
+        "_routes",
+        "_routes_lock",
         "_strict",
         "_use_isolating",
     )
@@ -129,6 +135,8 @@ class FluentLocalization(
         cache: CacheConfig | None = None,
         on_fallback: Callable[[FallbackInfo], None] | None = None,
         strict: bool = True,
+        resource_cache: ResourceCache | None = None,
+        executor: Executor | None = None,
     ) -> None:
         """Initialize multi-locale localization.
 
@@ -150,6 +158,13 @@ class FluentLocalization(
                    and formatting errors raise FormattingIntegrityError.
                    Set to False only for development or when soft error recovery
                    is explicitly required.
+            resource_cache: Optional on-disk ResourceCache shared by every bundle;
+                unchanged resources are loaded from it instead of being re-parsed.
+            executor: Optional ``concurrent.futures`` executor that loads and
+                parses startup resources in parallel. Thread pools work with any
+                loader; process pools need a picklable loader. Results are
+                registered in sequential order, so bundles and the LoadSummary
+                match sequential loading. The executor is not shut down.
 
         Raises:
             ValueError: If locales is empty
@@ -184,6 +199,7 @@ class FluentLocalization(
         self._cache_config: CacheConfig | None = cache
         self._on_fallback = on_fallback
         self._strict = strict
+        self._resource_cache = resource_cache
 
         # Bundle storage: only contains initialized bundles (no None markers).
         # A bundle materializes when a resource loads successfully for a locale
@@ -201,17 +217,22 @@ class FluentLocalization(
         # calls (readers) while serializing add_resource/add_function (writers).
         self._lock = RWLock()
 
+        # Routing table: message ID -> first locale (and bundle) in the chain
+        # that defines it. Read lock-free by formatting; written under
+        # _routes_lock, and replaced whenever a locale gains a resource.
+        self._routes: dict[MessageId, tuple[LocaleCode, FluentBundle]] = {}
+        self._routes_lock = threading.Lock()
+
         # Resource loading is eager by design:
         # - Fail-fast: critical load/parse issues surface during construction
         # - Predictable: all requested resource loads are attempted immediately
         # - Demand-driven bundles: locales only get a bundle after a successful
         #   load or on the first later access path that needs one
         # - Tracking: all load attempts are recorded in _load_results
+        # - Parallel: with an executor, load+parse runs on its workers while
+        #   registration stays on this thread in the same order
         if resource_loader and resource_ids:
-            for locale in self._locales:
-                for resource_id in self._resource_ids:
-                    result = self._load_single_resource(locale, resource_id, resource_loader)
-                    self._load_results.append(result)
+            self._load_results.extend(self._load_all_resources(resource_loader, executor))
 
     @property
     def locales(self) -> tuple[LocaleCode, ...]:
@@ -257,6 +278,11 @@ class FluentLocalization(
         """
         return self._cache_config
 
+    @property
+    def resource_cache(self) -> ResourceCache | None:
+        """Get the on-disk parsed resource cache shared by all bundles (read-only)."""
+        return self._resource_cache
+
     @property
     def strict(self) -> bool:
         """Get whether strict mode is enabled (read-only).
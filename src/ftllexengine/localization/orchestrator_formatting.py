@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from ftllexengine.core.semantic_types import FTLSource, LocaleCode, MessageId
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.localization.orchestrator_protocols import LocalizationStateProtocol
+    from ftllexengine.runtime.bundle import FluentBundle
     from ftllexengine.syntax import Junk
 
 
@@ -37,14 +38,19 @@ class _LocalizationFormattingMixin:
 
             if normalized_locale not in self._bundles:
                 self._create_bundle(normalized_locale)
-            return self._bundles[normalized_locale].add_resource(ftl_source)
+            try:
+                return self._bundles[normalized_locale].add_resource(ftl_source)
+            finally:
+                self._reroute_locale(normalized_locale)
 
     def add_resource_stream(
         self: LocalizationStateProtocol,
         locale: LocaleCode,
-        lines: Iterable[str],
+        lines: Iterable[str] | Iterable[bytes],
         *,
         source_path: str | None = None,
+        batch_size: int | None = None,
+        absolute_spans: bool = False,
     ) -> tuple[Junk, ...]:
         """Add FTL resource to a locale bundle from a line-oriented stream."""
         normalized_locale = require_locale_code(locale, "locale")
@@ -56,9 +62,60 @@ class _LocalizationFormattingMixin:
 
             if normalized_locale not in self._bundles:
                 self._create_bundle(normalized_locale)
-            return self._bundles[normalized_locale].add_resource_stream(
-                lines, source_path=source_path
-            )
+            try:
+                return self._bundles[normalized_locale].add_resource_stream(
+                    lines,
+                    source_path=source_path,
+                    batch_size=batch_size,
+                    absolute_spans=absolute_spans,
+                )
+            finally:
+                # Batches registered before a strict-mode failure stay registered.
+                self._reroute_locale(normalized_locale)
+
+    def _route_message(
+        self: LocalizationStateProtocol,
+        message_id: MessageId,
+        bundle_for: Callable[[LocaleCode], FluentBundle],
+    ) -> tuple[LocaleCode, FluentBundle] | None:
+        """Return the first locale in the chain that has ``message_id``, with its bundle.
+
+        Routes found by walking the chain are recorded in ``_routes``, so later
+        lookups of the message take one dict lookup and no bundle locks.
+        Messages found in no locale are not recorded.
+        """
+        routes = self._routes
+        cacheable = type(message_id) is str
+        if cacheable:
+            route = routes.get(message_id)
+            if route is not None:
+                return route
+        for locale in self._locales:
+            bundle = bundle_for(locale)
+            if bundle.has_message(message_id):
+                route = (locale, bundle)
+                if cacheable:
+                    with self._routes_lock:
+                        # A registration since the walk began may have changed the route.
+                        if self._routes is routes:
+                            routes[message_id] = route
+                return route
+        return None
+
+    def _reroute_locale(self: LocalizationStateProtocol, locale: LocaleCode) -> None:
+        """Drop the routes a resource just registered for ``locale`` can change.
+
+        Resources only add or redefine messages, so messages routed to
+        ``locale`` or an earlier locale keep their route. The table is replaced,
+        not mutated, so lock-free readers never see it change size.
+        """
+        rank = self._locales.index(locale)
+        with self._routes_lock:
+            self._routes = {
+                message_id: route
+                for message_id, route in self._routes.items()
+                if self._locales.index(route[0]) <= rank
+            }
 
     def _handle_message_not_found(
         self: LocalizationStateProtocol,
@@ -128,11 +185,7 @@ class _LocalizationFormattingMixin:
 
     def has_message(self: LocalizationStateProtocol, message_id: MessageId) -> bool:
         """Return whether any locale in the chain contains ``message_id``."""
-        for locale in self._locales:
-            bundle = self._get_or_create_bundle(locale)
-            if bundle.has_message(message_id):
-                return True
-        return False
+        return self._route_message(message_id, self._get_or_create_bundle) is not None
 
     def format_pattern(
         self: LocalizationStateProtocol,
@@ -142,6 +195,45 @@ class _LocalizationFormattingMixin:
         attribute: str | None = None,
     ) -> tuple[str, tuple[FrozenFluentError, ...]]:
         """Format a message with fallback-chain semantics."""
+        return self._format_in_chain(message_id, args, attribute, self._get_or_create_bundle)
+
+    def format_many(
+        self: LocalizationStateProtocol,
+        requests: Iterable[tuple[MessageId, Mapping[str, FluentValue] | None]],
+        /,
+    ) -> tuple[tuple[str, tuple[FrozenFluentError, ...]], ...]:
+        """Format many ``(message_id, args)`` pairs with fallback-chain semantics.
+
+        Each pair is formatted exactly as ``format_pattern(message_id, args)``
+        would, and results are returned in request order. Bundle lookups for
+        the fallback chain are resolved once per batch instead of once per
+        request. In strict mode the first failing request raises.
+        """
+        bundles: dict[LocaleCode, FluentBundle] = {}
+
+        def bundle_for(locale: LocaleCode) -> FluentBundle:
+            bundle = bundles.get(locale)
+            if bundle is None:
+                bundle = bundles[locale] = self._get_or_create_bundle(locale)
+            return bundle
+
+        return tuple(
+            self._format_in_chain(message_id, args, None, bundle_for)
+            for message_id, args in tuple(requests)
+        )
+
+    def _format_in_chain(
+        self: LocalizationStateProtocol,
+        message_id: MessageId,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+        bundle_for: Callable[[LocaleCode], FluentBundle],
+    ) -> tuple[str, tuple[FrozenFluentError, ...]]:
+        """Format one message from the first locale that has it.
+
+        The locale comes from the routing table (see _route_message); only
+        messages not routed yet walk the fallback chain via ``bundle_for``.
+        """
         errors: list[FrozenFluentError] = []
 
         if not self._check_mapping_arg(args, errors):
@@ -164,47 +256,45 @@ class _LocalizationFormattingMixin:
                 self._raise_strict_error(message_id, FALLBACK_INVALID, attr_error)
             return (FALLBACK_INVALID, tuple(errors))
 
-        for locale in self._locales:
-            bundle = self._get_or_create_bundle(locale)
-            if not bundle.has_message(message_id):
-                continue
+        route = self._route_message(message_id, bundle_for)
+        if route is None:
+            return self._handle_message_not_found(message_id, errors)
+        locale, bundle = route
 
-            try:
-                value, bundle_errors = bundle.format_pattern(message_id, args, attribute=attribute)
-            except FormattingIntegrityError as exc:
-                old_ctx = exc.context
-                err_count = len(exc.fluent_errors)
-                new_ctx = IntegrityContext(
-                    component="localization",
-                    operation=old_ctx.operation if old_ctx else "format_pattern",
-                    key=old_ctx.key if old_ctx else str(message_id),
-                    expected=old_ctx.expected if old_ctx else "<no errors>",
-                    actual=old_ctx.actual if old_ctx else f"<{err_count} error(s)>",
-                    timestamp=old_ctx.timestamp if old_ctx else time.monotonic(),
-                    wall_time_unix=old_ctx.wall_time_unix if old_ctx else time.time(),
-                )
-                raise FormattingIntegrityError(
-                    str(exc),
-                    context=new_ctx,
-                    fluent_errors=exc.fluent_errors,
-                    fallback_value=exc.fallback_value,
-                    message_id=exc.message_id,
-                ) from exc
-
-            errors.extend(bundle_errors)
-
-            if self._on_fallback is not None and locale != self._primary_locale:
-                self._on_fallback(
-                    FallbackInfo(
-                        requested_locale=self._primary_locale,
-                        resolved_locale=locale,
-                        message_id=message_id,
-                    )
-                )
+        try:
+            value, bundle_errors = bundle.format_pattern(message_id, args, attribute=attribute)
+        except FormattingIntegrityError as exc:
+            old_ctx = exc.context
+            err_count = len(exc.fluent_errors)
+            new_ctx = IntegrityContext(
+                component="localization",
+                operation=old_ctx.operation if old_ctx else "format_pattern",
+                key=old_ctx.key if old_ctx else str(message_id),
+                expected=old_ctx.expected if old_ctx else "<no errors>",
+                actual=old_ctx.actual if old_ctx else f"<{err_count} error(s)>",
+                timestamp=old_ctx.timestamp if old_ctx else time.monotonic(),
+                wall_time_unix=old_ctx.wall_time_unix if old_ctx else time.time(),
+            )
+            raise FormattingIntegrityError(
+                str(exc),
+                context=new_ctx,
+                fluent_errors=exc.fluent_errors,
+                fallback_value=exc.fallback_value,
+                message_id=exc.message_id,
+            ) from exc
+
+        errors.extend(bundle_errors)
 
-            return (value, tuple(errors))
+        if self._on_fallback is not None and locale != self._primary_locale:
+            self._on_fallback(
+                FallbackInfo(
+                    requested_locale=self._primary_locale,
+                    resolved_locale=locale,
+                    message_id=message_id,
+                )
+            )
 
-        return self._handle_message_not_found(message_id, errors)
+        return (value, tuple(errors))
 
     def add_function(
         self: LocalizationStateProtocol, name: str, func: Callable[..., FluentValue]
@@ -16,11 +16,39 @@ from ftllexengine.introspection import (
 )
 from ftllexengine.localization.loading import LoadSummary, ResourceLoader, ResourceLoadResult
 from ftllexengine.runtime.bundle import FluentBundle
+from ftllexengine.runtime.resource_cache import CompiledResource
+from ftllexengine.syntax.parser import FluentParserV1
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
     from ftllexengine.core.semantic_types import LocaleCode, MessageId, ResourceId
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.localization.orchestrator_protocols import LocalizationStateProtocol
+    from ftllexengine.runtime.resource_cache import ResourceCache
+
+
+def _compile_resource(
+    resource_loader: ResourceLoader,
+    locale: LocaleCode,
+    resource_id: ResourceId,
+    parser: FluentParserV1,
+    resource_cache: ResourceCache | None,
+) -> CompiledResource:
+    """Load and parse one resource; runs on an executor worker.
+
+    Module-level (and free of localization state) so process pools can pickle it.
+    """
+    source: object = resource_loader.load(locale, resource_id)
+    if not isinstance(source, str):
+        msg = (
+            f"source must be str, not {type(source).__name__}. "
+            "Decode bytes to str (e.g., source.decode('utf-8')) before calling add_resource()."
+        )
+        raise TypeError(msg)
+    if resource_cache is not None:
+        return resource_cache.load_or_parse(source, parser)
+    return CompiledResource.from_resource(parser.parse(source))
 
 
 class _LocalizationLoadingMixin:
@@ -35,6 +63,7 @@ class _LocalizationLoadingMixin:
             use_isolating=self._use_isolating,
             cache=self._cache_config,
             strict=self._strict,
+            resource_cache=self._resource_cache,
         )
         for name, func in self._pending_functions.items():
             bundle.add_function(name, func)
@@ -59,14 +88,28 @@ class _LocalizationLoadingMixin:
         locale: LocaleCode,
         resource_id: ResourceId,
         resource_loader: ResourceLoader,
+        compiled: Future[CompiledResource] | None = None,
     ) -> ResourceLoadResult:
-        """Load one resource for one locale and capture the outcome."""
+        """Load one resource for one locale and capture the outcome.
+
+        With ``compiled``, loading and parsing already ran on an executor and
+        only registration happens here; worker exceptions surface from
+        ``compiled.result()`` and are classified exactly like inline ones.
+        """
         source_path = resource_loader.describe_path(locale, resource_id)
 
         try:
-            ftl_source = resource_loader.load(locale, resource_id)
-            bundle = self._get_or_create_bundle(locale)
-            junk_entries = bundle.add_resource(ftl_source, source_path=source_path)
+            if compiled is None:
+                ftl_source = resource_loader.load(locale, resource_id)
+                bundle = self._get_or_create_bundle(locale)
+                junk_entries = bundle.add_resource(ftl_source, source_path=source_path)
+            else:
+                compiled_resource = compiled.result()
+                bundle = self._get_or_create_bundle(locale)
+                junk_entries = bundle.add_compiled_resource(
+                    compiled_resource, source_path=source_path
+                )
+            self._reroute_locale(locale)
             return ResourceLoadResult(
                 locale=locale,
                 resource_id=resource_id,
@@ -90,6 +133,53 @@ class _LocalizationLoadingMixin:
                 source_path=source_path,
             )
 
+    def _load_all_resources(
+        self: LocalizationStateProtocol,
+        resource_loader: ResourceLoader,
+        executor: Executor | None,
+    ) -> list[ResourceLoadResult]:
+        """Load every (locale, resource_id) pair in fallback-chain order.
+
+        With an executor, load+parse fans out to its workers up front while
+        results are registered here, on the constructing thread, in the same
+        order as sequential loading, so bundles and the LoadSummary are
+        identical.
+        """
+        pairs = [
+            (locale, resource_id)
+            for locale in self._locales
+            for resource_id in self._resource_ids
+        ]
+        if executor is None:
+            return [
+                self._load_single_resource(locale, resource_id, resource_loader)
+                for locale, resource_id in pairs
+            ]
+
+        # Localization bundles use the default parser limits; a parser built
+        # with the same limits yields the same AST and ResourceCache key.
+        parser = FluentParserV1()
+        futures = [
+            executor.submit(
+                _compile_resource,
+                resource_loader,
+                locale,
+                resource_id,
+                parser,
+                self._resource_cache,
+            )
+            for locale, resource_id in pairs
+        ]
+        try:
+            return [
+                self._load_single_resource(locale, resource_id, resource_loader, future)
+                for (locale, resource_id), future in zip(pairs, futures, strict=True)
+            ]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
     @staticmethod
     def _check_mapping_arg(
         args: Mapping[str, FluentValue] | None,
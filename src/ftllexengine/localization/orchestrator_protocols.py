@@ -6,18 +6,22 @@ from typing import TYPE_CHECKING, NoReturn, Protocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
+    from concurrent.futures import Future
+    from threading import Lock
 
-    from ftllexengine.core.semantic_types import LocaleCode, MessageId
+    from ftllexengine.core.semantic_types import LocaleCode, MessageId, ResourceId
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.diagnostics import FrozenFluentError
     from ftllexengine.introspection import MessageVariableValidationResult
     from ftllexengine.localization.loading import (
         FallbackInfo,
         LoadSummary,
+        ResourceLoader,
         ResourceLoadResult,
     )
     from ftllexengine.runtime.bundle import FluentBundle
     from ftllexengine.runtime.cache_config import CacheConfig
+    from ftllexengine.runtime.resource_cache import CompiledResource, ResourceCache
     from ftllexengine.runtime.rwlock import RWLock
     from ftllexengine.syntax import Message
 
@@ -33,6 +37,10 @@ class LocalizationStateProtocol(Protocol):
     _on_fallback: Callable[[FallbackInfo], None] | None
     _pending_functions: dict[str, Callable[..., FluentValue]]
     _primary_locale: LocaleCode
+    _resource_cache: ResourceCache | None
+    _resource_ids: tuple[ResourceId, ...]
+    _routes: dict[MessageId, tuple[LocaleCode, FluentBundle]]
+    _routes_lock: Lock
     _strict: bool
     _use_isolating: bool
 
@@ -42,6 +50,15 @@ class LocalizationStateProtocol(Protocol):
     def _get_or_create_bundle(self, locale: LocaleCode) -> FluentBundle:
         ...  # pragma: no cover - typing-only protocol declaration
 
+    def _load_single_resource(
+        self,
+        locale: LocaleCode,
+        resource_id: ResourceId,
+        resource_loader: ResourceLoader,
+        compiled: Future[CompiledResource] | None = None,
+    ) -> ResourceLoadResult:
+        ...  # pragma: no cover - typing-only protocol declaration
+
     @staticmethod
     def _check_mapping_arg(
         args: Mapping[str, FluentValue] | None,
@@ -52,6 +69,16 @@ class LocalizationStateProtocol(Protocol):
     def get_message(self, message_id: MessageId) -> Message | None:
         ...  # pragma: no cover - typing-only protocol declaration
 
+    def _route_message(
+        self,
+        message_id: MessageId,
+        bundle_for: Callable[[LocaleCode], FluentBundle],
+    ) -> tuple[LocaleCode, FluentBundle] | None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _reroute_locale(self, locale: LocaleCode) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
     def _handle_message_not_found(
         self,
         message_id: MessageId,
@@ -68,6 +95,15 @@ class LocalizationStateProtocol(Protocol):
     ) -> tuple[str, tuple[FrozenFluentError, ...]]:
         ...  # pragma: no cover - typing-only protocol declaration
 
+    def _format_in_chain(
+        self,
+        message_id: MessageId,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+        bundle_for: Callable[[LocaleCode], FluentBundle],
+    ) -> tuple[str, tuple[FrozenFluentError, ...]]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
     def _raise_strict_error(
         self,
         message_id: MessageId,
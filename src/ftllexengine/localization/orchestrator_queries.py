@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Literal, cast, get_args
+
+from ftllexengine.runtime.prefork import freeze_heap
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -13,9 +15,32 @@ if TYPE_CHECKING:
     from ftllexengine.localization.orchestrator import LocalizationCacheStats
     from ftllexengine.localization.orchestrator_protocols import LocalizationStateProtocol
     from ftllexengine.runtime.bundle import FluentBundle
-    from ftllexengine.runtime.cache import CacheAuditLogEntry
+    from ftllexengine.runtime.cache import CacheAuditLogEntry, CacheStats
     from ftllexengine.syntax import Message, Term
 
+type _SummedCacheStat = Literal[
+    "size",
+    "maxsize",
+    "hits",
+    "misses",
+    "unhashable_skips",
+    "oversize_skips",
+    "error_bloat_skips",
+    "combined_weight_skips",
+    "corruption_detected",
+    "idempotent_writes",
+    "write_once_conflicts",
+    "sequence",
+    "audit_entries",
+    "verifications",
+    "verification_skips",
+    "invalidated_entries",
+    "retained_entries",
+]
+
+# Integer CacheStats fields that aggregate across bundles by summation
+_SUMMED_CACHE_STATS: tuple[_SummedCacheStat, ...] = get_args(_SummedCacheStat.__value__)
+
 
 class _LocalizationQueryMixin:
     """Read-only query behavior for FluentLocalization."""
@@ -127,10 +152,26 @@ class _LocalizationQueryMixin:
         return bundle.validate_resource(ftl_source)
 
     def clear_cache(self: LocalizationStateProtocol) -> None:
-        """Clear caches on all initialized bundles."""
+        """Clear caches on all initialized bundles and the message routing table."""
         with self._lock.write():
             for bundle in self._bundles.values():
                 bundle.clear_cache()
+            with self._routes_lock:
+                # Replace rather than clear, so lookups that began before the
+                # clear see a different table and do not record their route.
+                routes: dict[MessageId, tuple[LocaleCode, FluentBundle]] = {}
+                self._routes = routes
+
+    def prepare_for_fork(self: LocalizationStateProtocol, *, freeze: bool = True) -> None:
+        """Materialize every fallback bundle and freeze the heap before forking.
+
+        Bundles for locales without loaded resources are otherwise created
+        lazily in each worker; here they are built once and shared.
+        """
+        for locale in self._locales:
+            self._get_or_create_bundle(locale).prepare_for_fork(freeze=False)
+        if freeze:
+            freeze_heap()
 
     def get_cache_stats(
         self: LocalizationStateProtocol,
@@ -140,77 +181,51 @@ class _LocalizationQueryMixin:
             return None
 
         with self._lock.read():
-            total_size = 0
-            total_maxsize = 0
-            total_hits = 0
-            total_misses = 0
-            total_unhashable = 0
-            total_oversize = 0
-            total_error_bloat = 0
-            total_combined_weight = 0
-            total_corruption = 0
-            total_idempotent = 0
-            total_write_once_conflicts = 0
-            total_sequence = 0
-            total_audit_entries = 0
-            first_write_once = False
-            first_strict = False
-            first_audit_enabled = False
-            first_max_entry_weight = 0
-            first_max_errors = 0
-            is_first = True
+            totals = dict.fromkeys(_SUMMED_CACHE_STATS, 0)
+            first: CacheStats | None = None
 
             for bundle in self._bundles.values():
                 stats = bundle.get_cache_stats()
                 if stats is None:
                     continue
 
-                total_size += stats["size"]
-                total_maxsize += stats["maxsize"]
-                total_hits += stats["hits"]
-                total_misses += stats["misses"]
-                total_unhashable += stats["unhashable_skips"]
-                total_oversize += stats["oversize_skips"]
-                total_error_bloat += stats["error_bloat_skips"]
-                total_combined_weight += stats["combined_weight_skips"]
-                total_corruption += stats["corruption_detected"]
-                total_idempotent += stats["idempotent_writes"]
-                total_write_once_conflicts += stats["write_once_conflicts"]
-                total_sequence += stats["sequence"]
-                total_audit_entries += stats["audit_entries"]
-                if is_first:
-                    first_write_once = stats["write_once"]
-                    first_strict = stats["strict"]
-                    first_audit_enabled = stats["audit_enabled"]
-                    first_max_entry_weight = stats["max_entry_weight"]
-                    first_max_errors = stats["max_errors_per_entry"]
-                    is_first = False
-
-            total_requests = total_hits + total_misses
-            hit_rate = (total_hits / total_requests * 100) if total_requests > 0 else 0.0
+                for key in _SUMMED_CACHE_STATS:
+                    totals[key] += stats[key]
+                if first is None:
+                    first = stats
+
+            total_requests = totals["hits"] + totals["misses"]
+            hit_rate = (totals["hits"] / total_requests * 100) if total_requests > 0 else 0.0
 
             return cast(
                 "LocalizationCacheStats",
                 {
-                "size": total_size,
-                "maxsize": total_maxsize,
-                "max_entry_weight": first_max_entry_weight,
-                "max_errors_per_entry": first_max_errors,
-                "hits": total_hits,
-                "misses": total_misses,
+                "size": totals["size"],
+                "maxsize": totals["maxsize"],
+                "max_entry_weight": first["max_entry_weight"] if first else 0,
+                "max_errors_per_entry": first["max_errors_per_entry"] if first else 0,
+                "hits": totals["hits"],
+                "misses": totals["misses"],
                 "hit_rate": round(hit_rate, 2),
-                "unhashable_skips": total_unhashable,
-                "oversize_skips": total_oversize,
-                "error_bloat_skips": total_error_bloat,
-                "combined_weight_skips": total_combined_weight,
-                "corruption_detected": total_corruption,
-                "idempotent_writes": total_idempotent,
-                "write_once_conflicts": total_write_once_conflicts,
-                "sequence": total_sequence,
-                "write_once": first_write_once,
-                "strict": first_strict,
-                "audit_enabled": first_audit_enabled,
-                "audit_entries": total_audit_entries,
+                "unhashable_skips": totals["unhashable_skips"],
+                "oversize_skips": totals["oversize_skips"],
+                "error_bloat_skips": totals["error_bloat_skips"],
+                "combined_weight_skips": totals["combined_weight_skips"],
+                "corruption_detected": totals["corruption_detected"],
+                "idempotent_writes": totals["idempotent_writes"],
+                "write_once_conflicts": totals["write_once_conflicts"],
+                "sequence": totals["sequence"],
+                "write_once": first["write_once"] if first else False,
+                "strict": first["strict"] if first else False,
+                "audit_enabled": first["audit_enabled"] if first else False,
+                "audit_entries": totals["audit_entries"],
+                "verification": (
+                    first["verification"] if first else self._cache_config.verification
+                ),
+                "verifications": totals["verifications"],
+                "verification_skips": totals["verification_skips"],
+                "invalidated_entries": totals["invalidated_entries"],
+                "retained_entries": totals["retained_entries"],
                 "bundle_count": len(self._bundles),
                 },
             )
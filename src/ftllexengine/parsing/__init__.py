@@ -16,10 +16,15 @@ Public API:
 
     Parsing Functions:
         parse_decimal - Returns ParseResult[Decimal]
+        parse_decimals - Returns parallel (results, errors) tuples for many values
+        iter_decimals - Yields ParseResult[Decimal] per value (streaming)
         parse_fluent_number - Returns ParseResult[FluentNumber]
         parse_date - Returns ParseResult[date]
+        parse_dates - Returns tuple[ParseResult[date], ...] for many values
         parse_datetime - Returns ParseResult[datetime]
         parse_currency - Returns ParseResult[tuple[Decimal, str]]
+        parse_currencies - Returns parallel (results, errors) tuples for many values
+        iter_currencies - Yields ParseResult[tuple[Decimal, str]] per value (streaming)
 
     Type Guards:
         is_valid_decimal - TypeIs guard for finite Decimal
@@ -30,6 +35,7 @@ Public API:
     Cache Lifecycle:
         clear_date_caches - Clear cached CLDR date/datetime patterns
         clear_currency_caches - Clear cached CLDR currency data
+        clear_number_caches - Clear cached bulk number parsing data
 
 Examples:
     >>> from ftllexengine.parsing import parse_decimal, is_valid_decimal  # doctest: +SKIP
@@ -43,26 +49,39 @@ Python 3.13+. Requires Babel for CLDR patterns.
 from ftllexengine.diagnostics import ParseResult
 
 from .currency import clear_currency_caches, parse_currency
-from .dates import clear_date_caches, parse_date, parse_datetime
+from .currency_bulk import iter_currencies, parse_currencies
+from .dates import clear_date_caches, parse_date, parse_dates, parse_datetime
 from .guards import (
     is_valid_currency,
     is_valid_date,
     is_valid_datetime,
     is_valid_decimal,
 )
-from .numbers import parse_decimal, parse_fluent_number
+from .numbers import (
+    clear_number_caches,
+    iter_decimals,
+    parse_decimal,
+    parse_decimals,
+    parse_fluent_number,
+)
 
 __all__ = [
     "ParseResult",
     "clear_currency_caches",
     "clear_date_caches",
+    "clear_number_caches",
     "is_valid_currency",
     "is_valid_date",
     "is_valid_datetime",
     "is_valid_decimal",
+    "iter_currencies",
+    "iter_decimals",
+    "parse_currencies",
     "parse_currency",
     "parse_date",
+    "parse_dates",
     "parse_datetime",
     "parse_decimal",
+    "parse_decimals",
     "parse_fluent_number",
 ]
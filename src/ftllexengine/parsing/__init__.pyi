@@ -2,27 +2,39 @@ from ftllexengine.diagnostics import ParseResult as ParseResult
 
 from .currency import clear_currency_caches as clear_currency_caches
 from .currency import parse_currency as parse_currency
+from .currency_bulk import iter_currencies as iter_currencies
+from .currency_bulk import parse_currencies as parse_currencies
 from .dates import clear_date_caches as clear_date_caches
 from .dates import parse_date as parse_date
+from .dates import parse_dates as parse_dates
 from .dates import parse_datetime as parse_datetime
 from .guards import is_valid_currency as is_valid_currency
 from .guards import is_valid_date as is_valid_date
 from .guards import is_valid_datetime as is_valid_datetime
 from .guards import is_valid_decimal as is_valid_decimal
+from .numbers import clear_number_caches as clear_number_caches
+from .numbers import iter_decimals as iter_decimals
 from .numbers import parse_decimal as parse_decimal
+from .numbers import parse_decimals as parse_decimals
 from .numbers import parse_fluent_number as parse_fluent_number
 
 __all__: list[str] = [
     "ParseResult",
     "clear_currency_caches",
     "clear_date_caches",
+    "clear_number_caches",
     "is_valid_currency",
     "is_valid_date",
     "is_valid_datetime",
     "is_valid_decimal",
+    "iter_currencies",
+    "iter_decimals",
+    "parse_currencies",
     "parse_currency",
     "parse_date",
+    "parse_dates",
     "parse_datetime",
     "parse_decimal",
+    "parse_decimals",
     "parse_fluent_number",
 ]
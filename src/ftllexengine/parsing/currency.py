@@ -17,11 +17,13 @@ Data Architecture:
     - Merged maps: Fast tier overrides full tier for unambiguous symbol assignments
 
 Symbol Detection:
-    Uses a single regex pattern built from the complete merged symbol set (fast tier +
-    CLDR). Symbols are sorted longest-first to guarantee correct detection of multi-char
-    symbols (e.g., "Rs" before "R", "kr." before "kr", "$AU" before "$"). The CLDR scan
-    cost (~200-500ms) is incurred once per process on first parse_currency() call, then
-    cached via @functools.cache.
+    Uses a prefix trie of the complete merged symbol set (fast tier + CLDR), compiled
+    once into a regex that branches on one character per trie level (see
+    currency_symbols). The longest symbol at the leftmost position wins, guaranteeing
+    correct detection of multi-char symbols (e.g., "Rs" before "R", "kr." before "kr",
+    "$AU" before "$"). _get_currency_pattern() keeps the equivalent flat alternation
+    as the reference definition. The CLDR scan cost (~200-500ms) is incurred once per
+    process on first parse_currency() call, then cached via @functools.cache.
 
 Architecture:
     Uses @functools.cache for thread-safe, lazy-loaded CLDR data access.
@@ -64,6 +66,7 @@ from ftllexengine.parsing.currency_maps import (
 from ftllexengine.parsing.currency_maps import (
     clear_currency_caches as _clear_currency_maps_caches,
 )
+from ftllexengine.parsing.currency_symbols import _get_currency_symbol_matcher
 
 __all__ = [
     "_FAST_TIER_UNAMBIGUOUS_SYMBOLS",
@@ -187,7 +190,10 @@ def _resolve_currency_code(
 
 @functools.cache
 def _get_currency_pattern() -> re.Pattern[str]:
-    """Compile currency detection regex from merged symbol maps.
+    """Compile the reference currency detection regex from merged symbol maps.
+
+    parse_currency() detects symbols with the equivalent trie-based
+    CurrencySymbolMatcher; this flat alternation defines the expected result.
 
     Builds a single pattern from the complete merged symbol set (fast tier +
     CLDR). Symbols are sorted longest-first to guarantee correct detection of
@@ -235,24 +241,25 @@ def _get_currency_pattern() -> re.Pattern[str]:
 def _detect_currency_symbol(
     value: str,
     locale_code: str,
-) -> tuple[re.Match[str] | None, FrozenFluentError | None]:
+) -> tuple[tuple[int, int] | None, FrozenFluentError | None]:
     """Detect currency symbol or ISO code in input string.
 
-    Uses a single longest-match-first regex built from the complete merged
-    symbol set (fast tier + CLDR). This guarantees multi-char symbols are
-    matched before their single-char prefixes (e.g., "Rs" before "R").
+    Uses the symbol trie built from the complete merged symbol set (fast
+    tier + CLDR). The longest symbol at the leftmost position wins, so
+    multi-char symbols are matched before their single-char prefixes
+    (e.g., "Rs" before "R").
 
     Args:
         value: Currency string to search.
         locale_code: BCP 47 locale identifier (for error context).
 
     Returns:
-        Tuple of (match, error) - exactly one is None.
+        Tuple of (span, error) - exactly one is None. ``span`` is the
+        ``(start, end)`` of the symbol or code in ``value``.
     """
-    pattern = _get_currency_pattern()
-    match = pattern.search(value)
+    span = _get_currency_symbol_matcher().search(value)
 
-    if not match:
+    if span is None:
         diagnostic = ErrorTemplate.parse_currency_failed(
             value, locale_code, "No currency symbol or code found",
         )
@@ -269,12 +276,12 @@ def _detect_currency_symbol(
         )
         return (None, error)
 
-    return (match, None)
+    return (span, None)
 
 
 def _parse_currency_amount(
     value: str,
-    match: re.Match[str],
+    span: tuple[int, int],
     locale: Any,
     locale_code: str,
     parse_decimal_fn: Any,
@@ -287,7 +294,7 @@ def _parse_currency_amount(
 
     Args:
         value: Original currency string.
-        match: Regex match containing the currency symbol/code.
+        span: (start, end) of the currency symbol/code in ``value``.
         locale: Babel Locale object.
         locale_code: BCP 47 locale identifier (for error context).
         parse_decimal_fn: Babel's parse_decimal function.
@@ -298,9 +305,8 @@ def _parse_currency_amount(
     """
     # Remove ONLY the matched occurrence, not all instances.
     # Prevents corruption if the symbol appears elsewhere in the string.
-    number_str = (
-        value[:match.start(1)] + value[match.end(1):]
-    ).strip()
+    start, end = span
+    number_str = (value[:start] + value[end:]).strip()
 
     try:
         amount = parse_decimal_fn(number_str, locale=locale)
@@ -341,7 +347,7 @@ def parse_currency(
 
     Phases:
         1. Validate inputs (type check, locale parse)
-        2. Detect currency symbol/code (longest-match-first regex)
+        2. Detect currency symbol/code (longest-match-first symbol trie)
         3. Resolve symbol to ISO 4217 code
         4. Parse numeric amount
 
@@ -465,8 +471,8 @@ def parse_currency(
         ),))
 
     # Phase 2: Detect currency symbol/code
-    match, detect_error = _detect_currency_symbol(value, locale_code)
-    if detect_error is not None or match is None:
+    span, detect_error = _detect_currency_symbol(value, locale_code)
+    if detect_error is not None or span is None:
         if detect_error is not None:
             return (None, (detect_error,))
         # Defensive: _detect_currency_symbol contract guarantees
@@ -486,7 +492,7 @@ def parse_currency(
             context=context,
         ),))
 
-    currency_str = match.group(1)
+    currency_str = value[span[0]:span[1]]
 
     # Phase 3: Resolve symbol to ISO 4217 code
     currency_code, resolution_error = _resolve_currency_code(
@@ -519,7 +525,7 @@ def parse_currency(
     # Phase 4: Parse numeric amount
     amount, amount_error = _parse_currency_amount(
         value,
-        match,
+        span,
         locale,
         locale_code,
         parse_decimal,
@@ -554,7 +560,8 @@ def clear_currency_caches() -> None:
     Clears cached CLDR currency data from:
     - _build_currency_maps_from_cldr() - symbol-to-currency maps from CLDR scan
     - _get_currency_maps() - merged fast tier + full CLDR maps
-    - _get_currency_pattern() - currency detection regex pattern
+    - _get_currency_pattern() - reference currency detection regex pattern
+    - _get_currency_symbol_matcher() - currency detection symbol trie
 
     Useful for:
     - Memory reclamation in long-running applications
@@ -575,3 +582,4 @@ def clear_currency_caches() -> None:
     """
     _clear_currency_maps_caches()
     _get_currency_pattern.cache_clear()
+    _get_currency_symbol_matcher.cache_clear()
@@ -0,0 +1,154 @@
+"""Bulk currency parsing with locale awareness.
+
+API:
+- parse_currencies() returns parallel (results, errors) tuples for many values
+- iter_currencies() yields one parse_currency() result per value (streaming)
+
+Each value is parsed exactly as by parse_currency(). Per batch, the locale is
+resolved once, the currency symbol matcher and per-locale digit regex are
+fetched once, and symbol-to-code resolutions are memoized. Amounts made of
+plain digits and locale separators are converted to Decimal directly; every
+other value, and every value that fails, is parsed by parse_currency() so
+results and error messages stay identical.
+
+Thread-safe. Uses Babel for currency symbol mapping and number parsing.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ftllexengine.core.babel_compat import require_babel
+from ftllexengine.parsing.currency import _resolve_currency_code, parse_currency
+from ftllexengine.parsing.currency_symbols import _get_currency_symbol_matcher
+from ftllexengine.parsing.numbers import _get_number_fast_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from decimal import Decimal
+
+    from ftllexengine.diagnostics import FrozenFluentError
+
+__all__ = ["iter_currencies", "parse_currencies"]
+
+
+def iter_currencies(
+    values: Iterable[str],
+    locale_code: str,
+    *,
+    default_currency: str | None = None,
+    infer_from_locale: bool = False,
+) -> Iterator[tuple[tuple[Decimal, str] | None, tuple[FrozenFluentError, ...]]]:
+    """Parse locale-aware currency strings lazily, one result per value.
+
+    Streaming form of parse_currencies(): values are consumed and results
+    produced one at a time, so arbitrarily long inputs are parsed in
+    constant memory.
+
+    Args:
+        values: Currency strings to parse
+        locale_code: BCP 47 locale identifier applied to every value
+        default_currency: ISO 4217 code for ambiguous symbols
+        infer_from_locale: Infer currency from locale if symbol is ambiguous
+
+    Yields:
+        The parse_currency() result for each value, in input order
+
+    Raises:
+        BabelImportError: If Babel is not installed (on first iteration)
+    """
+    require_babel("iter_currencies")
+    fast_path = _get_number_fast_path(locale_code)
+    if fast_path is None:
+        for value in values:
+            yield parse_currency(
+                value,
+                locale_code,
+                default_currency=default_currency,
+                infer_from_locale=infer_from_locale,
+            )
+        return
+
+    search = _get_currency_symbol_matcher().search
+    amount_match = fast_path.loose.fullmatch
+    resolved: dict[str, str] = {}
+    for value in values:
+        span = search(value) if type(value) is str else None
+        if span is not None:
+            start, end = span
+            currency_str = value[start:end]
+            currency_code = resolved.get(currency_str)
+            if currency_code is None:
+                currency_code, _ = _resolve_currency_code(
+                    currency_str,
+                    locale_code,
+                    value,
+                    default_currency=default_currency,
+                    infer_from_locale=infer_from_locale,
+                )
+                if currency_code is not None:
+                    resolved[currency_str] = currency_code
+            if currency_code is not None:
+                number_str = (value[:start] + value[end:]).strip()
+                if amount_match(number_str) is not None:
+                    yield ((fast_path.to_decimal(number_str), currency_code), ())
+                    continue
+        yield parse_currency(
+            value,
+            locale_code,
+            default_currency=default_currency,
+            infer_from_locale=infer_from_locale,
+        )
+
+
+def parse_currencies(
+    values: Iterable[str],
+    locale_code: str,
+    *,
+    default_currency: str | None = None,
+    infer_from_locale: bool = False,
+) -> tuple[tuple[tuple[Decimal, str] | None, ...], tuple[tuple[FrozenFluentError, ...], ...]]:
+    """Parse many locale-aware currency strings, e.g. one ledger column.
+
+    Each value is parsed exactly as by parse_currency(), with locale data,
+    compiled patterns, and symbol resolutions shared across the batch.
+
+    Args:
+        values: Currency strings to parse
+        locale_code: BCP 47 locale identifier applied to every value
+        default_currency: ISO 4217 code for ambiguous symbols
+        infer_from_locale: Infer currency from locale if symbol is ambiguous
+
+    Returns:
+        Tuple of (results, errors), parallel to ``values``:
+        - results: (amount, currency_code), or None, per value
+        - errors: Tuple of FrozenFluentError (empty on success) per value
+
+    Raises:
+        BabelImportError: If Babel is not installed
+
+    Examples:
+        >>> results, errors = parse_currencies(  # doctest: +SKIP
+        ...     ["100,50 EUR", "1 234,00 €"], "lv_LV"
+        ... )
+        >>> results  # doctest: +SKIP
+        ((Decimal('100.50'), 'EUR'), (Decimal('1234.00'), 'EUR'))
+        >>> errors  # doctest: +SKIP
+        ((), ())
+
+    Thread Safety:
+        Thread-safe. Uses Babel (no global state).
+    """
+    results: list[tuple[Decimal, str] | None] = []
+    errors: list[tuple[FrozenFluentError, ...]] = []
+    for result, value_errors in iter_currencies(
+        values,
+        locale_code,
+        default_currency=default_currency,
+        infer_from_locale=infer_from_locale,
+    ):
+        results.append(result)
+        errors.append(value_errors)
+    return (tuple(results), tuple(errors))
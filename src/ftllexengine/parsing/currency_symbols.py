@@ -0,0 +1,100 @@
+"""Trie-based currency symbol and ISO code detection.
+
+Finds the currency marker in a money string with the same result as the
+reference alternation regex built by ``currency._get_currency_pattern()``: the
+leftmost position where a marker starts, and at that position an ISO 4217
+code (three uppercase ASCII letters) if one starts there, else the longest
+symbol.
+
+Instead of letting the regex engine try every CLDR symbol at every position,
+the symbols are folded into a prefix trie and compiled to a regex that
+branches on one character per trie level. Cost per position is bounded by
+the longest symbol, not by the number of symbols.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING, Any
+
+from ftllexengine.parsing.currency_maps import ISO_CURRENCY_CODE_LENGTH, _get_currency_maps
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["CurrencySymbolMatcher"]
+
+# Trie key marking that the path from the root spells a complete symbol.
+# Never a valid one-character key.
+_TERMINAL = ""
+
+
+def _trie_alternation(node: dict[str, Any]) -> str:
+    """Render the subtrees below ``node`` as one regex alternation.
+
+    Sibling edges have distinct characters, so at most one branch can match
+    the next input character; the caller makes the alternation greedy-optional
+    at terminal nodes, so the deepest (longest) symbol wins.
+    """
+    leaves: list[str] = []
+    branches: list[str] = []
+    for char in sorted(node):
+        if char == _TERMINAL:
+            continue
+        child = node[char]
+        if len(child) == 1 and _TERMINAL in child:
+            leaves.append(re.escape(char))
+            continue
+        inner = _trie_alternation(child)
+        suffix = f"(?:{inner})?" if _TERMINAL in child else f"(?:{inner})"
+        branches.append(re.escape(char) + suffix)
+    if len(leaves) > 1:
+        branches.append(f"[{''.join(leaves)}]")
+    elif leaves:
+        branches.append(leaves[0])
+    return "|".join(branches)
+
+
+class CurrencySymbolMatcher:
+    """Leftmost, longest-symbol matcher over a fixed set of currency symbols.
+
+    The symbols are stored in a prefix trie, which is compiled into a single
+    regex whose alternations branch on one character per trie level. The
+    regex engine therefore follows one trie path per input position instead
+    of trying every symbol. Immutable after construction and safe to share
+    across threads.
+    """
+
+    __slots__ = ("_pattern",)
+
+    def __init__(self, symbols: Iterable[str]) -> None:
+        trie: dict[str, Any] = {}
+        for symbol in symbols:
+            if not symbol:
+                continue
+            node = trie
+            for char in symbol:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = True
+        iso_code = f"[A-Z]{{{ISO_CURRENCY_CODE_LENGTH}}}"
+        alternation = _trie_alternation(trie)
+        self._pattern = re.compile(f"{iso_code}|{alternation}" if alternation else iso_code)
+
+    def search(self, value: str) -> tuple[int, int] | None:
+        """Return the ``(start, end)`` span of the first currency marker, or None."""
+        match = self._pattern.search(value)
+        return match.span() if match is not None else None
+
+
+@functools.cache
+def _get_currency_symbol_matcher() -> CurrencySymbolMatcher:
+    """Build the matcher for every symbol in the merged currency maps.
+
+    Thread-safe via functools.cache internal locking. Cleared by
+    ``currency.clear_currency_caches()``.
+    """
+    symbol_map, ambiguous, _, _ = _get_currency_maps()
+    return CurrencySymbolMatcher(symbol_map.keys() | ambiguous)
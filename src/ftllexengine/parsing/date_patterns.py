@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import calendar
+import re
+import time
+from datetime import UTC, datetime, timedelta, timezone
 from functools import lru_cache
+from locale import LC_TIME, getlocale
 from typing import Any
 
 from ftllexengine.constants import MAX_LOCALE_CACHE_SIZE
@@ -15,8 +20,11 @@ from ftllexengine.core.babel_compat import (
 from ftllexengine.core.locale_utils import normalize_locale
 
 __all__ = [
+    "_CompiledDatePatterns",
     "_babel_to_strptime",
+    "_get_date_matcher",
     "_get_date_patterns",
+    "_get_datetime_matcher",
     "_get_datetime_patterns",
     "_is_word_boundary",
     "_preprocess_datetime_input",
@@ -368,8 +376,288 @@ def _babel_to_strptime(babel_pattern: str) -> tuple[str, bool]:
     return ("".join(result_parts).strip(), has_era)
 
 
+# ==============================================================================
+# COMPILED PATTERN MATCHING
+# ==============================================================================
+
+
+# Regex bodies for strptime directives, as in CPython's _strptime.TimeRE.
+# Nested groups are non-capturing so that each directive owns one group.
+_DIRECTIVE_REGEX: dict[str, str] = {
+    "d": r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]",
+    "f": r"[0-9]{1,6}",
+    "H": r"2[0-3]|[0-1]\d|\d",
+    "I": r"1[0-2]|0[1-9]|[1-9]",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "M": r"[0-5]\d|\d",
+    "S": r"6[0-1]|[0-5]\d|\d",
+    "w": r"[0-6]",
+    "y": r"\d\d",
+    "Y": r"\d\d\d\d",
+    "z": r"[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|(?-i:Z)",
+}
+
+# Escaping applied by strptime before directives are expanded.
+_STRPTIME_REGEX_CHARS = re.compile(r"([\\.^$*+?\(\){}\[\]|])")
+_STRPTIME_WHITESPACE = re.compile(r"\s+")
+
+_MAX_UTC_OFFSET = timedelta(hours=24)
+
+# Days per month in a common year, indexed by month number.
+_DAYS_IN_MONTH: tuple[int, ...] = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _locale_time_names() -> dict[str, tuple[str, ...]]:
+    """Get the lowercase month, weekday, and AM/PM names strptime matches."""
+    am_pm = tuple(
+        time.strftime("%p", time.struct_time((1999, 3, 17, hour, 44, 55, 2, 76, 0))).lower()
+        for hour in (1, 22)
+    )
+    return {
+        "A": tuple(name.lower() for name in calendar.day_name),
+        "a": tuple(name.lower() for name in calendar.day_abbr),
+        "B": tuple(name.lower() for name in calendar.month_name[1:]),
+        "b": tuple(name.lower() for name in calendar.month_abbr[1:]),
+        "p": am_pm,
+    }
+
+
+def _pattern_to_regex(
+    pattern: str, names: dict[str, tuple[str, ...]], suffix: str
+) -> tuple[str, tuple[str, ...]] | None:
+    """Translate a strptime pattern to a regex body and its directive order.
+
+    Each directive becomes a group named ``<directive>_<suffix>`` so that
+    several patterns can share one regex. Returns None for directives this
+    translation does not cover.
+    """
+    escaped = _STRPTIME_WHITESPACE.sub(r"\\s+", _STRPTIME_REGEX_CHARS.sub(r"\\\1", pattern))
+    parts: list[str] = []
+    directives: list[str] = []
+    while "%" in escaped:
+        index = escaped.index("%")
+        if index + 1 == len(escaped):
+            return None
+        directive = escaped[index + 1]
+        parts.append(escaped[:index])
+        escaped = escaped[index + 2 :]
+        if directive == "%":
+            parts.append("%")
+            continue
+        if directive in _DIRECTIVE_REGEX:
+            regex = _DIRECTIVE_REGEX[directive]
+        elif directive in names:
+            alternatives = sorted(names[directive], key=len, reverse=True)
+            regex = "|".join(re.escape(name) for name in alternatives)
+        else:
+            return None
+        parts.append(f"(?P<{directive}_{suffix}>{regex})")
+        directives.append(directive)
+    parts.append(escaped)
+    return "".join(parts), tuple(directives)
+
+
+def _utc_offset(value: str) -> timezone | None:
+    """Convert a matched %z value to a timezone, as strptime does."""
+    if value == "Z":
+        return UTC
+    offset = value
+    if offset[3] == ":":
+        offset = offset[:3] + offset[4:]
+        if len(offset) > 5:
+            if offset[5] != ":":
+                return None
+            offset = offset[:5] + offset[6:]
+    fraction = offset[8:]
+    delta = timedelta(
+        hours=int(offset[1:3]),
+        minutes=int(offset[3:5]),
+        seconds=int(offset[5:7] or 0),
+        microseconds=int(fraction + "0" * (6 - len(fraction))),
+    )
+    if offset[0] == "-":
+        delta = -delta
+    if not -_MAX_UTC_OFFSET < delta < _MAX_UTC_OFFSET:
+        return None
+    return timezone(delta)
+
+
+class _CompiledDatePatterns:
+    """A locale's strptime patterns compiled for exception-free matching.
+
+    Patterns are joined into one alternation per input form (as given, and
+    era-stripped), each wrapped in a group named ``pattern_<index>``. One
+    ``fullmatch`` finds the first matching pattern: the wrapping group
+    closes last, so ``Match.lastindex`` identifies it. Values are built from
+    the captured groups with the same rules as ``datetime.strptime``, so a
+    miss costs a regex pass rather than one ValueError per pattern.
+
+    Patterns outside the regex translation (none are produced by the CLDR
+    converter) switch matching to an ordered per-pattern scan that uses
+    ``datetime.strptime`` for them.
+    """
+
+    __slots__ = ("_alternations", "_compiled", "_months", "_names")
+
+    def __init__(self, patterns: tuple[tuple[str, bool], ...]) -> None:
+        self._names = _locale_time_names()
+        self._months = {
+            name: month
+            for key in ("B", "b")
+            for month, name in enumerate(self._names[key], start=1)
+        }
+        compiled: list[tuple[str, bool, re.Pattern[str] | None, tuple[str, ...]]] = []
+        bodies: dict[bool, list[str]] = {False: [], True: []}
+        owners: dict[bool, dict[int, int]] = {False: {}, True: {}}
+        group_counts = {False: 0, True: 0}
+        for pattern, has_era in patterns:
+            translated = _pattern_to_regex(pattern, self._names, str(len(compiled)))
+            if translated is None:
+                compiled.append((pattern, has_era, None, ()))
+                continue
+            body, directives = translated
+            try:
+                regex = re.compile(f"({body})", re.IGNORECASE)
+            except re.error:
+                # A repeated directive: strptime cannot compile the pattern
+                # either, so it never matches.
+                continue
+            bodies[has_era].append(f"(?P<pattern_{len(compiled)}>{body})")
+            owners[has_era][group_counts[has_era] + 1] = len(compiled)
+            group_counts[has_era] += len(directives) + 1
+            compiled.append((pattern, has_era, regex, directives))
+        self._compiled = tuple(compiled)
+        self._alternations: tuple[tuple[re.Pattern[str], bool, dict[int, int]], ...] = ()
+        if all(regex is not None for _, _, regex, _ in compiled):
+            self._alternations = tuple(
+                (re.compile("|".join(bodies[has_era]), re.IGNORECASE), has_era, owners[has_era])
+                for has_era in (False, True)
+                if bodies[has_era]
+            )
+
+    def match(self, value: str, locale_code: str) -> datetime | None:
+        """Return the datetime from the first pattern that parses ``value``, or None."""
+        if not self._alternations:
+            return self._scan(0, value, locale_code)
+        first: tuple[int, re.Match[str]] | None = None
+        for regex, has_era, owners in self._alternations:
+            found = regex.fullmatch(_strip_era(value, locale_code) if has_era else value)
+            if found is not None:
+                index = owners[found.lastindex or 0]
+                if first is None or index < first[0]:
+                    first = (index, found)
+        if first is None:
+            return None
+        index, found = first
+        parsed = self._build(self._compiled[index][3], found, found.lastindex or 0)
+        if parsed is not None:
+            return parsed
+        # The first textual match is not a valid date (e.g. February 30):
+        # continue with the patterns after it, as the strptime loop would.
+        return self._scan(index + 1, value, locale_code)
+
+    def _scan(self, start: int, value: str, locale_code: str) -> datetime | None:
+        """Try patterns from ``start`` onwards one at a time."""
+        for pattern, has_era, regex, directives in self._compiled[start:]:
+            text = _strip_era(value, locale_code) if has_era else value
+            if regex is None:
+                try:
+                    return datetime.strptime(text, pattern)
+                except ValueError:
+                    continue
+            found = regex.fullmatch(text)
+            if found is not None:
+                parsed = self._build(directives, found, 1)
+                if parsed is not None:
+                    return parsed
+        return None
+
+    def _build(
+        self, directives: tuple[str, ...], found: re.Match[str], group: int
+    ) -> datetime | None:
+        """Build a datetime from the directive groups following ``group``.
+
+        Mirrors ``_strptime``: two-digit years pivot at 69, %I without %p is
+        read as AM, and weekday directives do not affect the result. Returns
+        None where strptime would raise.
+        """
+        year, month, day = 1900, 1, 1
+        hour = minute = second = microsecond = 0
+        hour_12: int | None = None
+        am_pm = ""
+        tzinfo: timezone | None = None
+        for directive, text in zip(
+            directives, found.groups()[group : group + len(directives)], strict=True
+        ):
+            match directive:
+                case "Y":
+                    year = int(text)
+                case "y":
+                    year = int(text)
+                    year += 2000 if year <= 68 else 1900
+                case "m":
+                    month = int(text)
+                case "B" | "b":
+                    month = self._months[text.lower()]
+                case "d":
+                    day = int(text)
+                case "H":
+                    hour = int(text)
+                case "I":
+                    hour_12 = int(text)
+                case "p":
+                    am_pm = text.lower()
+                case "M":
+                    minute = int(text)
+                case "S":
+                    second = int(text)
+                case "f":
+                    microsecond = int(text + "0" * (6 - len(text)))
+                case "z":
+                    tzinfo = _utc_offset(text)
+                    if tzinfo is None:
+                        return None
+                case _:
+                    pass
+        if hour_12 is not None:
+            am, pm = self._names["p"]
+            hour = hour_12
+            if am_pm in ("", am):
+                if hour == 12:
+                    hour = 0
+            elif am_pm == pm and hour != 12:
+                hour += 12
+        if year < 1 or second > 59:
+            return None
+        if day > 28 and day > _DAYS_IN_MONTH[month] + (month == 2 and calendar.isleap(year)):
+            return None
+        return datetime(year, month, day, hour, minute, second, microsecond, tzinfo)
+
+
+@lru_cache(maxsize=MAX_LOCALE_CACHE_SIZE)
+def _compile_patterns(
+    patterns: tuple[tuple[str, bool], ...],
+    time_locale: tuple[str | None, str | None],  # noqa: ARG001 - cache key only
+) -> _CompiledDatePatterns:
+    """Compile strptime patterns; cached per pattern set and process LC_TIME."""
+    return _CompiledDatePatterns(patterns)
+
+
+def _get_date_matcher(locale_code: str) -> _CompiledDatePatterns | None:
+    """Get the compiled date patterns for one locale, or None if it is unknown."""
+    patterns = _get_date_patterns(locale_code)
+    return _compile_patterns(patterns, getlocale(LC_TIME)) if patterns else None
+
+
+def _get_datetime_matcher(locale_code: str) -> _CompiledDatePatterns | None:
+    """Get the compiled datetime patterns for one locale, or None if it is unknown."""
+    patterns = _get_datetime_patterns(locale_code)
+    return _compile_patterns(patterns, getlocale(LC_TIME)) if patterns else None
+
+
 def clear_date_caches() -> None:
     """Clear cached locale-specific date and datetime parsing patterns."""
     _get_date_patterns.cache_clear()
     _get_datetime_patterns.cache_clear()
     _get_localized_era_strings.cache_clear()
+    _compile_patterns.cache_clear()
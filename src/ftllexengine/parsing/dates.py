@@ -1,10 +1,17 @@
 """Date and datetime parsing functions with locale awareness.
 
 - parse_date() returns tuple[date | None, tuple[FrozenFluentError, ...]]
+- parse_dates() returns one such result per input value
 - parse_datetime() returns tuple[datetime | None, tuple[FrozenFluentError, ...]]
 - Parse errors returned in tuple
 - Raises BabelImportError if Babel is not installed
-- Pattern generation is cached per locale
+- Pattern generation and compilation are cached per locale
+
+Pattern Matching:
+    A locale's CLDR-derived strptime patterns are compiled into one regex
+    (see date_patterns._CompiledDatePatterns) and tried in a single pass, so
+    a value that does not match costs no exceptions. Results are identical
+    to trying datetime.strptime with each pattern in order.
 
 Babel Dependency:
     This module requires Babel for CLDR data. Import is deferred to function call
@@ -37,18 +44,24 @@ Thread-safe. Uses Python 3.13 stdlib + Babel CLDR patterns.
 Python 3.13+.
 """
 
+from __future__ import annotations
+
 from datetime import date, datetime, timezone
+from functools import cache, partial
 from importlib import import_module
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Literal, cast
 
 from ftllexengine.diagnostics import ErrorCategory, FrozenErrorContext, FrozenFluentError
 from ftllexengine.diagnostics.templates import ErrorTemplate
 
 from .date_patterns import (
     _BABEL_TOKEN_MAP,
+    _CompiledDatePatterns,
     _extract_datetime_separator,
     _extract_era_strings_from_babel_locale,
+    _get_date_matcher,
     _get_date_patterns,
+    _get_datetime_matcher,
     _get_datetime_patterns,
     _get_localized_era_strings,
     _is_word_boundary,
@@ -59,7 +72,9 @@ from .date_patterns import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
+
+    from ftllexengine.diagnostics import ParseResult
 
 __all__ = [
     "_BABEL_TOKEN_MAP",
@@ -75,6 +90,7 @@ __all__ = [
     "_tokenize_babel_pattern",
     "clear_date_caches",
     "parse_date",
+    "parse_dates",
     "parse_datetime",
 ]
 
@@ -102,6 +118,57 @@ def _babel_to_strptime(babel_pattern: str) -> tuple[str, bool]:
         module_vars["_BABEL_TOKEN_MAP"] = original_map
 
 
+def _parse_error(
+    parse_type: Literal["date", "datetime"], value: object, locale_code: str, reason: str | None
+) -> tuple[None, tuple[FrozenFluentError, ...]]:
+    """Build the failed result for one value; ``reason`` None means unknown locale."""
+    if reason is None:
+        diagnostic = ErrorTemplate.parse_locale_unknown(locale_code)
+    elif parse_type == "date":
+        diagnostic = ErrorTemplate.parse_date_failed(str(value), locale_code, reason)
+    else:
+        diagnostic = ErrorTemplate.parse_datetime_failed(str(value), locale_code, reason)
+    context = FrozenErrorContext(
+        input_value=str(value),
+        locale_code=locale_code,
+        parse_type=parse_type,
+    )
+    error = FrozenFluentError(
+        str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
+    )
+    return (None, (error,))
+
+
+def _parse_date_value(
+    value: str,
+    locale_code: str,
+    get_matcher: Callable[[], _CompiledDatePatterns | None],
+) -> tuple[date | None, tuple[FrozenFluentError, ...]]:
+    """Parse one date value with lazily resolved compiled patterns."""
+    # Type check: value must be string (runtime defense for untyped callers)
+    if not isinstance(value, str):
+        return _parse_error(  # type: ignore[unreachable]
+            "date", value, locale_code, f"Expected string, got {type(value).__name__}"
+        )
+
+    # Try ISO 8601 first (fastest path). ISO dates start with a 4-digit year;
+    # skipping other values avoids a ValueError per localized input.
+    if value[:4].isdigit():
+        try:
+            return (datetime.fromisoformat(value).date(), ())
+        except ValueError:
+            pass
+
+    # Try locale-specific CLDR patterns
+    matcher = get_matcher()
+    if matcher is None:
+        return _parse_error("date", value, locale_code, None)
+    parsed = matcher.match(value, locale_code)
+    if parsed is not None:
+        return (parsed.date(), ())
+    return _parse_error("date", value, locale_code, "No matching date pattern found")
+
+
 def parse_date(
     value: str,
     locale_code: str,
@@ -149,68 +216,38 @@ def parse_date(
     Thread Safety:
         Thread-safe. Uses Babel + stdlib (no global state).
     """
-    errors: list[FrozenFluentError] = []
+    return _parse_date_value(value, locale_code, partial(_get_date_matcher, locale_code))
 
-    # Type check: value must be string (runtime defense for untyped callers)
-    if not isinstance(value, str):
-        diagnostic = ErrorTemplate.parse_date_failed(  # type: ignore[unreachable]
-            str(value), locale_code, f"Expected string, got {type(value).__name__}"
-        )
-        context = FrozenErrorContext(
-            input_value=str(value),
-            locale_code=locale_code,
-            parse_type="date",
-        )
-        error = FrozenFluentError(
-            str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-        )
-        errors.append(error)
-        return (None, tuple(errors))
 
-    # Try ISO 8601 first (fastest path)
-    try:
-        return (datetime.fromisoformat(value).date(), tuple(errors))
-    except ValueError:
-        pass
+def parse_dates(
+    values: Iterable[str],
+    locale_code: str,
+) -> tuple[ParseResult[date], ...]:
+    """Parse many locale-aware date strings, e.g. one CSV column.
 
-    # Try locale-specific CLDR patterns
-    patterns = _get_date_patterns(locale_code)
-    if not patterns:
-        # Unknown locale
-        diagnostic = ErrorTemplate.parse_locale_unknown(locale_code)
-        context = FrozenErrorContext(
-            input_value=str(value),
-            locale_code=locale_code,
-            parse_type="date",
-        )
-        error = FrozenFluentError(
-            str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-        )
-        errors.append(error)
-        return (None, tuple(errors))
+    Each value is parsed exactly as by parse_date(); the locale's compiled
+    patterns are looked up once for the whole batch.
 
-    for pattern, has_era in patterns:
-        try:
-            # Preprocess for era tokens before strptime (with localized era names)
-            parse_value = _preprocess_datetime_input(value, locale_code, has_era=has_era)
-            return (datetime.strptime(parse_value, pattern).date(), tuple(errors))
-        except ValueError:
-            continue
+    Args:
+        values: Date strings to parse
+        locale_code: BCP 47 locale identifier applied to every value
 
-    # All patterns failed
-    diagnostic = ErrorTemplate.parse_date_failed(
-        value, locale_code, "No matching date pattern found"
-    )
-    context = FrozenErrorContext(
-        input_value=str(value),
-        locale_code=locale_code,
-        parse_type="date",
-    )
-    error = FrozenFluentError(
-        str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-    )
-    errors.append(error)
-    return (None, tuple(errors))
+    Returns:
+        One (result, errors) tuple per value, in input order
+
+    Raises:
+        BabelImportError: If Babel is not installed
+
+    Examples:
+        >>> results = parse_dates(["1/28/25", "2025-01-29", "x"], "en_US")  # doctest: +SKIP
+        >>> [result for result, _ in results]  # doctest: +SKIP
+        [datetime.date(2025, 1, 28), datetime.date(2025, 1, 29), None]
+
+    Thread Safety:
+        Thread-safe. Uses Babel + stdlib (no global state).
+    """
+    get_matcher = cache(partial(_get_date_matcher, locale_code))
+    return tuple(_parse_date_value(value, locale_code, get_matcher) for value in values)
 
 
 def parse_datetime(
@@ -266,71 +303,29 @@ def parse_datetime(
     Thread Safety:
         Thread-safe. Uses Babel + stdlib (no global state).
     """
-    errors: list[FrozenFluentError] = []
-
     # Type check: value must be string (runtime defense for untyped callers)
     if not isinstance(value, str):
-        diagnostic = ErrorTemplate.parse_datetime_failed(  # type: ignore[unreachable]
-            str(value), locale_code, f"Expected string, got {type(value).__name__}"
+        return _parse_error(  # type: ignore[unreachable]
+            "datetime", value, locale_code, f"Expected string, got {type(value).__name__}"
         )
-        context = FrozenErrorContext(
-            input_value=str(value),
-            locale_code=locale_code,
-            parse_type="datetime",
-        )
-        error = FrozenFluentError(
-            str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-        )
-        errors.append(error)
-        return (None, tuple(errors))
 
     # Try ISO 8601 first (fastest path)
-    try:
-        parsed = datetime.fromisoformat(value)
-        if tzinfo is not None and parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=tzinfo)
-        return (parsed, tuple(errors))
-    except (ValueError, TypeError):
-        pass
-
-    # Try locale-specific CLDR patterns
-    patterns = _get_datetime_patterns(locale_code)
-    if not patterns:
-        # Unknown locale
-        diagnostic = ErrorTemplate.parse_locale_unknown(locale_code)
-        context = FrozenErrorContext(
-            input_value=str(value),
-            locale_code=locale_code,
-            parse_type="datetime",
-        )
-        error = FrozenFluentError(
-            str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-        )
-        errors.append(error)
-        return (None, tuple(errors))
-
-    for pattern, has_era in patterns:
+    if value[:4].isdigit():
         try:
-            # Preprocess for era tokens before strptime (with localized era names)
-            parse_value = _preprocess_datetime_input(value, locale_code, has_era=has_era)
-            parsed = datetime.strptime(parse_value, pattern)
+            parsed = datetime.fromisoformat(value)
             if tzinfo is not None and parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=tzinfo)
-            return (parsed, tuple(errors))
-        except ValueError:
-            continue
+            return (parsed, ())
+        except (ValueError, TypeError):
+            pass
 
-    # All patterns failed
-    diagnostic = ErrorTemplate.parse_datetime_failed(
-        value, locale_code, "No matching datetime pattern found"
-    )
-    context = FrozenErrorContext(
-        input_value=str(value),
-        locale_code=locale_code,
-        parse_type="datetime",
-    )
-    error = FrozenFluentError(
-        str(diagnostic), ErrorCategory.PARSE, diagnostic=diagnostic, context=context
-    )
-    errors.append(error)
-    return (None, tuple(errors))
+    # Try locale-specific CLDR patterns
+    matcher = _get_datetime_matcher(locale_code)
+    if matcher is None:
+        return _parse_error("datetime", value, locale_code, None)
+    matched = matcher.match(value, locale_code)
+    if matched is None:
+        return _parse_error("datetime", value, locale_code, "No matching datetime pattern found")
+    if tzinfo is not None and matched.tzinfo is None:
+        matched = matched.replace(tzinfo=tzinfo)
+    return (matched, ())
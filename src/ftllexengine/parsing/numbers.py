@@ -1,10 +1,19 @@
 """Number parsing functions with locale awareness.
 
 - parse_decimal() returns ParseResult[Decimal]
+- parse_decimals() returns parallel (results, errors) tuples for many values
+- iter_decimals() yields one ParseResult[Decimal] per value (streaming)
 - parse_fluent_number() returns ParseResult[FluentNumber]
 - Parse errors returned in tuple
 - Raises BabelImportError if Babel is not installed
 
+Bulk Parsing:
+    parse_decimals() and iter_decimals() resolve the locale once and check each
+    value against a precompiled per-locale regex of plain digit strings (optional
+    sign, correctly placed group separators, decimal part). Matching values are
+    normalized and passed to Decimal directly; everything else goes through
+    parse_decimal(), so results are identical to calling it per value.
+
 Babel Dependency:
     This module requires Babel for CLDR data. Import is deferred to function call
     time to support parser-only installations. Clear error message provided when
@@ -15,8 +24,15 @@ Thread-safe. Uses Babel for CLDR-compliant parsing.
 Python 3.13+.
 """
 
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from ftllexengine.constants import MAX_LOCALE_CACHE_SIZE
 from ftllexengine.core.babel_compat import (
     get_locale_class,
     get_number_format_error_class,
@@ -37,7 +53,16 @@ from ftllexengine.diagnostics import (
 )
 from ftllexengine.diagnostics.templates import ErrorTemplate
 
-__all__ = ["parse_decimal", "parse_fluent_number"]
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = [
+    "clear_number_caches",
+    "iter_decimals",
+    "parse_decimal",
+    "parse_decimals",
+    "parse_fluent_number",
+]
 
 
 def _validate_group_positions(
@@ -226,6 +251,158 @@ def parse_decimal(
         return (None, tuple(errors))
 
 
+@dataclass(frozen=True, slots=True)
+class _NumberFastPath:
+    """Precompiled checks for inputs Babel's parse_decimal reads as plain digits.
+
+    Attributes:
+        grouped: Full-match regex for values parse_decimal() accepts unchanged:
+            ASCII digits, optional sign and decimal part, and group separators
+            only at the locale's digit-boundary positions
+        loose: Like ``grouped`` but with group separators between any digits,
+            as Babel accepts for currency amounts
+        group_sep: Locale group separator, removed before conversion
+        decimal_sep: Locale decimal separator, replaced by "."
+    """
+
+    grouped: re.Pattern[str]
+    loose: re.Pattern[str]
+    group_sep: str
+    decimal_sep: str
+
+    def to_decimal(self, value: str) -> Decimal:
+        """Convert a value matched by ``grouped`` or ``loose``, as Babel does."""
+        return Decimal(value.replace(self.group_sep, "").replace(self.decimal_sep, "."))
+
+
+@lru_cache(maxsize=MAX_LOCALE_CACHE_SIZE)
+def _get_number_fast_path(locale_code: str) -> _NumberFastPath | None:
+    """Build the bulk-parsing fast path for one locale.
+
+    Returns None when every value must take the per-value path: the locale is
+    invalid or unknown, or the separators Babel parses with (Latin digits)
+    differ from those the group-position guard validates (default numbering
+    system).
+    """
+    if not is_structurally_valid_locale_code(locale_code):
+        return None
+    try:
+        locale = get_locale_class().parse(normalize_locale(locale_code))
+        latn = locale.number_symbols["latn"]
+        default = locale.number_symbols[locale.default_numbering_system]
+        raw_grouping = getattr(locale.decimal_formats[None], "grouping", (3, 3))
+    except (get_unknown_locale_error_class(), ValueError, AttributeError, KeyError, TypeError):
+        return None
+    group_sep: str = latn.get("group", ",")
+    decimal_sep: str = latn.get("decimal", ".")
+    if (group_sep, decimal_sep) != (default.get("group", ""), default.get("decimal", ".")):
+        return None
+    primary = raw_grouping[0] if raw_grouping else 3
+    secondary = raw_grouping[1] if len(raw_grouping) > 1 and raw_grouping[1] != 0 else primary
+
+    fraction = f"(?:{re.escape(decimal_sep)}[0-9]+)?"
+    if group_sep:
+        group = re.escape(group_sep)
+        grouped = (
+            f"[0-9]+|[0-9]{{1,{secondary}}}(?:{group}[0-9]{{{secondary}}})*"
+            f"{group}[0-9]{{{primary}}}"
+        )
+        loose = f"[0-9]+(?:{group}[0-9]+)*"
+    else:
+        grouped = loose = "[0-9]+"
+    return _NumberFastPath(
+        grouped=re.compile(f"[+-]?(?:{grouped}){fraction}"),
+        loose=re.compile(f"[+-]?(?:{loose}){fraction}"),
+        group_sep=group_sep,
+        decimal_sep=decimal_sep,
+    )
+
+
+def iter_decimals(
+    values: Iterable[str],
+    locale_code: str,
+) -> Iterator[ParseResult[Decimal]]:
+    """Parse locale-aware number strings lazily, one result per value.
+
+    Streaming form of parse_decimals(): values are consumed and results
+    produced one at a time, so arbitrarily long inputs (e.g. rows read from
+    a file) are parsed in constant memory.
+
+    Args:
+        values: Number strings to parse
+        locale_code: BCP 47 locale identifier applied to every value
+
+    Yields:
+        The parse_decimal() result for each value, in input order
+
+    Raises:
+        BabelImportError: If Babel is not installed (on first iteration)
+
+    Examples:
+        >>> for amount, errors in iter_decimals(["1,234.56", "x"], "en_US"):  # doctest: +SKIP
+        ...     print(amount, len(errors))
+        1234.56 0
+        None 1
+    """
+    require_babel("iter_decimals")
+    fast_path = _get_number_fast_path(locale_code)
+    if fast_path is None:
+        for value in values:
+            yield parse_decimal(value, locale_code)
+        return
+    grouped = fast_path.grouped
+    for value in values:
+        if type(value) is str and grouped.fullmatch(value) is not None:
+            yield (fast_path.to_decimal(value), ())
+        else:
+            yield parse_decimal(value, locale_code)
+
+
+def parse_decimals(
+    values: Iterable[str],
+    locale_code: str,
+) -> tuple[tuple[Decimal | None, ...], tuple[tuple[FrozenFluentError, ...], ...]]:
+    """Parse many locale-aware number strings, e.g. one ledger column.
+
+    Each value is parsed exactly as by parse_decimal(). Locale data and the
+    per-locale digit regex are resolved once, and plain digit strings are
+    converted to Decimal without calling Babel.
+
+    Args:
+        values: Number strings to parse
+        locale_code: BCP 47 locale identifier applied to every value
+
+    Returns:
+        Tuple of (results, errors), parallel to ``values``:
+        - results: Parsed Decimal, or None, per value
+        - errors: Tuple of FrozenFluentError (empty on success) per value
+
+    Raises:
+        BabelImportError: If Babel is not installed
+
+    Examples:
+        >>> amounts, errors = parse_decimals(["1 234,56", "12,5"], "lv_LV")  # doctest: +SKIP
+        >>> amounts  # doctest: +SKIP
+        (Decimal('1234.56'), Decimal('12.5'))
+        >>> errors  # doctest: +SKIP
+        ((), ())
+
+    Thread Safety:
+        Thread-safe. Uses Babel (no global state).
+    """
+    results: list[Decimal | None] = []
+    errors: list[tuple[FrozenFluentError, ...]] = []
+    for result, value_errors in iter_decimals(values, locale_code):
+        results.append(result)
+        errors.append(value_errors)
+    return (tuple(results), tuple(errors))
+
+
+def clear_number_caches() -> None:
+    """Clear cached per-locale bulk number parsing data."""
+    _get_number_fast_path.cache_clear()
+
+
 def parse_fluent_number(
     value: str,
     locale_code: str,
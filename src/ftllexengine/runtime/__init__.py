@@ -22,6 +22,7 @@ from ftllexengine.diagnostics import ValidationResult
 from .cache import CacheAuditLogEntry, WriteLogEntry
 from .cache_config import CacheConfig
 from .function_bridge import FluentNumber, FunctionRegistry, fluent_function
+from .resource_cache import CompiledResource, ResourceCache
 from .value_types import make_fluent_number
 
 if TYPE_CHECKING:
@@ -61,7 +62,8 @@ def __getattr__(name: str) -> object:
         optional_attrs=_BABEL_OPTIONAL_ATTRS,
         parser_only_hint=(
             "Parser-only usage keeps CacheConfig, FluentNumber, FunctionRegistry, "
-            "fluent_function, make_fluent_number, ValidationResult, and cache entry types "
+            "ResourceCache, fluent_function, make_fluent_number, ValidationResult, "
+            "and cache entry types "
             "importable. Locale-formatting helpers require the full runtime extra."
         ),
     )
@@ -71,8 +73,10 @@ def __getattr__(name: str) -> object:
 __all__: list[str] = [
     "CacheAuditLogEntry",
     "CacheConfig",
+    "CompiledResource",
     "FluentNumber",
     "FunctionRegistry",
+    "ResourceCache",
     "ValidationResult",
     "WriteLogEntry",
     "fluent_function",
@@ -14,15 +14,19 @@ from .functions import datetime_format as datetime_format
 from .functions import get_shared_registry as get_shared_registry
 from .functions import number_format as number_format
 from .plural_rules import select_plural_category as select_plural_category
+from .resource_cache import CompiledResource as CompiledResource
+from .resource_cache import ResourceCache as ResourceCache
 from .value_types import make_fluent_number as make_fluent_number
 
 __all__: list[str] = [
     "AsyncFluentBundle",
     "CacheAuditLogEntry",
     "CacheConfig",
+    "CompiledResource",
     "FluentBundle",
     "FluentNumber",
     "FunctionRegistry",
+    "ResourceCache",
     "ValidationResult",
     "WriteLogEntry",
     "create_default_registry",
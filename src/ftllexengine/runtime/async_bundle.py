@@ -1,8 +1,10 @@
 """Async-native FluentBundle wrapper for asyncio applications.
 
 AsyncFluentBundle wraps FluentBundle and offloads all CPU-bound operations
-to a thread pool via asyncio.to_thread(), keeping the event loop unblocked.
-The underlying FluentBundle handles all concurrency via its internal RWLock;
+to a thread pool via asyncio.to_thread() (or a caller-supplied executor),
+keeping the event loop unblocked. In adaptive format mode, formatting calls
+that are known to be cheap run inline on the event loop instead. The
+underlying FluentBundle handles all concurrency via its internal RWLock;
 this module is purely an asyncio adapter layer.
 
 Python 3.13+.
@@ -11,14 +13,19 @@ Python 3.13+.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Self
+import contextvars
+import functools
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Literal, Self, cast
 
 from ftllexengine.core.locale_utils import get_system_locale
 
 from .bundle import FluentBundle
+from .bundle_formatting import InlineDeferral
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+    from concurrent.futures import Executor
     from types import TracebackType
 
     from ftllexengine.core.semantic_types import LocaleCode
@@ -28,17 +35,57 @@ if TYPE_CHECKING:
     from ftllexengine.runtime.cache import CacheAuditLogEntry, CacheStats
     from ftllexengine.syntax.ast import Junk, Message, Term
 
+    from .bundle_lifecycle import ConcurrencyMode
     from .cache_config import CacheConfig
     from .function_bridge import FunctionRegistry
+    from .resource_cache import ResourceCache
+
+type AsyncFormatMode = Literal["offload", "adaptive"]
+
+# Requests format_many() may format inline before offloading the remainder,
+# bounding how long one adaptive batch can hold the event loop.
+_MAX_INLINE_BATCH = 256
+
+# Characters (or bytes) pulled from an async source per event-loop round trip.
+_ASYNC_STREAM_BLOCK_SIZE = 65536
+
+
+async def _read_block(iterator: AsyncIterator[str | bytes]) -> list[str | bytes]:
+    """Read items until about _ASYNC_STREAM_BLOCK_SIZE has arrived or the source ends."""
+    block: list[str | bytes] = []
+    size = 0
+    async for item in iterator:
+        block.append(item)
+        size += len(item)
+        if size >= _ASYNC_STREAM_BLOCK_SIZE:
+            break
+    return block
+
+
+def _iter_from_loop(
+    iterator: AsyncIterator[str | bytes], loop: asyncio.AbstractEventLoop
+) -> Iterator[str | bytes]:
+    """Yield an async source's items in a worker thread, reading blocks on ``loop``."""
+    while block := asyncio.run_coroutine_threadsafe(_read_block(iterator), loop).result():
+        yield from block
 
 
 class AsyncFluentBundle:
     """Async-native wrapper around FluentBundle for asyncio applications.
 
     All mutation and formatting operations are offloaded to a thread pool via
-    asyncio.to_thread(), preventing event-loop blocking. The underlying
-    FluentBundle handles all thread safety via its internal RWLock. This class
-    is purely an asyncio adapter — no additional locking is introduced.
+    asyncio.to_thread(), or to ``executor`` if one is given, preventing
+    event-loop blocking. The underlying FluentBundle handles all thread safety
+    via its internal RWLock. This class is purely an asyncio adapter — no
+    additional locking is introduced.
+
+    With ``format_mode="adaptive"``, format_pattern() and format_many() skip
+    the thread hop when the result is cheap to produce: placeable-free
+    patterns, cache hits, and messages whose expansion is small and calls only
+    built-in functions are formatted inline on the event loop. Custom
+    functions, large select trees, lazily indexed messages, and calls made
+    while a writer holds the lock are still offloaded. Results are identical
+    in both modes.
 
     Fast read lookups (has_message, get_message, etc.) are exposed as
     synchronous methods because the underlying dict operations are O(1) and
@@ -59,7 +106,7 @@ class AsyncFluentBundle:
         >>> asyncio.run(example())  # doctest: +SKIP
     """
 
-    __slots__ = ("_bundle",)
+    __slots__ = ("_bundle", "_executor", "_format_mode", "_inline_cheap")
 
     def __init__(
         self,
@@ -73,6 +120,13 @@ class AsyncFluentBundle:
         max_nesting_depth: int | None = None,
         max_expansion_size: int | None = None,
         strict: bool = True,
+        compiled: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+        concurrency: ConcurrencyMode = "rwlock",
+        resource_cache: ResourceCache | None = None,
+        format_mode: AsyncFormatMode = "offload",
+        executor: Executor | None = None,
     ) -> None:
         """Initialize async bundle for locale.
 
@@ -88,7 +142,30 @@ class AsyncFluentBundle:
             max_nesting_depth: Maximum placeable nesting depth.
             max_expansion_size: Maximum formatted output length in characters.
             strict: Raise on formatting or syntax errors (default: True).
+            compiled: Lower entries into compiled resolution plans at
+                add_resource time (default: False).
+            compact: Store entries span-free with shared subtrees to reduce
+                memory for large catalogs (default: False).
+            lazy: Index resources in add_resource and parse each entry on
+                first use (default: False).
+            concurrency: ``"rwlock"`` (default) or ``"snapshot"`` for lock-free
+                reads with copy-on-write publication of new resources.
+            resource_cache: On-disk ResourceCache for parsed resources.
+            format_mode: ``"offload"`` (default) runs every format call in a
+                worker thread; ``"adaptive"`` formats cheap calls inline on
+                the event loop.
+            executor: Executor for offloaded work. Defaults to the event
+                loop's default executor (as used by asyncio.to_thread()).
+
+        Raises:
+            ValueError: If format_mode is not "offload" or "adaptive".
         """
+        if format_mode not in ("offload", "adaptive"):
+            msg = f"format_mode must be 'offload' or 'adaptive', got {format_mode!r}"
+            raise ValueError(msg)
+        self._format_mode: AsyncFormatMode = format_mode
+        self._executor = executor
+        self._inline_cheap: dict[tuple[str, str | None], bool] = {}
         self._bundle = FluentBundle(
             locale,
             use_isolating=use_isolating,
@@ -98,6 +175,11 @@ class AsyncFluentBundle:
             max_nesting_depth=max_nesting_depth,
             max_expansion_size=max_expansion_size,
             strict=strict,
+            compiled=compiled,
+            compact=compact,
+            lazy=lazy,
+            concurrency=concurrency,
+            resource_cache=resource_cache,
         )
 
     @classmethod
@@ -111,6 +193,13 @@ class AsyncFluentBundle:
         max_nesting_depth: int | None = None,
         max_expansion_size: int | None = None,
         strict: bool = True,
+        compiled: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+        concurrency: ConcurrencyMode = "rwlock",
+        resource_cache: ResourceCache | None = None,
+        format_mode: AsyncFormatMode = "offload",
+        executor: Executor | None = None,
     ) -> AsyncFluentBundle:
         """Create AsyncFluentBundle for the current system locale.
 
@@ -124,6 +213,13 @@ class AsyncFluentBundle:
             max_nesting_depth: Maximum placeable nesting depth.
             max_expansion_size: Maximum formatted output length in characters.
             strict: Fail-fast mode (default True).
+            compiled: Lower entries into compiled resolution plans.
+            compact: Store entries span-free with shared subtrees.
+            lazy: Parse entries on first use instead of in add_resource.
+            concurrency: Read-path concurrency mode ("rwlock" or "snapshot").
+            resource_cache: On-disk ResourceCache for parsed resources.
+            format_mode: "offload" or "adaptive" (inline cheap format calls).
+            executor: Executor for offloaded work (default: loop default).
 
         Returns:
             AsyncFluentBundle configured for the detected system locale.
@@ -141,6 +237,13 @@ class AsyncFluentBundle:
             max_nesting_depth=max_nesting_depth,
             max_expansion_size=max_expansion_size,
             strict=strict,
+            compiled=compiled,
+            compact=compact,
+            lazy=lazy,
+            concurrency=concurrency,
+            resource_cache=resource_cache,
+            format_mode=format_mode,
+            executor=executor,
         )
 
     async def __aenter__(self) -> Self:
@@ -181,6 +284,31 @@ class AsyncFluentBundle:
         """Whether Unicode bidi isolation marks are inserted around interpolations."""
         return self._bundle.use_isolating
 
+    @property
+    def format_mode(self) -> AsyncFormatMode:
+        """Format-call dispatch mode ("offload" or "adaptive")."""
+        return self._format_mode
+
+    @property
+    def concurrency(self) -> ConcurrencyMode:
+        """Read-path concurrency mode ("rwlock" or "snapshot")."""
+        return self._bundle.concurrency
+
+    @property
+    def compiled(self) -> bool:
+        """Whether entries are lowered into compiled resolution plans."""
+        return self._bundle.compiled
+
+    @property
+    def compact(self) -> bool:
+        """Whether entries are stored span-free with shared subtrees."""
+        return self._bundle.compact
+
+    @property
+    def lazy(self) -> bool:
+        """Whether add_resource defers parsing to first use."""
+        return self._bundle.lazy
+
     @property
     def cache_enabled(self) -> bool:
         """Whether result caching is enabled."""
@@ -216,27 +344,42 @@ class AsyncFluentBundle:
             TypeError: If source is not a string.
             SyntaxIntegrityError: In strict mode, if any Junk entries are parsed.
         """
-        return await asyncio.to_thread(
-            self._bundle.add_resource, source, source_path=source_path
-        )
+        try:
+            return await self._offload(self._bundle.add_resource, source, source_path=source_path)
+        finally:
+            self._inline_cheap.clear()
 
     async def add_resource_stream(
-        self, lines: Iterable[str], /, *, source_path: str | None = None
+        self,
+        lines: Iterable[str] | Iterable[bytes] | AsyncIterable[str] | AsyncIterable[bytes],
+        /,
+        *,
+        source_path: str | None = None,
+        batch_size: int | None = None,
+        absolute_spans: bool = False,
     ) -> tuple[Junk, ...]:
         """Add FTL resource from a line iterator. Offloads parsing to a thread pool.
 
         Memory usage is proportional to the largest single FTL entry, not the
-        total resource size. Semantically identical to add_resource() in all
-        other respects.
+        total resource size. An async iterable (e.g. an aiofiles handle or an
+        HTTP body's chunk iterator) is consumed on the event loop in blocks of
+        about 64 KiB, which the worker thread parses as they arrive.
+        Semantically identical to FluentBundle.add_resource_stream().
 
         Args:
-            lines: Iterable of FTL source lines [positional-only].
+            lines: Iterable or async iterable of FTL source lines, or of raw
+                UTF-8 byte chunks [positional-only].
             source_path: Optional source path for error messages.
+            batch_size: Register entries in batches of this size, each under
+                its own write lock. Defaults to one atomic registration.
+            absolute_spans: Rebase spans to offsets in the whole stream.
 
         Returns:
             Tuple of Junk entries. Empty if parsing succeeded without errors.
 
         Raises:
+            ValueError: If batch_size is not positive.
+            UnicodeDecodeError: If a byte stream is not valid UTF-8.
             SyntaxIntegrityError: In strict mode, if any Junk entries are parsed.
 
         Example:
@@ -244,9 +387,84 @@ class AsyncFluentBundle:
             ...     with open("locales/en/ui.ftl") as f:
             ...         await bundle.add_resource_stream(f, source_path="locales/en/ui.ftl")
         """
-        return await asyncio.to_thread(
-            self._bundle.add_resource_stream, lines, source_path=source_path
+        source: Iterable[str] | Iterable[bytes]
+        if isinstance(lines, AsyncIterable):
+            # One source yields either text or bytes, never a mix.
+            source = cast(
+                "Iterable[str]",
+                _iter_from_loop(aiter(lines), asyncio.get_running_loop()),
+            )
+        else:
+            source = lines
+        try:
+            return await self._offload(
+                self._bundle.add_resource_stream,
+                source,
+                source_path=source_path,
+                batch_size=batch_size,
+                absolute_spans=absolute_spans,
+            )
+        finally:
+            self._inline_cheap.clear()
+
+    async def validate(self) -> tuple[Junk, ...]:
+        """Report syntax errors of lazily added resources. Offloads parsing to a thread pool.
+
+        Semantically identical to FluentBundle.validate().
+
+        Returns:
+            Tuple of Junk entries across all lazily added resources.
+
+        Raises:
+            SyntaxIntegrityError: In strict mode, if any Junk entries are parsed.
+        """
+        try:
+            return await self._offload(self._bundle.validate)
+        finally:
+            self._inline_cheap.clear()
+
+    async def format_many(
+        self,
+        requests: Iterable[tuple[str, Mapping[str, FluentValue] | None]],
+        /,
+    ) -> tuple[tuple[str, tuple[FrozenFluentError, ...]], ...]:
+        """Format many ``(message_id, args)`` pairs in one thread-pool hop.
+
+        Semantically identical to FluentBundle.format_many(): one read-lock
+        acquisition for the whole batch, results in request order. In adaptive
+        mode, leading cheap requests (up to a fixed number) are formatted
+        inline and the rest of the batch, from the first request that is not
+        cheap, in one hop.
+
+        Args:
+            requests: Iterable of ``(message_id, args)`` pairs [positional-only]
+
+        Returns:
+            Tuple of ``(formatted_string, errors)`` results in request order.
+
+        Raises:
+            FormattingIntegrityError: In strict mode, on the first failing request.
+        """
+        batch = tuple(requests)
+        if self._format_mode == "offload":
+            return await self._offload(self._bundle.format_many, batch)
+        format_inline = self._bundle._format_inline  # noqa: SLF001 - co-module
+        results: list[tuple[str, tuple[FrozenFluentError, ...]]] = []
+        missed_first = False
+        for message_id, args in batch[:_MAX_INLINE_BATCH]:
+            result = format_inline(message_id, args, None, self._inline_cheap)
+            if isinstance(result, InlineDeferral):
+                missed_first = result is InlineDeferral.CACHE_MISSED
+                break
+            results.append(result)
+        if len(results) == len(batch):
+            return tuple(results)
+        rest = await self._offload(
+            self._bundle._format_many_impl,  # noqa: SLF001 - co-module
+            batch[len(results) :],
+            missed_first=missed_first,
         )
+        return (*results, *rest)
 
     async def format_pattern(
         self,
@@ -260,6 +478,7 @@ class AsyncFluentBundle:
 
         Semantically identical to FluentBundle.format_pattern() in all respects:
         strict/soft-error behavior, fallback semantics, and error reporting.
+        In adaptive mode, cheap calls are formatted inline without a thread hop.
 
         Args:
             message_id: Message identifier [positional-only]
@@ -274,7 +493,20 @@ class AsyncFluentBundle:
             FormattingIntegrityError: In strict mode, if any error occurs during
                 formatting.
         """
-        return await asyncio.to_thread(
+        if self._format_mode == "adaptive":
+            result = self._bundle._format_inline(  # noqa: SLF001 - co-module
+                message_id, args, attribute, self._inline_cheap
+            )
+            if result is InlineDeferral.CACHE_MISSED:
+                return await self._offload(
+                    self._bundle._format_missed,  # noqa: SLF001 - co-module
+                    message_id,
+                    args,
+                    attribute,
+                )
+            if not isinstance(result, InlineDeferral):
+                return result
+        return await self._offload(
             self._bundle.format_pattern, message_id, args, attribute=attribute
         )
 
@@ -289,7 +521,21 @@ class AsyncFluentBundle:
             func: Callable implementing the function. See fluent_function decorator
                   for locale-injection support.
         """
-        await asyncio.to_thread(self._bundle.add_function, name, func)
+        try:
+            await self._offload(self._bundle.add_function, name, func)
+        finally:
+            self._inline_cheap.clear()
+
+    async def _offload[**P, R](
+        self, func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        """Run ``func`` on the configured executor, like asyncio.to_thread()."""
+        if self._executor is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
 
     # ------------------------------------------------------------------
     # Synchronous read operations (fast dict lookups — O(1), non-blocking)
@@ -370,6 +616,15 @@ class AsyncFluentBundle:
         Synchronous. Safe to call from async code; the cache clear is O(1).
         """
         self._bundle.clear_cache()
+        self._inline_cheap.clear()
+
+    def prepare_for_fork(self, *, freeze: bool = True) -> None:
+        """Build lazily created locale state and freeze the heap before forking.
+
+        Synchronous; call in the pre-fork master before any event loop starts.
+        See FluentBundle.prepare_for_fork().
+        """
+        self._bundle.prepare_for_fork(freeze=freeze)
 
     def get_cache_stats(self) -> CacheStats | None:
         """Return cache statistics, or None if caching is disabled.
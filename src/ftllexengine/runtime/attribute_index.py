@@ -0,0 +1,62 @@
+"""Name-to-pattern tables for message and term attributes.
+
+Attribute lookups (``format_pattern(..., attribute=...)``, ``{ msg.attr }``,
+``{ -term.attr }``) resolve duplicate attribute names last-wins, which a scan
+of ``entry.attributes`` does from the end. FluentBundle instead builds one
+table per registered entry with attributes (index_attributes) and the
+resolver finds attributes in it by name (find_attribute).
+
+Tables are keyed by ``id(entry)`` and hold the entry, so a lookup for any
+other object, such as a Message passed straight to FluentResolver, scans its
+attributes as before.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from ftllexengine.syntax import Message, Pattern, Term
+
+__all__ = ["AttributeTable", "find_attribute", "index_attributes"]
+
+type AttributeTable = tuple[Message | Term, dict[str, Pattern]]
+
+
+def index_attributes(entries: Iterable[Message | Term]) -> dict[int, AttributeTable]:
+    """Return attribute tables for ``entries`` that have attributes.
+
+    Args:
+        entries: Messages and terms to index
+
+    Returns:
+        Tables keyed by entry identity; later duplicates replace earlier ones
+    """
+    return {
+        id(entry): (entry, {attr.id.name: attr.value for attr in entry.attributes})
+        for entry in entries
+        if entry.attributes
+    }
+
+
+def find_attribute(
+    tables: Mapping[int, AttributeTable] | None, entry: Message | Term, name: str
+) -> Pattern | None:
+    """Return the pattern of attribute ``name`` of ``entry`` (last wins), or None.
+
+    Args:
+        tables: Attribute tables of registered entries, or None to always scan
+        entry: Message or term whose attribute to find
+        name: Attribute name
+    """
+    table = tables.get(id(entry)) if tables is not None else None
+    if table is not None and table[0] is entry:
+        return table[1].get(name)
+    for attr in reversed(entry.attributes):
+        if attr.id.name == name:
+            return attr.value
+    return None
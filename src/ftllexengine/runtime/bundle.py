@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .bundle_formatting import _BundleFormattingMixin
+from .bundle_lazy import _BundleLazyMixin
 from .bundle_lifecycle import _BundleLifecycleMixin
 from .bundle_mutation import _BundleMutationMixin
 from .bundle_queries import _BundleQueryMixin
@@ -21,12 +22,20 @@ if TYPE_CHECKING:
     from ftllexengine.syntax import Message, Term
     from ftllexengine.syntax.parser import FluentParserV1
 
+    from .attribute_index import AttributeTable
+    from .bundle_lifecycle import ConcurrencyMode
     from .bundle_protocols import BundleStateProtocol
     from .cache import IntegrityCache
     from .cache_config import CacheConfig
+    from .cache_sharded import ShardedIntegrityCache
+    from .compact_storage import EntryCompactor, EntryTrivia
     from .function_bridge import FunctionRegistry
+    from .lazy_index import LazyEntry
     from .resolver import FluentResolver
-    from .rwlock import RWLock
+    from .resolver_compiled import PatternPlan
+    from .resource_cache import ResourceCache
+    from .rwlock import RWLock, SnapshotLock
+    from .static_terms import StaticTerm
 
 
 class FluentBundle(
@@ -34,13 +43,21 @@ class FluentBundle(
     _BundleQueryMixin,
     _BundleFormattingMixin,
     _BundleRegistrationMixin,
+    _BundleLazyMixin,
     _BundleMutationMixin,
 ):
     """Fluent message bundle for specific locale."""
 
-    _cache: IntegrityCache | None
+    _attributes: dict[int, AttributeTable]
+    _cache: IntegrityCache | ShardedIntegrityCache | None
     _cache_config: CacheConfig | None
+    _compactor: EntryCompactor | None
+    _concurrency: ConcurrencyMode
+    _dependents: dict[str, set[str]]
+    _entry_trivia: dict[int, EntryTrivia]
     _function_registry: FunctionRegistry
+    _lazy_entries: dict[str, LazyEntry] | None
+    _lazy_sources: list[tuple[str, str | None]]
     _locale: LocaleCode
     _max_expansion_size: int
     _max_nesting_depth: int
@@ -49,17 +66,28 @@ class FluentBundle(
     _msg_deps: dict[str, frozenset[str]]
     _owns_registry: bool
     _parser: FluentParserV1
+    _plans: dict[int, PatternPlan] | None
     _resolver: FluentResolver
-    _rwlock: RWLock
+    _resource_cache: ResourceCache | None
+    _rwlock: RWLock | SnapshotLock
+    _static_patterns: dict[tuple[str, str | None], str]
+    _static_terms: dict[tuple[str, str | None], StaticTerm]
     _strict: bool
     _term_deps: dict[str, frozenset[str]]
     _terms: dict[str, Term]
     _use_isolating: bool
 
     __slots__ = (
+        "_attributes",
         "_cache",
         "_cache_config",
+        "_compactor",
+        "_concurrency",
+        "_dependents",
+        "_entry_trivia",
         "_function_registry",
+        "_lazy_entries",
+        "_lazy_sources",
         "_locale",
         "_max_expansion_size",
         "_max_nesting_depth",
@@ -68,8 +96,12 @@ class FluentBundle(
         "_msg_deps",
         "_owns_registry",
         "_parser",
+        "_plans",
         "_resolver",
+        "_resource_cache",
         "_rwlock",
+        "_static_patterns",
+        "_static_terms",
         "_strict",
         "_term_deps",
         "_terms",
@@ -85,5 +117,17 @@ class FluentBundle(
         attribute: str | None = None,
     ) -> tuple[str, tuple[FrozenFluentError, ...]]:
         """Format one message or attribute to a string."""
+        # Placeable-free patterns were rendered at registration time; they need
+        # no resolver, context, depth guard, or cache. Exact type checks keep
+        # invalid inputs on the validating path below.
+        if (
+            type(message_id) is str
+            and (attribute is None or type(attribute) is str)
+            and (args is None or type(args) is dict)
+        ):
+            static = self._static_patterns.get((message_id, attribute))
+            if static is not None:
+                return (static, ())
+        self._materialize_message(message_id)
         with self._rwlock.read():
             return self._format_pattern_impl(message_id, args, attribute)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from contextlib import ExitStack
+from enum import Enum, auto
 from typing import TYPE_CHECKING, NoReturn
 
 from ftllexengine.constants import FALLBACK_INVALID, FALLBACK_MISSING_MESSAGE
@@ -16,15 +18,28 @@ from ftllexengine.diagnostics import (
     FrozenFluentError,
 )
 from ftllexengine.integrity import FormattingIntegrityError, IntegrityContext
+from ftllexengine.runtime.attribute_index import find_attribute
+from ftllexengine.runtime.format_cost import is_cheap_to_format
 from ftllexengine.runtime.resolver import FluentResolver
 
 if TYPE_CHECKING:
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.runtime.bundle_protocols import BundleStateProtocol
+    from ftllexengine.syntax import Message, Term
 
 logger = logging.getLogger("ftllexengine.runtime.bundle")
 
 
+class InlineDeferral(Enum):
+    """Why _format_inline() left a request to the caller's thread path."""
+
+    UNCHECKED = auto()
+    """The cache was not consulted; format normally."""
+
+    CACHE_MISSED = auto()
+    """The cache was consulted and missed; format without a second lookup."""
+
+
 class _BundleFormattingMixin:
     """Formatting behavior for FluentBundle."""
 
@@ -149,34 +164,182 @@ class _BundleFormattingMixin:
             message_id=message_id,
         )
 
-    def _create_resolver(self: BundleStateProtocol) -> FluentResolver:
-        """Create a resolver bound to the current bundle state."""
+    def _create_resolver(
+        self: BundleStateProtocol,
+        messages: dict[str, Message] | None = None,
+        terms: dict[str, Term] | None = None,
+    ) -> FluentResolver:
+        """Create a resolver bound to the current (or given) bundle registries."""
         return FluentResolver(
             locale=self._locale,
-            messages=self._messages,
-            terms=self._terms,
+            messages=self._messages if messages is None else messages,
+            terms=self._terms if terms is None else terms,
             function_registry=self._function_registry,
             use_isolating=self._use_isolating,
             max_nesting_depth=self._max_nesting_depth,
             max_expansion_size=self._max_expansion_size,
+            plans=self._plans,
+            static_terms=self._static_terms,
+            attributes=self._attributes,
         )
 
+    def format_many(
+        self: BundleStateProtocol,
+        requests: Iterable[tuple[str, Mapping[str, FluentValue] | None]],
+        /,
+    ) -> tuple[tuple[str, tuple[FrozenFluentError, ...]], ...]:
+        """Format many ``(message_id, args)`` pairs under one read-lock acquisition.
+
+        Each pair is formatted exactly as ``format_pattern(message_id, args)``
+        would, and results are returned in request order. The request iterable
+        is materialized before the lock is taken, so it may safely call back
+        into this bundle. In strict mode the first failing request raises and
+        no partial results are returned.
+        """
+        return self._format_many_impl(tuple(requests), missed_first=False)
+
+    def _format_many_impl(
+        self: BundleStateProtocol,
+        batch: tuple[tuple[str, Mapping[str, FluentValue] | None], ...],
+        *,
+        missed_first: bool,
+    ) -> tuple[tuple[str, tuple[FrozenFluentError, ...]], ...]:
+        """Format a batch as format_many() does.
+
+        ``missed_first`` skips the cache lookup for the first request, which
+        the caller already looked up and missed.
+        """
+        lazy_entries = self._lazy_entries
+        if lazy_entries:
+            keys = [f"msg:{message_id}" for message_id, _ in batch if type(message_id) is str]
+            if any(key in lazy_entries for key in keys):
+                with self._rwlock.write():
+                    self._materialize_locked(keys)
+        static_patterns = self._static_patterns
+        results: list[tuple[str, tuple[FrozenFluentError, ...]]] = []
+        with self._rwlock.read():
+            for index, (message_id, args) in enumerate(batch):
+                static = (
+                    static_patterns.get((message_id, None))
+                    if type(message_id) is str and (args is None or type(args) is dict)
+                    else None
+                )
+                if static is not None:
+                    results.append((static, ()))
+                else:
+                    lookup = index > 0 or not missed_first
+                    results.append(
+                        self._format_pattern_impl(message_id, args, None, lookup=lookup)
+                    )
+        return tuple(results)
+
+    def _format_missed(
+        self: BundleStateProtocol,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+    ) -> tuple[str, tuple[FrozenFluentError, ...]]:
+        """Format as format_pattern() does, after _format_inline() missed the cache."""
+        self._materialize_message(message_id)
+        with self._rwlock.read():
+            return self._format_pattern_impl(message_id, args, attribute, lookup=False)
+
+    def _format_inline(  # noqa: PLR0911 - each deferral to the thread path returns early
+        self: BundleStateProtocol,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+        cheap: dict[tuple[str, str | None], bool],
+    ) -> tuple[str, tuple[FrozenFluentError, ...]] | InlineDeferral:
+        """Format without blocking if the result is cheap to produce.
+
+        Used by AsyncFluentBundle to format on the event loop. Formats static
+        patterns, cache hits, and messages that is_cheap_to_format() accepts;
+        ``cheap`` memoizes that classification for registered messages and
+        attributes only, so it is bounded by the catalog, and must be
+        cleared by the caller whenever resources or functions change.
+        Defers, rather than waiting, for lazily indexed messages and while a
+        writer holds or awaits the lock. A deferral of expensive messages
+        reports CACHE_MISSED so the caller does not look the cache up again.
+        """
+        if (
+            type(message_id) is not str
+            or (attribute is not None and type(attribute) is not str)
+            or (args is not None and type(args) is not dict)
+        ):
+            return InlineDeferral.UNCHECKED
+        static = self._static_patterns.get((message_id, attribute))
+        if static is not None:
+            return (static, ())
+        lazy_entries = self._lazy_entries
+        if lazy_entries and f"msg:{message_id}" in lazy_entries:
+            return InlineDeferral.UNCHECKED
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(self._rwlock.read(timeout=0.0))
+            except TimeoutError:
+                return InlineDeferral.UNCHECKED
+            cached_result = self._lookup_cached_pattern(message_id, args, attribute)
+            if cached_result is not None:
+                return cached_result
+            key = (message_id, attribute)
+            is_cheap = cheap.get(key)
+            if is_cheap is None:
+                message = self._messages.get(message_id)
+                if message is None or (
+                    attribute is not None
+                    and find_attribute(self._attributes, message, attribute) is None
+                ):
+                    # Missing entries format to a fallback cheaply; they are not
+                    # memoized so arbitrary IDs cannot grow ``cheap``.
+                    return self._format_pattern_impl(message_id, args, attribute, lookup=False)
+                is_cheap = is_cheap_to_format(
+                    message,
+                    attribute,
+                    messages=self._messages,
+                    terms=self._terms,
+                    registry=self._function_registry,
+                )
+                cheap[key] = is_cheap
+            if not is_cheap:
+                return InlineDeferral.CACHE_MISSED
+            return self._format_pattern_impl(message_id, args, attribute, lookup=False)
+
     def _format_pattern_impl(
         self: BundleStateProtocol,
         message_id: str,
         args: Mapping[str, FluentValue] | None,
         attribute: str | None,
+        *,
+        lookup: bool = True,
     ) -> tuple[str, tuple[FrozenFluentError, ...]]:
-        """Format a message without acquiring bundle locks."""
+        """Format a message without acquiring bundle locks.
+
+        ``lookup=False`` skips the cache lookup, for callers that already
+        looked up and missed; the result is still cached.
+        """
         invalid_result = self._validate_format_request(message_id, args, attribute)
         if invalid_result is not None:
             return invalid_result
 
-        cached_result = self._lookup_cached_pattern(message_id, args, attribute)
-        if cached_result is not None:
-            return cached_result
+        if lookup:
+            cached_result = self._lookup_cached_pattern(message_id, args, attribute)
+            if cached_result is not None:
+                return cached_result
 
-        if message_id not in self._messages:
+        return self._resolve_and_cache(message_id, args, attribute)
+
+    def _resolve_and_cache(
+        self: BundleStateProtocol,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+    ) -> tuple[str, tuple[FrozenFluentError, ...]]:
+        """Resolve a validated request that missed the cache, and cache the result."""
+        # Capture each published registry once: in snapshot mode a writer may
+        # swap them concurrently, and the resolver is always published first.
+        messages = self._messages
+        if message_id not in messages:
             (logger.warning if self._strict else logger.debug)(
                 "Message '%s' not found",
                 message_id,
@@ -188,7 +351,7 @@ class _BundleFormattingMixin:
                 self._raise_strict_error(message_id, fallback, (error,))
             return (fallback, (error,))
 
-        message = self._messages[message_id]
+        message = messages[message_id]
         resolver = self._resolver
         result, errors_tuple = resolver.resolve_message(message, args, attribute)
 
@@ -214,6 +377,10 @@ class _BundleFormattingMixin:
                 formatted=result,
                 errors=errors_tuple,
             )
+            if self._resolver is not resolver:
+                # A snapshot writer published new state mid-resolution; its cache
+                # invalidation may have run before this put, so drop the stale result.
+                self._cache.invalidate({message_id})
 
         if errors_tuple and self._strict:
             self._raise_strict_error(message_id, result, errors_tuple)
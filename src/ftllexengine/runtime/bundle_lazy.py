@@ -0,0 +1,231 @@
+"""Lazy resource registration for FluentBundle.
+
+In lazy mode ``add_resource()`` only indexes the resource (see lazy_index) and
+each message or term is parsed and registered the first time it is needed,
+together with every lazily indexed entry it references. Registered entries
+therefore never reference an entry that is still unparsed, so the resolver,
+compiled plans, and static fast path work on them unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import deque
+from typing import TYPE_CHECKING
+
+from ftllexengine.core.reference_graph import entry_dependency_set
+from ftllexengine.introspection import extract_references
+from ftllexengine.syntax import Junk, Message, Resource, Term
+
+from .lazy_index import index_resource
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ftllexengine.syntax import Entry
+
+    from .bundle_protocols import BundleStateProtocol
+    from .lazy_index import LazyEntry
+
+logger = logging.getLogger("ftllexengine.runtime.bundle")
+
+_LOG_TRUNCATE_WARNING: int = 100
+
+
+def _entry_keys(dependencies: Iterable[str]) -> dict[str, None]:
+    """Map dependency keys (which may name an attribute) to entry keys, in order."""
+    return dict.fromkeys(dep.partition(".")[0] for dep in dependencies)
+
+
+class _BundleLazyMixin:
+    """Deferred parsing of lazily indexed resources for FluentBundle."""
+
+    @property
+    def lazy(self: BundleStateProtocol) -> bool:
+        """Get whether add_resource() defers parsing to first use."""
+        return self._lazy_entries is not None
+
+    def _add_lazy_resource(
+        self: BundleStateProtocol,
+        lazy_entries: dict[str, LazyEntry],
+        source: str,
+        source_path: str | None,
+    ) -> tuple[Junk, ...]:
+        """Index a resource into ``lazy_entries`` for parsing on first use; return no Junk."""
+        if self._max_source_size > 0 and len(source) > self._max_source_size:
+            msg = (
+                f"Source length ({len(source):,} characters) exceeds maximum "
+                f"({self._max_source_size:,} characters). "
+                "Configure max_source_size in FluentBundle constructor to increase limit."
+            )
+            raise ValueError(msg)
+        normalized = re.sub(r"\r\n?", "\n", source)
+        index = index_resource(normalized, source_path)
+
+        with self._rwlock.write():
+            # Redefinitions of registered entries, and entries that registered
+            # ones already reference, are parsed now so no registered entry
+            # keeps resolving against a stale or missing definition.
+            referenced = _entry_keys(
+                frozenset().union(*self._msg_deps.values(), *self._term_deps.values())
+            )
+            eager: list[str] = []
+            for key in index:
+                kind, _, entry_id = key.partition(":")
+                registered = self._messages if kind == "msg" else self._terms
+                if key in referenced or entry_id in registered:
+                    eager.append(key)
+            lazy_entries.update(index)
+            self._lazy_sources.append((normalized, source_path))
+            self._materialize_locked(eager)
+            self._invalidate_dependents(index)
+
+        logger.info(
+            "Indexed resource %s: %d entries pending parse",
+            source_path or "<string>",
+            len(index),
+        )
+        return ()
+
+    def _materialize_message(self: BundleStateProtocol, message_id: str) -> None:
+        """Parse and register ``message_id`` if it is still lazily indexed."""
+        lazy_entries = self._lazy_entries
+        if lazy_entries and type(message_id) is str:
+            key = f"msg:{message_id}"
+            if key in lazy_entries:
+                with self._rwlock.write():
+                    self._materialize_locked((key,))
+
+    def _materialize_term(self: BundleStateProtocol, term_id: str) -> None:
+        """Parse and register ``term_id`` if it is still lazily indexed."""
+        lazy_entries = self._lazy_entries
+        if lazy_entries and type(term_id) is str:
+            key = f"term:{term_id}"
+            if key in lazy_entries:
+                with self._rwlock.write():
+                    self._materialize_locked((key,))
+
+    def _materialize_all(self: BundleStateProtocol) -> None:
+        """Parse and register every lazily indexed entry."""
+        if self._lazy_entries:
+            with self._rwlock.write():
+                self._materialize_locked(tuple(self._lazy_entries))
+
+    def _materialize_locked(self: BundleStateProtocol, keys: Iterable[str]) -> None:
+        """Parse and register indexed entries and their transitive references.
+
+        ``keys`` are entry or dependency keys (``msg:<id>``, ``term:<id>.<attr>``).
+        Must be called under the write lock. Syntax errors are logged, not
+        raised; ``validate()`` reports them.
+        """
+        lazy_entries = self._lazy_entries
+        if not lazy_entries:
+            return
+        queue = deque(key for key in _entry_keys(keys) if key in lazy_entries)
+        parsed: set[str] = set()
+        entries: list[Entry] = []
+        dependencies: list[frozenset[str] | None] = []
+        while queue:
+            key = queue.popleft()
+            lazy_entry = lazy_entries.get(key)
+            if lazy_entry is None or key in parsed:
+                continue
+            parsed.add(key)
+            for entry in self._parse_lazy_entry(lazy_entries, key, lazy_entry, parsed):
+                deps: frozenset[str] | None = None
+                if isinstance(entry, (Message, Term)):
+                    deps = entry_dependency_set(*extract_references(entry))
+                    queue.extend(key for key in _entry_keys(deps) if key in lazy_entries)
+                elif isinstance(entry, Junk):
+                    logger.warning(
+                        "Syntax error in %s: %s",
+                        lazy_entry.source_path or "<string>",
+                        repr(entry.content[:_LOG_TRUNCATE_WARNING]),
+                    )
+                entries.append(entry)
+                dependencies.append(deps)
+        if not parsed:
+            return
+
+        pending = self._collect_pending_entries(
+            Resource(entries=tuple(entries)), tuple(dependencies)
+        )
+        for entry_type, entry_id in pending.overwrite_warnings:
+            logger.warning(
+                "Overwriting existing %s '%s%s' with new definition",
+                entry_type,
+                "-" if entry_type == "term" else "",
+                entry_id,
+            )
+        self._commit_pending(pending)
+        # Keys whose slice held only Junk stay unregistered; do not parse them again.
+        for key in parsed:
+            lazy_entries.pop(key, None)
+        logger.debug("Parsed %d lazily indexed entries", len(parsed))
+
+    def _parse_lazy_entry(
+        self: BundleStateProtocol,
+        lazy_entries: dict[str, LazyEntry],
+        key: str,
+        lazy_entry: LazyEntry,
+        parsed: set[str],
+    ) -> tuple[Entry, ...]:
+        """Parse the slice of ``key``, or its whole resource if the slice has Junk.
+
+        A slice boundary falls inside a placeable that spans lines when a
+        continuation line starts in column 1, which cuts the entry in two.
+        Parsing the full source recovers it. The fallback returns the
+        resource's Junk and its entries that are still indexed to this
+        resource and not already parsed, and adds their keys to ``parsed``.
+        Their spans are relative to the resource start.
+        """
+        slice_entries = self._parser.parse(lazy_entry.text).entries
+        if not any(isinstance(entry, Junk) for entry in slice_entries):
+            return slice_entries
+        junk: list[Entry] = []
+        found: dict[str, Entry] = {}
+        for entry in self._parser.parse(lazy_entry.source).entries:
+            if isinstance(entry, Junk):
+                junk.append(entry)
+                continue
+            if not isinstance(entry, (Message, Term)):
+                continue
+            entry_key = f"{'term' if isinstance(entry, Term) else 'msg'}:{entry.id.name}"
+            indexed = lazy_entries.get(entry_key)
+            if (
+                indexed is not None
+                and indexed.source is lazy_entry.source
+                and (entry_key == key or entry_key not in parsed)
+            ):
+                # Later duplicates replace earlier ones, as in the index.
+                found.pop(entry_key, None)
+                found[entry_key] = entry
+        parsed.update(found)
+        logger.debug(
+            "Slice of '%s' in %s did not parse; parsed the whole resource",
+            key,
+            lazy_entry.source_path or "<string>",
+        )
+        return (*junk, *found.values())
+
+    def validate(self: BundleStateProtocol) -> tuple[Junk, ...]:
+        """Parse every lazily added resource in full and return its Junk.
+
+        Lazy ``add_resource()`` skips syntax-error detection; this runs it
+        without registering anything. In strict mode the first resource with
+        Junk raises SyntaxIntegrityError, as eager ``add_resource()`` would
+        have. Eager bundles report Junk when resources are added and return
+        an empty tuple.
+        """
+        with self._rwlock.read():
+            sources = tuple(self._lazy_sources)
+        junk_entries: list[Junk] = []
+        for source, source_path in sources:
+            junk_tuple = tuple(
+                entry for entry in self._parser.parse(source).entries if isinstance(entry, Junk)
+            )
+            if junk_tuple and self._strict:
+                self._raise_syntax_error(junk_tuple, source_path, "validate")
+            junk_entries.extend(junk_tuple)
+        return tuple(junk_entries)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Literal, cast
 
 from ftllexengine.constants import (
     DEFAULT_MAX_EXPANSION_SIZE,
@@ -15,26 +15,37 @@ from ftllexengine.core.locale_utils import get_system_locale, require_locale_cod
 from ftllexengine.syntax.parser import FluentParserV1
 
 from .cache import IntegrityCache
+from .cache_sharded import ShardedIntegrityCache
+from .compact_storage import EntryCompactor, EntryTrivia
 from .function_bridge import FunctionRegistry
 from .functions import get_shared_registry
 from .locale_context import LocaleContext
-from .rwlock import RWLock
+from .rwlock import RWLock, SnapshotLock
 
 if TYPE_CHECKING:
     from ftllexengine.core.semantic_types import LocaleCode
     from ftllexengine.syntax import Message, Term
 
+    from .attribute_index import AttributeTable
     from .bundle import FluentBundle
     from .bundle_protocols import BundleStateProtocol
     from .cache_config import CacheConfig
+    from .lazy_index import LazyEntry
+    from .resolver_compiled import PatternPlan
+    from .resource_cache import ResourceCache
+    from .static_terms import StaticTerm
 
 logger = logging.getLogger("ftllexengine.runtime.bundle")
 
+type ConcurrencyMode = Literal["rwlock", "snapshot"]
+
+_CONCURRENCY_MODES: frozenset[str] = frozenset({"rwlock", "snapshot"})
+
 
 class _BundleLifecycleMixin:
     """Construction, configuration, and identity behavior for FluentBundle."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0915 - one assignment per bundle state slot
         self: BundleStateProtocol,
         locale: str,
         /,
@@ -46,8 +57,19 @@ class _BundleLifecycleMixin:
         max_nesting_depth: int | None = None,
         max_expansion_size: int | None = None,
         strict: bool = True,
+        compiled: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+        concurrency: ConcurrencyMode = "rwlock",
+        resource_cache: ResourceCache | None = None,
     ) -> None:
         """Initialize bundle state for one locale."""
+        if concurrency not in _CONCURRENCY_MODES:
+            msg = f"concurrency must be 'rwlock' or 'snapshot', got {concurrency!r}"
+            raise ValueError(msg)
+        if lazy and resource_cache is not None:
+            msg = "lazy bundles do not parse on add_resource(); resource_cache must be None"
+            raise ValueError(msg)
         canonical_locale = require_locale_code(locale, "locale")
         locale_context = LocaleContext.create_or_raise(canonical_locale)
         self._locale = locale_context.locale_code
@@ -57,6 +79,15 @@ class _BundleLifecycleMixin:
         self._terms: dict[str, Term] = {}
         self._msg_deps: dict[str, frozenset[str]] = {}
         self._term_deps: dict[str, frozenset[str]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._static_patterns: dict[tuple[str, str | None], str] = {}
+        self._static_terms: dict[tuple[str, str | None], StaticTerm] = {}
+        self._plans: dict[int, PatternPlan] | None = {} if compiled else None
+        self._attributes: dict[int, AttributeTable] = {}
+        self._compactor = EntryCompactor() if compact else None
+        self._entry_trivia: dict[int, EntryTrivia] = {}
+        self._lazy_entries: dict[str, LazyEntry] | None = {} if lazy else None
+        self._lazy_sources: list[tuple[str, str | None]] = []
 
         self._max_source_size = max_source_size if max_source_size is not None else MAX_SOURCE_SIZE
         requested_depth = max_nesting_depth if max_nesting_depth is not None else MAX_DEPTH
@@ -68,7 +99,9 @@ class _BundleLifecycleMixin:
             max_source_size=self._max_source_size,
             max_nesting_depth=self._max_nesting_depth,
         )
-        self._rwlock = RWLock()
+        self._resource_cache = resource_cache
+        self._concurrency: ConcurrencyMode = concurrency
+        self._rwlock = SnapshotLock() if concurrency == "snapshot" else RWLock()
 
         provided_functions: object = functions
         if provided_functions is not None:
@@ -85,8 +118,21 @@ class _BundleLifecycleMixin:
             self._owns_registry = False
 
         self._cache_config = cache
-        self._cache: IntegrityCache | None = None
-        if cache is not None:
+        self._cache: IntegrityCache | ShardedIntegrityCache | None = None
+        if cache is not None and cache.shards > 1:
+            self._cache = ShardedIntegrityCache(
+                maxsize=cache.size,
+                max_entry_weight=cache.max_entry_weight,
+                max_errors_per_entry=cache.max_errors_per_entry,
+                shards=cache.shards,
+                write_once=cache.write_once,
+                strict=cache.integrity_strict and strict,
+                enable_audit=cache.enable_audit,
+                max_audit_entries=cache.max_audit_entries,
+                verification=cache.verification,
+                verification_interval=cache.verification_interval,
+            )
+        elif cache is not None:
             self._cache = IntegrityCache(
                 maxsize=cache.size,
                 max_entry_weight=cache.max_entry_weight,
@@ -95,6 +141,8 @@ class _BundleLifecycleMixin:
                 strict=cache.integrity_strict and strict,
                 enable_audit=cache.enable_audit,
                 max_audit_entries=cache.max_audit_entries,
+                verification=cache.verification,
+                verification_interval=cache.verification_interval,
             )
 
         self._resolver = self._create_resolver()
@@ -121,6 +169,21 @@ class _BundleLifecycleMixin:
         """Get whether strict mode is enabled."""
         return self._strict
 
+    @property
+    def concurrency(self: BundleStateProtocol) -> ConcurrencyMode:
+        """Get the read-path concurrency mode (``"rwlock"`` or ``"snapshot"``)."""
+        return self._concurrency
+
+    @property
+    def compiled(self: BundleStateProtocol) -> bool:
+        """Get whether entries are lowered into compiled resolution plans."""
+        return self._plans is not None
+
+    @property
+    def resource_cache(self: BundleStateProtocol) -> ResourceCache | None:
+        """Get the on-disk parsed resource cache, if any."""
+        return self._resource_cache
+
     @property
     def cache_enabled(self: BundleStateProtocol) -> bool:
         """Get whether format caching is enabled."""
@@ -169,6 +232,11 @@ class _BundleLifecycleMixin:
         max_nesting_depth: int | None = None,
         max_expansion_size: int | None = None,
         strict: bool = True,
+        compiled: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+        concurrency: ConcurrencyMode = "rwlock",
+        resource_cache: ResourceCache | None = None,
     ) -> FluentBundle:
         """Factory method to create a FluentBundle using the system locale."""
         system_locale = get_system_locale(raise_on_failure=True)
@@ -183,6 +251,11 @@ class _BundleLifecycleMixin:
                 max_nesting_depth=max_nesting_depth,
                 max_expansion_size=max_expansion_size,
                 strict=strict,
+                compiled=compiled,
+                compact=compact,
+                lazy=lazy,
+                concurrency=concurrency,
+                resource_cache=resource_cache,
             ),
         )
 
@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import logging
+from itertools import batched
 from typing import TYPE_CHECKING
 
 from ftllexengine.syntax import Resource
 from ftllexengine.validation import validate_resource as _validate_resource_impl
 
+from .prefork import freeze_heap, warm_locale_data
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.diagnostics import ValidationResult
-    from ftllexengine.syntax import Entry, Junk
+    from ftllexengine.syntax import Junk
 
     from .bundle_protocols import BundleStateProtocol
     from .cache import CacheAuditLogEntry, CacheStats
+    from .resource_cache import CompiledResource
 
 logger = logging.getLogger("ftllexengine.runtime.bundle")
 
@@ -40,23 +44,56 @@ class _BundleMutationMixin:
             )
             raise TypeError(msg)
 
+        if self._lazy_entries is not None:
+            return self._add_lazy_resource(self._lazy_entries, raw_source, source_path)
+        if self._resource_cache is not None:
+            compiled = self._resource_cache.load_or_parse(raw_source, self._parser)
+            return self.add_compiled_resource(compiled, source_path=source_path)
         resource = self._parser.parse(raw_source)
         with self._rwlock.write():
             return self._register_resource(resource, source_path)
 
-    def add_resource_stream(
+    def add_compiled_resource(
         self: BundleStateProtocol,
-        lines: Iterable[str],
+        compiled: CompiledResource,
         /,
         *,
         source_path: str | None = None,
     ) -> tuple[Junk, ...]:
-        """Add FTL resource to bundle from a line-oriented source stream."""
-        collected: list[Entry] = list(self._parser.parse_stream(lines))
-        resource = Resource(entries=tuple(collected))
-
+        """Add an already parsed resource (e.g. from ResourceCache or a worker)."""
         with self._rwlock.write():
-            return self._register_resource(resource, source_path)
+            return self._register_resource(
+                compiled.resource, source_path, compiled.dependencies
+            )
+
+    def add_resource_stream(
+        self: BundleStateProtocol,
+        lines: Iterable[str] | Iterable[bytes],
+        /,
+        *,
+        source_path: str | None = None,
+        batch_size: int | None = None,
+        absolute_spans: bool = False,
+    ) -> tuple[Junk, ...]:
+        """Add FTL resource to bundle from a line-oriented source stream.
+
+        With ``batch_size``, every ``batch_size`` parsed entries are registered
+        under their own write lock, so only one batch is held at a time.
+        """
+        if batch_size is not None and batch_size < 1:
+            msg = f"batch_size must be a positive integer, got {batch_size}"
+            raise ValueError(msg)
+        entries = self._parser.parse_stream(lines, absolute_spans=absolute_spans)
+        if batch_size is None:
+            resource = Resource(entries=tuple(entries))
+            with self._rwlock.write():
+                return self._register_resource(resource, source_path)
+
+        junk: list[Junk] = []
+        for batch in batched(entries, batch_size, strict=False):
+            with self._rwlock.write():
+                junk.extend(self._register_resource(Resource(entries=batch), source_path))
+        return tuple(junk)
 
     def validate_resource(self: BundleStateProtocol, source: str) -> ValidationResult:
         """Validate FTL resource without adding to bundle."""
@@ -69,6 +106,7 @@ class _BundleMutationMixin:
             )
             raise TypeError(msg)
 
+        self._materialize_all()
         with self._rwlock.read():
             return _validate_resource_impl(
                 raw_source,
@@ -86,7 +124,11 @@ class _BundleMutationMixin:
     ) -> None:
         """Add custom function to bundle."""
         with self._rwlock.write():
-            if not self._owns_registry:
+            if self._concurrency == "snapshot":
+                # Lock-free readers may hold the current registry; publish a copy.
+                self._function_registry = self._function_registry.copy()
+                self._owns_registry = True
+            elif not self._owns_registry:
                 self._function_registry = self._function_registry.copy()
                 self._owns_registry = True
                 logger.debug("Registry copied on first add_function")
@@ -106,6 +148,17 @@ class _BundleMutationMixin:
                 self._cache.clear()
                 logger.debug("Cache manually cleared")
 
+    def prepare_for_fork(self: BundleStateProtocol, *, freeze: bool = True) -> None:
+        """Build lazily created locale state and freeze the heap before forking.
+
+        Call in a pre-fork master after all resources are added. With
+        ``freeze=False`` only the locale state is built, leaving ``gc.freeze()``
+        to the caller (e.g. after preparing several bundles).
+        """
+        warm_locale_data(self._locale)
+        if freeze:
+            freeze_heap()
+
     def get_cache_stats(self: BundleStateProtocol) -> CacheStats | None:
         """Get cache statistics."""
         if self._cache is not None:
@@ -5,28 +5,43 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, NoReturn, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
     from ftllexengine.core.semantic_types import LocaleCode
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.diagnostics import ErrorCategory, FrozenFluentError
     from ftllexengine.diagnostics.codes import DiagnosticCode
+    from ftllexengine.runtime.attribute_index import AttributeTable
+    from ftllexengine.runtime.bundle_lifecycle import ConcurrencyMode
     from ftllexengine.runtime.bundle_registration import _PendingRegistration
     from ftllexengine.runtime.cache import IntegrityCache
     from ftllexengine.runtime.cache_config import CacheConfig
+    from ftllexengine.runtime.cache_sharded import ShardedIntegrityCache
+    from ftllexengine.runtime.compact_storage import EntryCompactor, EntryTrivia
     from ftllexengine.runtime.function_bridge import FunctionRegistry
+    from ftllexengine.runtime.lazy_index import LazyEntry
     from ftllexengine.runtime.resolver import FluentResolver
-    from ftllexengine.runtime.rwlock import RWLock
-    from ftllexengine.syntax import Junk, Message, Resource, Term
+    from ftllexengine.runtime.resolver_compiled import PatternPlan
+    from ftllexengine.runtime.resource_cache import CompiledResource, ResourceCache
+    from ftllexengine.runtime.rwlock import RWLock, SnapshotLock
+    from ftllexengine.runtime.static_terms import StaticTerm
+    from ftllexengine.syntax import Entry, Junk, Message, Resource, Term
     from ftllexengine.syntax.parser import FluentParserV1
 
 
 class BundleStateProtocol(Protocol):
     """Structural contract implemented by FluentBundle for its mixins."""
 
-    _cache: IntegrityCache | None
+    _attributes: dict[int, AttributeTable]
+    _cache: IntegrityCache | ShardedIntegrityCache | None
     _cache_config: CacheConfig | None
+    _compactor: EntryCompactor | None
+    _concurrency: ConcurrencyMode
+    _dependents: dict[str, set[str]]
+    _entry_trivia: dict[int, EntryTrivia]
     _function_registry: FunctionRegistry
+    _lazy_entries: dict[str, LazyEntry] | None
+    _lazy_sources: list[tuple[str, str | None]]
     _locale: LocaleCode
     _max_expansion_size: int
     _max_nesting_depth: int
@@ -35,22 +50,145 @@ class BundleStateProtocol(Protocol):
     _msg_deps: dict[str, frozenset[str]]
     _owns_registry: bool
     _parser: FluentParserV1
+    _plans: dict[int, PatternPlan] | None
     _resolver: FluentResolver
-    _rwlock: RWLock
+    _resource_cache: ResourceCache | None
+    _rwlock: RWLock | SnapshotLock
+    _static_patterns: dict[tuple[str, str | None], str]
+    _static_terms: dict[tuple[str, str | None], StaticTerm]
     _strict: bool
     _term_deps: dict[str, frozenset[str]]
     _terms: dict[str, Term]
     _use_isolating: bool
 
-    def _collect_pending_entries(self, resource: Resource) -> _PendingRegistration:
+    def _collect_pending_entries(
+        self,
+        resource: Resource,
+        dependencies: tuple[frozenset[str] | None, ...] | None = None,
+    ) -> _PendingRegistration:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _compile_pending_entries(self, pending: _PendingRegistration) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _collect_static_patterns(
+        self, message: Message, pending: _PendingRegistration
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _commit_static_patterns(
+        self,
+        pending: _PendingRegistration,
+        static_patterns: dict[tuple[str, str | None], str],
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _compact_pending_entry[EntryT: (Message, Term)](
+        self,
+        entry: EntryT,
+        previous: Message | Term | None,
+        pending: _PendingRegistration,
+    ) -> EntryT:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _commit_entry_trivia(
+        self,
+        pending: _PendingRegistration,
+        entry_trivia: dict[int, EntryTrivia],
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _discard_pending_entries(self, pending: _PendingRegistration) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _commit_attributes(
+        self,
+        pending: _PendingRegistration,
+        attributes: dict[int, AttributeTable],
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _full_entry[EntryT: (Message, Term)](self, entry: EntryT) -> EntryT:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _commit_pending(self, pending: _PendingRegistration) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _index_dependents(self, pending: _PendingRegistration) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _transitive_dependents(self, keys: Iterable[str]) -> dict[str, None]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _invalidate_dependents(self, keys: Iterable[str]) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _commit_static_terms(
+        self,
+        pending: _PendingRegistration,
+        static_terms: dict[tuple[str, str | None], StaticTerm],
+        terms: dict[str, Term],
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _raise_syntax_error(
+        self,
+        junk_tuple: tuple[Junk, ...],
+        source_path: str | None,
+        operation: str,
+    ) -> NoReturn:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _add_lazy_resource(
+        self,
+        lazy_entries: dict[str, LazyEntry],
+        source: str,
+        source_path: str | None,
+    ) -> tuple[Junk, ...]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _materialize_message(self, message_id: str) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _materialize_term(self, term_id: str) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _materialize_all(self) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _materialize_locked(self, keys: Iterable[str]) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _parse_lazy_entry(
+        self,
+        lazy_entries: dict[str, LazyEntry],
+        key: str,
+        lazy_entry: LazyEntry,
+        parsed: set[str],
+    ) -> tuple[Entry, ...]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _publish_snapshot(self, pending: _PendingRegistration) -> None:
         ...  # pragma: no cover - typing-only protocol declaration
 
     def _register_resource(
-        self, resource: Resource, source_path: str | None
+        self,
+        resource: Resource,
+        source_path: str | None,
+        dependencies: tuple[frozenset[str] | None, ...] | None = None,
     ) -> tuple[Junk, ...]:
         ...  # pragma: no cover - typing-only protocol declaration
 
-    def _create_resolver(self) -> FluentResolver:
+    def add_compiled_resource(
+        self, compiled: CompiledResource, /, *, source_path: str | None = None
+    ) -> tuple[Junk, ...]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _create_resolver(
+        self,
+        messages: dict[str, Message] | None = None,
+        terms: dict[str, Term] | None = None,
+    ) -> FluentResolver:
         ...  # pragma: no cover - typing-only protocol declaration
 
     def _raise_strict_error(
@@ -93,5 +231,23 @@ class BundleStateProtocol(Protocol):
         message_id: str,
         args: Mapping[str, FluentValue] | None,
         attribute: str | None,
+        *,
+        lookup: bool = True,
     ) -> tuple[str, tuple[FrozenFluentError, ...]]:
         ...  # pragma: no cover - typing-only protocol declaration
+
+    def _resolve_and_cache(
+        self,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+    ) -> tuple[str, tuple[FrozenFluentError, ...]]:
+        ...  # pragma: no cover - typing-only protocol declaration
+
+    def _format_many_impl(
+        self,
+        batch: tuple[tuple[str, Mapping[str, FluentValue] | None], ...],
+        *,
+        missed_first: bool,
+    ) -> tuple[tuple[str, tuple[FrozenFluentError, ...]], ...]:
+        ...  # pragma: no cover - typing-only protocol declaration
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from ftllexengine.introspection import extract_variables, introspect_message
 
+from .compact_storage import EntryCompactor
+
 if TYPE_CHECKING:
     from ftllexengine.introspection import MessageIntrospection
     from ftllexengine.runtime.bundle_protocols import BundleStateProtocol
@@ -15,8 +17,24 @@ if TYPE_CHECKING:
 class _BundleQueryMixin:
     """Read-only query behavior for FluentBundle."""
 
+    @property
+    def compact(self: BundleStateProtocol) -> bool:
+        """Get whether entries are stored span-free with shared subtrees."""
+        return self._compactor is not None
+
+    def _full_entry[EntryT: (Message, Term)](
+        self: BundleStateProtocol, entry: EntryT
+    ) -> EntryT:
+        """Return the entry with spans and comment, rebuilding compact entries."""
+        trivia = self._entry_trivia.get(id(entry))
+        if trivia is None or trivia.entry is not entry:
+            # Not compact, or replaced by a concurrent snapshot publication.
+            return entry
+        return cast("EntryT", EntryCompactor.restore(trivia))
+
     def has_message(self: BundleStateProtocol, message_id: str) -> bool:
         """Return whether the bundle contains ``message_id``."""
+        self._materialize_message(message_id)
         with self._rwlock.read():
             return message_id in self._messages
 
@@ -24,6 +42,7 @@ class _BundleQueryMixin:
         self: BundleStateProtocol, message_id: str, attribute: str
     ) -> bool:
         """Return whether ``message_id`` exposes ``attribute``."""
+        self._materialize_message(message_id)
         with self._rwlock.read():
             message = self._messages.get(message_id)
             if message is None:
@@ -32,6 +51,7 @@ class _BundleQueryMixin:
 
     def get_message_ids(self: BundleStateProtocol) -> list[str]:
         """Return message IDs in insertion order."""
+        self._materialize_all()
         with self._rwlock.read():
             return list(self._messages.keys())
 
@@ -39,6 +59,7 @@ class _BundleQueryMixin:
         self: BundleStateProtocol, message_id: str
     ) -> frozenset[str]:
         """Return the variables referenced by one message."""
+        self._materialize_message(message_id)
         with self._rwlock.read():
             if message_id not in self._messages:
                 msg = f"Message '{message_id}' not found"
@@ -49,6 +70,7 @@ class _BundleQueryMixin:
         self: BundleStateProtocol,
     ) -> dict[str, frozenset[str]]:
         """Return variables for every registered message."""
+        self._materialize_all()
         with self._rwlock.read():
             return {
                 message_id: frozenset(extract_variables(message))
@@ -59,30 +81,36 @@ class _BundleQueryMixin:
         self: BundleStateProtocol, message_id: str
     ) -> MessageIntrospection:
         """Return structured introspection for ``message_id``."""
+        self._materialize_message(message_id)
         with self._rwlock.read():
             if message_id not in self._messages:
                 msg = f"Message '{message_id}' not found"
                 raise KeyError(msg)
-            return introspect_message(self._messages[message_id])
+            return introspect_message(self._full_entry(self._messages[message_id]))
 
     def introspect_term(
         self: BundleStateProtocol, term_id: str
     ) -> MessageIntrospection:
         """Return structured introspection for ``term_id``."""
+        self._materialize_term(term_id)
         with self._rwlock.read():
             if term_id not in self._terms:
                 msg = f"Term '{term_id}' not found"
                 raise KeyError(msg)
-            return introspect_message(self._terms[term_id])
+            return introspect_message(self._full_entry(self._terms[term_id]))
 
     def get_message(
         self: BundleStateProtocol, message_id: str
     ) -> Message | None:
         """Return the raw message AST node when present."""
+        self._materialize_message(message_id)
         with self._rwlock.read():
-            return self._messages.get(message_id)
+            message = self._messages.get(message_id)
+            return None if message is None else self._full_entry(message)
 
     def get_term(self: BundleStateProtocol, term_id: str) -> Term | None:
         """Return the raw term AST node when present."""
+        self._materialize_term(term_id)
         with self._rwlock.read():
-            return self._terms.get(term_id)
+            term = self._terms.get(term_id)
+            return None if term is None else self._full_entry(term)
@@ -4,16 +4,29 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Literal, assert_never
+from typing import TYPE_CHECKING, Literal, NoReturn, assert_never
 
 from ftllexengine.core.reference_graph import entry_dependency_set
 from ftllexengine.integrity import IntegrityContext, SyntaxIntegrityError
 from ftllexengine.introspection import extract_references
-from ftllexengine.syntax import Comment, Junk, Message, Resource, Term
+from ftllexengine.runtime.attribute_index import index_attributes
+from ftllexengine.runtime.bundle_lazy import _entry_keys
+from ftllexengine.runtime.resolver import FluentResolver
+from ftllexengine.runtime.resolver_compiled import iter_entry_patterns
+from ftllexengine.runtime.static_terms import render_static_terms
+from ftllexengine.syntax import Comment, Junk, Message, Resource, Term, TextElement
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ftllexengine.runtime.attribute_index import AttributeTable
     from ftllexengine.runtime.bundle_protocols import BundleStateProtocol
+    from ftllexengine.runtime.compact_storage import EntryTrivia
+    from ftllexengine.runtime.resolver_compiled import PatternPlan
+    from ftllexengine.runtime.static_terms import StaticTerm
+    from ftllexengine.syntax import Pattern
 
 logger = logging.getLogger("ftllexengine.runtime.bundle")
 
@@ -30,31 +43,326 @@ class _PendingRegistration:
     term_deps: dict[str, frozenset[str]] = field(default_factory=dict)
     junk: list[Junk] = field(default_factory=list)
     overwrite_warnings: list[tuple[Literal["message", "term"], str]] = field(default_factory=list)
+    static_patterns: dict[tuple[str, str | None], str] = field(default_factory=dict)
+    trivia: dict[int, EntryTrivia] = field(default_factory=dict)
+
+
+def _static_text(pattern: Pattern) -> str | None:
+    """Return the final text of a placeable-free pattern, or None."""
+    parts: list[str] = []
+    for element in pattern.elements:
+        if not isinstance(element, TextElement):
+            return None
+        parts.append(element.value)
+    return "".join(parts)
+
+
+def _drop_static_patterns(
+    static_patterns: dict[tuple[str, str | None], str], message: Message
+) -> None:
+    """Remove pre-rendered text recorded for a message that is being replaced."""
+    msg_id = message.id.name
+    static_patterns.pop((msg_id, None), None)
+    for attr in message.attributes:
+        static_patterns.pop((msg_id, attr.id.name), None)
 
 
 class _BundleRegistrationMixin:
     """Resource registration behavior for FluentBundle."""
 
+    def _collect_static_patterns(
+        self: BundleStateProtocol, message: Message, pending: _PendingRegistration
+    ) -> None:
+        """Record pre-rendered text for the placeable-free patterns of a message.
+
+        Text that would overflow ``max_expansion_size`` is left to the resolver
+        so the budget error is still reported. Cached bundles skip this so every
+        lookup stays visible in cache statistics and the audit log.
+        """
+        if self._cache is not None:
+            return
+        msg_id = message.id.name
+        previous = pending.messages.get(msg_id)
+        if previous is not None:
+            _drop_static_patterns(pending.static_patterns, previous)
+        candidates: list[tuple[str | None, Pattern]] = [
+            (attr.id.name, attr.value) for attr in message.attributes
+        ]
+        if message.value is not None:
+            candidates.append((None, message.value))
+        for attribute, pattern in candidates:
+            text = _static_text(pattern)
+            if text is None or len(text) > self._max_expansion_size:
+                # Last-wins: a dynamic duplicate attribute shadows an earlier static one.
+                pending.static_patterns.pop((msg_id, attribute), None)
+                continue
+            pending.static_patterns[(msg_id, attribute)] = text
+
+    def _commit_static_patterns(
+        self: BundleStateProtocol,
+        pending: _PendingRegistration,
+        static_patterns: dict[tuple[str, str | None], str],
+    ) -> None:
+        """Replace pre-rendered text for every message in a pending registration."""
+        for msg_id in pending.messages:
+            previous = self._messages.get(msg_id)
+            if previous is not None:
+                _drop_static_patterns(static_patterns, previous)
+        static_patterns.update(pending.static_patterns)
+
+    def _compact_pending_entry[EntryT: (Message, Term)](
+        self: BundleStateProtocol,
+        entry: EntryT,
+        previous: Message | Term | None,
+        pending: _PendingRegistration,
+    ) -> EntryT:
+        """Return the compact form of an entry when compact storage is enabled.
+
+        ``previous`` is an entry with the same ID earlier in the same resource;
+        its restore record and interned subtrees are dropped along with it.
+        """
+        compactor = self._compactor
+        if compactor is None:
+            return entry
+        if previous is not None:
+            pending.trivia.pop(id(previous), None)
+            compactor.release(previous)
+        compact_entry, trivia = compactor.compact(entry)
+        pending.trivia[id(compact_entry)] = trivia
+        return compact_entry
+
+    def _commit_entry_trivia(
+        self: BundleStateProtocol,
+        pending: _PendingRegistration,
+        entry_trivia: dict[int, EntryTrivia],
+    ) -> None:
+        """Replace restore records for every entry in a pending registration.
+
+        Replaced entries also release their interned subtrees.
+        """
+        compactor = self._compactor
+        if compactor is None:
+            return
+        for msg_id in pending.messages:
+            previous = self._messages.get(msg_id)
+            if previous is not None:
+                entry_trivia.pop(id(previous), None)
+                compactor.release(previous)
+        for term_id in pending.terms:
+            previous_term = self._terms.get(term_id)
+            if previous_term is not None:
+                entry_trivia.pop(id(previous_term), None)
+                compactor.release(previous_term)
+        entry_trivia.update(pending.trivia)
+
+    def _discard_pending_entries(self: BundleStateProtocol, pending: _PendingRegistration) -> None:
+        """Release the interned subtrees of a pending registration that is not committed."""
+        compactor = self._compactor
+        if compactor is not None:
+            entries: tuple[Message | Term, ...] = (
+                *pending.messages.values(),
+                *pending.terms.values(),
+            )
+            for entry in entries:
+                compactor.release(entry)
+
+    def _commit_attributes(
+        self: BundleStateProtocol,
+        pending: _PendingRegistration,
+        attributes: dict[int, AttributeTable],
+    ) -> None:
+        """Replace attribute tables for every entry in a pending registration."""
+        for msg_id in pending.messages:
+            previous = self._messages.get(msg_id)
+            if previous is not None:
+                attributes.pop(id(previous), None)
+        for term_id in pending.terms:
+            previous_term = self._terms.get(term_id)
+            if previous_term is not None:
+                attributes.pop(id(previous_term), None)
+        attributes.update(
+            index_attributes((*pending.messages.values(), *pending.terms.values()))
+        )
+
+    def _commit_pending(self: BundleStateProtocol, pending: _PendingRegistration) -> None:
+        """Apply pending entries in place, or publish a snapshot in snapshot mode.
+
+        Lazily indexed definitions of the committed IDs are superseded and
+        dropped only after the entries are visible.
+        """
+        self._index_dependents(pending)
+        if self._concurrency == "snapshot":
+            self._publish_snapshot(pending)
+        else:
+            self._compile_pending_entries(pending)
+            self._commit_static_patterns(pending, self._static_patterns)
+            self._commit_entry_trivia(pending, self._entry_trivia)
+            self._commit_attributes(pending, self._attributes)
+            self._messages.update(pending.messages)
+            self._terms.update(pending.terms)
+            self._commit_static_terms(pending, self._static_terms, self._terms)
+            self._msg_deps.update(pending.msg_deps)
+            self._term_deps.update(pending.term_deps)
+        lazy_entries = self._lazy_entries
+        if lazy_entries:
+            for msg_id in pending.messages:
+                lazy_entries.pop(f"msg:{msg_id}", None)
+            for term_id in pending.terms:
+                lazy_entries.pop(f"term:{term_id}", None)
+
+    def _index_dependents(self: BundleStateProtocol, pending: _PendingRegistration) -> None:
+        """Update the reverse-dependency index for the entries being committed.
+
+        ``_dependents`` maps an entry key (``msg:id`` or ``term:id``) to the keys
+        of the entries that reference it directly. Only writers read it, so it
+        is updated in place in every concurrency mode.
+        """
+        dependents = self._dependents
+        for kind, registered, committed in (
+            ("msg", self._msg_deps, pending.msg_deps),
+            ("term", self._term_deps, pending.term_deps),
+        ):
+            for entry_id, deps in committed.items():
+                key = f"{kind}:{entry_id}"
+                for dep in _entry_keys(registered.get(entry_id, ())):
+                    referrers = dependents.get(dep)
+                    if referrers is not None:
+                        referrers.discard(key)
+                for dep in _entry_keys(deps):
+                    dependents.setdefault(dep, set()).add(key)
+
+    def _transitive_dependents(self: BundleStateProtocol, keys: Iterable[str]) -> dict[str, None]:
+        """Return ``keys`` and every entry key that transitively references them."""
+        dependents = self._dependents
+        reached = dict.fromkeys(keys)
+        queue = deque(reached)
+        while queue:
+            for referrer in dependents.get(queue.popleft(), ()):
+                if referrer not in reached:
+                    reached[referrer] = None
+                    queue.append(referrer)
+        return reached
+
+    def _invalidate_dependents(self: BundleStateProtocol, keys: Iterable[str]) -> None:
+        """Evict cached results that may depend on the (re)defined entries ``keys``.
+
+        New definitions count too: referrers may have cached the fallback for a
+        missing reference. Results of messages that do not transitively
+        reference any of ``keys`` stay cached.
+        """
+        if self._cache is None:
+            return
+        stale = self._transitive_dependents(keys)
+        message_ids = {key[4:] for key in stale if key.startswith("msg:")}
+        evicted = self._cache.invalidate(message_ids) if message_ids else 0
+        logger.debug("Invalidated %d cache entries for %d messages", evicted, len(message_ids))
+
+    def _commit_static_terms(
+        self: BundleStateProtocol,
+        pending: _PendingRegistration,
+        static_terms: dict[tuple[str, str | None], StaticTerm],
+        terms: dict[str, Term],
+    ) -> None:
+        """Re-render the pre-resolved terms that the pending terms can change.
+
+        ``terms`` already holds the pending terms. Static terms only reference
+        other terms, so only terms that transitively reference a pending term
+        are dropped and rendered again.
+        """
+        if not pending.terms:
+            return
+        stale = {
+            key[5:]
+            for key in self._transitive_dependents(f"term:{term_id}" for term_id in pending.terms)
+            if key.startswith("term:")
+        }
+        for key in [key for key in static_terms if key[0] in stale]:
+            del static_terms[key]
+        render_static_terms(
+            terms,
+            stale,
+            static_terms,
+            use_isolating=self._use_isolating,
+            max_depth=self._max_nesting_depth,
+            max_expansion_size=self._max_expansion_size,
+        )
+
+    def _publish_snapshot(self: BundleStateProtocol, pending: _PendingRegistration) -> None:
+        """Build new registries from pending entries and publish them by reference swap.
+
+        Nothing a concurrent lock-free reader may hold is mutated. The resolver
+        and restore records are published before the message registry so a
+        reader that sees a new message always resolves it against registries
+        that contain it.
+        """
+        if self._plans is not None:
+            # The published resolver keeps reading the previous plan table.
+            plans: dict[int, PatternPlan] | None = dict(self._plans)
+            self._plans = plans
+        self._compile_pending_entries(pending)
+        static_patterns = dict(self._static_patterns)
+        self._commit_static_patterns(pending, static_patterns)
+        entry_trivia = dict(self._entry_trivia)
+        self._commit_entry_trivia(pending, entry_trivia)
+        attributes = dict(self._attributes)
+        self._commit_attributes(pending, attributes)
+        messages = {**self._messages, **pending.messages}
+        terms = {**self._terms, **pending.terms}
+        static_terms = dict(self._static_terms)
+        self._commit_static_terms(pending, static_terms, terms)
+
+        self._static_terms = static_terms
+        self._attributes = attributes
+        self._resolver = self._create_resolver(messages, terms)
+        self._terms = terms
+        self._entry_trivia = entry_trivia
+        self._messages = messages
+        self._msg_deps = {**self._msg_deps, **pending.msg_deps}
+        self._term_deps = {**self._term_deps, **pending.term_deps}
+        self._static_patterns = static_patterns
+
     def _collect_pending_entries(
-        self: BundleStateProtocol, resource: Resource
+        self: BundleStateProtocol,
+        resource: Resource,
+        dependencies: tuple[frozenset[str] | None, ...] | None = None,
     ) -> _PendingRegistration:
-        """Collect parsed entries without mutating bundle state."""
+        """Collect parsed entries without mutating bundle state.
+
+        ``dependencies`` holds precomputed per-entry dependency sets (as loaded
+        from a ResourceCache); when None they are extracted from the AST.
+        """
         pending = _PendingRegistration()
 
-        for entry in resource.entries:
+        for index, entry in enumerate(resource.entries):
+            known_deps = dependencies[index] if dependencies is not None else None
             match entry:
                 case Message():
                     msg_id = entry.id.name
                     if msg_id in self._messages or msg_id in pending.messages:
                         pending.overwrite_warnings.append(("message", msg_id))
+                    entry = self._compact_pending_entry(  # noqa: PLW2901 - stored form
+                        entry, pending.messages.get(msg_id), pending
+                    )
+                    self._collect_static_patterns(entry, pending)
                     pending.messages[msg_id] = entry
-                    pending.msg_deps[msg_id] = entry_dependency_set(*extract_references(entry))
+                    pending.msg_deps[msg_id] = (
+                        known_deps
+                        if known_deps is not None
+                        else entry_dependency_set(*extract_references(entry))
+                    )
                 case Term():
                     term_id = entry.id.name
                     if term_id in self._terms or term_id in pending.terms:
                         pending.overwrite_warnings.append(("term", term_id))
+                    entry = self._compact_pending_entry(  # noqa: PLW2901 - stored form
+                        entry, pending.terms.get(term_id), pending
+                    )
                     pending.terms[term_id] = entry
-                    pending.term_deps[term_id] = entry_dependency_set(*extract_references(entry))
+                    pending.term_deps[term_id] = (
+                        known_deps
+                        if known_deps is not None
+                        else entry_dependency_set(*extract_references(entry))
+                    )
                 case Junk():
                     pending.junk.append(entry)
                 case Comment():
@@ -64,38 +372,71 @@ class _BundleRegistrationMixin:
 
         return pending
 
+    def _compile_pending_entries(
+        self: BundleStateProtocol, pending: _PendingRegistration
+    ) -> None:
+        """Lower pending entries into resolution plans, dropping replaced plans."""
+        plans = self._plans
+        if plans is None:
+            return
+        entries: list[tuple[Message | Term | None, Message | Term]] = [
+            (self._messages.get(msg_id), message)
+            for msg_id, message in pending.messages.items()
+        ]
+        entries.extend(
+            (self._terms.get(term_id), term) for term_id, term in pending.terms.items()
+        )
+        for previous, entry in entries:
+            if previous is not None:
+                for pattern in iter_entry_patterns(previous):
+                    plans.pop(id(pattern), None)
+            plans.update(FluentResolver.compile_entry(entry))
+
+    def _raise_syntax_error(
+        self: BundleStateProtocol,
+        junk_tuple: tuple[Junk, ...],
+        source_path: str | None,
+        operation: str,
+    ) -> NoReturn:
+        """Raise SyntaxIntegrityError for Junk found in strict mode."""
+        source_desc = source_path or "<string>"
+        error_summary = "; ".join(repr(junk.content[:50]) for junk in junk_tuple[:3])
+        if len(junk_tuple) > 3:
+            error_summary += f" (and {len(junk_tuple) - 3} more)"
+
+        context = IntegrityContext(
+            component="bundle",
+            operation=operation,
+            key=source_desc,
+            expected="<no syntax errors>",
+            actual=f"<{len(junk_tuple)} syntax error(s)>",
+            timestamp=time.monotonic(),
+            wall_time_unix=time.time(),
+        )
+        msg = (
+            f"Strict mode: {len(junk_tuple)} syntax error(s) in "
+            f"{source_desc}: {error_summary}"
+        )
+        raise SyntaxIntegrityError(
+            msg,
+            context=context,
+            junk_entries=junk_tuple,
+            source_path=source_path,
+        )
+
     def _register_resource(
-        self: BundleStateProtocol, resource: Resource, source_path: str | None
+        self: BundleStateProtocol,
+        resource: Resource,
+        source_path: str | None,
+        dependencies: tuple[frozenset[str] | None, ...] | None = None,
     ) -> tuple[Junk, ...]:
         """Register parsed resource entries via a two-phase commit."""
-        pending = self._collect_pending_entries(resource)
+        pending = self._collect_pending_entries(resource, dependencies)
         junk_tuple = tuple(pending.junk)
 
         if self._strict and junk_tuple:
-            source_desc = source_path or "<string>"
-            error_summary = "; ".join(repr(junk.content[:50]) for junk in junk_tuple[:3])
-            if len(junk_tuple) > 3:
-                error_summary += f" (and {len(junk_tuple) - 3} more)"
-
-            context = IntegrityContext(
-                component="bundle",
-                operation="add_resource",
-                key=source_desc,
-                expected="<no syntax errors>",
-                actual=f"<{len(junk_tuple)} syntax error(s)>",
-                timestamp=time.monotonic(),
-                wall_time_unix=time.time(),
-            )
-            msg = (
-                f"Strict mode: {len(junk_tuple)} syntax error(s) in "
-                f"{source_desc}: {error_summary}"
-            )
-            raise SyntaxIntegrityError(
-                msg,
-                context=context,
-                junk_entries=junk_tuple,
-                source_path=source_path,
-            )
+            self._discard_pending_entries(pending)
+            self._raise_syntax_error(junk_tuple, source_path, "add_resource")
 
         for entry_type, entry_id in pending.overwrite_warnings:
             if entry_type == "message":
@@ -109,10 +450,11 @@ class _BundleRegistrationMixin:
                     entry_id,
                 )
 
-        self._messages.update(pending.messages)
-        self._terms.update(pending.terms)
-        self._msg_deps.update(pending.msg_deps)
-        self._term_deps.update(pending.term_deps)
+        self._commit_pending(pending)
+        if self._lazy_entries:
+            self._materialize_locked(
+                frozenset().union(*pending.msg_deps.values(), *pending.term_deps.values())
+            )
 
         for msg_id in pending.messages:
             logger.debug("Registered message: %s", msg_id)
@@ -143,8 +485,9 @@ class _BundleRegistrationMixin:
                 len(pending.junk),
             )
 
-        if self._cache is not None:
-            self._cache.clear()
-            logger.debug("Cache cleared after add_resource")
+        self._invalidate_dependents(
+            [f"msg:{msg_id}" for msg_id in pending.messages]
+            + [f"term:{term_id}" for term_id in pending.terms]
+        )
 
         return junk_tuple
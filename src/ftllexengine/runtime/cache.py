@@ -1,11 +1,12 @@
 """Thread-safe LRU cache with integrity verification for message formatting.
 
 Provides financial-grade caching of format_pattern() calls with:
-- BLAKE2b-128 checksum verification on every get/put
+- BLAKE2b-128 checksums computed on every put, verified on get per the
+  configured verification tier (always, sampled, or on_write)
 - Write-once semantics (optional) for data race prevention
 - Audit logging (optional) for post-mortem analysis
 - Immutable cache entries (frozen dataclasses)
-- Automatic invalidation on resource/function changes
+- Per-message invalidation on resource changes (full clear on function changes)
 
 Architecture:
     - Thread-safe using threading.Lock
@@ -37,15 +38,13 @@ from threading import Lock
 from typing import TYPE_CHECKING, final
 
 from ftllexengine.constants import DEFAULT_CACHE_SIZE, DEFAULT_MAX_ENTRY_WEIGHT
-from ftllexengine.integrity import (
-    CacheCorruptionError,
-    IntegrityContext,
-    WriteConflictError,
-)
+from ftllexengine.integrity import CacheCorruptionError, IntegrityContext, WriteConflictError
 from ftllexengine.runtime.cache_audit import _CacheAuditMixin
 from ftllexengine.runtime.cache_introspection import _CacheKeyMixin, _CacheStatsMixin
+from ftllexengine.runtime.cache_invalidation import _CacheInvalidationMixin
 from ftllexengine.runtime.cache_types import (
     _DEFAULT_MAX_ERRORS_PER_ENTRY,
+    VERIFICATION_TIERS,
     CacheAuditLogEntry,
     CacheStats,
     HashableValue,
@@ -54,12 +53,14 @@ from ftllexengine.runtime.cache_types import (
     _CacheKey,
     _estimate_error_weight,
 )
+from ftllexengine.runtime.cache_verification import _CacheVerificationMixin
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.diagnostics import FrozenFluentError
+    from ftllexengine.runtime.cache_types import CacheVerification
 
 __all__ = [
     "CacheAuditLogEntry",
@@ -72,11 +73,17 @@ __all__ = [
 
 
 @final
-class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
+class IntegrityCache(
+    _CacheStatsMixin,
+    _CacheAuditMixin,
+    _CacheKeyMixin,
+    _CacheVerificationMixin,
+    _CacheInvalidationMixin,
+):
     """Financial-grade format cache with integrity verification.
 
     Thread-safe LRU cache that provides:
-    - BLAKE2b-128 checksum verification on every get()
+    - BLAKE2b-128 checksum verification on get() (every hit by default)
     - Write-once semantics (optional) to prevent data races
     - Audit logging (optional) for compliance and debugging
     - Fail-fast on corruption (strict mode) or silent eviction
@@ -94,7 +101,7 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         (message text, diagnostic fields, resolution path strings, context fields).
 
     Integrity Guarantees:
-        - Checksums computed on put(), verified on get()
+        - Checksums computed on put(), verified on get() per verification tier
         - Corruption detected via BLAKE2b-128 mismatch
         - Write-once mode prevents overwrites (data race protection)
         - Audit log provides complete operation history
@@ -124,6 +131,7 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         "_error_bloat_skips",
         "_hits",
         "_idempotent_writes",
+        "_invalidated_entries",
         "_lock",
         "_max_audit_entries",
         "_max_entry_weight",
@@ -131,9 +139,15 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         "_maxsize",
         "_misses",
         "_oversize_skips",
+        "_retained_entries",
         "_sequence",
         "_strict",
         "_unhashable_skips",
+        "_verification",
+        "_verification_skips",
+        "_verifications",
+        "_verify_countdown",
+        "_verify_interval",
         "_write_once",
         "_write_once_conflicts",
     )
@@ -148,6 +162,8 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         strict: bool = True,
         enable_audit: bool = False,
         max_audit_entries: int = 10000,
+        verification: CacheVerification = "always",
+        verification_interval: int = 16,
     ) -> None:
         """Initialize integrity cache.
 
@@ -163,9 +179,13 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
                 If False, silently evict corrupted entries and return cache miss.
             enable_audit: If True, maintain audit log of all operations (default: False).
             max_audit_entries: Maximum audit log entries before oldest are evicted (default: 10000).
+            verification: Hit verification tier (default: "always"). "sampled" verifies
+                every ``verification_interval``-th hit; "on_write" never re-verifies hits.
+            verification_interval: Hit interval for the "sampled" tier (default: 16).
 
         Raises:
-            ValueError: If maxsize, max_entry_weight, or max_errors_per_entry is not positive
+            ValueError: If maxsize, max_entry_weight, max_errors_per_entry, or
+                verification_interval is not positive, or verification is unknown
         """
         if maxsize <= 0:
             msg = "maxsize must be positive"
@@ -176,6 +196,12 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         if max_errors_per_entry <= 0:
             msg = "max_errors_per_entry must be positive"
             raise ValueError(msg)
+        if verification not in VERIFICATION_TIERS:
+            msg = f"verification must be one of {VERIFICATION_TIERS}, got {verification!r}"
+            raise ValueError(msg)
+        if verification_interval <= 0:
+            msg = "verification_interval must be positive"
+            raise ValueError(msg)
 
         self._cache: OrderedDict[_CacheKey, IntegrityCacheEntry] = OrderedDict()
         self._maxsize = maxsize
@@ -191,6 +217,13 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         )
         self._max_audit_entries = max_audit_entries
 
+        # Hit verification: interval 1 verifies every hit, 0 never re-verifies
+        self._verification = verification
+        self._verify_interval = {"always": 1, "sampled": verification_interval}.get(
+            verification, 0
+        )
+        self._verify_countdown = self._verify_interval
+
         # Statistics
         self._hits = 0
         self._misses = 0
@@ -201,6 +234,10 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         self._corruption_detected = 0
         self._idempotent_writes = 0
         self._write_once_conflicts = 0
+        self._verifications = 0
+        self._verification_skips = 0
+        self._invalidated_entries = 0
+        self._retained_entries = 0
         self._sequence = 0
 
     def get(
@@ -230,7 +267,12 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
             CacheCorruptionError: If strict=True and checksum mismatch detected
         """
         key = self._make_key(message_id, args, attribute, locale_code, use_isolating=use_isolating)
+        return self._get_keyed(key, message_id)
 
+    def _get_keyed(
+        self, key: _CacheKey | None, message_id: str
+    ) -> IntegrityCacheEntry | None:
+        """Look up an already-built key (shared by get() and sharded lookups)."""
         if key is None:
             with self._lock:
                 self._unhashable_skips += 1
@@ -248,54 +290,8 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
                 self._audit("MISS", key, None)
                 return None
 
-            # INTEGRITY CHECK: Verify checksum before returning
-            if not entry.verify():
-                self._corruption_detected += 1
-                self._audit("CORRUPTION", key, entry)
-
-                if self._strict:
-                    # Fail-fast: raise immediately
-                    context = IntegrityContext(
-                        component="cache",
-                        operation="get",
-                        key=message_id,
-                        expected=entry.checksum.hex(),
-                        actual="<recomputed mismatch>",
-                        timestamp=time.monotonic(),
-                        wall_time_unix=time.time(),
-                    )
-                    msg = f"Cache entry corruption detected for '{message_id}'"
-                    raise CacheCorruptionError(msg, context=context)
-                # Non-strict: evict corrupted entry, return miss
-                del self._cache[key]
-                self._misses += 1
-                return None
-
-            # KEY BINDING CHECK: Verify entry is stored under the correct key.
-            # Detects key confusion where an entry is moved to a different cache slot
-            # while its checksum remains internally consistent (verify() above only
-            # checks that the stored key_hash matches the checksum, not that the
-            # stored key_hash matches the CURRENT lookup key).
-            expected_key_hash = IntegrityCache._compute_key_hash(key)
-            if not hmac.compare_digest(entry.key_hash, expected_key_hash):
-                self._corruption_detected += 1
-                self._audit("CORRUPTION", key, entry)
-
-                if self._strict:
-                    context = IntegrityContext(
-                        component="cache",
-                        operation="get",
-                        key=message_id,
-                        expected=expected_key_hash.hex(),
-                        actual=entry.key_hash.hex(),
-                        timestamp=time.monotonic(),
-                        wall_time_unix=time.time(),
-                    )
-                    msg = f"Cache key confusion detected for '{message_id}'"
-                    raise CacheCorruptionError(msg, context=context)
-                # Non-strict: evict entry with wrong key binding, return miss
-                del self._cache[key]
-                self._misses += 1
+            # INTEGRITY CHECK (tiered): verify checksum and key binding
+            if self._should_verify() and not self._verify_hit(key, entry, message_id):
                 return None
 
             # Move to end (mark as recently used) and record hit
@@ -304,6 +300,56 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
             self._audit("HIT", key, entry)
             return entry
 
+    def _verify_hit(
+        self,
+        key: _CacheKey,
+        entry: IntegrityCacheEntry,
+        message_id: str,
+    ) -> bool:
+        """Verify checksum and key binding of a hit.
+
+        Returns:
+            True if the entry is intact. False if it was corrupted and evicted
+            (non-strict mode); the caller then reports a miss.
+
+        Raises:
+            CacheCorruptionError: If strict=True and verification fails
+        """
+        if not entry.verify():
+            expected = entry.checksum.hex()
+            actual = "<recomputed mismatch>"
+            msg = f"Cache entry corruption detected for '{message_id}'"
+        else:
+            # KEY BINDING CHECK: Verify entry is stored under the correct key.
+            # Detects key confusion where an entry is moved to a different cache
+            # slot while its checksum remains internally consistent (verify()
+            # only checks that the stored key_hash matches the checksum, not that
+            # the stored key_hash matches the CURRENT lookup key).
+            expected_key_hash = IntegrityCache._compute_key_hash(key)
+            if hmac.compare_digest(entry.key_hash, expected_key_hash):
+                return True
+            expected = expected_key_hash.hex()
+            actual = entry.key_hash.hex()
+            msg = f"Cache key confusion detected for '{message_id}'"
+
+        self._corruption_detected += 1
+        self._audit("CORRUPTION", key, entry)
+        if self._strict:
+            context = IntegrityContext(
+                component="cache",
+                operation="get",
+                key=message_id,
+                expected=expected,
+                actual=actual,
+                timestamp=time.monotonic(),
+                wall_time_unix=time.time(),
+            )
+            raise CacheCorruptionError(msg, context=context)
+        # Non-strict: evict the untrustworthy entry and report a miss
+        del self._cache[key]
+        self._misses += 1
+        return False
+
     def put(
         self,
         message_id: str,
@@ -331,6 +377,17 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
         Raises:
             WriteConflictError: If write_once=True and key already exists (strict mode)
         """
+        key = self._make_key(message_id, args, attribute, locale_code, use_isolating=use_isolating)
+        self._put_keyed(key, message_id, formatted, errors)
+
+    def _put_keyed(
+        self,
+        key: _CacheKey | None,
+        message_id: str,
+        formatted: str,
+        errors: tuple[FrozenFluentError, ...],
+    ) -> None:
+        """Store under an already-built key (shared by put() and sharded stores)."""
         # Check entry weight before caching
         if len(formatted) > self._max_entry_weight:
             with self._lock:
@@ -353,8 +410,6 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
                 self._combined_weight_skips += 1
             return
 
-        key = self._make_key(message_id, args, attribute, locale_code, use_isolating=use_isolating)
-
         if key is None:
             with self._lock:
                 self._unhashable_skips += 1
@@ -430,7 +485,7 @@ class IntegrityCache(_CacheStatsMixin, _CacheAuditMixin, _CacheKeyMixin):
     def clear(self) -> None:
         """Clear all cached entries.
 
-        Thread-safe. Call when bundle is mutated (add_resource, add_function).
+        Thread-safe. Call when every entry may be stale (e.g. add_function).
 
         Metrics are cumulative and NOT reset on clear. They reflect the total
         operational history of this cache instance. Resetting on clear would
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 
 from ftllexengine.constants import DEFAULT_CACHE_SIZE, DEFAULT_MAX_ENTRY_WEIGHT
 from ftllexengine.core.validators import require_positive_int
+from ftllexengine.runtime.cache_types import VERIFICATION_TIERS, CacheVerification
 
 __all__ = ["CacheConfig"]
 
@@ -43,6 +44,20 @@ class CacheConfig:
             (default: 10000). Results exceeding this are computed but not cached.
         max_errors_per_entry: Maximum errors per cache entry (default: 50).
             Prevents memory exhaustion from pathological cases.
+        shards: Number of independently locked LRU shards (default: 1).
+            Values above 1 split ``size`` across shards selected by key hash,
+            so concurrent cache hits on different keys do not serialize on
+            one lock. Checksums and write-once apply per shard; statistics
+            are aggregated across shards. Must not exceed ``size``.
+        verification: Integrity verification tier for cache hits
+            (default: ``"always"``). ``"always"`` re-verifies checksums,
+            error integrity, and key binding on every hit. ``"sampled"``
+            verifies every ``verification_interval``-th hit. ``"on_write"``
+            computes checksums when storing but serves hits unverified.
+            Keep ``"always"`` for financial paths; the cheaper tiers suit
+            display-only bundles where the cache is a pure accelerator.
+        verification_interval: Hit interval for the ``"sampled"`` tier
+            (default: 16).
 
     Example:
         >>> from ftllexengine import FluentBundle  # doctest: +SKIP
@@ -72,6 +87,9 @@ class CacheConfig:
     max_audit_entries: int = 10000
     max_entry_weight: int = DEFAULT_MAX_ENTRY_WEIGHT
     max_errors_per_entry: int = 50
+    shards: int = 1
+    verification: CacheVerification = "always"
+    verification_interval: int = 16
 
     def __post_init__(self) -> None:
         """Validate configuration values at construction time.
@@ -79,9 +97,19 @@ class CacheConfig:
         Raises:
             TypeError: If any integer field receives a non-int value.
             ValueError: If size, max_entry_weight, max_errors_per_entry,
-                or max_audit_entries is zero or negative.
+                max_audit_entries, shards, or verification_interval is zero
+                or negative, if shards exceeds size, or if verification is not
+                a known tier.
         """
         require_positive_int(self.size, "size")
         require_positive_int(self.max_entry_weight, "max_entry_weight")
         require_positive_int(self.max_errors_per_entry, "max_errors_per_entry")
         require_positive_int(self.max_audit_entries, "max_audit_entries")
+        require_positive_int(self.shards, "shards")
+        require_positive_int(self.verification_interval, "verification_interval")
+        if self.shards > self.size:
+            msg = f"shards must not exceed size, got shards={self.shards}, size={self.size}"
+            raise ValueError(msg)
+        if self.verification not in VERIFICATION_TIERS:
+            msg = f"verification must be one of {VERIFICATION_TIERS}, got {self.verification!r}"
+            raise ValueError(msg)
@@ -80,6 +80,11 @@ class _CacheStatsMixin:
                 "strict": self._strict,
                 "audit_enabled": self._audit_log is not None,
                 "audit_entries": len(self._audit_log) if self._audit_log is not None else 0,
+                "verification": self._verification,
+                "verifications": self._verifications,
+                "verification_skips": self._verification_skips,
+                "invalidated_entries": self._invalidated_entries,
+                "retained_entries": self._retained_entries,
             }
 
     def __len__(self: CacheStateProtocol) -> int:
@@ -157,6 +162,30 @@ class _CacheStatsMixin:
         with self._lock:
             return self._write_once_conflicts
 
+    @property
+    def verifications(self: CacheStateProtocol) -> int:
+        """Number of cache hits whose integrity was verified. Thread-safe."""
+        with self._lock:
+            return self._verifications
+
+    @property
+    def verification_skips(self: CacheStateProtocol) -> int:
+        """Number of cache hits served without verification. Thread-safe."""
+        with self._lock:
+            return self._verification_skips
+
+    @property
+    def invalidated_entries(self: CacheStateProtocol) -> int:
+        """Number of entries evicted by targeted invalidation. Thread-safe."""
+        with self._lock:
+            return self._invalidated_entries
+
+    @property
+    def retained_entries(self: CacheStateProtocol) -> int:
+        """Number of entries kept across targeted invalidations. Thread-safe."""
+        with self._lock:
+            return self._retained_entries
+
     @property
     def write_once(self: CacheStateProtocol) -> bool:
         """Whether write-once mode is enabled."""
@@ -0,0 +1,41 @@
+"""Targeted invalidation for IntegrityCache.
+
+FluentBundle tracks which messages reference which entries. When a resource
+redefines some entries, only the messages that transitively depend on them
+can format differently, so the bundle evicts just their cache entries instead
+of clearing the whole cache. Every other cached result stays valid.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+    from .cache_protocols import CacheStateProtocol
+
+
+class _CacheInvalidationMixin:
+    """Per-message eviction for IntegrityCache."""
+
+    def invalidate(self: CacheStateProtocol, message_ids: AbstractSet[str]) -> int:
+        """Evict every cached result of the given messages.
+
+        Thread-safe. Entries of other messages are kept. Like clear(), this
+        never resets cumulative metrics; it adds to ``invalidated_entries``
+        (entries evicted) and ``retained_entries`` (entries kept).
+
+        Args:
+            message_ids: IDs of the messages whose results are stale
+
+        Returns:
+            Number of entries evicted
+        """
+        with self._lock:
+            stale = [key for key in self._cache if key[0] in message_ids]
+            for key in stale:
+                self._audit("INVALIDATE", key, self._cache.pop(key))
+            self._invalidated_entries += len(stale)
+            self._retained_entries += len(self._cache)
+            return len(stale)
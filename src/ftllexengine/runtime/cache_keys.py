@@ -1,8 +1,13 @@
-"""Hashable-key conversion helpers for IntegrityCache."""
+"""Hashable-key conversion helpers for IntegrityCache.
+
+Cache keys are built on every format call, so the common argument types
+(str, int, bool, None, Decimal, datetime, date) are converted through an
+exact-type dispatch table instead of the recursive converter, and key
+binding hashes reuse Python's tuple hash instead of serializing the key.
+"""
 
 from __future__ import annotations
 
-import hashlib
 from collections.abc import Mapping, Sequence
 from datetime import date, datetime
 from decimal import Decimal
@@ -13,6 +18,7 @@ from ftllexengine.core.value_types import FluentNumber, FluentValue
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Any
 
     from ftllexengine.runtime.cache_types import HashableValue, _CacheKey
 
@@ -20,6 +26,10 @@ __all__ = ["HASHABLE_NODE_BUDGET", "compute_key_hash", "make_hashable", "make_ke
 
 HASHABLE_NODE_BUDGET: int = 10_000
 
+# Domain tag mixed into key binding hashes so they never equal the plain
+# hash(key) that OrderedDict uses for slot selection.
+_KEY_BINDING_TAG = "__ftllexengine_cache_key__"
+
 
 def _hashable_decimal(value: Decimal) -> HashableValue:
     if value.is_nan():
@@ -28,8 +38,40 @@ def _hashable_decimal(value: Decimal) -> HashableValue:
 
 
 def _hashable_datetime(value: datetime) -> HashableValue:
-    tz_key = str(value.tzinfo) if value.tzinfo else "__naive__"
-    return ("__datetime__", value.isoformat(), tz_key)
+    # Same-instant datetimes in different zones compare equal but format
+    # differently, so the tzinfo object is part of the key. fold is included
+    # because same-tzinfo comparisons ignore it although the offset differs.
+    tz_key = value.tzinfo if value.tzinfo is not None else "__naive__"
+    return ("__datetime__", value, tz_key, value.fold)
+
+
+def _hashable_date(value: date) -> HashableValue:
+    return ("__date__", value)
+
+
+def _hashable_int(value: int) -> HashableValue:
+    return ("__int__", value)
+
+
+def _hashable_bool(value: bool) -> HashableValue:  # noqa: FBT001 - converter signature
+    return ("__bool__", value)
+
+
+def _hashable_identity(value: str | None) -> HashableValue:
+    return value
+
+
+# Exact-type converters for leaf values. Subclasses (e.g. an IntEnum or a
+# str subclass) deliberately miss this table and take the recursive path.
+_SCALAR_CONVERTERS: dict[type, Callable[[Any], HashableValue]] = {
+    str: _hashable_identity,
+    int: _hashable_int,
+    bool: _hashable_bool,
+    type(None): _hashable_identity,
+    Decimal: _hashable_decimal,
+    datetime: _hashable_datetime,
+    date: _hashable_date,
+}
 
 
 def _hashable_mapping(
@@ -67,15 +109,15 @@ def _hashable_scalar_value(
         case str() | None:
             result = value
         case bool():
-            result = ("__bool__", value)
+            result = _hashable_bool(value)
         case int():
-            result = ("__int__", value)
+            result = _hashable_int(value)
         case Decimal():
             result = _hashable_decimal(value)
         case datetime():
             result = _hashable_datetime(value)
         case date():
-            result = ("__date__", value.isoformat())
+            result = _hashable_date(value)
         case FluentNumber():
             result = (
                 "__fluentnumber__",
@@ -146,11 +188,14 @@ def make_hashable(value: object, depth: int = MAX_DEPTH) -> HashableValue:
 
 
 def compute_key_hash(key: _CacheKey) -> bytes:
-    """Compute the 8-byte BLAKE2b key binding used by cache entries."""
-    return hashlib.blake2b(
-        str(key).encode("utf-8", errors="surrogatepass"),
-        digest_size=8,
-    ).digest()
+    """Compute the 8-byte key binding used by cache entries.
+
+    The binding only has to detect an entry served from the wrong slot of an
+    in-memory cache, so it reuses Python's tuple hash (SipHash-randomized for
+    strings) under a domain tag instead of serializing the key with str().
+    The value is stable within a process and is never persisted.
+    """
+    return hash((_KEY_BINDING_TAG, key)).to_bytes(8, "big", signed=True)
 
 
 def make_key(
@@ -168,7 +213,10 @@ def make_key(
         try:
             items: list[tuple[str, HashableValue]] = []
             for key, value in args.items():
-                items.append((key, make_hashable(value)))
+                convert = _SCALAR_CONVERTERS.get(type(value))
+                items.append(
+                    (key, convert(value) if convert is not None else make_hashable(value))
+                )
             args_tuple = tuple(sorted(items))
             hash(args_tuple)
         except (TypeError, RecursionError):
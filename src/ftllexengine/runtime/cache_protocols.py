@@ -8,7 +8,13 @@ if TYPE_CHECKING:
     from collections import OrderedDict, deque
     from threading import Lock
 
-    from .cache_types import CacheStats, IntegrityCacheEntry, WriteLogEntry, _CacheKey
+    from .cache_types import (
+        CacheStats,
+        CacheVerification,
+        IntegrityCacheEntry,
+        WriteLogEntry,
+        _CacheKey,
+    )
 
 
 class CacheStateProtocol(Protocol):
@@ -21,17 +27,29 @@ class CacheStateProtocol(Protocol):
     _error_bloat_skips: int
     _hits: int
     _idempotent_writes: int
+    _invalidated_entries: int
     _lock: Lock
     _max_entry_weight: int
     _max_errors_per_entry: int
     _maxsize: int
     _misses: int
     _oversize_skips: int
+    _retained_entries: int
     _sequence: int
     _strict: bool
     _unhashable_skips: int
+    _verification: CacheVerification
+    _verification_skips: int
+    _verifications: int
+    _verify_countdown: int
+    _verify_interval: int
     _write_once: bool
     _write_once_conflicts: int
 
     def get_stats(self) -> CacheStats:
         ...  # pragma: no cover - typing-only protocol declaration
+
+    def _audit(
+        self, operation: str, key: _CacheKey, entry: IntegrityCacheEntry | None
+    ) -> None:
+        ...  # pragma: no cover - typing-only protocol declaration
@@ -0,0 +1,253 @@
+"""Sharded IntegrityCache for contended multi-threaded formatting.
+
+A single IntegrityCache serializes every hit behind one Lock because
+``get()`` reorders the LRU list and bumps counters. ShardedIntegrityCache
+splits the key space across N independent IntegrityCache shards selected by
+key hash, so concurrent lookups of different keys contend only when they land
+on the same shard.
+
+Each shard keeps the full IntegrityCache contract: BLAKE2b checksums verified
+on get, key-binding checks, write-once semantics, and optional audit logging.
+LRU eviction is per shard, so the eviction order is approximate across the
+whole cache while total capacity still honours the configured size.
+
+Python 3.13+. Zero external dependencies.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, final
+
+from ftllexengine.constants import DEFAULT_CACHE_SIZE, DEFAULT_MAX_ENTRY_WEIGHT
+from ftllexengine.core.validators import require_positive_int
+
+from .cache import IntegrityCache
+from .cache_introspection import _CacheKeyMixin
+from .cache_types import _DEFAULT_MAX_ERRORS_PER_ENTRY
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Set as AbstractSet
+
+    from ftllexengine.core.value_types import FluentValue
+    from ftllexengine.diagnostics import FrozenFluentError
+
+    from .cache_types import CacheStats, CacheVerification, IntegrityCacheEntry, WriteLogEntry
+
+__all__ = ["ShardedIntegrityCache"]
+
+
+@final
+class ShardedIntegrityCache(_CacheKeyMixin):
+    """IntegrityCache partitioned into independently locked LRU shards.
+
+    Drop-in replacement for IntegrityCache on the FluentBundle formatting
+    path (``get``, ``put``, ``clear``, ``get_stats``, ``get_audit_log``,
+    and the ``hits``, ``misses``, ``strict``, ``size``, and ``maxsize``
+    properties).
+    The lookup key is built once per call and routed to
+    ``shards[hash(key) % shard_count]``.
+
+    Thread Safety:
+        Each shard has its own Lock. Operations on different shards never
+        contend; aggregate readers (``get_stats``, ``size``) lock one shard
+        at a time and therefore report a near-instantaneous snapshot.
+    """
+
+    __slots__ = ("_max_audit_entries", "_shards")
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        max_entry_weight: int = DEFAULT_MAX_ENTRY_WEIGHT,
+        max_errors_per_entry: int = _DEFAULT_MAX_ERRORS_PER_ENTRY,
+        *,
+        shards: int,
+        write_once: bool = False,
+        strict: bool = True,
+        enable_audit: bool = False,
+        max_audit_entries: int = 10000,
+        verification: CacheVerification = "always",
+        verification_interval: int = 16,
+    ) -> None:
+        """Initialize the shards.
+
+        Args:
+            maxsize: Total entry capacity; the first ``maxsize % shards`` shards
+                hold one entry more than the rest
+            max_entry_weight: Per-entry weight limit, applied by every shard
+            max_errors_per_entry: Per-entry error limit, applied by every shard
+            shards: Number of independent shards
+            write_once: Reject updates to existing keys (checked per shard)
+            strict: Raise on corruption and write-once conflicts
+            enable_audit: Keep an audit log in every shard
+            max_audit_entries: Maximum merged audit log length
+            verification: Hit verification tier, applied by every shard
+            verification_interval: Per-shard hit interval for the "sampled" tier
+
+        Raises:
+            TypeError: If shards is not an int
+            ValueError: If shards or any IntegrityCache limit is not positive,
+                or shards exceeds maxsize
+        """
+        require_positive_int(shards, "shards")
+        if maxsize <= 0:
+            msg = "maxsize must be positive"
+            raise ValueError(msg)
+        if shards > maxsize:
+            msg = f"shards must not exceed maxsize, got shards={shards}, maxsize={maxsize}"
+            raise ValueError(msg)
+        shard_maxsize, larger_shards = divmod(maxsize, shards)
+        self._shards: tuple[IntegrityCache, ...] = tuple(
+            IntegrityCache(
+                maxsize=shard_maxsize + (index < larger_shards),
+                max_entry_weight=max_entry_weight,
+                max_errors_per_entry=max_errors_per_entry,
+                write_once=write_once,
+                strict=strict,
+                enable_audit=enable_audit,
+                max_audit_entries=max_audit_entries,
+                verification=verification,
+                verification_interval=verification_interval,
+            )
+            for index in range(shards)
+        )
+        self._max_audit_entries = max_audit_entries
+
+    def get(
+        self,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+        locale_code: str,
+        *,
+        use_isolating: bool,
+    ) -> IntegrityCacheEntry | None:
+        """Get a verified entry from the shard owning this key.
+
+        Raises:
+            CacheCorruptionError: If strict and the shard detects corruption
+        """
+        key = self._make_key(message_id, args, attribute, locale_code, use_isolating=use_isolating)
+        shards = self._shards
+        shard = shards[0] if key is None else shards[hash(key) % len(shards)]
+        return shard._get_keyed(key, message_id)  # noqa: SLF001 - shard delegation
+
+    def put(
+        self,
+        message_id: str,
+        args: Mapping[str, FluentValue] | None,
+        attribute: str | None,
+        locale_code: str,
+        *,
+        use_isolating: bool,
+        formatted: str,
+        errors: tuple[FrozenFluentError, ...],
+    ) -> None:
+        """Store an entry in the shard owning this key.
+
+        Raises:
+            WriteConflictError: If write_once and strict and the key already
+                holds different content in its shard
+        """
+        key = self._make_key(message_id, args, attribute, locale_code, use_isolating=use_isolating)
+        shards = self._shards
+        shard = shards[0] if key is None else shards[hash(key) % len(shards)]
+        shard._put_keyed(key, message_id, formatted, errors)  # noqa: SLF001 - shard delegation
+
+    def clear(self) -> None:
+        """Clear every shard. Cumulative metrics are preserved, as in IntegrityCache."""
+        for shard in self._shards:
+            shard.clear()
+
+    def invalidate(self, message_ids: AbstractSet[str]) -> int:
+        """Evict the given messages' entries from every shard; return the count."""
+        return sum(shard.invalidate(message_ids) for shard in self._shards)
+
+    def get_shard_stats(self) -> tuple[CacheStats, ...]:
+        """Get the individual statistics of each shard, in shard order."""
+        return tuple(shard.get_stats() for shard in self._shards)
+
+    def get_stats(self) -> CacheStats:
+        """Get statistics aggregated across all shards.
+
+        Counters, sizes, and sequences are summed; ``hit_rate`` is recomputed
+        from the summed hits and misses.
+        """
+        per_shard = self.get_shard_stats()
+        first = per_shard[0]
+        hits = sum(stats["hits"] for stats in per_shard)
+        misses = sum(stats["misses"] for stats in per_shard)
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0.0
+        return {
+            "size": sum(stats["size"] for stats in per_shard),
+            "maxsize": sum(stats["maxsize"] for stats in per_shard),
+            "max_entry_weight": first["max_entry_weight"],
+            "max_errors_per_entry": first["max_errors_per_entry"],
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hit_rate, 2),
+            "unhashable_skips": sum(stats["unhashable_skips"] for stats in per_shard),
+            "oversize_skips": sum(stats["oversize_skips"] for stats in per_shard),
+            "error_bloat_skips": sum(stats["error_bloat_skips"] for stats in per_shard),
+            "combined_weight_skips": sum(stats["combined_weight_skips"] for stats in per_shard),
+            "corruption_detected": sum(stats["corruption_detected"] for stats in per_shard),
+            "idempotent_writes": sum(stats["idempotent_writes"] for stats in per_shard),
+            "write_once_conflicts": sum(stats["write_once_conflicts"] for stats in per_shard),
+            "sequence": sum(stats["sequence"] for stats in per_shard),
+            "write_once": first["write_once"],
+            "strict": first["strict"],
+            "audit_enabled": first["audit_enabled"],
+            "audit_entries": min(
+                sum(stats["audit_entries"] for stats in per_shard), self._max_audit_entries
+            ),
+            "verification": first["verification"],
+            "verifications": sum(stats["verifications"] for stats in per_shard),
+            "verification_skips": sum(stats["verification_skips"] for stats in per_shard),
+            "invalidated_entries": sum(stats["invalidated_entries"] for stats in per_shard),
+            "retained_entries": sum(stats["retained_entries"] for stats in per_shard),
+        }
+
+    def get_audit_log(self) -> tuple[WriteLogEntry, ...]:
+        """Get the most recent audit entries of all shards, merged by timestamp."""
+        merged = heapq.merge(
+            *(shard.get_audit_log() for shard in self._shards),
+            key=lambda entry: entry.timestamp,
+        )
+        return tuple(merged)[-self._max_audit_entries :]
+
+    def __len__(self) -> int:
+        """Get the total number of cached entries across shards."""
+        return sum(len(shard) for shard in self._shards)
+
+    @property
+    def size(self) -> int:
+        """Current number of cached entries across shards."""
+        return len(self)
+
+    @property
+    def maxsize(self) -> int:
+        """Total capacity across shards."""
+        return sum(shard.maxsize for shard in self._shards)
+
+    @property
+    def hits(self) -> int:
+        """Number of cache hits across shards."""
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        """Number of cache misses across shards."""
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def strict(self) -> bool:
+        """Whether strict mode is enabled."""
+        return self._shards[0].strict
+
+    @property
+    def shard_count(self) -> int:
+        """Number of independent shards."""
+        return len(self._shards)
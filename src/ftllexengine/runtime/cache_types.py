@@ -7,17 +7,19 @@ import hmac
 import struct
 import time
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, tzinfo
 from decimal import Decimal
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 from ftllexengine.core.value_types import FluentNumber
 from ftllexengine.diagnostics import FrozenFluentError
 
 __all__ = [
+    "VERIFICATION_TIERS",
     "_DEFAULT_MAX_ERRORS_PER_ENTRY",
     "CacheAuditLogEntry",
     "CacheStats",
+    "CacheVerification",
     "HashableValue",
     "IntegrityCacheEntry",
     "WriteLogEntry",
@@ -49,8 +51,17 @@ class CacheStats(TypedDict):
     strict: bool
     audit_enabled: bool
     audit_entries: int
+    verification: CacheVerification
+    verifications: int
+    verification_skips: int
+    invalidated_entries: int
+    retained_entries: int
 
 
+type CacheVerification = Literal["always", "sampled", "on_write"]
+
+VERIFICATION_TIERS: tuple[CacheVerification, ...] = ("always", "sampled", "on_write")
+
 _ERROR_BASE_OVERHEAD: int = 100
 _DEFAULT_MAX_ERRORS_PER_ENTRY: int = 50
 
@@ -95,6 +106,7 @@ type HashableValue = (
     | datetime
     | date
     | FluentNumber
+    | tzinfo
     | None
     | tuple["HashableValue", ...]
     | frozenset["HashableValue"]
@@ -0,0 +1,39 @@
+"""Hit-verification helpers for IntegrityCache.
+
+Verification tiers trade integrity checking on cache hits for speed:
+
+- ``"always"``: every hit re-verifies the entry checksum, the error
+  integrity hashes, and the key binding (financial-grade default).
+- ``"sampled"``: every Nth hit is verified; the others are served directly.
+- ``"on_write"``: checksums are still computed when entries are stored, but
+  hits are never re-verified.
+
+Checksums are computed on every put regardless of tier, so a bundle can
+switch tiers by configuration without changing the stored entry format.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache_protocols import CacheStateProtocol
+
+
+class _CacheVerificationMixin:
+    """Verification-tier sampling for IntegrityCache hits (internal, assumes lock held)."""
+
+    def _should_verify(self: CacheStateProtocol) -> bool:
+        """Decide whether the current hit is verified, updating counters."""
+        interval = self._verify_interval
+        if interval == 1:
+            self._verifications += 1
+            return True
+        if interval:
+            self._verify_countdown -= 1
+            if self._verify_countdown == 0:
+                self._verify_countdown = interval
+                self._verifications += 1
+                return True
+        self._verification_skips += 1
+        return False
@@ -0,0 +1,201 @@
+"""Compact storage for registered message and term entries.
+
+A parsed entry is a graph of small frozen AST nodes, each carrying its own
+``Span``. Resolution never reads spans or comments, and large catalogs repeat
+the same identifiers, variable references, and text fragments thousands of
+times. In compact mode a bundle stores each entry with:
+
+- spans and the attached comment removed into an ``EntryTrivia`` record
+  (spans as one flat ``array`` of start/end offsets in traversal order);
+- every pattern-free subtree (identifiers, literals, references, text
+  elements, inline placeables) interned, so equal subtrees are one object
+  shared across all entries of the bundle.
+
+Interned subtrees are reference counted per use. ``release()`` walks a
+replaced entry the same way ``compact()`` did and drops subtrees no stored
+entry uses any more, so redefining entries does not grow the intern table.
+
+``Pattern`` nodes and their ancestors are never shared: compiled resolution
+plans are keyed by pattern identity. ``restore()`` rebuilds the full entry,
+spans and comment included, for ``get_message()`` and introspection.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, final
+
+from ftllexengine.syntax import (
+    Attribute,
+    Message,
+    Pattern,
+    SelectExpression,
+    Span,
+    Term,
+    Variant,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ftllexengine.syntax import Comment
+
+__all__ = ["EntryCompactor", "EntryTrivia"]
+
+# Offset pair recorded for nodes whose span is None.
+_NO_SPAN: int = -1
+
+# Node types that contain a Pattern (directly or through variants).
+_UNSHARED_TYPES: frozenset[type] = frozenset(
+    {Attribute, Message, Pattern, SelectExpression, Term, Variant}
+)
+
+_field_names_by_type: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(node_type: type) -> tuple[str, ...]:
+    """Return dataclass field names for an AST node type (memoized)."""
+    names = _field_names_by_type.get(node_type)
+    if names is None:
+        names = tuple(f.name for f in fields(node_type))
+        _field_names_by_type[node_type] = names
+    return names
+
+
+def _is_node(value: object) -> bool:
+    """Return whether a field value is an AST node to traverse."""
+    return hasattr(type(value), "__dataclass_fields__")
+
+
+@dataclass(frozen=True, slots=True)
+class EntryTrivia:
+    """Source-only data removed from one compact entry.
+
+    Attributes:
+        entry: The compact entry this record belongs to (checked by identity)
+        spans: Start/end offset pairs in traversal order; ``-1`` marks no span
+        comment: The comment attached to the original entry
+    """
+
+    entry: Message | Term
+    spans: array[int]
+    comment: Comment | None
+
+
+@final
+class EntryCompactor:
+    """Strips spans from entries and interns their pattern-free subtrees.
+
+    One compactor belongs to one bundle; interned nodes are shared by every
+    entry the bundle registers. Not thread-safe: callers serialize
+    ``compact()`` and ``release()`` under the bundle's write lock.
+    """
+
+    __slots__ = ("_nodes", "_uses")
+
+    def __init__(self) -> None:
+        """Initialize an empty intern table."""
+        self._nodes: dict[Any, Any] = {}
+        # id(interned node) -> number of compacted occurrences still stored.
+        self._uses: dict[int, int] = {}
+
+    @property
+    def interned_count(self) -> int:
+        """Number of distinct shared subtrees."""
+        return len(self._nodes)
+
+    def compact[EntryT: Message | Term](self, entry: EntryT) -> tuple[EntryT, EntryTrivia]:
+        """Return the compact form of ``entry`` and the trivia needed to restore it."""
+        spans: array[int] = array("q")
+        compact_entry, _ = self._compact_node(replace(entry, comment=None), spans)
+        return compact_entry, EntryTrivia(entry=compact_entry, spans=spans, comment=entry.comment)
+
+    def release(self, entry: Message | Term) -> None:
+        """Drop one use of every subtree ``entry`` shares; call once per replaced entry.
+
+        ``entry`` must be a compact entry returned by ``compact()``.
+        """
+        self._release_node(entry)
+
+    def _compact_node[NodeT](self, node: NodeT, spans: array[int]) -> tuple[NodeT, bool]:
+        """Compact one node; return it and whether it may be shared."""
+        node_type = type(node)
+        shareable = node_type not in _UNSHARED_TYPES
+        values: dict[str, object] = {}
+        for name in _field_names(node_type):
+            value = getattr(node, name)
+            if name == "span":
+                if value is None:
+                    spans.extend((_NO_SPAN, _NO_SPAN))
+                else:
+                    spans.extend((value.start, value.end))
+                    value = None
+            elif isinstance(value, tuple):
+                items: list[object] = []
+                for item in value:
+                    if _is_node(item):
+                        item, item_shareable = self._compact_node(item, spans)  # noqa: PLW2901 - rebinding to the compacted child
+                        shareable = shareable and item_shareable
+                    items.append(item)
+                value = tuple(items)
+            elif _is_node(value):
+                value, child_shareable = self._compact_node(value, spans)
+                shareable = shareable and child_shareable
+            values[name] = value
+        compact_node = node_type(**values)
+        if shareable:
+            compact_node = self._nodes.setdefault(compact_node, compact_node)
+            key = id(compact_node)
+            self._uses[key] = self._uses.get(key, 0) + 1
+        return compact_node, shareable
+
+    def _release_node(self, node: object) -> bool:
+        """Release one node, mirroring _compact_node; return whether it is shared."""
+        node_type = type(node)
+        shareable = node_type not in _UNSHARED_TYPES
+        for name in _field_names(node_type):
+            value = getattr(node, name)
+            if isinstance(value, tuple):
+                for item in value:
+                    if _is_node(item):
+                        shareable = self._release_node(item) and shareable
+            elif name != "span" and _is_node(value):
+                shareable = self._release_node(value) and shareable
+        if shareable:
+            key = id(node)
+            uses = self._uses[key] - 1
+            if uses:
+                self._uses[key] = uses
+            else:
+                del self._uses[key]
+                del self._nodes[node]
+        return shareable
+
+    @staticmethod
+    def restore(trivia: EntryTrivia) -> Message | Term:
+        """Rebuild the full entry, with spans and comment, from its trivia."""
+        offsets = iter(trivia.spans)
+        restored = _restore_node(trivia.entry, offsets)
+        return replace(restored, comment=trivia.comment)
+
+
+def _restore_node[NodeT](node: NodeT, offsets: Iterator[int]) -> NodeT:
+    """Rebuild one node, consuming its span offsets in traversal order."""
+    node_type = type(node)
+    values: dict[str, object] = {}
+    for name in _field_names(node_type):
+        value = getattr(node, name)
+        if name == "span":
+            start, end = next(offsets), next(offsets)
+            value = None if start == _NO_SPAN else Span(start=start, end=end)
+        elif isinstance(value, tuple):
+            value = tuple(
+                _restore_node(item, offsets) if _is_node(item) else item for item in value
+            )
+        elif _is_node(value):
+            value = _restore_node(value, offsets)
+        values[name] = value
+    return node_type(**values)
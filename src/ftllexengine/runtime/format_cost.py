@@ -0,0 +1,152 @@
+"""Static cost classification of messages for inline (event-loop) formatting.
+
+AsyncFluentBundle's adaptive mode formats a message directly on the event
+loop when doing so cannot take long, and offloads it to a thread otherwise.
+is_cheap_to_format() decides this from the AST alone, before formatting: a
+message is cheap when the patterns it expands to (through message and term
+references) contain at most a fixed number of expressions and select
+variants, and every function call resolves to a built-in function.
+
+The classification is conservative, never a semantic decision: a message
+judged expensive formats identically, only on a worker thread.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ftllexengine.syntax import (
+    FunctionReference,
+    Identifier,
+    MessageReference,
+    Placeable,
+    SelectExpression,
+    TermReference,
+    TextElement,
+)
+
+from .functions import get_shared_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ftllexengine.syntax import Expression, Message, Pattern, Term
+
+    from .function_bridge import FunctionRegistry
+
+__all__ = ["INLINE_FORMAT_BUDGET", "is_cheap_to_format"]
+
+# Expressions plus select variants a message may expand to and still be
+# formatted inline; formatting that much costs less than a thread hop.
+INLINE_FORMAT_BUDGET = 64
+
+
+class _Classifier:
+    """Walks a message's expansion, spending one budget unit per expression.
+
+    Every reference is walked and charged again, as formatting expands it
+    again; only references to an entry already on the current path (cycles)
+    stop the walk.
+    """
+
+    __slots__ = ("_budget", "_builtins", "_messages", "_path", "_registry", "_terms")
+
+    def __init__(
+        self,
+        messages: Mapping[str, Message],
+        terms: Mapping[str, Term],
+        registry: FunctionRegistry,
+        budget: int,
+    ) -> None:
+        self._messages = messages
+        self._terms = terms
+        self._registry = registry
+        self._builtins = get_shared_registry()
+        self._budget = budget
+        self._path: set[tuple[str, str | None]] = set()
+
+    def pattern(self, pattern: Pattern | None) -> bool:
+        if pattern is None:
+            return True
+        for element in pattern.elements:
+            if not isinstance(element, TextElement) and not self.expression(element.expression):
+                return False
+        return True
+
+    def expression(self, expr: Expression) -> bool:  # noqa: PLR0911 - one return per expression type
+        self._budget -= 1
+        if self._budget < 0:
+            return False
+        match expr:
+            case SelectExpression():
+                self._budget -= len(expr.variants)
+                return self.expression(expr.selector) and all(
+                    self.pattern(variant.value) for variant in expr.variants
+                )
+            case Placeable():
+                return self.expression(expr.expression)
+            case FunctionReference():
+                name = expr.id.name
+                if self._registry.get_callable(name) is not self._builtins.get_callable(name):
+                    return False
+                return all(self.expression(arg) for arg in expr.arguments.positional)
+            case MessageReference():
+                return self.entry(
+                    f"msg:{expr.id.name}", self._messages.get(expr.id.name), expr.attribute
+                )
+            case TermReference():
+                if expr.arguments is not None and not all(
+                    self.expression(arg) for arg in expr.arguments.positional
+                ):
+                    return False
+                return self.entry(
+                    f"term:{expr.id.name}", self._terms.get(expr.id.name), expr.attribute
+                )
+            case _:
+                return True
+
+    def entry(
+        self, key: str, entry: Message | Term | None, attribute: Identifier | str | None
+    ) -> bool:
+        name = attribute.name if isinstance(attribute, Identifier) else attribute
+        # Missing entries and reference cycles resolve to an error at once.
+        if entry is None or (key, name) in self._path:
+            return True
+        self._path.add((key, name))
+        try:
+            if name is None:
+                return self.pattern(entry.value)
+            return all(
+                self.pattern(attr.value) for attr in entry.attributes if attr.id.name == name
+            )
+        finally:
+            self._path.discard((key, name))
+
+
+def is_cheap_to_format(
+    message: Message,
+    attribute: str | None,
+    *,
+    messages: Mapping[str, Message],
+    terms: Mapping[str, Term],
+    registry: FunctionRegistry,
+    budget: int = INLINE_FORMAT_BUDGET,
+) -> bool:
+    """Return whether formatting ``message`` is bounded by a small, fixed cost.
+
+    Args:
+        message: Message to classify
+        attribute: Attribute to format, or None for the message value
+        messages: Registered messages, for following message references
+        terms: Registered terms, for following term references
+        registry: The bundle's function registry; only functions bound to the
+            built-in implementations count as cheap
+        budget: Maximum expressions plus select variants in the expansion
+
+    Returns:
+        True if the message can be formatted inline without noticeable delay
+    """
+    classifier = _Classifier(messages, terms, registry, budget)
+    return classifier.entry(f"msg:{message.id.name}", message, attribute)
@@ -30,14 +30,12 @@ Python 3.13+. Uses Babel for i18n.
 from __future__ import annotations
 
 import functools
-import logging
 from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from datetime import date, datetime
     from decimal import Decimal
 
-from ftllexengine.core.babel_compat import get_babel_numbers
 from ftllexengine.core.value_types import (
     FluentNumber,
     _make_fluent_number,
@@ -49,8 +47,6 @@ from .locale_context import LocaleContext
 
 __all__ = ["create_default_registry", "get_shared_registry"]
 
-logger = logging.getLogger(__name__)
-
 
 def number_format(
     value: int | Decimal,
@@ -126,10 +122,6 @@ def number_format(
         - number_format(Decimal('1.0'), min=0, max=3) -> "1" with precision=0
         - number_format(1, min=2, max=2) -> "1.00" with precision=2
     """
-    babel_numbers = get_babel_numbers()
-    get_decimal_symbol = babel_numbers.get_decimal_symbol
-    parse_pattern = babel_numbers.parse_pattern
-
     # Public runtime entry points fail fast on unknown locales instead of
     # silently downgrading to a different locale's formatting rules.
     ctx = LocaleContext.create_or_raise(locale_code)
@@ -145,30 +137,17 @@ def number_format(
     # Compute actual visible precision from formatted string (CLDR v operand).
     # Use the decimal symbol for the active numbering system so precision counting
     # is correct for non-Latin numeral systems (e.g., "arab" uses U+066B not ASCII dot).
-    decimal_symbol = get_decimal_symbol(ctx.babel_locale, numbering_system=numbering_system)
+    decimal_symbol = ctx.get_decimal_symbol(numbering_system)
 
     # When a custom pattern is provided, extract max fraction digits from pattern
     # metadata to cap precision. This prevents literal digit suffixes (ICU
     # single-quote syntax like "0.0'5'") from inflating the v operand.
+    # The pattern was already parsed (and cached) by format_number above, so this
+    # lookup cannot fail: a malformed pattern raised before reaching this point.
     max_frac: int | None = None
     if pattern is not None:
-        try:
-            parsed = parse_pattern(pattern)
-            # frac_prec is (min_frac, max_frac) tuple
-            max_frac = parsed.frac_prec[1]
-        except (ValueError, AttributeError):
-            # Malformed pattern: fall back to uncapped counting.
-            # Babel format_number already handled the pattern successfully,
-            # so parse_pattern failure is unexpected but not fatal.
-            # Logged at WARNING: the formatted output is correct, but the
-            # CLDR v operand (plural precision) may be inflated when the
-            # pattern uses ICU single-quote literals (e.g., "0.0'5'").
-            # Financial applications should inspect this warning.
-            logger.warning(
-                "parse_pattern failed for NUMBER pattern %r; "
-                "precision capping disabled — CLDR v operand may be inflated",
-                pattern,
-            )
+        # frac_prec is (min_frac, max_frac) tuple
+        max_frac = ctx.parse_number_pattern(pattern).frac_prec[1]
 
     return _make_fluent_number(
         value,
@@ -339,10 +318,6 @@ def currency_format(
         matching for custom patterns or locales that deviate from standard
         decimal places.
     """
-    babel_numbers = get_babel_numbers()
-    get_decimal_symbol = babel_numbers.get_decimal_symbol
-    parse_pattern = babel_numbers.parse_pattern
-
     # Public runtime entry points fail fast on unknown locales instead of
     # silently downgrading to a different locale's formatting rules.
     ctx = LocaleContext.create_or_raise(locale_code)
@@ -359,25 +334,13 @@ def currency_format(
     # Compute actual visible precision from formatted string (CLDR v operand).
     # Use the decimal symbol for the active numbering system so precision counting
     # is correct for non-Latin numeral systems (e.g., "arab" uses U+066B not ASCII dot).
-    decimal_symbol = get_decimal_symbol(ctx.babel_locale, numbering_system=numbering_system)
+    decimal_symbol = ctx.get_decimal_symbol(numbering_system)
 
     # When a custom pattern is provided, extract max fraction digits from pattern
     # metadata to cap precision. Same rationale as number_format().
     max_frac: int | None = None
     if pattern is not None:
-        try:
-            parsed = parse_pattern(pattern)
-            max_frac = parsed.frac_prec[1]
-        except (ValueError, AttributeError):
-            # Logged at WARNING: same rationale as number_format — the
-            # formatted output is correct but the CLDR v operand may be
-            # inflated for patterns with ICU single-quote literals.
-            # Financial applications should inspect this warning.
-            logger.warning(
-                "parse_pattern failed for CURRENCY pattern %r; "
-                "precision capping disabled — CLDR v operand may be inflated",
-                pattern,
-            )
+        max_frac = ctx.parse_number_pattern(pattern).frac_prec[1]
 
     return _make_fluent_number(
         value,
@@ -0,0 +1,102 @@
+"""Entry index for lazily parsed FTL resources.
+
+A lazy FluentBundle does not parse a resource when it is added. It scans the
+source once for top-level entry boundaries and records, per message and term
+ID, the source slice that defines it. The slice is parsed on first use.
+
+Entry Boundaries:
+    Per the Fluent syntax, top-level entries start at column 1 and
+    continuation lines are indented (or are a closing ``}``). A new entry
+    therefore starts at every line beginning with ``#``, ``-``, or an ASCII
+    letter, which are also the lines at which the parser resumes after Junk.
+    A run of ``#`` comment lines directly above an entry is included in its
+    slice, so the comment still attaches to the entry.
+
+    The scan does not track placeables, so a placeable that spans lines and
+    continues in column 1 (``msg = {\nother }``) is cut at that line. The
+    cut slice parses to Junk, and the bundle then parses the whole resource
+    instead of the slice.
+
+Spans:
+    Entries parsed from a slice carry spans relative to the slice start, as
+    with ``FluentParserV1.parse_stream()``.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+__all__ = ["LazyEntry", "index_resource"]
+
+# Column-1 lines that start a top-level region. Group 1 marks a single-hash
+# comment line (attaches to a following entry); group 2 is a "-"-prefixed or
+# bare identifier followed by "=", i.e. a term or message definition.
+_BOUNDARY_PATTERN = re.compile(
+    r"^(?:(#(?: |$))|#|(-?[a-zA-Z][a-zA-Z0-9_-]*) *=|-?[a-zA-Z])",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LazyEntry:
+    """Source slice defining one lazily parsed message or term.
+
+    Attributes:
+        source: Normalized resource source shared by all entries of the resource
+        start: Offset of the first character of the slice
+        end: Offset one past the last character of the slice
+        source_path: Path of the resource, for log messages
+    """
+
+    source: str
+    start: int
+    end: int
+    source_path: str | None
+
+    @property
+    def text(self) -> str:
+        """Return the source slice to parse."""
+        return self.source[self.start : self.end]
+
+
+def index_resource(source: str, source_path: str | None = None) -> dict[str, LazyEntry]:
+    """Map dependency keys (``msg:<id>``, ``term:<id>``) to their defining slices.
+
+    ``source`` must already be line-ending normalized. A later definition of
+    the same ID replaces an earlier one, as in eager registration. Regions that
+    define no entry (standalone comments, Junk) are not indexed.
+    """
+    index: dict[str, LazyEntry] = {}
+    pending_key: str | None = None
+    pending_start = 0
+    comment_start: int | None = None
+    comment_next_line = -1
+
+    for match in _BOUNDARY_PATTERN.finditer(source):
+        line_start = match.start()
+        if pending_key is not None:
+            index[pending_key] = LazyEntry(source, pending_start, line_start, source_path)
+            pending_key = None
+        if comment_start is not None and line_start != comment_next_line:
+            comment_start = None
+
+        if match.group(1) is not None:
+            if comment_start is None:
+                comment_start = line_start
+            comment_next_line = source.find("\n", line_start) + 1
+            continue
+
+        identifier = match.group(2)
+        if identifier is not None:
+            pending_key = (
+                f"term:{identifier[1:]}" if identifier[0] == "-" else f"msg:{identifier}"
+            )
+            pending_start = comment_start if comment_start is not None else line_start
+        comment_start = None
+
+    if pending_key is not None:
+        index[pending_key] = LazyEntry(source, pending_start, len(source), source_path)
+    return index
@@ -52,7 +52,9 @@ from ftllexengine.runtime.locale_formatting import (
     format_currency_for_locale,
     format_datetime_for_locale,
     format_number_for_locale,
+    get_decimal_symbol_for_locale,
     get_iso_code_pattern_for_locale,
+    parse_number_pattern,
 )
 
 if TYPE_CHECKING:
@@ -60,6 +62,7 @@ if TYPE_CHECKING:
     from decimal import Decimal
 
     from babel import Locale
+    from babel.numbers import NumberPattern
 
     from ftllexengine.core.semantic_types import LocaleCode
 
@@ -128,6 +131,14 @@ class LocaleContext:
     _factory_token: object = field(
         default=None, repr=False, compare=False, hash=False
     )
+    # Per-instance memo tables (Flyweight-shared, so filled once per locale).
+    # Values are immutable and idempotent, so unlocked dict races are benign.
+    _number_patterns: dict[str, NumberPattern] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+    _decimal_symbols: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
 
     def __post_init__(self) -> None:
         """Validate construction came from factory method."""
@@ -348,12 +359,15 @@ class LocaleContext:
         # locale_class.parse() is called only for validation here; create()
         # will use the cache or re-parse as needed. On the first call for a
         # locale, parse() executes twice (once here, once inside create() on
-        # cache miss). On subsequent calls, create() returns the cached
-        # instance without re-parsing, making this effectively O(1) after
-        # the first invocation. This is the correct trade-off: correctness
-        # and cache coherence take precedence over avoiding one extra parse
-        # on first use.
+        # cache miss). Cached non-fallback contexts already passed Babel
+        # validation, so subsequent calls return them without re-parsing.
+        # Fallback contexts are re-validated so unknown locales keep raising.
         normalized_locale = require_locale_code(locale_code, "locale_code")
+        with cls._cache_lock:
+            cached = cls._cache.get(normalized_locale)
+            if cached is not None and not cached.is_fallback:
+                cls._cache.move_to_end(normalized_locale)
+                return cached
 
         try:
             locale_class.parse(normalized_locale)
@@ -399,8 +413,21 @@ class LocaleContext:
             use_grouping=use_grouping,
             pattern=pattern,
             numbering_system=numbering_system,
+            pattern_cache=self._number_patterns,
         )
 
+    def get_decimal_symbol(self, numbering_system: str = "latn") -> str:
+        """Get the decimal symbol for a numbering system (cached per context)."""
+        return get_decimal_symbol_for_locale(
+            babel_locale=self._babel_locale,
+            numbering_system=numbering_system,
+            symbol_cache=self._decimal_symbols,
+        )
+
+    def parse_number_pattern(self, pattern: str) -> NumberPattern:
+        """Parse a Babel number pattern through this context's pattern cache."""
+        return parse_number_pattern(pattern, self._number_patterns)
+
     def format_datetime(
         self,
         value: date | datetime | str,
@@ -442,6 +469,7 @@ class LocaleContext:
             currency_digits=currency_digits,
             numbering_system=numbering_system,
             debug_logger=logger,
+            pattern_cache=self._number_patterns,
         )
 
     def _get_iso_code_pattern(self) -> str | None:
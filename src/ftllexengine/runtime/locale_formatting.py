@@ -12,13 +12,18 @@ from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Literal
 
-from ftllexengine.constants import FALLBACK_FUNCTION_ERROR, MAX_FORMAT_DIGITS
+from ftllexengine.constants import (
+    FALLBACK_FUNCTION_ERROR,
+    MAX_FORMAT_DIGITS,
+    MAX_NUMBER_PATTERN_CACHE_SIZE,
+)
 from ftllexengine.core.babel_compat import get_babel_dates, get_babel_numbers
 from ftllexengine.diagnostics import ErrorCategory, FrozenErrorContext, FrozenFluentError
 from ftllexengine.diagnostics.templates import ErrorTemplate
 
 if TYPE_CHECKING:
     from babel import Locale
+    from babel.numbers import NumberPattern
 
     from ftllexengine.core.semantic_types import LocaleCode
 
@@ -28,10 +33,56 @@ __all__ = [
     "format_currency_for_locale",
     "format_datetime_for_locale",
     "format_number_for_locale",
+    "get_decimal_symbol_for_locale",
     "get_iso_code_pattern_for_locale",
+    "parse_number_pattern",
 ]
 
 
+def parse_number_pattern(
+    pattern: str,
+    pattern_cache: dict[str, NumberPattern] | None = None,
+) -> NumberPattern:
+    """Parse a Babel number pattern, reusing ``pattern_cache`` when supplied.
+
+    Parsed patterns are locale-independent and immutable, so one cache entry
+    serves every NUMBER/CURRENCY call with the same pattern string. The cache
+    stops growing at MAX_NUMBER_PATTERN_CACHE_SIZE entries; further patterns
+    are parsed per call.
+    """
+    if pattern_cache is not None:
+        cached = pattern_cache.get(pattern)
+        if cached is not None:
+            return cached
+    parsed: NumberPattern = get_babel_numbers().parse_pattern(pattern)
+    if pattern_cache is not None and len(pattern_cache) < MAX_NUMBER_PATTERN_CACHE_SIZE:
+        pattern_cache[pattern] = parsed
+    return parsed
+
+
+def get_decimal_symbol_for_locale(
+    *,
+    babel_locale: Locale,
+    numbering_system: str = "latn",
+    symbol_cache: dict[str, str] | None = None,
+) -> str:
+    """Return the locale's decimal symbol for a numbering system.
+
+    Raises:
+        UnsupportedNumberingSystemError: If the locale lacks the numbering system
+    """
+    if symbol_cache is not None:
+        symbol = symbol_cache.get(numbering_system)
+        if symbol is not None:
+            return symbol
+    symbol = str(
+        get_babel_numbers().get_decimal_symbol(babel_locale, numbering_system=numbering_system)
+    )
+    if symbol_cache is not None:
+        symbol_cache[numbering_system] = symbol
+    return symbol
+
+
 def format_number_for_locale(
     *,
     locale_code: LocaleCode,
@@ -42,6 +93,7 @@ def format_number_for_locale(
     use_grouping: bool = True,
     pattern: str | None = None,
     numbering_system: str = "latn",
+    pattern_cache: dict[str, NumberPattern] | None = None,
 ) -> str:
     """Format a number using the supplied Babel locale."""
     if not 0 <= minimum_fraction_digits <= MAX_FORMAT_DIGITS:
@@ -58,38 +110,26 @@ def format_number_for_locale(
         raise ValueError(msg)
     maximum_fraction_digits = max(maximum_fraction_digits, minimum_fraction_digits)
 
-    babel_numbers = get_babel_numbers()
-
     try:
         if pattern is not None:
-            return str(
-                babel_numbers.format_decimal(
-                    value,
-                    format=pattern,
-                    locale=babel_locale,
-                    numbering_system=numbering_system,
-                )
-            )
-
-        integer_part = "#,##0" if use_grouping else "0"
-
-        if maximum_fraction_digits == 0:
-            format_pattern = integer_part
-        elif minimum_fraction_digits == maximum_fraction_digits:
-            decimal_part = "0" * minimum_fraction_digits
-            format_pattern = f"{integer_part}.{decimal_part}"
+            format_pattern = pattern
         else:
-            required = "0" * minimum_fraction_digits
-            optional = "#" * (maximum_fraction_digits - minimum_fraction_digits)
-            format_pattern = f"{integer_part}.{required}{optional}"
-
+            integer_part = "#,##0" if use_grouping else "0"
+
+            if maximum_fraction_digits == 0:
+                format_pattern = integer_part
+            elif minimum_fraction_digits == maximum_fraction_digits:
+                decimal_part = "0" * minimum_fraction_digits
+                format_pattern = f"{integer_part}.{decimal_part}"
+            else:
+                required = "0" * minimum_fraction_digits
+                optional = "#" * (maximum_fraction_digits - minimum_fraction_digits)
+                format_pattern = f"{integer_part}.{required}{optional}"
+
+        # Equivalent to babel.numbers.format_decimal() minus the per-call parse.
+        number_pattern = parse_number_pattern(format_pattern, pattern_cache)
         return str(
-            babel_numbers.format_decimal(
-                value,
-                format=format_pattern,
-                locale=babel_locale,
-                numbering_system=numbering_system,
-            )
+            number_pattern.apply(value, babel_locale, numbering_system=numbering_system)
         )
 
     except (ValueError, TypeError, InvalidOperation, AttributeError, KeyError) as e:
@@ -224,6 +264,7 @@ def format_currency_for_locale(
     currency_digits: bool = True,
     numbering_system: str = "latn",
     debug_logger: logging.Logger | None = None,
+    pattern_cache: dict[str, NumberPattern] | None = None,
 ) -> str:
     """Format a currency value using the supplied Babel locale."""
     babel_numbers = get_babel_numbers()
@@ -234,7 +275,8 @@ def format_currency_for_locale(
                 babel_numbers.format_currency(
                     value,
                     currency,
-                    format=pattern,
+                    # Babel treats an empty format as "use the locale standard".
+                    format=parse_number_pattern(pattern, pattern_cache) if pattern else None,
                     locale=babel_locale,
                     currency_digits=False,
                     group_separator=use_grouping,
@@ -267,7 +309,7 @@ def format_currency_for_locale(
                     babel_numbers.format_currency(
                         value,
                         currency,
-                        format=code_pattern,
+                        format=parse_number_pattern(code_pattern, pattern_cache),
                         locale=babel_locale,
                         currency_digits=currency_digits,
                         group_separator=use_grouping,
@@ -13,12 +13,172 @@ Python 3.13+.
 Reference: https://www.unicode.org/cldr/charts/latest/supplemental/language_plural_rules.html
 """
 
+from __future__ import annotations
+
+import functools
 from decimal import ROUND_HALF_EVEN, Decimal
+from typing import TYPE_CHECKING, final
 
+from ftllexengine.constants import MAX_LOCALE_CACHE_SIZE, MAX_PLURAL_MEMO_SIZE
 from ftllexengine.core.babel_compat import get_unknown_locale_error_class, require_babel
 from ftllexengine.core.locale_utils import get_babel_locale
 
-__all__ = ["select_plural_category"]
+if TYPE_CHECKING:
+    from babel.plural import PluralRule
+
+__all__ = [
+    "PluralSelector",
+    "clear_plural_selector_cache",
+    "get_plural_selector",
+    "select_plural_category",
+]
+
+
+@final
+class PluralSelector:
+    """Per-locale CLDR plural category selector with a bounded memo.
+
+    Resolves the Babel locale and its cardinal/ordinal rules once, then
+    memoizes ``(operand, precision, ordinal) -> category`` in a per-instance
+    LRU cache of MAX_PLURAL_MEMO_SIZE entries. Select expressions over counts
+    repeat the same few operands, so most selections become a single memo hit
+    instead of rule lookup, Decimal quantization, and CLDR operand extraction.
+
+    Memo keys use ``str()`` for Decimal operands: ``Decimal("1")`` and
+    ``Decimal("1.0")`` compare equal but have different CLDR v operands.
+
+    Thread Safety:
+        Immutable after construction; the memo is an lru_cache, which is
+        thread-safe.
+
+    Note:
+        Obtain instances via get_plural_selector(), which caches one selector
+        per locale code.
+    """
+
+    __slots__ = ("_cardinal", "_categorize", "_ordinal")
+
+    def __init__(self, locale: str) -> None:
+        """Resolve the plural rules for a locale.
+
+        Unknown or invalid locale codes fall back to the CLDR root locale,
+        whose rules return "other" for all values.
+
+        Args:
+            locale: Locale code (e.g., "lv_LV", "en_US", "ar-SA")
+
+        Raises:
+            BabelImportError: If Babel is not installed
+        """
+        require_babel("select_plural_category")
+        unknown_locale_error_class = get_unknown_locale_error_class()
+
+        self._cardinal: PluralRule | None = None
+        self._ordinal: PluralRule | None = None
+        try:
+            # Use cached locale parsing for performance
+            locale_obj = get_babel_locale(locale)
+        except (unknown_locale_error_class, ValueError):
+            # Fallback to CLDR root locale for unknown/invalid locales
+            # CLDR root returns "other" for all values, which is the safest
+            # default since it makes no assumptions about language-specific rules.
+            try:
+                locale_obj = get_babel_locale("root")
+            except (unknown_locale_error_class, ValueError):  # pragma: no cover
+                # Should not happen, but ultimate fallback: rules stay None
+                locale_obj = None
+
+        if locale_obj is not None:
+            # ordinal_form uses CLDR ordinal rules (1st, 2nd, 3rd...);
+            # plural_form uses CLDR cardinal rules (1 item, 2 items...).
+            self._cardinal = locale_obj.plural_form
+            self._ordinal = locale_obj.ordinal_form
+
+        self._categorize = functools.lru_cache(maxsize=MAX_PLURAL_MEMO_SIZE)(self._compute)
+
+    def select(
+        self,
+        n: int | Decimal,
+        precision: int | None = None,
+        *,
+        ordinal: bool = False,
+    ) -> str:
+        """Select the CLDR plural category for a number.
+
+        Args:
+            n: Number to categorize (int or Decimal)
+            precision: Minimum fraction digits (CLDR v operand), None if not specified
+            ordinal: Use CLDR ordinal rules instead of cardinal rules
+
+        Returns:
+            Plural category: "zero", "one", "two", "few", "many", or "other"
+        """
+        if isinstance(n, int):
+            return self._categorize(n, precision, ordinal)
+        # Non-finite Decimal guard: NaN and Infinity cannot be categorized by CLDR rules.
+        # Babel's plural_rule() raises ValueError for non-finite Decimal values.
+        # Per Fluent spec, resolution must never fail catastrophically.
+        # Return "other" (safest category) for non-finite values.
+        if isinstance(n, Decimal) and not n.is_finite():
+            return "other"
+        return self._categorize(str(n), precision, ordinal)
+
+    def _compute(self, operand: int | str, precision: int | None, ordinal: bool) -> str:  # noqa: FBT001 - positional lru_cache key
+        """Evaluate the CLDR rule for a memo key (memo miss path)."""
+        plural_rule = self._ordinal if ordinal else self._cardinal
+        if plural_rule is None:  # pragma: no cover - root locale unavailable
+            return "other"
+
+        n = operand if isinstance(operand, int) else Decimal(operand)
+
+        # Apply precision if specified (for CLDR v operand)
+        # Use >= 0 to ensure precision=0 also triggers quantization (round to integer)
+        if precision is not None and precision >= 0:
+            # Convert to Decimal with specified fraction digits
+            # This ensures Babel's plural rule sees the correct v operand.
+            # Example: 1 with precision=2 becomes Decimal("1.00"), which has v=2.
+            # Example: 1.5 with precision=0 becomes Decimal("2"), which is integer.
+            quantizer = Decimal(10) ** -precision
+            # ROUND_HALF_EVEN matches Babel's default decimal_quantization rounding so
+            # the CLDR v operand used for plural selection agrees with the displayed value.
+            decimal_value = Decimal(str(n)).quantize(quantizer, rounding=ROUND_HALF_EVEN)
+            return plural_rule(decimal_value)
+
+        # Apply CLDR plural rule with original value
+        return plural_rule(n)
+
+
+@functools.lru_cache(maxsize=MAX_LOCALE_CACHE_SIZE)
+def _get_plural_selector_cached(locale: str) -> PluralSelector:
+    """Build and cache the PluralSelector for a locale code."""
+    return PluralSelector(locale)
+
+
+def get_plural_selector(locale: str) -> PluralSelector:
+    """Get the cached PluralSelector for a locale code.
+
+    Thread-safe via lru_cache internal locking.
+
+    Args:
+        locale: Locale code (e.g., "lv_LV", "en_US", "ar-SA")
+
+    Returns:
+        Shared PluralSelector for the locale
+
+    Raises:
+        BabelImportError: If Babel is not installed
+    """
+    # Checked outside the cache so a cached selector never masks Babel removal.
+    require_babel("select_plural_category")
+    return _get_plural_selector_cached(locale)
+
+
+def clear_plural_selector_cache() -> None:
+    """Clear cached PluralSelector instances and their memos.
+
+    Thread-safe via lru_cache internal locking. Does NOT require Babel.
+    """
+    _get_plural_selector_cached.cache_clear()
 
 
 def select_plural_category(
@@ -85,8 +245,9 @@ def select_plural_category(
         If locale parsing fails, falls back to CLDR root locale.
 
     Performance:
-        Uses cached locale parsing via get_babel_locale() to avoid
-        repeated Locale.parse() overhead in hot paths.
+        Delegates to the per-locale PluralSelector from get_plural_selector(),
+        which resolves the locale's rules once and memoizes categories per
+        (value, precision, ordinal).
 
     Precision Handling:
         When precision is provided, the number is converted to Decimal with the
@@ -95,46 +256,4 @@ def select_plural_category(
         - select_plural_category(1, "en_US") -> "one" (v=0: integer)
         - select_plural_category(1, "en_US", precision=2) -> "other" (v=2: "1.00")
     """
-    require_babel("select_plural_category")
-    unknown_locale_error_class = get_unknown_locale_error_class()
-
-    try:
-        # Use cached locale parsing for performance
-        locale_obj = get_babel_locale(locale)
-    except (unknown_locale_error_class, ValueError):
-        # Fallback to CLDR root locale for unknown/invalid locales
-        # CLDR root returns "other" for all values, which is the safest
-        # default since it makes no assumptions about language-specific rules.
-        try:
-            locale_obj = get_babel_locale("root")
-        except (unknown_locale_error_class, ValueError):  # pragma: no cover
-            # Should not happen, but ultimate fallback
-            return "other"
-
-    # Non-finite Decimal guard: NaN and Infinity cannot be categorized by CLDR rules.
-    # Babel's plural_rule() raises ValueError for non-finite Decimal values.
-    # Per Fluent spec, resolution must never fail catastrophically.
-    # Return "other" (safest category) for non-finite values.
-    if isinstance(n, Decimal) and (n.is_nan() or n.is_infinite()):
-        return "other"
-
-    # Get plural rule from Babel CLDR data.
-    # ordinal_form uses CLDR ordinal rules (1st, 2nd, 3rd...);
-    # plural_form uses CLDR cardinal rules (1 item, 2 items...).
-    plural_rule = locale_obj.ordinal_form if ordinal else locale_obj.plural_form
-
-    # Apply precision if specified (for CLDR v operand)
-    # Use >= 0 to ensure precision=0 also triggers quantization (round to integer)
-    if precision is not None and precision >= 0:
-        # Convert to Decimal with specified fraction digits
-        # This ensures Babel's plural rule sees the correct v operand.
-        # Example: 1 with precision=2 becomes Decimal("1.00"), which has v=2.
-        # Example: 1.5 with precision=0 becomes Decimal("2"), which is integer.
-        quantizer = Decimal(10) ** -precision
-        # ROUND_HALF_EVEN matches Babel's default decimal_quantization rounding so
-        # the CLDR v operand used for plural selection agrees with the displayed value.
-        decimal_value = Decimal(str(n)).quantize(quantizer, rounding=ROUND_HALF_EVEN)
-        return plural_rule(decimal_value)
-
-    # Apply CLDR plural rule with original value
-    return plural_rule(n)
+    return get_plural_selector(locale).select(n, precision, ordinal=ordinal)
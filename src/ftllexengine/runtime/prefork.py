@@ -0,0 +1,52 @@
+"""Pre-fork preparation for sharing formatting state with forked workers.
+
+Pre-fork servers (gunicorn, uWSGI, ``multiprocessing`` with the fork start
+method) share the master's memory pages with every worker copy-on-write.
+Two things defeat that sharing for a naively prepared FluentBundle:
+
+- State built lazily on first use (Babel CLDR locale data, number patterns,
+  plural selectors, fallback bundles) is rebuilt privately in every worker.
+- CPython's cyclic garbage collector writes to the header of every tracked
+  object it examines, so the first full collection in a worker dirties
+  nearly every page holding parsed ASTs and resolver state.
+
+``prepare_for_fork()`` on FluentBundle and FluentLocalization builds the lazy
+state once in the master and then moves every live object into the
+collector's permanent generation (``gc.freeze()``), which is never scanned.
+Reference-count updates on objects a worker actually touches while
+formatting still copy those pages; everything else stays shared.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import gc
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from .locale_context import LocaleContext
+from .plural_rules import get_plural_selector
+
+if TYPE_CHECKING:
+    from ftllexengine.core.semantic_types import LocaleCode
+
+__all__ = ["freeze_heap", "warm_locale_data"]
+
+
+def warm_locale_data(locale: LocaleCode) -> None:
+    """Load the CLDR data and per-locale caches formatting would build lazily."""
+    context = LocaleContext.create_or_raise(locale)
+    context.format_number(Decimal("1.5"))
+    get_plural_selector(context.locale_code)
+
+
+def freeze_heap() -> None:
+    """Collect garbage, then exclude all surviving objects from future collections.
+
+    Call in the master process after all shared state is built and before
+    forking. Objects allocated later (including in workers) are collected
+    normally; ``gc.unfreeze()`` reverses the operation.
+    """
+    gc.collect()
+    gc.freeze()
@@ -23,6 +23,8 @@ from ftllexengine.constants import (
     FALLBACK_MISSING_MESSAGE,
     FALLBACK_MISSING_TERM,
     MAX_DEPTH,
+    UNICODE_FSI,
+    UNICODE_PDI,
 )
 from ftllexengine.core import depth_clamp
 from ftllexengine.diagnostics import (
@@ -30,6 +32,10 @@ from ftllexengine.diagnostics import (
     ErrorTemplate,
     FrozenFluentError,
 )
+from ftllexengine.runtime.attribute_index import find_attribute
+from ftllexengine.runtime.plural_rules import (
+    get_plural_selector as _get_plural_selector,
+)
 from ftllexengine.runtime.plural_rules import (
     select_plural_category as _select_plural_category,
 )
@@ -37,6 +43,7 @@ from ftllexengine.runtime.resolution_context import (
     GlobalDepthGuard,
     ResolutionContext,
 )
+from ftllexengine.runtime.resolver_compiled import _ResolverCompiledMixin
 from ftllexengine.runtime.resolver_runtime import _ResolverRuntimeMixin
 from ftllexengine.runtime.resolver_selection import _ResolverSelectionMixin
 from ftllexengine.syntax import (
@@ -59,21 +66,20 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from ftllexengine.core.value_types import FluentValue
+    from ftllexengine.runtime.attribute_index import AttributeTable
     from ftllexengine.runtime.function_bridge import FunctionRegistry
+    from ftllexengine.runtime.resolver_compiled import PatternPlan
+    from ftllexengine.runtime.static_terms import StaticTerm
 
 __all__ = ["FluentResolver", "GlobalDepthGuard", "ResolutionContext"]
 
+get_plural_selector = _get_plural_selector
 select_plural_category = _select_plural_category
 
 logger = logging.getLogger(__name__)
 
-# Unicode bidirectional isolation characters per Unicode TR9.
-# Used to prevent RTL/LTR text interference when interpolating values.
-UNICODE_FSI: str = "\u2068"  # U+2068 FIRST STRONG ISOLATE
-UNICODE_PDI: str = "\u2069"  # U+2069 POP DIRECTIONAL ISOLATE
-
 
-class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
+class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin, _ResolverCompiledMixin):
     """Resolves Fluent messages to strings.
 
     Aligned with Mozilla python-fluent error handling:
@@ -84,14 +90,32 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
     Thread Safety:
         Uses explicit ResolutionContext instead of thread-local state for
         full reentrancy and async framework compatibility.
+
+    Compiled Plans:
+        When constructed with a ``plans`` mapping, patterns with a matching
+        PatternPlan run through a flat pre-bound step loop instead of the AST
+        interpreter. Patterns without a plan are interpreted as usual.
+
+    Static Terms:
+        When constructed with a ``static_terms`` mapping, argument-free
+        references to the terms it holds return their pre-resolved text
+        (see static_terms) instead of resolving the term pattern.
+
+    Attribute Tables:
+        When constructed with an ``attributes`` mapping, message and term
+        attributes of the entries it indexes are found by name (see
+        attribute_index) instead of by scanning the entry's attributes.
     """
 
     __slots__ = (
+        "_attributes",
         "_function_registry",
         "_locale",
         "_max_expansion_size",
         "_max_nesting_depth",
         "_messages",
+        "_plans",
+        "_static_terms",
         "_terms",
         "_use_isolating",
     )
@@ -106,6 +130,9 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
         use_isolating: bool = True,
         max_nesting_depth: int = MAX_DEPTH,
         max_expansion_size: int = DEFAULT_MAX_EXPANSION_SIZE,
+        plans: dict[int, PatternPlan] | None = None,
+        static_terms: dict[tuple[str, str | None], StaticTerm] | None = None,
+        attributes: dict[int, AttributeTable] | None = None,
     ) -> None:
         """Initialize resolver.
 
@@ -117,6 +144,12 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
             use_isolating: Wrap interpolated values in Unicode bidi marks (keyword-only)
             max_nesting_depth: Maximum resolution depth limit (keyword-only)
             max_expansion_size: Maximum total characters in resolved output (keyword-only)
+            plans: Compiled pattern plans keyed by ``id(pattern)``, shared by
+                reference with the owning bundle (keyword-only)
+            static_terms: Pre-resolved static terms keyed by ``(term_id, attribute)``,
+                shared by reference with the owning bundle (keyword-only)
+            attributes: Attribute tables keyed by ``id(entry)``, shared by
+                reference with the owning bundle (keyword-only)
         """
         self._locale = locale
         self._use_isolating = use_isolating
@@ -125,6 +158,9 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
         self._function_registry = function_registry
         self._max_nesting_depth = depth_clamp(max_nesting_depth)
         self._max_expansion_size = max_expansion_size
+        self._plans = plans
+        self._static_terms = static_terms
+        self._attributes = attributes
 
     def resolve_message(
         self,
@@ -186,14 +222,14 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
 
         # Select pattern (value or attribute)
         if attribute:
-            attr = next((a for a in reversed(message.attributes) if a.id.name == attribute), None)
-            if not attr:
+            attr_pattern = find_attribute(self._attributes, message, attribute)
+            if attr_pattern is None:
                 diag = ErrorTemplate.attribute_not_found(attribute, message.id.name)
                 error = FrozenFluentError(str(diag), ErrorCategory.REFERENCE, diagnostic=diag)
                 errors.append(error)
                 fallback = FALLBACK_MISSING_MESSAGE.format(id=f"{message.id.name}.{attribute}")
                 return (fallback, tuple(errors))
-            pattern = attr.value
+            pattern = attr_pattern
         else:
             if message.value is None:
                 diag = ErrorTemplate.message_no_value(message.id.name)
@@ -240,7 +276,7 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
             fallback = FALLBACK_MISSING_MESSAGE.format(id=msg_key)
             return (fallback, tuple(errors))
 
-    def _resolve_pattern(
+    def _resolve_pattern(  # noqa: PLR0912  # Plan dispatch plus per-element interpreter
         self,
         pattern: Pattern,
         args: Mapping[str, FluentValue],
@@ -267,6 +303,10 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
             )
             return "".join(parts)
 
+        plan = self._find_plan(pattern)
+        if plan is not None:
+            return self._run_plan(plan, args, errors, context)
+
         for element in pattern.elements:
             match element:
                 case TextElement():
@@ -416,6 +456,24 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
         errors.extend(nested_errors)
         return result
 
+    def _lookup_static_term(
+        self, expr: TermReference, context: ResolutionContext
+    ) -> str | None:
+        """Return a pre-resolved term's text, charging the budget, if it applies."""
+        static_terms = self._static_terms
+        arguments = expr.arguments
+        if not static_terms or (
+            arguments is not None and (arguments.positional or arguments.named)
+        ):
+            return None
+        static = static_terms.get(
+            (expr.id.name, expr.attribute.name if expr.attribute is not None else None)
+        )
+        if static is None or not static.fits(context):
+            return None
+        context.track_expansion(static.charge)
+        return static.text
+
     def _resolve_term_reference(
         self,
         expr: TermReference,
@@ -430,7 +488,13 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
 
         Term arguments are evaluated and merged into the resolution context,
         allowing term patterns to reference them as variables.
+
+        Argument-free references to a pre-resolved static term return its text
+        when the whole expansion fits within the context's limits.
         """
+        static_text = self._lookup_static_term(expr, context)
+        if static_text is not None:
+            return static_text
         term_id = expr.id.name
         if term_id not in self._terms:
             diag = ErrorTemplate.term_not_found(term_id)
@@ -438,16 +502,13 @@ class FluentResolver(_ResolverRuntimeMixin, _ResolverSelectionMixin):
         term = self._terms[term_id]
 
         # Select pattern (value or attribute)
-        # Use reversed() for last-wins semantics, consistent with message attribute resolution
+        # Last-wins for duplicate attributes, consistent with message attribute resolution
         if expr.attribute:
-            attr = next(
-                (a for a in reversed(term.attributes) if a.id.name == expr.attribute.name),
-                None,
-            )
-            if not attr:
+            attr_pattern = find_attribute(self._attributes, term, expr.attribute.name)
+            if attr_pattern is None:
                 diag = ErrorTemplate.term_attribute_not_found(expr.attribute.name, term_id)
                 raise FrozenFluentError(str(diag), ErrorCategory.REFERENCE, diagnostic=diag)
-            pattern = attr.value
+            pattern = attr_pattern
         else:
             pattern = term.value
 
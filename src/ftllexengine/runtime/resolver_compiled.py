@@ -0,0 +1,354 @@
+"""Compiled resolution plans for FluentResolver.
+
+A plan lowers one ``Pattern`` into a flat tuple of steps: literal text chunks
+and pre-bound evaluator callables for placeables. Expression dispatch happens
+once at compile time instead of on every ``format_pattern`` call.
+
+Plans never change resolution semantics. Evaluators delegate to the same
+resolver methods the interpreter uses for anything beyond literals and
+variable lookups, and the plan loop applies the identical expansion-budget,
+depth-guard, bidi-isolation, and error-fallback rules as
+``FluentResolver._resolve_pattern``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ftllexengine.constants import UNICODE_FSI, UNICODE_PDI
+from ftllexengine.diagnostics import ErrorCategory, ErrorTemplate, FrozenFluentError
+from ftllexengine.syntax import (
+    FunctionReference,
+    Message,
+    MessageReference,
+    NumberLiteral,
+    Pattern,
+    Placeable,
+    SelectExpression,
+    StringLiteral,
+    Term,
+    TermReference,
+    TextElement,
+    VariableReference,
+)
+
+if TYPE_CHECKING:
+    from ftllexengine.core.value_types import FluentValue
+    from ftllexengine.runtime.resolution_context import ResolutionContext
+    from ftllexengine.syntax import Expression
+
+__all__ = ["PatternPlan", "PlaceableStep", "iter_entry_patterns"]
+
+type Evaluator = Callable[
+    [_ResolverCompiledMixin, Mapping[str, FluentValue], list[FrozenFluentError], ResolutionContext],
+    FluentValue,
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PlaceableStep:
+    """Pre-bound evaluator for one top-level placeable of a pattern.
+
+    Attributes:
+        expression: Source expression, kept for fallback rendering
+        evaluate: Callable ``(resolver, args, errors, context) -> FluentValue``
+    """
+
+    expression: Expression
+    evaluate: Evaluator
+
+
+@dataclass(frozen=True, slots=True)
+class PatternPlan:
+    """Flat resolution plan for one pattern.
+
+    Attributes:
+        pattern: Pattern this plan was compiled from (identity-checked on use)
+        steps: Text chunks and placeable steps in source order
+    """
+
+    pattern: Pattern
+    steps: tuple[str | PlaceableStep, ...]
+
+
+def _iter_expression_patterns(expr: Expression) -> Iterator[Pattern]:
+    """Yield every pattern nested inside an expression."""
+    match expr:
+        case SelectExpression():
+            yield from _iter_expression_patterns(expr.selector)
+            for variant in expr.variants:
+                yield from _iter_pattern_tree(variant.value)
+        case Placeable():
+            yield from _iter_expression_patterns(expr.expression)
+        case FunctionReference() | TermReference() if expr.arguments is not None:
+            for arg in expr.arguments.positional:
+                yield from _iter_expression_patterns(arg)
+        case _:
+            return
+
+
+def _iter_pattern_tree(pattern: Pattern) -> Iterator[Pattern]:
+    """Yield a pattern and every pattern nested in its placeables."""
+    yield pattern
+    for element in pattern.elements:
+        if isinstance(element, Placeable):
+            yield from _iter_expression_patterns(element.expression)
+
+
+def iter_entry_patterns(entry: Message | Term) -> Iterator[Pattern]:
+    """Yield every pattern reachable from a message or term.
+
+    Covers the value, all attributes, select-expression variants, and
+    patterns nested inside function or term arguments.
+    """
+    if entry.value is not None:
+        yield from _iter_pattern_tree(entry.value)
+    for attr in entry.attributes:
+        yield from _iter_pattern_tree(attr.value)
+
+
+def _bind_delegate[E: Expression](
+    method: Callable[
+        [
+            _ResolverCompiledMixin,
+            E,
+            Mapping[str, FluentValue],
+            list[FrozenFluentError],
+            ResolutionContext,
+        ],
+        FluentValue,
+    ],
+    expr: E,
+) -> Evaluator:
+    """Pre-bind an expression to an unbound resolver method."""
+
+    def evaluate_delegate(
+        resolver: _ResolverCompiledMixin,
+        args: Mapping[str, FluentValue],
+        errors: list[FrozenFluentError],
+        context: ResolutionContext,
+    ) -> FluentValue:
+        return method(resolver, expr, args, errors, context)
+
+    return evaluate_delegate
+
+
+class _ResolverCompiledMixin:
+    """Plan compilation and plan execution for FluentResolver."""
+
+    _plans: dict[int, PatternPlan] | None
+    _use_isolating: bool
+
+    if TYPE_CHECKING:
+
+        def _format_value(self, value: object) -> str: ...
+
+        def _get_fallback_for_placeable(self, expr: Expression, depth: int = 10) -> str: ...
+
+        def _resolve_expression(
+            self,
+            expr: Expression,
+            args: Mapping[str, FluentValue],
+            errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> FluentValue: ...
+
+        def _resolve_variable_reference(
+            self,
+            expr: VariableReference,
+            args: Mapping[str, FluentValue],
+            context: ResolutionContext,
+        ) -> FluentValue: ...
+
+        def _resolve_message_reference(
+            self,
+            expr: MessageReference,
+            args: Mapping[str, FluentValue],
+            errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> str: ...
+
+        def _resolve_term_reference(
+            self,
+            expr: TermReference,
+            args: Mapping[str, FluentValue],
+            errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> str: ...
+
+        def _resolve_function_call(
+            self,
+            func_ref: FunctionReference,
+            args: Mapping[str, FluentValue],
+            errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> FluentValue: ...
+
+        def _resolve_select_expression(
+            self,
+            expr: SelectExpression,
+            args: Mapping[str, FluentValue],
+            errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> str: ...
+
+    @classmethod
+    def compile_entry(cls, entry: Message | Term) -> dict[int, PatternPlan]:
+        """Compile every pattern reachable from an entry into plans.
+
+        Args:
+            entry: Message or Term AST node
+
+        Returns:
+            Mapping of ``id(pattern)`` to its compiled plan
+        """
+        return {
+            id(pattern): cls._compile_pattern(pattern)
+            for pattern in iter_entry_patterns(entry)
+        }
+
+    @classmethod
+    def _compile_pattern(cls, pattern: Pattern) -> PatternPlan:
+        """Lower one pattern into text chunks and placeable steps."""
+        steps: list[str | PlaceableStep] = []
+        for element in pattern.elements:
+            if isinstance(element, TextElement):
+                # Adjacent text elements stay separate: the expansion budget is
+                # checked per element and overflow must truncate at the same point.
+                steps.append(element.value)
+            else:
+                steps.append(
+                    PlaceableStep(element.expression, cls._compile_expression(element.expression))
+                )
+        return PatternPlan(pattern, tuple(steps))
+
+    @classmethod
+    def _compile_expression(cls, expr: Expression) -> Evaluator:
+        """Build a pre-bound evaluator for one expression."""
+        match expr:
+            case StringLiteral() | NumberLiteral():
+                constant: FluentValue = expr.value
+
+                def evaluate_literal(
+                    _resolver: _ResolverCompiledMixin,
+                    _args: Mapping[str, FluentValue],
+                    _errors: list[FrozenFluentError],
+                    _context: ResolutionContext,
+                ) -> FluentValue:
+                    return constant
+
+                return evaluate_literal
+            case VariableReference():
+                return cls._compile_variable(expr)
+            case Placeable():
+                inner = cls._compile_expression(expr.expression)
+
+                def evaluate_nested(
+                    resolver: _ResolverCompiledMixin,
+                    args: Mapping[str, FluentValue],
+                    errors: list[FrozenFluentError],
+                    context: ResolutionContext,
+                ) -> FluentValue:
+                    with context.expression_guard:
+                        return inner(resolver, args, errors, context)
+
+                return evaluate_nested
+            case _:
+                return cls._compile_delegate(expr)
+
+    @classmethod
+    def _compile_variable(cls, expr: VariableReference) -> Evaluator:
+        """Build an evaluator that reads a variable without dispatch."""
+        name = expr.id.name
+        resolve_missing = cls._resolve_variable_reference
+
+        def evaluate_variable(
+            resolver: _ResolverCompiledMixin,
+            args: Mapping[str, FluentValue],
+            _errors: list[FrozenFluentError],
+            context: ResolutionContext,
+        ) -> FluentValue:
+            if name in args:
+                return args[name]
+            # Raises the interpreter's missing-variable error with resolution path.
+            return resolve_missing(resolver, expr, args, context)
+
+        return evaluate_variable
+
+    @classmethod
+    def _compile_delegate(cls, expr: Expression) -> Evaluator:
+        """Bind a structural expression to its resolver method once."""
+        match expr:
+            case SelectExpression():
+                return _bind_delegate(cls._resolve_select_expression, expr)
+            case MessageReference():
+                return _bind_delegate(cls._resolve_message_reference, expr)
+            case TermReference():
+                return _bind_delegate(cls._resolve_term_reference, expr)
+            case FunctionReference():
+                return _bind_delegate(cls._resolve_function_call, expr)
+            case _:
+                return _bind_delegate(cls._resolve_expression, expr)
+
+    def _find_plan(self, pattern: Pattern) -> PatternPlan | None:
+        """Return the compiled plan for a pattern, if one exists."""
+        if self._plans is None:
+            return None
+        plan = self._plans.get(id(pattern))
+        # Identity check guards against id() reuse after an entry is replaced.
+        if plan is None or plan.pattern is not pattern:
+            return None
+        return plan
+
+    def _run_plan(
+        self,
+        plan: PatternPlan,
+        args: Mapping[str, FluentValue],
+        errors: list[FrozenFluentError],
+        context: ResolutionContext,
+    ) -> str:
+        """Execute a compiled plan with interpreter-identical semantics."""
+        parts: list[str] = []
+        limit = context.max_expansion_size
+        isolating = self._use_isolating
+
+        for step in plan.steps:
+            if isinstance(step, str):
+                context.track_expansion(len(step))
+                if context.total_chars > limit:
+                    diag = ErrorTemplate.expansion_budget_exceeded(context.total_chars, limit)
+                    errors.append(
+                        FrozenFluentError(str(diag), ErrorCategory.RESOLUTION, diagnostic=diag)
+                    )
+                    break
+                parts.append(step)
+                continue
+
+            try:
+                with context.expression_guard:
+                    value = step.evaluate(self, args, errors, context)
+                formatted = self._format_value(value)
+                pre_track = context.total_chars
+                context.track_expansion(len(formatted))
+                if context.total_chars > limit:
+                    if pre_track <= limit:
+                        diag = ErrorTemplate.expansion_budget_exceeded(
+                            context.total_chars, limit
+                        )
+                        errors.append(
+                            FrozenFluentError(
+                                str(diag), ErrorCategory.RESOLUTION, diagnostic=diag
+                            )
+                        )
+                    break
+                parts.append(f"{UNICODE_FSI}{formatted}{UNICODE_PDI}" if isolating else formatted)
+            except FrozenFluentError as e:
+                errors.append(e)
+                if e.category == ErrorCategory.FORMATTING and e.fallback_value:
+                    parts.append(e.fallback_value)
+                else:
+                    parts.append(self._get_fallback_for_placeable(step.expression))
+
+        return "".join(parts)
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
     from ftllexengine.runtime.resolution_context import ResolutionContext
     from ftllexengine.syntax import Expression, Pattern, SelectExpression, Variant
 
+    from .variant_index import VariantIndex
+
 
 class ResolverStateProtocol(Protocol):
     """Structural contract implemented by FluentResolver for its mixins."""
@@ -66,18 +68,18 @@ class ResolverStateProtocol(Protocol):
 
     def _find_exact_variant(
         self,
-        variants: Sequence[Variant],
+        index: VariantIndex,
         selector_value: object,
         selector_str: str,
     ) -> Variant | None:
         ...  # pragma: no cover - typing-only protocol declaration
 
     def _find_plural_variant(
-        self, variants: Sequence[Variant], plural_category: str
+        self, index: VariantIndex, plural_category: str
     ) -> Variant | None:
         ...  # pragma: no cover - typing-only protocol declaration
 
-    def _find_default_variant(self, variants: Sequence[Variant]) -> Variant | None:
+    def _find_default_variant(self, index: VariantIndex) -> Variant | None:
         ...  # pragma: no cover - typing-only protocol declaration
 
     def _get_reference_fallback(self, expr: Expression) -> str | None:
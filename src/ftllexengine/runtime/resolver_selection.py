@@ -9,14 +9,17 @@ from ftllexengine.core.babel_compat import BabelImportError
 from ftllexengine.core.value_types import FluentNumber
 from ftllexengine.diagnostics import ErrorCategory, ErrorTemplate, FrozenFluentError
 from ftllexengine.runtime import resolver as _resolver_module
-from ftllexengine.syntax import Expression, Identifier, NumberLiteral, SelectExpression, Variant
+
+from .variant_index import variant_index
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Mapping
 
     from ftllexengine.core.value_types import FluentValue
     from ftllexengine.runtime.resolution_context import ResolutionContext
-    from ftllexengine.syntax import Pattern
+    from ftllexengine.syntax import Expression, Pattern, SelectExpression, Variant
+
+    from .variant_index import VariantIndex
 
 
 class _ResolverSelectionMixin:
@@ -46,7 +49,7 @@ class _ResolverSelectionMixin:
 
     def _find_exact_variant(
         self,
-        variants: Sequence[Variant],
+        index: VariantIndex,
         selector_value: object,
         selector_str: str,
     ) -> Variant | None:
@@ -61,35 +64,17 @@ class _ResolverSelectionMixin:
         if numeric_for_match is not None:
             sel_decimal = Decimal(str(numeric_for_match))
 
-        for variant in variants:
-            match variant.key:
-                case Identifier(name=key_name):
-                    if key_name == selector_str:
-                        return variant
-                case NumberLiteral(raw=raw_str):
-                    if sel_decimal is not None and Decimal(raw_str) == sel_decimal:
-                        return variant
-        return None
+        return index.exact(selector_str, sel_decimal)
 
     def _find_plural_variant(
-        self, variants: Sequence[Variant], plural_category: str
+        self, index: VariantIndex, plural_category: str
     ) -> Variant | None:
         """Pass 2: find a plural-category variant match."""
-        for variant in variants:
-            match variant.key:
-                case Identifier(name=key_name):
-                    if key_name == plural_category:
-                        return variant
-        return None
-
-    def _find_default_variant(
-        self, variants: Sequence[Variant]
-    ) -> Variant | None:
+        return index.named(plural_category)
+
+    def _find_default_variant(self, index: VariantIndex) -> Variant | None:
         """Return the default variant, if one exists."""
-        for variant in variants:
-            if variant.default:
-                return variant
-        return None
+        return index.default
 
     def _resolve_select_expression(
         self,
@@ -98,7 +83,11 @@ class _ResolverSelectionMixin:
         errors: list[FrozenFluentError],
         context: ResolutionContext,
     ) -> str:
-        """Resolve a select expression using Fluent's matching order."""
+        """Resolve a select expression using Fluent's matching order.
+
+        Each pass is a lookup in the expression's VariantIndex, so selection
+        cost does not grow with the number of variants.
+        """
         try:
             with context.expression_guard:
                 selector_value = self._resolve_expression(expr.selector, args, errors, context)
@@ -108,7 +97,8 @@ class _ResolverSelectionMixin:
 
         selector_str = self._format_value(selector_value)
 
-        exact_match = self._find_exact_variant(expr.variants, selector_value, selector_str)
+        index = variant_index(expr)
+        exact_match = self._find_exact_variant(index, selector_value, selector_str)
         if exact_match is not None:
             return self._resolve_pattern(exact_match.value, args, errors, context)
 
@@ -124,12 +114,10 @@ class _ResolverSelectionMixin:
 
         if numeric_value is not None:
             try:
-                plural_category = _resolver_module.select_plural_category(
-                    numeric_value,
-                    self._locale,
-                    precision,
+                plural_category = _resolver_module.get_plural_selector(self._locale).select(
+                    numeric_value, precision
                 )
-                plural_match = self._find_plural_variant(expr.variants, plural_category)
+                plural_match = self._find_plural_variant(index, plural_category)
                 if plural_match is not None:
                     return self._resolve_pattern(plural_match.value, args, errors, context)
             except BabelImportError:
@@ -148,7 +136,7 @@ class _ResolverSelectionMixin:
         context: ResolutionContext,
     ) -> str:
         """Resolve the default or first variant after selector failure."""
-        default_variant = self._find_default_variant(expr.variants)
+        default_variant = self._find_default_variant(variant_index(expr))
         if default_variant is not None:
             return self._resolve_pattern(default_variant.value, args, errors, context)
 
@@ -0,0 +1,333 @@
+"""Content-addressed on-disk cache of parsed FTL resources.
+
+Every process start parses each ``.ftl`` source and extracts the message/term
+dependency set of every entry before a bundle can format anything. ResourceCache
+persists that work as one file per distinct resource, so an unchanged resource
+is restored with a single read instead of a parse.
+
+Cache Key:
+    BLAKE2b-256 over the cache format version, the ftllexengine version, the
+    parser limits (max_source_size, max_nesting_depth, max_parse_errors), and
+    the UTF-8 source text. Any change to the source, the library, or the limits
+    selects a different file; stale files are never consulted.
+
+File Layout:
+    ``MAGIC | BLAKE2b-256(payload, key=cache key) | payload``
+
+    The payload is a pickled CompiledResource. Its digest is keyed with the
+    cache key, binding each file to the exact source it was built from.
+
+Integrity:
+    A file whose digest does not verify, or whose payload does not decode, is
+    corruption under the same model as IntegrityCache: strict caches raise
+    CacheCorruptionError, non-strict caches delete the file and re-parse.
+    Payloads are decoded by an unpickler restricted to AST node classes,
+    CommentType, Decimal, and frozenset, so a cache file cannot name any
+    other callable.
+
+Thread Safety:
+    Counters are protected by a Lock. Files are written to a temporary name
+    and renamed into place, so concurrent writers and readers (including
+    other processes sharing the directory) never observe partial files.
+    Instances pickle as their directory and strict flag, so process-pool
+    workers share the files; counters are per process.
+
+Python 3.13+. Zero external dependencies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import logging
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import partial
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _get_version
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, TypedDict, final
+
+from ftllexengine.core.reference_graph import entry_dependency_set
+from ftllexengine.integrity import CacheCorruptionError, IntegrityContext
+from ftllexengine.introspection import extract_references
+from ftllexengine.syntax import ast
+from ftllexengine.syntax.ast import Message, Resource, Term
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable
+
+    from ftllexengine.syntax.parser import FluentParserV1
+
+__all__ = ["CompiledResource", "ResourceCache", "ResourceCacheStats"]
+
+logger = logging.getLogger(__name__)
+
+# Bump when the payload layout changes; part of every cache key.
+_FORMAT_VERSION: int = 1
+
+_MAGIC: bytes = b"FTLC"
+_DIGEST_SIZE: int = 32
+_HEADER_SIZE: int = len(_MAGIC) + _DIGEST_SIZE
+_FILE_SUFFIX: str = ".ftlc"
+# Writes in progress use this suffix, so clear() never matches and deletes them.
+_TMP_SUFFIX: str = ".ftlc-tmp"
+_KEY_PERSON: bytes = b"ftllexengine-rc"
+
+# Globals a cache payload may reference. Anything else fails to unpickle.
+_ALLOWED_GLOBALS: frozenset[tuple[str, str]] = frozenset(
+    {(ast.__name__, name) for name in ast.__all__ if isinstance(getattr(ast, name), type)}
+    | {
+        (__name__, "CompiledResource"),
+        ("ftllexengine.enums", "CommentType"),
+        ("decimal", "Decimal"),
+        ("builtins", "frozenset"),
+    }
+)
+
+
+def _library_version() -> str:
+    """Return the installed ftllexengine version (development fallback)."""
+    try:
+        return _get_version("ftllexengine")
+    except PackageNotFoundError:  # pragma: no cover - source checkout without metadata
+        return "0.0.0+dev"
+
+
+class _ResourceUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves globals listed in _ALLOWED_GLOBALS."""
+
+    def find_class(self, module: str, name: str) -> type:
+        if (module, name) not in _ALLOWED_GLOBALS:
+            msg = f"global '{module}.{name}' is not allowed in resource cache payloads"
+            raise pickle.UnpicklingError(msg)
+        result: type = super().find_class(module, name)
+        return result
+
+
+class ResourceCacheStats(TypedDict):
+    """Typed statistics snapshot returned by ResourceCache.get_stats()."""
+
+    hits: int
+    misses: int
+    writes: int
+    write_errors: int
+    corruption_detected: int
+    strict: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledResource:
+    """Parsed resource plus the dependency set of each of its entries.
+
+    Attributes:
+        resource: Parsed AST resource
+        dependencies: One item per ``resource.entries`` position: the
+            ``entry_dependency_set`` of a Message or Term, None otherwise
+    """
+
+    resource: Resource
+    dependencies: tuple[frozenset[str] | None, ...]
+
+    @classmethod
+    def from_resource(cls, resource: Resource) -> CompiledResource:
+        """Compute entry dependency sets for a freshly parsed resource."""
+        return cls(
+            resource=resource,
+            dependencies=tuple(
+                entry_dependency_set(*extract_references(entry))
+                if isinstance(entry, (Message, Term))
+                else None
+                for entry in resource.entries
+            ),
+        )
+
+
+@final
+class ResourceCache:
+    """Persistent content-addressed cache of parsed FTL resources.
+
+    Share one instance (or one directory) between every bundle that should
+    reuse parse results. The directory is created on construction.
+
+    Example:
+        >>> cache = ResourceCache("/var/cache/myapp/ftl")  # doctest: +SKIP
+        >>> bundle = FluentBundle("en_US", resource_cache=cache)  # doctest: +SKIP
+        >>> bundle.add_resource(source)  # parsed once, then loaded from disk  # doctest: +SKIP
+    """
+
+    __slots__ = (
+        "_corruption_detected",
+        "_directory",
+        "_hits",
+        "_lock",
+        "_misses",
+        "_strict",
+        "_version",
+        "_write_errors",
+        "_writes",
+    )
+
+    def __init__(self, directory: str | os.PathLike[str], *, strict: bool = True) -> None:
+        """Initialize cache rooted at directory.
+
+        Args:
+            directory: Directory holding cache files (created if missing)
+            strict: Raise CacheCorruptionError on corrupted files (default: True).
+                When False, corrupted files are deleted and the source re-parsed.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._strict = strict
+        self._version = _library_version()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._write_errors = 0
+        self._corruption_detected = 0
+
+    def __reduce__(self) -> tuple[Callable[[Path], ResourceCache], tuple[Path]]:
+        """Pickle as (directory, strict) so process-pool workers share the directory."""
+        return partial(ResourceCache, strict=self._strict), (self._directory,)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding cache files."""
+        return self._directory
+
+    @property
+    def strict(self) -> bool:
+        """Whether corrupted files raise CacheCorruptionError."""
+        return self._strict
+
+    def make_key(self, source: str, parser: FluentParserV1) -> str:
+        """Return the hex cache key for source parsed under parser's limits."""
+        hasher = hashlib.blake2b(digest_size=_DIGEST_SIZE, person=_KEY_PERSON)
+        header = (
+            f"{_FORMAT_VERSION}\x00{self._version}\x00{parser.max_source_size}\x00"
+            f"{parser.max_nesting_depth}\x00{parser.max_parse_errors}\x00"
+        )
+        hasher.update(header.encode("ascii"))
+        hasher.update(source.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def load_or_parse(self, source: str, parser: FluentParserV1) -> CompiledResource:
+        """Return the compiled resource for source, parsing only on a cache miss.
+
+        Args:
+            source: FTL source text
+            parser: Parser used on a miss; its limits are part of the key
+
+        Returns:
+            CompiledResource equal to ``CompiledResource.from_resource(parser.parse(source))``
+
+        Raises:
+            CacheCorruptionError: If the cached file is corrupted and strict=True
+        """
+        key = self.make_key(source, parser)
+        path = self._directory / f"{key}{_FILE_SUFFIX}"
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+
+        if data is not None:
+            compiled = self._decode(key, path, data)
+            if compiled is not None:
+                with self._lock:
+                    self._hits += 1
+                return compiled
+
+        compiled = CompiledResource.from_resource(parser.parse(source))
+        with self._lock:
+            self._misses += 1
+        self._store(key, path, compiled)
+        return compiled
+
+    def clear(self) -> int:
+        """Delete every cache file in the directory; returns the number deleted.
+
+        Temporary files of writes in progress are left in place and not counted.
+        """
+        removed = 0
+        for path in self._directory.glob(f"*{_FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def get_stats(self) -> ResourceCacheStats:
+        """Return a snapshot of cache counters."""
+        with self._lock:
+            return ResourceCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                write_errors=self._write_errors,
+                corruption_detected=self._corruption_detected,
+                strict=self._strict,
+            )
+
+    def _decode(self, key: str, path: Path, data: bytes) -> CompiledResource | None:
+        """Verify and decode one cache file; None if corrupted and non-strict."""
+        payload = data[_HEADER_SIZE:]
+        actual = hashlib.blake2b(
+            payload, digest_size=_DIGEST_SIZE, key=bytes.fromhex(key)
+        ).digest()
+        compiled: object = None
+        if data[: len(_MAGIC)] == _MAGIC and hmac.compare_digest(
+            data[len(_MAGIC) : _HEADER_SIZE], actual
+        ):
+            try:
+                compiled = _ResourceUnpickler(io.BytesIO(payload)).load()
+            except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+                compiled = None
+        if isinstance(compiled, CompiledResource):
+            return compiled
+
+        with self._lock:
+            self._corruption_detected += 1
+        if self._strict:
+            context = IntegrityContext(
+                component="resource_cache",
+                operation="load",
+                key=path.name,
+                expected="<valid cache file>",
+                actual=f"<{len(data)} unverifiable bytes>",
+                timestamp=time.monotonic(),
+                wall_time_unix=time.time(),
+            )
+            msg = f"Resource cache file corrupted: {path}"
+            raise CacheCorruptionError(msg, context=context)
+        logger.warning("Discarding corrupted resource cache file: %s", path)
+        path.unlink(missing_ok=True)
+        return None
+
+    def _store(self, key: str, path: Path, compiled: CompiledResource) -> None:
+        """Atomically write one cache file; I/O failures are counted, not raised."""
+        payload = pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.blake2b(
+            payload, digest_size=_DIGEST_SIZE, key=bytes.fromhex(key)
+        ).digest()
+        tmp_name: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory, prefix=".tmp-", suffix=_TMP_SUFFIX, delete=False
+            ) as handle:
+                tmp_name = handle.name
+                handle.write(_MAGIC + digest + payload)
+            Path(tmp_name).replace(path)
+        except OSError as exc:
+            logger.warning("Resource cache write failed for %s: %s", path.name, exc)
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            with self._lock:
+                self._write_errors += 1
+            return
+        with self._lock:
+            self._writes += 1
@@ -42,7 +42,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-__all__ = ["RWLock"]
+__all__ = ["RWLock", "SnapshotLock"]
 
 
 class RWLock:
@@ -391,3 +391,75 @@ class RWLock:
         """
         with self._condition:
             return self._waiting_writers
+
+
+class SnapshotLock:
+    """Writer-only lock for state published by reference swap.
+
+    Companion to RWLock for FluentBundle's ``concurrency="snapshot"`` mode.
+    Writers build new immutable-by-convention state and publish it with a
+    single attribute assignment, so readers never need to coordinate:
+    ``read()`` acquires nothing. ``write()`` serializes writers only.
+
+    Thread Safety:
+        Readers must capture each published reference once and never mutate
+        it. Writers must not mutate any object a reader may already hold.
+
+    Limitations:
+        Write lock reentrancy is prohibited: raises RuntimeError.
+    """
+
+    __slots__ = ("_lock", "_writer")
+
+    def __init__(self) -> None:
+        """Initialize snapshot lock."""
+        self._lock = threading.Lock()
+        self._writer: int | None = None
+
+    @contextmanager
+    def read(self, timeout: float | None = None) -> Generator[None]:  # noqa: ARG002 - RWLock-compatible signature
+        """Enter a lock-free read section.
+
+        Args:
+            timeout: Accepted for RWLock compatibility; readers never wait.
+
+        Yields:
+            None
+        """
+        yield
+
+    @contextmanager
+    def write(self, timeout: float | None = None) -> Generator[None]:
+        """Acquire exclusive writer access.
+
+        Args:
+            timeout: Maximum seconds to wait for lock acquisition.
+                None (default) waits indefinitely.
+
+        Raises:
+            RuntimeError: If thread already holds the write lock.
+            TimeoutError: If lock cannot be acquired within timeout.
+            ValueError: If timeout is negative.
+
+        Yields:
+            None
+        """
+        if timeout is not None and timeout < 0:
+            msg = f"Timeout must be non-negative, got {timeout}"
+            raise ValueError(msg)
+        current_thread_id = threading.get_ident()
+        if self._writer == current_thread_id:
+            msg = (
+                "Cannot acquire write lock: already holding write lock. "
+                "Release the write lock before acquiring it again."
+            )
+            raise RuntimeError(msg)
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            msg = "Timed out waiting for write lock"
+            raise TimeoutError(msg)
+        self._writer = current_thread_id
+        try:
+            yield
+        finally:
+            self._writer = None
+            self._lock.release()
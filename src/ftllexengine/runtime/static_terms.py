@@ -0,0 +1,216 @@
+"""Pre-resolved text of argument-free terms.
+
+Terms such as ``-brand = Acme Corp`` are referenced from many messages, and
+each reference normally re-enters cycle detection, pushes a resolution-stack
+entry, and resolves the term pattern again. A term value or attribute is
+*static* when its pattern contains only text, string and number literals,
+and argument-free references to other static terms. Its output is then the
+same on every reference, so FluentBundle renders it once at registration
+(render_static_terms) and the resolver answers references from the memo.
+
+A memo hit reproduces the resolver's bookkeeping exactly: it charges the
+expansion budget with the characters the full resolution would have counted
+and is only taken when the resolution stack, expression depth, and budget
+have room for the whole expansion. Otherwise the term resolves as usual and
+reports the limit error the same way.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ftllexengine.constants import UNICODE_FSI, UNICODE_PDI
+from ftllexengine.syntax import (
+    NumberLiteral,
+    Placeable,
+    StringLiteral,
+    TermReference,
+    TextElement,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from ftllexengine.runtime.resolution_context import ResolutionContext
+    from ftllexengine.syntax import Expression, Pattern, Term
+
+__all__ = ["StaticTerm", "render_static_terms"]
+
+type StaticTermKey = tuple[str, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class StaticTerm:
+    """Resolved output of a static term value or attribute.
+
+    Attributes:
+        text: Resolved text, including bidi isolation of nested placeables
+        charge: Characters the resolver tracks against the expansion budget
+            while resolving the term
+        depth: Resolution-stack entries the resolution pushes (nested terms)
+        expression_depth: Expression-guard levels the resolution enters
+    """
+
+    text: str
+    charge: int
+    depth: int
+    expression_depth: int
+
+    def fits(self, context: ResolutionContext) -> bool:
+        """Return whether resolving the term in ``context`` cannot hit a limit."""
+        guard = context.expression_guard
+        return (
+            context.depth + self.depth <= context.max_depth
+            and guard.current_depth + self.expression_depth <= guard.max_depth
+            and context.total_chars + self.charge <= context.max_expansion_size
+        )
+
+
+class _Renderer:
+    """Renders static terms depth-first, memoizing every term it visits."""
+
+    __slots__ = (
+        "_dynamic",
+        "_isolating",
+        "_max_chars",
+        "_max_depth",
+        "_memo",
+        "_terms",
+        "_visiting",
+    )
+
+    def __init__(
+        self,
+        terms: Mapping[str, Term],
+        memo: dict[StaticTermKey, StaticTerm],
+        *,
+        use_isolating: bool,
+        max_depth: int,
+        max_expansion_size: int,
+    ) -> None:
+        self._terms = terms
+        self._memo = memo
+        self._isolating = use_isolating
+        self._max_depth = max_depth
+        self._max_chars = max_expansion_size
+        self._dynamic: set[StaticTermKey] = set()
+        self._visiting: set[StaticTermKey] = set()
+
+    def term(self, key: StaticTermKey) -> StaticTerm | None:
+        static = self._memo.get(key)
+        # A term on the current path is part of a reference cycle.
+        if static is not None or key in self._dynamic or key in self._visiting:
+            return static
+        pattern = self._pattern_of(key)
+        if pattern is not None:
+            self._visiting.add(key)
+            try:
+                static = self.pattern(pattern)
+            finally:
+                self._visiting.discard(key)
+        # Expansions that can never fit are left to the resolver's limit errors.
+        if (
+            static is None
+            or static.depth > self._max_depth
+            or static.charge > self._max_chars
+        ):
+            self._dynamic.add(key)
+            return None
+        self._memo[key] = static
+        return static
+
+    def _pattern_of(self, key: StaticTermKey) -> Pattern | None:
+        term_id, attribute = key
+        term = self._terms.get(term_id)
+        if term is None:
+            return None
+        if attribute is None:
+            return term.value
+        # Last-wins for duplicate attributes, as in the resolver.
+        return next(
+            (attr.value for attr in reversed(term.attributes) if attr.id.name == attribute),
+            None,
+        )
+
+    def pattern(self, pattern: Pattern) -> StaticTerm | None:
+        parts: list[str] = []
+        charge = 0
+        depth = 0
+        expression_depth = 0
+        for element in pattern.elements:
+            if isinstance(element, TextElement):
+                parts.append(element.value)
+                charge += len(element.value)
+                continue
+            inner = self.expression(element.expression)
+            if inner is None:
+                return None
+            charge += inner.charge + len(inner.text)
+            depth = max(depth, inner.depth)
+            expression_depth = max(expression_depth, inner.expression_depth + 1)
+            text = inner.text
+            parts.append(f"{UNICODE_FSI}{text}{UNICODE_PDI}" if self._isolating else text)
+        return StaticTerm("".join(parts), charge, depth + 1, expression_depth)
+
+    def expression(self, expr: Expression) -> StaticTerm | None:
+        match expr:
+            case StringLiteral():
+                return StaticTerm(expr.value, 0, 0, 0)
+            case NumberLiteral():
+                return StaticTerm(str(expr.value), 0, 0, 0)
+            case Placeable():
+                inner = self.expression(expr.expression)
+                if inner is None:
+                    return None
+                return StaticTerm(
+                    inner.text, inner.charge, inner.depth, inner.expression_depth + 1
+                )
+            case TermReference() if expr.arguments is None or not (
+                expr.arguments.positional or expr.arguments.named
+            ):
+                attribute = expr.attribute.name if expr.attribute is not None else None
+                return self.term((expr.id.name, attribute))
+            case _:
+                return None
+
+
+def render_static_terms(
+    terms: Mapping[str, Term],
+    term_ids: Iterable[str],
+    memo: dict[StaticTermKey, StaticTerm],
+    *,
+    use_isolating: bool,
+    max_depth: int,
+    max_expansion_size: int,
+) -> None:
+    """Add the static values and attributes of ``term_ids`` to ``memo``.
+
+    Entries already in ``memo`` are trusted, so the caller must first remove
+    those of every term whose definition, or whose referenced terms'
+    definitions, changed.
+
+    Args:
+        terms: Registered terms, for following term references
+        term_ids: Terms to render
+        memo: Pre-resolved terms keyed by ``(term_id, attribute)``
+        use_isolating: Whether the resolver wraps placeables in bidi marks
+        max_depth: The resolver's resolution-depth limit
+        max_expansion_size: The resolver's expansion budget
+    """
+    renderer = _Renderer(
+        terms,
+        memo,
+        use_isolating=use_isolating,
+        max_depth=max_depth,
+        max_expansion_size=max_expansion_size,
+    )
+    for term_id in term_ids:
+        term = terms.get(term_id)
+        if term is None:
+            continue
+        renderer.term((term_id, None))
+        for attr in term.attributes:
+            renderer.term((term_id, attr.id.name))
@@ -0,0 +1,117 @@
+"""Per-node lookup tables for select-expression variants.
+
+Variant selection checks identifier keys, numeric keys, and the default
+variant in Fluent's matching order. Scanning ``expr.variants`` for each pass
+costs time proportional to the variant count, and numeric keys would be
+normalized to Decimal again on every call. variant_index() instead builds one
+VariantIndex per SelectExpression, the first time the expression is selected,
+and every later selection is a constant number of dict lookups.
+
+Indexes are cached by node identity rather than by value: frozen AST nodes
+hash and compare by value, which walks every variant. A weak reference to
+the node confirms the identity on lookup and evicts the index when the AST
+is garbage collected. Single dict operations are atomic, so the cache needs
+no lock; two threads racing on a new node both build the same index.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from ftllexengine.syntax import Identifier, NumberLiteral
+
+if TYPE_CHECKING:
+    from ftllexengine.syntax import SelectExpression, Variant
+
+__all__ = ["VariantIndex", "variant_index"]
+
+
+@dataclass(frozen=True, slots=True)
+class VariantIndex:
+    """Lookup tables for the variants of one SelectExpression.
+
+    Duplicate keys keep their first position, so lookups return the variant
+    a front-to-back scan would.
+
+    Attributes:
+        variants: The indexed variants, in source order
+        names: Position of the first variant per identifier key
+        numbers: Position of the first variant per numeric key value
+        default: The first variant marked default, if any
+    """
+
+    variants: tuple[Variant, ...]
+    names: dict[str, int]
+    numbers: dict[Decimal, int]
+    default: Variant | None
+
+    def exact(self, selector_str: str, selector_number: Decimal | None) -> Variant | None:
+        """Return the first variant whose key matches the selector exactly.
+
+        Args:
+            selector_str: Formatted selector, compared with identifier keys
+            selector_number: Numeric selector value, compared with numeric
+                keys by value, or None for non-numeric selectors
+        """
+        position = self.names.get(selector_str)
+        # Keys are finite; NaN and infinities never match (and sNaN is unhashable).
+        if selector_number is not None and selector_number.is_finite():
+            number_position = self.numbers.get(selector_number)
+            if number_position is not None and (position is None or number_position < position):
+                position = number_position
+        return None if position is None else self.variants[position]
+
+    def named(self, name: str) -> Variant | None:
+        """Return the first variant with identifier key ``name``."""
+        position = self.names.get(name)
+        return None if position is None else self.variants[position]
+
+
+def _build(variants: tuple[Variant, ...]) -> VariantIndex:
+    names: dict[str, int] = {}
+    numbers: dict[Decimal, int] = {}
+    default: Variant | None = None
+    for position, variant in enumerate(variants):
+        match variant.key:
+            case Identifier(name=key_name):
+                names.setdefault(key_name, position)
+            case NumberLiteral(raw=raw_str):
+                # Equal Decimals hash equally, so "1", "1.0" and "1.00" share a slot.
+                numbers.setdefault(Decimal(raw_str), position)
+        if default is None and variant.default:
+            default = variant
+    return VariantIndex(variants, names, numbers, default)
+
+
+# id(expr) -> (weak reference to expr, its index).
+_indexes: dict[int, tuple[weakref.ref[SelectExpression], VariantIndex]] = {}
+
+
+def variant_index(expr: SelectExpression) -> VariantIndex:
+    """Return the variant lookup tables of ``expr``, building them once.
+
+    Args:
+        expr: Select expression to index
+
+    Returns:
+        The cached VariantIndex for this expression object
+    """
+    key = id(expr)
+    entry = _indexes.get(key)
+    if entry is not None and entry[0]() is expr:
+        return entry[1]
+
+    def evict(ref: weakref.ref[SelectExpression]) -> None:
+        # Runs while expr is freed, before its id can be reused.
+        current = _indexes.get(key)
+        if current is not None and current[0] is ref:
+            _indexes.pop(key, None)
+
+    index = _build(expr.variants)
+    _indexes[key] = (weakref.ref(expr, evict), index)
+    return index
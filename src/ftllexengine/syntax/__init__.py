@@ -113,19 +113,25 @@ def parse(source: str) -> Resource:
     return parser.parse(source)
 
 
-def parse_stream(lines: Iterable[str]) -> Iterator[Entry]:
+def parse_stream(
+    lines: Iterable[str] | Iterable[bytes],
+    *,
+    absolute_spans: bool = False,
+) -> Iterator[Entry]:
     """Parse FTL entries incrementally from a line-oriented source stream.
 
     Convenience function for FluentParserV1.parse_stream(). Yields entries as
     each blank-line-delimited chunk is parsed, without materializing the full
     source string. Memory usage is proportional to the largest single entry.
 
-    Span positions in yielded entries are chunk-relative, not stream-relative.
-    Use parse() when absolute span positions are required (e.g., IDE tooling).
+    Span positions in yielded entries are chunk-relative, not stream-relative,
+    unless ``absolute_spans=True`` rebases them to offsets in the whole stream.
 
     Args:
-        lines: Iterable of FTL source lines. Trailing newlines are stripped per
-               line; the stream need not be pre-normalized.
+        lines: Iterable of FTL source lines, or of raw UTF-8 byte chunks (e.g. a
+               binary file handle). Trailing newlines are stripped per line; the
+               stream need not be pre-normalized.
+        absolute_spans: Rebase spans to stream offsets, as parse() reports them.
 
     Yields:
         Message, Term, Comment, or Junk AST nodes in document order.
@@ -140,4 +146,4 @@ def parse_stream(lines: Iterable[str]) -> Iterator[Entry]:
         'greeting'
     """
     parser = FluentParserV1()
-    yield from parser.parse_stream(lines)
+    yield from parser.parse_stream(lines, absolute_spans=absolute_spans)
@@ -364,7 +364,7 @@ class Placeable:
 # ============================================================================
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class SelectExpression:
     """Conditional expression with variants.
 
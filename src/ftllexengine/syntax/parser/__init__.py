@@ -10,6 +10,7 @@ Module Organization:
 - expressions.py: Inline expressions, calls, and select expressions
 - patterns.py: Pattern parsing and multiline continuation handling
 - primitives.py: Basic parsers (identifiers, numbers, strings)
+- scanner.py: Integer-offset entry scanner for the "offset" parser mode
 - whitespace.py: Whitespace handling and continuation detection
 - rules.py: Aggregated grammar surface for advanced internal/test usage
 
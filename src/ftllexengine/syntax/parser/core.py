@@ -37,7 +37,7 @@ from __future__ import annotations
 import logging
 import re
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from ftllexengine.constants import MAX_DEPTH, MAX_SOURCE_SIZE
 from ftllexengine.diagnostics import DiagnosticCode
@@ -56,12 +56,17 @@ from ftllexengine.syntax.cursor import Cursor
 from ftllexengine.syntax.parser.context import ParseContext
 from ftllexengine.syntax.parser.entries import parse_comment, parse_message, parse_term
 from ftllexengine.syntax.parser.primitives import is_identifier_start
+from ftllexengine.syntax.parser.scanner import scan_entry
+from ftllexengine.syntax.parser.stream import iter_source_lines, rebase_spans, starts_entry
 from ftllexengine.syntax.parser.whitespace import skip_blank
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
-__all__ = ["FluentParserV1"]
+__all__ = ["FluentParserV1", "ScannerMode"]
+
+type ScannerMode = Literal["cursor", "offset"]
+_SCANNER_MODES: frozenset[str] = frozenset(("cursor", "offset"))
 
 # Maximum number of Junk (error) entries before the parser aborts.
 # Prevents memory exhaustion from malformed input that generates excessive errors.
@@ -122,6 +127,27 @@ def _is_at_column_one(cursor: Cursor) -> bool:
     return cursor.source[cursor.pos - 1] == "\n"
 
 
+def _with_comment(entry: Message | Term, comment: Comment | None) -> Message | Term:
+    """Return the entry with an attached preceding comment, if any."""
+    if comment is None:
+        return entry
+    if isinstance(entry, Term):
+        return Term(
+            id=entry.id,
+            value=entry.value,
+            attributes=entry.attributes,
+            comment=comment,
+            span=entry.span,
+        )
+    return Message(
+        id=entry.id,
+        value=entry.value,
+        attributes=entry.attributes,
+        comment=comment,
+        span=entry.span,
+    )
+
+
 class _CommentAccumulator:
     """Accumulator for merging adjacent comments efficiently.
 
@@ -193,12 +219,20 @@ class FluentParserV1:
     - Every parser returns ParseResult[T] | None (None indicates parse failure)
     - No mutation - compiler enforces progress
 
+    Scanner Modes:
+    - ``"cursor"`` (default): every entry is parsed by the cursor grammar rules
+    - ``"offset"``: messages and terms are parsed by the integer-offset scanner in
+      :mod:`~ftllexengine.syntax.parser.scanner`, which avoids per-character cursor
+      allocation and produces the same Resource AST, spans included. Entries the
+      scanner rejects are re-parsed by the cursor rules, so Junk is unchanged.
+
     Attributes:
         max_source_size: Maximum allowed source length in characters (default: 10M)
         max_nesting_depth: Maximum allowed placeable nesting depth (default: 100)
+        scanner: Entry scanner mode ("cursor" or "offset")
     """
 
-    __slots__ = ("_max_nesting_depth", "_max_parse_errors", "_max_source_size")
+    __slots__ = ("_max_nesting_depth", "_max_parse_errors", "_max_source_size", "_scanner")
 
     def __init__(
         self,
@@ -206,6 +240,7 @@ class FluentParserV1:
         max_source_size: int | None = None,
         max_nesting_depth: int | None = None,
         max_parse_errors: int | None = None,
+        scanner: ScannerMode = "cursor",
     ) -> None:
         """Initialize parser with optional size, nesting depth, and error limits.
 
@@ -221,10 +256,19 @@ class FluentParserV1:
             max_parse_errors: Maximum number of Junk (error) entries before aborting (default: 100).
                              Prevents memory exhaustion from malformed input generating excessive
                              errors. Real FTL files rarely exceed 10 errors.
+            scanner: Entry scanner mode (default: "cursor"). "offset" selects the
+                     high-throughput integer-offset scanner; the resulting AST is
+                     identical.
 
         Raises:
-            ValueError: If max_nesting_depth is specified and <= 0.
+            ValueError: If max_nesting_depth is specified and <= 0, or scanner
+                is not "cursor" or "offset".
         """
+        if scanner not in _SCANNER_MODES:
+            msg = f"scanner must be 'cursor' or 'offset', got {scanner!r}"
+            raise ValueError(msg)
+        self._scanner: ScannerMode = scanner
+
         # Validate max_nesting_depth
         if max_nesting_depth is not None and max_nesting_depth <= 0:
             msg = f"max_nesting_depth must be positive (got {max_nesting_depth})"
@@ -269,6 +313,16 @@ class FluentParserV1:
         """Maximum allowed placeable nesting depth."""
         return self._max_nesting_depth
 
+    @property
+    def max_parse_errors(self) -> int:
+        """Maximum number of Junk entries before parsing is aborted (0 = unlimited)."""
+        return self._max_parse_errors
+
+    @property
+    def scanner(self) -> ScannerMode:
+        """Entry scanner mode ("cursor" or "offset")."""
+        return self._scanner
+
     def parse(self, source: str) -> Resource:  # noqa: PLR0915 - main parser loop
         """Parse FTL source into AST Resource.
 
@@ -336,6 +390,8 @@ class FluentParserV1:
         # Track Junk (error) count for DoS prevention
         junk_count = 0
 
+        offset_scanner = self._scanner == "offset"
+
         # Parse entries until EOF
         while not cursor.is_eof:
             # Per spec: blank_block ::= (blank_inline? line_end)+
@@ -469,6 +525,16 @@ class FluentParserV1:
                 pending_accumulator = None
                 pending_comment_end_pos = 0
 
+            # Offset scanner: on failure, fall through so the cursor rules
+            # re-parse the entry and produce the usual Junk.
+            if offset_scanner:
+                scanned = scan_entry(source, cursor.pos, context)
+                if scanned is not None:
+                    entry, end_pos = scanned
+                    entries.append(_with_comment(entry, attach_comment))
+                    cursor = Cursor(source, end_pos)
+                    continue
+
             # Try to parse term (starts with '-')
             if cursor.current == "-":
                 term_result = parse_term(cursor, context)
@@ -550,11 +616,18 @@ class FluentParserV1:
 
         return Resource(entries=tuple(entries))
 
-    def parse_stream(self, lines: Iterable[str]) -> Iterator[Entry]:
+    def parse_stream(
+        self,
+        lines: Iterable[str] | Iterable[bytes],
+        *,
+        absolute_spans: bool = False,
+    ) -> Iterator[Entry]:
         """Parse FTL entries incrementally from a line-oriented source stream.
 
-        Splits the stream at blank-line boundaries, which delimit top-level FTL
-        entries per the Fluent specification. Each chunk is parsed independently
+        Splits the stream at blank lines followed by a line that can start a
+        top-level entry (an identifier, ``-`` or ``#`` in the first column);
+        blank lines inside multiline patterns and select expressions, whose
+        content is indented, do not split. Each chunk is parsed independently
         and its entries yielded in document order. Memory usage is proportional
         to the largest single entry, not the full source size.
 
@@ -563,19 +636,24 @@ class FluentParserV1:
         entry. Comments separated by blank lines are yielded as standalone
         Comment entries.
 
-        Span positions in yielded entries are relative to the start of each
-        parsed chunk, not to the position within the original source stream.
-        This differs from parse(), where spans reference absolute source
-        positions. For use cases that require span fidelity (e.g., IDE tooling),
-        use parse() instead.
+        By default, span positions in yielded entries are relative to the start
+        of each parsed chunk, not to the position within the original source
+        stream. With ``absolute_spans=True`` every span is rebased to its offset
+        in the whole (line-ending normalized) stream, as parse() reports it.
 
         Args:
-            lines: Iterable of FTL source lines. Trailing newlines are stripped
-                   per line; the stream need not be pre-normalized.
+            lines: Iterable of FTL source lines, or of raw UTF-8 byte chunks
+                   (e.g. a binary file handle), which are decoded incrementally.
+                   Trailing newlines are stripped per line; the stream need not
+                   be pre-normalized.
+            absolute_spans: Rebase spans to stream offsets
 
         Yields:
             Message, Term, Comment, or Junk AST nodes in document order.
 
+        Raises:
+            UnicodeDecodeError: If a byte stream is not valid UTF-8.
+
         Example:
             >>> parser = FluentParserV1()  # doctest: +SKIP
             >>> ftl_lines = ["greeting = Hello\\n", "\\n", "farewell = Bye\\n"]  # doctest: +SKIP
@@ -586,15 +664,45 @@ class FluentParserV1:
             'greeting'
         """
         chunk: list[str] = []
-        for line in lines:
+        chunk_start = 0
+        offset = 0
+        blank_tail = False
+        terminated = True
+        for line in iter_source_lines(lines):
             stripped = line.rstrip("\n\r")
-            if stripped:
-                chunk.append(stripped)
-            elif chunk:
-                yield from self.parse("\n".join(chunk)).entries
-                chunk = []
+            terminated = line.endswith(("\n", "\r"))
+            if not stripped.strip(" "):
+                blank_tail = True
+            else:
+                if blank_tail and starts_entry(stripped):
+                    yield from self._parse_chunk(
+                        chunk, chunk_start if absolute_spans else 0, terminated=True
+                    )
+                    chunk = []
+                    chunk_start = offset
+                blank_tail = False
+            # Chunks are contiguous slices of the source, so blank lines stay
+            # with the entry before them, as they do in parse().
+            chunk.append(stripped)
+            offset += len(stripped) + 1
         if chunk:
-            yield from self.parse("\n".join(chunk)).entries
+            yield from self._parse_chunk(
+                chunk, chunk_start if absolute_spans else 0, terminated=terminated
+            )
+
+    def _parse_chunk(
+        self, chunk: list[str], offset: int, *, terminated: bool
+    ) -> Iterator[Entry]:
+        """Parse one blank-line-delimited chunk, shifting spans by ``offset``."""
+        source = "\n".join(chunk)
+        if terminated:
+            source += "\n"
+        entries = self.parse(source).entries
+        if offset:
+            for entry in entries:
+                yield rebase_spans(entry, offset)
+        else:
+            yield from entries
 
     def _junk_limit_exceeded(self, junk_count: int) -> bool:
         """Return True and log warning if the Junk entry limit has been reached.
@@ -0,0 +1,318 @@
+"""Offset-based entry scanner for the high-throughput parser mode.
+
+The grammar modules thread an immutable :class:`~ftllexengine.syntax.cursor.Cursor`
+through every rule, allocating a new cursor per consumed character. This module
+re-implements the entry-level rules (message and term headers, attributes,
+patterns, continuation lines) over plain integer offsets into the normalized
+source string, using regex and slicing for identifier and text runs.
+
+Placeables holding a bare variable or message reference are matched directly;
+all other placeable bodies are delegated to
+:func:`~ftllexengine.syntax.parser.expressions.parse_placeable` with a cursor
+positioned at the offset, so expression grammar and nesting-depth tracking are
+shared with the cursor parser. Every function mirrors the control
+flow of its cursor counterpart in :mod:`~ftllexengine.syntax.parser.entries`,
+:mod:`~ftllexengine.syntax.parser.patterns`, and
+:mod:`~ftllexengine.syntax.parser.whitespace`, and fails exactly where the
+counterpart returns None, so both modes build identical AST nodes and spans.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from ftllexengine.constants import MAX_IDENTIFIER_LENGTH
+from ftllexengine.syntax.ast import (
+    Attribute,
+    Identifier,
+    Message,
+    MessageReference,
+    Pattern,
+    Placeable,
+    Span,
+    Term,
+    TextElement,
+    VariableReference,
+)
+from ftllexengine.syntax.cursor import Cursor
+from ftllexengine.syntax.parser.expressions import parse_placeable
+from ftllexengine.syntax.parser.patterns import (
+    _append_newline_to_elements,
+    _trim_pattern_blank_lines,
+)
+
+if TYPE_CHECKING:
+    from ftllexengine.syntax.parser.context import ParseContext
+
+__all__ = ["scan_entry", "scan_message", "scan_term"]
+
+_IDENTIFIER: re.Pattern[str] = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]*")
+
+# End of a text run inside a top-level pattern: a placeable or a line end.
+_TEXT_RUN_END: re.Pattern[str] = re.compile(r"[{\n]")
+
+# Placeable holding only a variable or message reference: "{ $name }" or "{ name }".
+_SIMPLE_PLACEABLE: re.Pattern[str] = re.compile(r"[ \n]*(\$?)([a-zA-Z][a-zA-Z0-9_-]*)[ \n]*\}")
+
+# First characters that end a pattern instead of continuing it on the next line.
+_NON_CONTINUATION_STARTS: str = "[*.}"
+
+
+def _identifier_end(source: str, pos: int) -> int:
+    """Return the end offset of the identifier at ``pos``, or -1 if there is none."""
+    match = _IDENTIFIER.match(source, pos)
+    if match is None:
+        return -1
+    end = match.end()
+    return end if end - pos <= MAX_IDENTIFIER_LENGTH else -1
+
+
+def _skip_spaces(source: str, pos: int) -> int:
+    """Return the offset of the first non-space character at or after ``pos``."""
+    length = len(source)
+    while pos < length and source[pos] == " ":
+        pos += 1
+    return pos
+
+
+def _skip_newlines(source: str, pos: int) -> int:
+    """Return the offset of the first non-LF character at or after ``pos``."""
+    length = len(source)
+    while pos < length and source[pos] == "\n":
+        pos += 1
+    return pos
+
+
+def _is_indented_continuation(source: str, pos: int) -> bool:
+    """Offset form of :func:`~ftllexengine.syntax.parser.whitespace.is_indented_continuation`."""
+    line_start = _skip_newlines(source, pos + 1)
+    if line_start >= len(source) or source[line_start] != " ":
+        return False
+    content = _skip_spaces(source, line_start)
+    return content >= len(source) or source[content] not in _NON_CONTINUATION_STARTS
+
+
+def _pattern_start(source: str, pos: int) -> tuple[int, int]:
+    """Offset form of :func:`~ftllexengine.syntax.parser.whitespace.skip_multiline_pattern_start`.
+
+    Returns:
+        (pattern start offset, common indent of a pattern starting on the next line, else 0)
+    """
+    pos = _skip_spaces(source, pos)
+    if pos < len(source) and source[pos] == "\n" and _is_indented_continuation(source, pos):
+        line_start = _skip_newlines(source, pos + 1)
+        content = _skip_spaces(source, line_start)
+        return content, content - line_start
+    return pos, 0
+
+
+def _scan_continuation(
+    source: str, pos: int, common_indent: int | None
+) -> tuple[int, int, str]:
+    """Offset form of :func:`~ftllexengine.syntax.parser.patterns._process_continuation_line`.
+
+    Returns:
+        (content offset, common indent, extra spaces beyond the common indent)
+    """
+    line_start = _skip_newlines(source, pos)
+    if common_indent is None:
+        pos = _skip_spaces(source, line_start)
+        return pos, pos - line_start, ""
+    indent_end = min(_skip_spaces(source, line_start), line_start + common_indent)
+    pos = _skip_spaces(source, indent_end)
+    return pos, common_indent, source[indent_end:pos]
+
+
+def _scan_placeable(source: str, pos: int, context: ParseContext) -> tuple[Placeable, int] | None:
+    """Scan the placeable whose body starts at ``pos`` (just after its ``{``).
+
+    Bare variable and message references are built directly from the regex
+    match; every other placeable goes through the cursor expression grammar.
+    """
+    match = _SIMPLE_PLACEABLE.match(source, pos)
+    if (
+        match is None
+        or context.is_depth_exceeded()
+        or match.end(2) - match.start(2) > MAX_IDENTIFIER_LENGTH
+    ):
+        placeable_result = parse_placeable(Cursor(source, pos), context)
+        if placeable_result is None:
+            return None
+        return placeable_result.value, placeable_result.cursor.pos
+
+    expr_start, id_start, id_end = match.start(1), match.start(2), match.end(2)
+    identifier = Identifier(match[2], span=Span(start=id_start, end=id_end))
+    expression: VariableReference | MessageReference
+    if match[1]:
+        expression = VariableReference(id=identifier, span=Span(start=expr_start, end=id_end))
+    else:
+        expression = MessageReference(
+            id=identifier, attribute=None, span=Span(start=expr_start, end=id_end)
+        )
+    return Placeable(expression=expression), match.end()
+
+
+def _scan_pattern(
+    source: str,
+    pos: int,
+    context: ParseContext,
+    initial_common_indent: int,
+) -> tuple[Pattern, int] | None:
+    """Offset form of :func:`~ftllexengine.syntax.parser.patterns.parse_pattern`."""
+    length = len(source)
+    elements: list[TextElement | Placeable] = []
+    common_indent: int | None = initial_common_indent or None
+    fragments: list[str] = []
+
+    while pos < length:
+        ch = source[pos]
+
+        if ch == "\n":
+            if not _is_indented_continuation(source, pos):
+                break
+            pos, common_indent, extra_spaces = _scan_continuation(source, pos + 1, common_indent)
+            _append_newline_to_elements(elements)
+            if extra_spaces:
+                fragments.append(extra_spaces)
+            continue
+
+        if ch == "{":
+            if fragments:
+                elements.append(TextElement(value="".join(fragments)))
+                fragments.clear()
+            placeable_result = _scan_placeable(source, pos + 1, context)
+            if placeable_result is None:
+                return None
+            placeable, pos = placeable_result
+            elements.append(placeable)
+        else:
+            run_end = _TEXT_RUN_END.search(source, pos)
+            end = run_end.start() if run_end is not None else length
+            text = source[pos:end]
+            if fragments:
+                text = "".join(fragments) + text
+                fragments.clear()
+            elements.append(TextElement(value=text))
+            pos = end
+
+    if fragments:
+        elements.append(TextElement(value="".join(fragments)))
+
+    return Pattern(elements=_trim_pattern_blank_lines(elements)), pos
+
+
+def _scan_attribute(
+    source: str, attr_start: int, context: ParseContext
+) -> tuple[Attribute, int] | None:
+    """Offset form of :func:`~ftllexengine.syntax.parser.entries.parse_attribute` (at its ``.``)."""
+    id_start = attr_start + 1
+    id_end = _identifier_end(source, id_start)
+    if id_end < 0:
+        return None
+
+    pos = _skip_spaces(source, id_end)
+    if pos >= len(source) or source[pos] != "=":
+        return None
+
+    pos, initial_indent = _pattern_start(source, pos + 1)
+    pattern_result = _scan_pattern(source, pos, context, initial_indent)
+    if pattern_result is None:
+        return None
+
+    pattern, pos = pattern_result
+    attribute = Attribute(
+        id=Identifier(source[id_start:id_end], span=Span(start=id_start, end=id_end)),
+        value=pattern,
+        span=Span(start=attr_start, end=pos),
+    )
+    return attribute, pos
+
+
+def _scan_attributes(source: str, pos: int, context: ParseContext) -> tuple[list[Attribute], int]:
+    """Offset form of :func:`~ftllexengine.syntax.parser.entries.parse_message_attributes`."""
+    length = len(source)
+    attributes: list[Attribute] = []
+
+    while pos < length and source[pos] == "\n":
+        line_start = _skip_newlines(source, pos + 1)
+        content = _skip_spaces(source, line_start)
+        if content >= length or source[content] != ".":
+            return attributes, line_start
+
+        attr_result = _scan_attribute(source, content, context)
+        if attr_result is None:
+            return attributes, line_start
+
+        attribute, pos = attr_result
+        attributes.append(attribute)
+
+    return attributes, pos
+
+
+def scan_message(source: str, pos: int, context: ParseContext) -> tuple[Message, int] | None:
+    """Scan a message at ``pos``; returns (message, end offset) or None on parse failure."""
+    id_end = _identifier_end(source, pos)
+    if id_end < 0:
+        return None
+
+    start_pos = pos
+    pos = _skip_spaces(source, id_end)
+    if pos >= len(source) or source[pos] != "=":
+        return None
+
+    pos, initial_indent = _pattern_start(source, pos + 1)
+    pattern_result = _scan_pattern(source, pos, context, initial_indent)
+    if pattern_result is None:
+        return None
+
+    pattern, pos = pattern_result
+    attributes, pos = _scan_attributes(source, pos, context)
+    if not pattern.elements and not attributes:
+        return None
+
+    message = Message(
+        id=Identifier(source[start_pos:id_end], span=Span(start=start_pos, end=id_end)),
+        value=pattern,
+        attributes=tuple(attributes),
+        span=Span(start=start_pos, end=pos),
+    )
+    return message, pos
+
+
+def scan_term(source: str, pos: int, context: ParseContext) -> tuple[Term, int] | None:
+    """Scan a term at ``pos`` (on its ``-``); returns (term, end offset) or None."""
+    start_pos = pos
+    id_start = pos + 1
+    id_end = _identifier_end(source, id_start)
+    if id_end < 0:
+        return None
+
+    pos = _skip_spaces(source, id_end)
+    if pos >= len(source) or source[pos] != "=":
+        return None
+
+    pos, initial_indent = _pattern_start(source, pos + 1)
+    pattern_result = _scan_pattern(source, pos, context, initial_indent)
+    if pattern_result is None:
+        return None
+
+    pattern, pos = pattern_result
+    if not pattern.elements:
+        return None
+
+    attributes, pos = _scan_attributes(source, pos, context)
+    term = Term(
+        id=Identifier(source[id_start:id_end], span=Span(start=id_start, end=id_end)),
+        value=pattern,
+        attributes=tuple(attributes),
+        span=Span(start=start_pos, end=pos),
+    )
+    return term, pos
+
+
+def scan_entry(source: str, pos: int, context: ParseContext) -> tuple[Message | Term, int] | None:
+    """Scan the message or term starting at column-1 offset ``pos``."""
+    if source[pos] == "-":
+        return scan_term(source, pos, context)
+    return scan_message(source, pos, context)
@@ -0,0 +1,100 @@
+"""Source-stream helpers for FluentParserV1.parse_stream().
+
+- iter_source_lines() turns an iterable of text lines or of raw UTF-8 byte
+  chunks (binary file handles, socket or HTTP bodies) into text lines,
+  decoding incrementally so no more than one line is buffered.
+- starts_entry() tells whether a line after blank lines begins a new entry,
+  i.e. whether parse_stream() may cut the stream there.
+- rebase_spans() shifts every span in an entry by a fixed offset, turning
+  chunk-relative positions into positions in the whole stream.
+"""
+
+from __future__ import annotations
+
+import codecs
+from dataclasses import fields, replace
+from typing import TYPE_CHECKING
+
+from ftllexengine.syntax.ast import Span
+from ftllexengine.syntax.parser.primitives import is_identifier_start
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = ["iter_source_lines", "rebase_spans", "starts_entry"]
+
+_field_names_by_type: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(node_type: type) -> tuple[str, ...]:
+    """Return dataclass field names for an AST node type (memoized)."""
+    names = _field_names_by_type.get(node_type)
+    if names is None:
+        names = tuple(f.name for f in fields(node_type))
+        _field_names_by_type[node_type] = names
+    return names
+
+
+def _is_node(value: object) -> bool:
+    """Return whether a field value is an AST node to traverse."""
+    return hasattr(type(value), "__dataclass_fields__")
+
+
+def iter_source_lines(lines: Iterable[str] | Iterable[bytes]) -> Iterator[str]:
+    """Yield text lines, each with its ``\\n`` terminator if it had one.
+
+    Each ``str`` item ends a line; newlines inside an item split it further.
+    ``bytes`` items are arbitrary chunks of UTF-8 text: they are decoded
+    incrementally and split at newlines, carrying partial lines (and partial
+    multi-byte characters) over to the next chunk. ``\\r`` before a newline
+    is left on the line for the caller to strip.
+
+    Raises:
+        UnicodeDecodeError: If the byte stream is not valid UTF-8
+    """
+    decoder: codecs.IncrementalDecoder | None = None
+    partial = ""
+    for item in lines:
+        if isinstance(item, str):
+            if "\n" in item:
+                *complete, partial_item = item.split("\n")
+                for line in complete:
+                    yield line + "\n"
+                if partial_item:
+                    yield partial_item
+            else:
+                yield item
+            continue
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+        *complete, partial = (partial + decoder.decode(item)).split("\n")
+        for line in complete:
+            yield line + "\n"
+    if decoder is not None:
+        partial += decoder.decode(b"", final=True)
+        if partial:
+            yield partial
+
+
+def starts_entry(line: str) -> bool:
+    """Return whether a non-blank line can begin a top-level entry."""
+    first = line[0]
+    return first in "-#" or is_identifier_start(first)
+
+
+def rebase_spans[NodeT](node: NodeT, offset: int) -> NodeT:
+    """Return ``node`` with every span in its subtree shifted by ``offset``."""
+    node_type = type(node)
+    changes: dict[str, object] = {}
+    for name in _field_names(node_type):
+        value = getattr(node, name)
+        if name == "span":
+            if value is not None:
+                changes[name] = Span(start=value.start + offset, end=value.end + offset)
+        elif isinstance(value, tuple):
+            changes[name] = tuple(
+                rebase_spans(item, offset) if _is_node(item) else item for item in value
+            )
+        elif _is_node(value):
+            changes[name] = rebase_spans(value, offset)
+    return replace(node, **changes)  # type: ignore[type-var]
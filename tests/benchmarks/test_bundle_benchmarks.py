@@ -7,11 +7,14 @@ Python 3.13+.
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
 
-from ftllexengine import FluentBundle
+from ftllexengine import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime import CacheConfig
 
 
 class TestBundleFormattingBenchmarks:
@@ -74,3 +77,238 @@ entries-count = {$count ->
 
         assert "5 entries" in result
         assert errors == ()
+
+
+class TestStaticMessageBenchmarks:
+    """Benchmark the pre-rendered path for placeable-free messages.
+
+    Both messages render the same text; only the static one skips the
+    resolver, resolution context, depth guard, and read lock.
+    """
+
+    @pytest.fixture
+    def bundle(self) -> FluentBundle:
+        """Create FluentBundle with a static and an equivalent dynamic message."""
+        bundle = FluentBundle("en", use_isolating=False)
+        bundle.add_resource(
+            """
+static = Hello, World!
+    .title = Greeting
+dynamic = Hello, { "World" }!
+"""
+        )
+        return bundle
+
+    def test_format_static_message(self, benchmark: Any, bundle: FluentBundle) -> None:
+        """Benchmark formatting a message with no placeables."""
+        result, errors = benchmark(bundle.format_pattern, "static")
+
+        assert result == "Hello, World!"
+        assert errors == ()
+
+    def test_format_static_attribute(self, benchmark: Any, bundle: FluentBundle) -> None:
+        """Benchmark formatting a placeable-free attribute."""
+        result, errors = benchmark(bundle.format_pattern, "static", attribute="title")
+
+        assert result == "Greeting"
+        assert errors == ()
+
+    def test_format_equivalent_dynamic_message(
+        self, benchmark: Any, bundle: FluentBundle
+    ) -> None:
+        """Benchmark the resolver path for the same output (baseline for the gap)."""
+        result, errors = benchmark(bundle.format_pattern, "dynamic")
+
+        assert result == "Hello, World!"
+        assert errors == ()
+
+
+class TestConcurrencyModeBenchmarks:
+    """Benchmark multi-threaded read throughput for each concurrency mode.
+
+    Each round formats a fixed batch of messages across a thread pool, so the
+    "rwlock" and "snapshot" results are directly comparable.
+    """
+
+    THREADS = 16
+    CALLS_PER_THREAD = 200
+
+    @pytest.mark.parametrize("concurrency", ["rwlock", "snapshot"])
+    def test_threaded_format_throughput(self, benchmark: Any, concurrency: str) -> None:
+        """Benchmark concurrent format_pattern calls from a thread pool."""
+        bundle = FluentBundle("en", use_isolating=False, concurrency=concurrency)  # type: ignore[arg-type]
+        bundle.add_resource("greeting = Hello, { $name }!\n")
+        args = {"name": "Anna"}
+
+        def worker() -> int:
+            for _ in range(self.CALLS_PER_THREAD):
+                bundle.format_pattern("greeting", args)
+            return self.CALLS_PER_THREAD
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+
+            def run_round() -> int:
+                futures = [executor.submit(worker) for _ in range(self.THREADS)]
+                return sum(future.result() for future in futures)
+
+            total = benchmark.pedantic(run_round, rounds=10, iterations=1, warmup_rounds=1)
+
+        assert total == self.THREADS * self.CALLS_PER_THREAD
+
+
+class TestLazyLoadingBenchmarks:
+    """Benchmark add_resource() startup cost for eager and lazy bundles.
+
+    Each round builds a bundle from a 5000-message resource and formats one
+    message, so lazy results include the cost of parsing on first use.
+    """
+
+    SOURCE = "".join(
+        f"item-{index} = {{ $name }} has {{ $count }} items\n    .title = Item {index}\n"
+        for index in range(5000)
+    )
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_add_resource_and_format_one(self, benchmark: Any, lazy: bool) -> None:
+        """Benchmark bundle construction plus a single format_pattern call."""
+
+        def load_and_format() -> str:
+            bundle = FluentBundle("en", use_isolating=False, lazy=lazy)
+            bundle.add_resource(self.SOURCE)
+            return bundle.format_pattern("item-42", {"name": "Anna", "count": 3})[0]
+
+        result = benchmark.pedantic(load_and_format, rounds=5, iterations=1)
+
+        assert result == "Anna has 3 items"
+
+
+class TestAsyncFormatModeBenchmarks:
+    """Benchmark AsyncFluentBundle throughput with 10k concurrent format tasks.
+
+    Each round gathers TASKS format_pattern() coroutines on one event loop.
+    "offload" pays a thread hop per call; "adaptive" formats these cheap
+    messages inline.
+    """
+
+    TASKS = 10_000
+
+    @pytest.mark.parametrize("format_mode", ["offload", "adaptive"])
+    def test_concurrent_format_tasks(self, benchmark: Any, format_mode: str) -> None:
+        """Benchmark asyncio.gather() over concurrent format_pattern calls."""
+        bundle = AsyncFluentBundle(
+            "en",
+            use_isolating=False,
+            cache=CacheConfig(),
+            format_mode=format_mode,  # type: ignore[arg-type]
+        )
+        bundle._bundle.add_resource(
+            "greeting = Hello, { $name }!\n"
+            "count = { $n ->\n    [one] One item\n   *[other] { NUMBER($n) } items\n}\n"
+        )
+        requests = [
+            ("greeting", {"name": f"user{index % 100}"}) if index % 2 else ("count", {"n": index % 10})
+            for index in range(self.TASKS)
+        ]
+
+        async def run_tasks() -> int:
+            results = await asyncio.gather(
+                *(bundle.format_pattern(message_id, args) for message_id, args in requests)
+            )
+            return len(results)
+
+        total = benchmark.pedantic(
+            lambda: asyncio.run(run_tasks()), rounds=5, iterations=1, warmup_rounds=1
+        )
+
+        assert total == self.TASKS
+
+
+class TestStaticTermBenchmarks:
+    """Benchmark references to pre-resolved argument-free terms.
+
+    Both messages render the same text; passing an (unused) argument makes
+    the term reference skip the memo and resolve the term patterns.
+    """
+
+    @pytest.fixture
+    def bundle(self) -> FluentBundle:
+        """Create FluentBundle whose messages reference nested static terms."""
+        bundle = FluentBundle("en", use_isolating=False)
+        bundle.add_resource(
+            """
+-brand = Acme Corp
+-product = { -brand } Cloud
+    .short = Cloud
+memo = { -product } by { -brand } ({ -product.short })
+resolved = { -product(v: 1) } by { -brand(v: 1) } ({ -product.short(v: 1) })
+"""
+        )
+        return bundle
+
+    @pytest.mark.parametrize("message_id", ["memo", "resolved"])
+    def test_format_term_references(
+        self, benchmark: Any, bundle: FluentBundle, message_id: str
+    ) -> None:
+        """Benchmark three term references per message, memoized or resolved."""
+        result, errors = benchmark(bundle.format_pattern, message_id)
+
+        assert result == "Acme Corp Cloud by Acme Corp (Cloud)"
+        assert errors == ()
+
+
+class TestLargeSelectorBenchmarks:
+    """Benchmark variant selection in select expressions of growing size.
+
+    Each message selects its last variant, the worst case for a front-to-back
+    scan; indexed selection should take the same time at every size.
+    """
+
+    @pytest.mark.parametrize("variant_count", [2, 50, 200])
+    def test_select_last_variant(self, benchmark: Any, variant_count: int) -> None:
+        """Benchmark an identifier key and a numeric key matching the last variant."""
+        keys = "".join(f"    [k{index}] K{index}\n" for index in range(variant_count - 1))
+        numbers = "".join(f"    [{index}] N{index}\n" for index in range(variant_count - 1))
+        bundle = FluentBundle("en", use_isolating=False)
+        bundle.add_resource(
+            f"named = {{ $key ->\n{keys}   *[last] Last\n}}\n"
+            f"numbered = {{ $n ->\n{numbers}   *[{variant_count}] Last\n}}\n"
+        )
+        args: dict[str, Any] = {"key": "last", "n": variant_count}
+
+        def select_both() -> tuple[str, str]:
+            return (
+                bundle.format_pattern("named", args)[0],
+                bundle.format_pattern("numbered", args)[0],
+            )
+
+        assert benchmark(select_both) == ("Last", "Last")
+
+
+class TestAttributeLookupBenchmarks:
+    """Benchmark formatting every attribute of attribute-heavy messages.
+
+    Mirrors a UI component pulling a dozen attributes from one message per
+    render; each lookup goes through the bundle's attribute tables.
+    """
+
+    ATTRIBUTES = tuple(f"attr{index}" for index in range(12))
+
+    @pytest.fixture
+    def bundle(self) -> FluentBundle:
+        """Create FluentBundle with a twelve-attribute message."""
+        attributes = "".join(f"    .{name} = {{ $name }} {name}\n" for name in self.ATTRIBUTES)
+        bundle = FluentBundle("en", use_isolating=False)
+        bundle.add_resource(f"component = Component\n{attributes}")
+        return bundle
+
+    def test_format_all_attributes(self, benchmark: Any, bundle: FluentBundle) -> None:
+        """Benchmark formatting all twelve attributes of one message."""
+        args: dict[str, Any] = {"name": "x"}
+
+        def render() -> list[str]:
+            return [
+                bundle.format_pattern("component", args, attribute=name)[0]
+                for name in self.ATTRIBUTES
+            ]
+
+        assert benchmark(render)[-1] == "x attr11"
@@ -0,0 +1,66 @@
+"""Performance benchmarks for IntegrityCache key construction.
+
+Measures the per-call cost of building cache keys and key binding hashes
+for each FluentValue argument type, since both run on every cached
+format_pattern() call.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from ftllexengine.runtime.cache_keys import compute_key_hash, make_key
+from ftllexengine.runtime.function_bridge import FluentNumber, FluentValue
+
+ARG_VALUES: dict[str, FluentValue] = {
+    "str": "Anna",
+    "int": 42,
+    "bool": True,
+    "decimal": Decimal("1234.56"),
+    "datetime": datetime(2024, 6, 1, 12, 30, tzinfo=UTC),
+    "date": date(2024, 6, 1),
+    "fluent_number": FluentNumber(value=Decimal("1234.56"), formatted="1,234.56", precision=2),
+    "list": ["a", "b", "c"],
+}
+
+
+class TestCacheKeyBenchmarks:
+    """Benchmark cache key building and key binding per argument type."""
+
+    @pytest.mark.parametrize("arg_type", list(ARG_VALUES))
+    def test_make_key(self, benchmark: Any, arg_type: str) -> None:
+        """Benchmark make_key for a single argument of each type."""
+        args = {"value": ARG_VALUES[arg_type]}
+
+        key = benchmark(make_key, "msg", args, None, "en_US", use_isolating=True)
+
+        assert key is not None
+
+    @pytest.mark.parametrize("arg_type", list(ARG_VALUES))
+    def test_compute_key_hash(self, benchmark: Any, arg_type: str) -> None:
+        """Benchmark the key binding hash for a key holding each argument type."""
+        key = make_key("msg", {"value": ARG_VALUES[arg_type]}, None, "en_US", use_isolating=True)
+        assert key is not None
+
+        digest = benchmark(compute_key_hash, key)
+
+        assert len(digest) == 8
+
+    def test_make_key_mixed_scalar_args(self, benchmark: Any) -> None:
+        """Benchmark make_key for a typical all-scalar argument dict."""
+        args: dict[str, FluentValue] = {
+            "name": "Anna",
+            "count": 3,
+            "amount": Decimal("19.99"),
+            "when": date(2024, 6, 1),
+        }
+
+        key = benchmark(make_key, "msg", args, None, "en_US", use_isolating=True)
+
+        assert key is not None
@@ -0,0 +1,95 @@
+"""Memory benchmarks for bundles shared with forked worker processes.
+
+Builds a multi-locale FluentLocalization in the parent, forks a child that
+formats messages and runs a full garbage collection (as any long-lived
+worker eventually does), and measures how much memory the child had to copy
+from the parent. Linux-only: reads ``/proc/self/smaps_rollup``.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ftllexengine import FluentLocalization
+
+SMAPS_ROLLUP = Path("/proc/self/smaps_rollup")
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork") or not SMAPS_ROLLUP.exists(),
+    reason="requires os.fork() and /proc/self/smaps_rollup",
+)
+
+LOCALES = ("en", "de", "fr", "lv")
+MESSAGE_COUNT = 2000
+
+
+def _private_kib() -> int:
+    """Memory owned exclusively by this process (copied or newly allocated)."""
+    with SMAPS_ROLLUP.open() as rollup:
+        return sum(
+            int(line.split()[1])
+            for line in rollup
+            if line.startswith(("Private_Clean:", "Private_Dirty:"))
+        )
+
+
+def _worker_private_growth(l10n: FluentLocalization) -> int:
+    """Fork a worker that formats and collects; return its private memory growth in KiB."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the forked child
+        os.close(read_fd)
+        baseline = _private_kib()
+        for index in range(0, MESSAGE_COUNT, 20):
+            l10n.format_value(f"msg-{index}", {"count": index})
+        gc.collect()
+        os.write(write_fd, str(_private_kib() - baseline).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        growth = int(pipe.read())
+    os.waitpid(pid, 0)
+    return growth
+
+
+@pytest.fixture
+def l10n() -> FluentLocalization:
+    """Localization holding MESSAGE_COUNT messages per locale."""
+    localization = FluentLocalization(LOCALES, strict=False)
+    for locale in LOCALES:
+        localization.add_resource(
+            locale,
+            "".join(
+                f"msg-{index} = {locale} {{ $count }} item {index}\n    .title = Title {index}\n"
+                for index in range(MESSAGE_COUNT)
+            ),
+        )
+    return localization
+
+
+class TestForkMemoryBenchmarks:
+    """Per-worker private memory with and without prepare_for_fork()."""
+
+    def test_prepare_for_fork_reduces_worker_private_memory(
+        self, benchmark: Any, l10n: FluentLocalization
+    ) -> None:
+        """Frozen heaps keep the worker's collection from copying shared pages."""
+        gc.collect()
+        unprepared = _worker_private_growth(l10n)
+
+        l10n.prepare_for_fork()
+        try:
+            prepared = benchmark.pedantic(_worker_private_growth, args=(l10n,), rounds=1)
+        finally:
+            gc.unfreeze()
+
+        benchmark.extra_info["unprepared_private_kib"] = unprepared
+        benchmark.extra_info["prepared_private_kib"] = prepared
+        assert prepared * 2 < unprepared
@@ -1,17 +1,47 @@
-"""Performance benchmarks for FluentLocalization fallback chains.
+"""Performance benchmarks for FluentLocalization fallback chains and boot.
 
-Measures fallback chain traversal to detect multi-locale performance issues.
+Measures fallback chain traversal to detect multi-locale performance issues,
+and cold construction of a multi-locale pack with and without an executor.
 
 Python 3.13+.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from ftllexengine import FluentLocalization
+from ftllexengine.localization import PathResourceLoader
+
+PACK_LOCALES = ("lv", "en", "de", "fr", "lt", "et", "pl", "fi")
+PACK_RESOURCE_IDS = tuple(f"part{index}.ftl" for index in range(4))
+
+
+@pytest.fixture(scope="module")
+def locale_pack(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a pack of 8 locales x 4 resources x 100 messages."""
+    root = tmp_path_factory.mktemp("pack")
+    for locale in PACK_LOCALES:
+        (root / locale).mkdir()
+        for resource_id in PACK_RESOURCE_IDS:
+            body = "".join(
+                f"msg-{index} = {locale} text {{ $value }} number {index}\n"
+                f"    .title = Title {index}\n"
+                for index in range(100)
+            )
+            (root / locale / resource_id).write_text(body)
+    return root
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Any:
+    """Warm process pool shared by boot benchmarks."""
+    with ProcessPoolExecutor() as executor:
+        yield executor
 
 
 class TestLocalizationBenchmarks:
@@ -60,3 +90,41 @@ class TestLocalizationBenchmarks:
 
         assert result == "Kontaktai"
         assert errors == ()
+
+    def test_format_four_locale_chain_long_tail(self, benchmark: Any) -> None:
+        """Benchmark an untranslated key resolved by the last of four locales.
+
+        After the first lookup the routing table answers directly, without
+        asking the three earlier bundles for the message.
+        """
+        l10n = FluentLocalization(["lv", "lt", "et", "en"])
+        for locale in ("lv", "lt", "et"):
+            l10n.add_resource(locale, f"home = {locale}")
+        l10n.add_resource("en", "home = Home\nlegal = Legal notice")
+
+        result, errors = benchmark(l10n.format_value, "legal")
+
+        assert result == "Legal notice"
+        assert errors == ()
+
+
+class TestLocalizationBootBenchmarks:
+    """Benchmark cold FluentLocalization construction over a multi-locale pack."""
+
+    @pytest.mark.parametrize("mode", ["sequential", "process_pool"])
+    def test_boot_locale_pack(
+        self, benchmark: Any, locale_pack: Path, process_pool: Executor, mode: str
+    ) -> None:
+        """Benchmark eager load+parse of 32 resources, optionally on a process pool."""
+        loader = PathResourceLoader(str(locale_pack / "{locale}"))
+        executor = process_pool if mode == "process_pool" else None
+
+        l10n = benchmark(
+            FluentLocalization,
+            PACK_LOCALES,
+            PACK_RESOURCE_IDS,
+            loader,
+            executor=executor,
+        )
+
+        assert l10n.get_load_summary().successful == len(PACK_LOCALES) * len(PACK_RESOURCE_IDS)
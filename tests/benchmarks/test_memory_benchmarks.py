@@ -0,0 +1,65 @@
+"""Memory-per-message benchmarks for bundle entry storage.
+
+Registers a large generated catalog in default, compact, and lazy bundles
+and measures the memory each retains per message with ``tracemalloc``. The
+source string and the parser's transient allocations are excluded: only
+memory still held by the bundle after registration is counted.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any
+
+from ftllexengine import FluentBundle
+
+MESSAGE_COUNT = 5000
+
+CATALOG = "-brand = Shop\n" + "".join(
+    f"# Comment for item {index}\n"
+    f"item-{index} = {{ $name }} has {{ $count }} items in {{ -brand }}\n"
+    f"    .title = Item {index} for {{ $name }}\n"
+    for index in range(MESSAGE_COUNT)
+)
+
+
+def _bytes_per_message(*, compact: bool = False, lazy: bool = False) -> float:
+    """Return memory retained by a bundle holding CATALOG, per message."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        bundle = FluentBundle("en", strict=False, compact=compact, lazy=lazy)
+        bundle.add_resource(CATALOG)
+        gc.collect()
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert bundle.has_message("item-0")
+    return retained / MESSAGE_COUNT
+
+
+class TestMemoryBenchmarks:
+    """Retained memory per message with default, compact, and lazy bundles."""
+
+    def test_compact_storage_reduces_memory_per_message(self, benchmark: Any) -> None:
+        """Compact bundles retain less memory per message than default bundles."""
+        default = _bytes_per_message(compact=False)
+        compact = benchmark.pedantic(
+            _bytes_per_message, kwargs={"compact": True}, rounds=1
+        )
+
+        benchmark.extra_info["default_bytes_per_message"] = round(default)
+        benchmark.extra_info["compact_bytes_per_message"] = round(compact)
+        assert compact < default
+
+    def test_lazy_loading_reduces_memory_per_message(self, benchmark: Any) -> None:
+        """Lazy bundles retain only the source and its index until entries are used."""
+        default = _bytes_per_message()
+        lazy = benchmark.pedantic(_bytes_per_message, kwargs={"lazy": True}, rounds=1)
+
+        benchmark.extra_info["default_bytes_per_message"] = round(default)
+        benchmark.extra_info["lazy_bytes_per_message"] = round(lazy)
+        assert lazy < default
@@ -9,7 +9,10 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
+
 from ftllexengine import parse_ftl
+from ftllexengine.syntax.parser import FluentParserV1
 
 
 class TestParserBenchmarks:
@@ -57,6 +60,21 @@ entries-count = {$count ->
 
         assert len(result.entries) == 100
 
+    @pytest.mark.parametrize("scanner", ["cursor", "offset"])
+    def test_parse_large_resource_by_scanner(self, benchmark: Any, scanner: str) -> None:
+        """Benchmark each scanner mode on a resource with comments, placeables, and attributes."""
+        parser = FluentParserV1(scanner=scanner)  # type: ignore[arg-type]
+        ftl_source = "\n".join(
+            f"# Comment {i}\n"
+            f"msg-{i} = Hello, {{ $name }}! You have {{ $count }} new messages.\n"
+            f"    .title = Inbox for {{ $name }}\n"
+            for i in range(100)
+        )
+
+        result = benchmark(parser.parse, ftl_source)
+
+        assert len(result.entries) == 100
+
     def test_parse_complex_nested(self, benchmark: Any) -> None:
         """Benchmark parsing deeply nested placeables."""
         ftl_source = """
@@ -0,0 +1,156 @@
+"""Performance benchmarks for locale-aware value parsing.
+
+Measures bulk parsing throughput on CSV-sized inputs, and the per-value
+functions on the same rows for comparison.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from babel import localedata
+from babel.numbers import format_currency
+
+from ftllexengine.parsing import (
+    parse_currencies,
+    parse_currency,
+    parse_date,
+    parse_dates,
+    parse_decimal,
+    parse_decimals,
+)
+from ftllexengine.parsing.currency import _get_currency_pattern
+from ftllexengine.parsing.currency_symbols import _get_currency_symbol_matcher
+
+BULK_ROWS = 1_000_000
+
+
+def _localized_dates(rows: int, pattern: str) -> list[str]:
+    """Build ``rows`` localized date strings cycling over 25 years of days."""
+    start = date(2000, 1, 1)
+    return [(start + timedelta(days=row % 9131)).strftime(pattern) for row in range(rows)]
+
+
+def _localized_amounts(rows: int, group: str, decimal: str) -> list[str]:
+    """Build ``rows`` grouped amounts such as "12,345.67" with the given separators."""
+    return [
+        f"{row * 37 % 1_000_000:,}.{row % 100:02d}".replace(",", "\0")
+        .replace(".", decimal)
+        .replace("\0", group)
+        for row in range(rows)
+    ]
+
+
+class TestBulkNumberParsingBenchmarks:
+    """Benchmark parse_decimals()/parse_currencies() against per-value calls."""
+
+    @pytest.mark.parametrize(
+        ("locale_code", "group", "decimal"),
+        [("en_US", ",", "."), ("de_DE", ".", ","), ("lv_LV", "\u00a0", ",")],
+    )
+    def test_parse_decimals_one_million_rows(
+        self, benchmark: Any, locale_code: str, group: str, decimal: str
+    ) -> None:
+        """Parse one million localized amounts in one call."""
+        values = _localized_amounts(BULK_ROWS, group, decimal)
+
+        results, errors = benchmark.pedantic(
+            parse_decimals, args=(values, locale_code), rounds=1
+        )
+
+        assert len(results) == BULK_ROWS
+        assert not any(errors)
+
+    def test_parse_decimal_per_value(self, benchmark: Any) -> None:
+        """Baseline: parse_decimal() called once per row."""
+        values = _localized_amounts(100_000, ",", ".")
+
+        results = benchmark.pedantic(
+            lambda: [parse_decimal(value, "en_US") for value in values], rounds=1
+        )
+
+        assert len(results) == len(values)
+
+    def test_parse_currencies_one_million_rows(self, benchmark: Any) -> None:
+        """Parse one million amounts with trailing currency codes in one call."""
+        values = [f"{amount} EUR" for amount in _localized_amounts(BULK_ROWS, ".", ",")]
+
+        results, errors = benchmark.pedantic(
+            parse_currencies, args=(values, "de_DE"), rounds=1
+        )
+
+        assert len(results) == BULK_ROWS
+        assert not any(errors)
+
+    def test_parse_currency_per_value(self, benchmark: Any) -> None:
+        """Baseline: parse_currency() called once per row."""
+        values = [f"{amount} EUR" for amount in _localized_amounts(100_000, ".", ",")]
+
+        results = benchmark.pedantic(
+            lambda: [parse_currency(value, "de_DE") for value in values], rounds=1
+        )
+
+        assert len(results) == len(values)
+
+
+def _all_locale_currency_amounts() -> list[str]:
+    """Format amounts in five currencies for every CLDR locale."""
+    return [
+        format_currency(1234.5, currency, locale=locale_code)
+        for locale_code in localedata.locale_identifiers()
+        for currency in ("USD", "EUR", "JPY", "INR", "SEK")
+    ]
+
+
+class TestCurrencySymbolDetectionBenchmarks:
+    """Benchmark trie-based symbol detection against the reference alternation regex."""
+
+    def test_reference_regex_all_locales(self, benchmark: Any) -> None:
+        """Baseline: one alternation of every symbol, longest first."""
+        values = _all_locale_currency_amounts()
+        search = _get_currency_pattern().search
+
+        matches = benchmark(lambda: [search(value) for value in values])
+
+        assert all(match is not None for match in matches)
+
+    def test_symbol_trie_all_locales(self, benchmark: Any) -> None:
+        """CurrencySymbolMatcher on the same inputs."""
+        values = _all_locale_currency_amounts()
+        search = _get_currency_symbol_matcher().search
+
+        spans = benchmark(lambda: [search(value) for value in values])
+
+        assert all(span is not None for span in spans)
+
+
+class TestBulkDateParsingBenchmarks:
+    """Benchmark parse_dates() throughput on 1M-row columns."""
+
+    @pytest.mark.parametrize(
+        ("locale_code", "pattern"),
+        [("en_US", "%m/%d/%y"), ("de_DE", "%d.%m.%Y"), ("en_US", "%b %d, %Y")],
+        ids=["en_US-short", "de_DE-4-digit-year", "en_US-medium"],
+    )
+    def test_parse_dates_one_million_rows(
+        self, benchmark: Any, locale_code: str, pattern: str
+    ) -> None:
+        """Parse one million localized dates in one call."""
+        values = _localized_dates(BULK_ROWS, pattern)
+
+        results = benchmark.pedantic(parse_dates, args=(values, locale_code), rounds=1)
+
+        assert len(results) == BULK_ROWS
+        assert results[0] == (date(2000, 1, 1), ())
+        assert all(not errors for _, errors in results)
+
+    def test_parse_date_miss_heavy_row(self, benchmark: Any) -> None:
+        """Benchmark one value that only matches a late CLDR pattern."""
+        result, errors = benchmark(parse_date, "Saturday, January 1, 2000", "en_US")
+
+        assert result == date(2000, 1, 1)
+        assert errors == ()
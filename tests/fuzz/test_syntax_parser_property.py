@@ -30,7 +30,12 @@ from ftllexengine.syntax.parser.rules import (
     parse_term_reference,
     parse_variable_reference,
 )
-from tests.strategies.ftl import ftl_chaos_source, ftl_simple_messages, ftl_terms
+from tests.strategies.ftl import (
+    ftl_chaos_source,
+    ftl_multiline_chaos_source,
+    ftl_simple_messages,
+    ftl_terms,
+)
 
 pytestmark = pytest.mark.fuzz
 
@@ -572,3 +577,21 @@ class TestParseStreamOracle:
         }
         event(f"term_count={len(stream_term_ids)}")
         assert stream_term_ids == parse_term_ids
+
+
+class TestOffsetScannerOracle:
+    """Oracle: the offset scanner mode must build the same Resource as the cursor mode."""
+
+    @given(
+        source=st.one_of(
+            ftl_chaos_source(),
+            ftl_multiline_chaos_source(),
+            _valid_ftl_message_sources(),
+        )
+    )
+    def test_offset_scanner_matches_cursor_parser(self, source: str) -> None:
+        """Entries, spans, comments, and Junk are identical in both scanner modes."""
+        expected = FluentParserV1().parse(source)
+        actual = FluentParserV1(scanner="offset").parse(source)
+        event(f"entry_count={len(expected.entries)}")
+        assert actual == expected
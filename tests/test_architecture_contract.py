@@ -38,8 +38,8 @@ LIVE_NETWORK_TEST_PATTERNS = (
 VERSION_PROVENANCE_PATTERN = re.compile(r"\b(?:Added|Pre|Post|Prior to)\s+v\d+\.\d+\.\d+\b|v\d+\.\d+\.\d+\+")
 
 FILE_LINE_BUDGETS = {
-    "src/ftllexengine/runtime/bundle.py": 120,
-    "src/ftllexengine/runtime/bundle_lifecycle.py": 260,
+    "src/ftllexengine/runtime/bundle.py": 140,
+    "src/ftllexengine/runtime/bundle_lifecycle.py": 280,
     "src/ftllexengine/runtime/bundle_mutation.py": 180,
     "src/ftllexengine/runtime/cache.py": 500,
     "src/ftllexengine/runtime/cache_audit.py": 80,
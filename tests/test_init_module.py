@@ -565,6 +565,12 @@ class TestClearModuleCaches:
 
         ftllexengine.clear_module_caches(frozenset({"parsing.dates"}))
 
+    def test_clear_single_component_parsing_numbers(self) -> None:
+        """Passing frozenset({'parsing.numbers'}) clears only that cache."""
+        import ftllexengine
+
+        ftllexengine.clear_module_caches(frozenset({"parsing.numbers"}))
+
     def test_clear_single_component_locale(self) -> None:
         """Passing frozenset({'locale'}) clears only the locale cache."""
         import ftllexengine
@@ -577,6 +583,12 @@ class TestClearModuleCaches:
 
         ftllexengine.clear_module_caches(frozenset({"runtime.locale_context"}))
 
+    def test_clear_single_component_runtime_plural(self) -> None:
+        """Passing frozenset({'runtime.plural'}) clears only that cache."""
+        import ftllexengine
+
+        ftllexengine.clear_module_caches(frozenset({"runtime.plural"}))
+
     def test_clear_single_component_introspection_message(self) -> None:
         """Passing frozenset({'introspection.message'}) clears only that cache."""
         import ftllexengine
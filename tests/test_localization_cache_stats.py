@@ -62,6 +62,11 @@ class TestGetCacheStatsBasic:
             "strict",
             "audit_enabled",
             "audit_entries",
+            "verification",
+            "verifications",
+            "verification_skips",
+            "invalidated_entries",
+            "retained_entries",
             "bundle_count",
         }
         assert set(stats.keys()) == expected_keys
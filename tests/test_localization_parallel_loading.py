@@ -0,0 +1,174 @@
+"""Tests for executor-based parallel resource loading in FluentLocalization."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from ftllexengine.enums import LoadStatus
+from ftllexengine.integrity import SyntaxIntegrityError
+from ftllexengine.localization import (
+    FluentLocalization,
+    LocalizationBootConfig,
+    PathResourceLoader,
+    ResourceLoader,
+)
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime.resource_cache import CompiledResource, ResourceCache
+from ftllexengine.syntax.parser import FluentParserV1
+
+LOCALES = ("lv", "en", "de")
+RESOURCE_IDS = ("main.ftl", "errors.ftl", "missing.ftl", "broken.ftl")
+
+type _ExecutorType = type[ThreadPoolExecutor | ProcessPoolExecutor]
+
+
+class _BytesLoader:
+    """Loader returning bytes instead of str."""
+
+    def load(self, locale: str, resource_id: str) -> bytes:
+        return f"{resource_id} = {locale}".encode()
+
+    def describe_path(self, locale: str, resource_id: str) -> str:
+        return f"{locale}/{resource_id}"
+
+
+@pytest.fixture
+def locales_dir(tmp_path: Path) -> Path:
+    """Write a small multi-locale pack with missing and broken resources."""
+    for locale in LOCALES:
+        locale_dir = tmp_path / locale
+        locale_dir.mkdir()
+        (locale_dir / "main.ftl").write_text(
+            f"hello = Hello from {locale}, {{ $name }}!\nshared = {locale}\n"
+        )
+        (locale_dir / "broken.ftl").write_text("ok = fine\n!!! junk\n")
+        if locale != "de":
+            (locale_dir / "errors.ftl").write_text(f"error = Error in {locale}\n")
+    return tmp_path
+
+
+def _build(base: Path, executor: Executor | None, **kwargs: object) -> FluentLocalization:
+    """Construct a non-strict localization over the pack."""
+    return FluentLocalization(
+        LOCALES,
+        RESOURCE_IDS,
+        PathResourceLoader(str(base / "{locale}")),
+        strict=False,
+        executor=executor,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _snapshot(l10n: FluentLocalization) -> tuple[object, ...]:
+    """Observable load state: results, bundle locales, and formatted output."""
+    summary = l10n.get_load_summary()
+    return (
+        tuple(
+            (r.locale, r.resource_id, r.status, r.source_path, r.junk_entries)
+            for r in summary.results
+        ),
+        tuple(l10n._bundles),
+        l10n.format_value("hello", {"name": "Anna"}),
+        l10n.format_value("error"),
+        l10n.format_value("ok"),
+    )
+
+
+class TestParallelLoading:
+    """Executors produce the same LoadSummary and bundles as sequential loading."""
+
+    @pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_matches_sequential_loading(
+        self, locales_dir: Path, executor_type: _ExecutorType
+    ) -> None:
+        """Results arrive in sequential order with identical classification."""
+        expected = _snapshot(_build(locales_dir, None))
+
+        with executor_type(max_workers=2) as executor:
+            actual = _snapshot(_build(locales_dir, executor))
+
+        assert actual == expected
+        results = actual[0]
+        assert isinstance(results, tuple)
+        statuses = [result[2] for result in results]
+        assert statuses.count(LoadStatus.NOT_FOUND) == 4
+        assert statuses.count(LoadStatus.SUCCESS) == 8
+
+    @pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_workers_share_resource_cache(
+        self, locales_dir: Path, executor_type: _ExecutorType
+    ) -> None:
+        """Workers write to the cache directory (identical sources share a file)."""
+        cache = ResourceCache(locales_dir / "cache")
+        with executor_type(max_workers=2) as executor:
+            _build(locales_dir, executor, resource_cache=cache)
+
+        assert len(list(cache.directory.glob("*.ftlc"))) == 6
+        assert ResourceCache(cache.directory).strict is True
+
+    def test_loader_errors_are_classified(self, locales_dir: Path) -> None:
+        """Worker OSError/ValueError results match inline classification."""
+        (locales_dir / "lv" / "main.ftl").unlink()
+        (locales_dir / "lv" / "main.ftl").mkdir()
+        expected = _build(locales_dir, None).get_load_summary()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = _build(locales_dir, executor).get_load_summary()
+
+        assert [(r.status, type(r.error)) for r in actual.results] == [
+            (r.status, type(r.error)) for r in expected.results
+        ]
+        assert actual.errors == expected.errors == 1
+
+    def test_strict_junk_raises_and_cancels(self, locales_dir: Path) -> None:
+        """Strict-mode syntax errors propagate from the registering thread."""
+        with ThreadPoolExecutor(max_workers=2) as executor, pytest.raises(SyntaxIntegrityError):
+            FluentLocalization(
+                LOCALES,
+                RESOURCE_IDS,
+                PathResourceLoader(str(locales_dir / "{locale}")),
+                executor=executor,
+            )
+
+    def test_non_str_source_rejected(self) -> None:
+        """Worker-side source type validation matches add_resource()."""
+        # Cast: the loader breaks the protocol on purpose to exercise the runtime check.
+        loader = cast("ResourceLoader", _BytesLoader())
+        with (
+            ThreadPoolExecutor(max_workers=2) as executor,
+            pytest.raises(TypeError, match="source must be str, not bytes"),
+        ):
+            FluentLocalization(["en"], ["main.ftl"], loader, executor=executor)
+
+    def test_boot_config_forwards_executor(self, locales_dir: Path) -> None:
+        """LocalizationBootConfig.from_path threads the executor to construction."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            config = LocalizationBootConfig.from_path(
+                locales=("en",),
+                resource_ids=("main.ftl",),
+                base_path=locales_dir / "{locale}",
+                executor=executor,
+            )
+            l10n, summary, _ = config.boot()
+
+        assert config.executor is executor
+        assert summary.successful == 1
+        assert l10n.format_value("shared") == ("en", ())
+
+
+class TestAddCompiledResource:
+    """FluentBundle registers resources parsed elsewhere."""
+
+    def test_add_compiled_resource(self) -> None:
+        """A CompiledResource registers like add_resource()."""
+        source = "-brand = Fx\nmsg = { -brand }\n"
+        bundle = FluentBundle("en", use_isolating=False)
+        compiled = CompiledResource.from_resource(FluentParserV1().parse(source))
+
+        assert bundle.add_compiled_resource(compiled, source_path="en/main.ftl") == ()
+        assert bundle.format_pattern("msg") == ("Fx", ())
+        assert bundle._msg_deps["msg"] == frozenset({"term:brand"})
@@ -0,0 +1,187 @@
+"""Tests for the FluentLocalization message routing table.
+
+FluentLocalization records the first locale in its fallback chain that
+defines each formatted message, so repeated lookups skip the chain walk.
+Registrations must keep the table consistent with walking the chain.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from hypothesis import event, given
+from hypothesis import strategies as st
+
+from ftllexengine.localization import FallbackInfo, FluentLocalization
+from ftllexengine.runtime.bundle import FluentBundle
+
+LOCALES = ("lv", "de", "en")
+
+
+def _l10n(**options: Any) -> FluentLocalization:
+    l10n = FluentLocalization(LOCALES, use_isolating=False, strict=False, **options)
+    l10n.add_resource("lv", "home = Mājas\n")
+    l10n.add_resource("en", "home = Home\nabout = About\nhelp = Help { $topic }\n")
+    return l10n
+
+
+def _routes(l10n: FluentLocalization) -> dict[str, str]:
+    return {message_id: locale for message_id, (locale, _) in l10n._routes.items()}
+
+
+class TestRoutingTable:
+    """What the table records and when lookups use it."""
+
+    def test_lookups_record_routes(self) -> None:
+        """Formatting and has_message record the resolving locale."""
+        l10n = _l10n()
+
+        assert l10n.format_value("about") == ("About", ())
+        assert l10n.has_message("home")
+        assert l10n.format_many([("help", {"topic": "x"})]) == (("Help x", ()),)
+
+        assert _routes(l10n) == {"about": "en", "home": "lv", "help": "en"}
+
+    def test_routed_lookups_skip_the_chain(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A recorded route is used without asking any bundle for the message."""
+        l10n = _l10n()
+        l10n.format_value("about")
+        calls: list[str] = []
+        original = FluentBundle.has_message
+
+        def spy(bundle: FluentBundle, message_id: str) -> bool:
+            calls.append(bundle.locale)
+            return original(bundle, message_id)
+
+        monkeypatch.setattr(FluentBundle, "has_message", spy)
+
+        assert l10n.format_value("about") == ("About", ())
+        assert l10n.has_message("about")
+        assert calls == []
+
+    def test_missing_messages_are_not_recorded(self) -> None:
+        """Unknown and invalid IDs report errors and leave the table unchanged."""
+        l10n = _l10n()
+
+        assert l10n.format_value("nope")[0] == "{nope}"
+        assert not l10n.has_message("nope")
+        assert l10n.format_value("")[1]
+
+        assert _routes(l10n) == {}
+
+    def test_fallback_callback_fires_on_routed_lookups(self) -> None:
+        """on_fallback is driven by the route on every call."""
+        seen: list[FallbackInfo] = []
+        l10n = _l10n(on_fallback=seen.append)
+
+        for _ in range(2):
+            l10n.format_value("about")
+            l10n.format_value("home")
+
+        assert [(info.message_id, info.resolved_locale) for info in seen] == [
+            ("about", "en"),
+            ("about", "en"),
+        ]
+
+
+class TestRerouting:
+    """Registrations drop exactly the routes they can change."""
+
+    def test_translation_in_earlier_locale_reroutes(self) -> None:
+        """A message added to an earlier locale takes over its route."""
+        l10n = _l10n()
+        l10n.format_value("about")
+        l10n.format_value("help", {"topic": "x"})
+
+        l10n.add_resource("de", "about = Über\n")
+
+        assert _routes(l10n) == {}
+        assert l10n.format_value("about") == ("Über", ())
+
+    def test_later_locale_keeps_routes(self) -> None:
+        """Registering a resource keeps routes to the same or earlier locales."""
+        l10n = _l10n()
+        l10n.format_value("home")
+        l10n.format_value("about")
+
+        l10n.add_resource("en", "home = Start\n")
+        assert _routes(l10n) == {"home": "lv", "about": "en"}
+
+        l10n.add_resource("de", "extra = Extra\n")
+        assert _routes(l10n) == {"home": "lv"}
+
+    def test_stream_registration_reroutes(self) -> None:
+        """add_resource_stream drops affected routes as add_resource does."""
+        l10n = _l10n()
+        l10n.format_value("about")
+
+        l10n.add_resource_stream("lv", ["about = Par\n"])
+
+        assert l10n.format_value("about") == ("Par", ())
+
+    def test_clear_cache_resets_routes(self) -> None:
+        """clear_cache() picks up resources added directly to a bundle."""
+        l10n = _l10n()
+        l10n.format_value("about")
+        lv_bundle = next(iter(l10n.get_bundles()))
+        lv_bundle.add_resource("about = Par\n")
+
+        l10n.clear_cache()
+
+        assert l10n.format_value("about") == ("Par", ())
+
+    def test_clear_cache_discards_route_of_lookup_in_progress(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A route found by a walk that overlaps clear_cache() is not recorded."""
+        l10n = FluentLocalization(("en", "de"), use_isolating=False, strict=False)
+        l10n.add_resource("de", "hello = Hallo\n")
+        en_bundle = next(iter(l10n.get_bundles()))
+        original = FluentBundle.has_message
+
+        def add_then_clear(bundle: FluentBundle, message_id: str) -> bool:
+            found = original(bundle, message_id)
+            if bundle.locale == "de":
+                monkeypatch.setattr(FluentBundle, "has_message", original)
+                en_bundle.add_resource("hello = Hello\n")
+                l10n.clear_cache()
+            return found
+
+        monkeypatch.setattr(FluentBundle, "has_message", add_then_clear)
+
+        assert l10n.format_value("hello") == ("Hallo", ())
+        assert _routes(l10n) == {}
+        assert l10n.format_value("hello") == ("Hello", ())
+
+    @given(
+        operations=st.lists(
+            st.tuples(
+                st.sampled_from(("add", "format")),
+                st.sampled_from(LOCALES),
+                st.sampled_from(("a", "b", "c")),
+            ),
+            max_size=20,
+        )
+    )
+    def test_routes_match_chain_walk(self, operations: list[tuple[str, str, str]]) -> None:
+        """After any registration sequence, formatting matches a fresh walk."""
+        l10n = FluentLocalization(LOCALES, use_isolating=False, strict=False)
+        for action, locale, message_id in operations:
+            if action == "add":
+                l10n.add_resource(locale, f"{message_id} = {locale}\n")
+            else:
+                l10n.format_value(message_id)
+        event(f"routes={len(l10n._routes)}")
+        defined = {
+            (locale, message_id) for action, locale, message_id in operations if action == "add"
+        }
+
+        for message_id in ("a", "b", "c"):
+            expected = next(
+                (locale for locale in LOCALES if (locale, message_id) in defined),
+                f"{{{message_id}}}",
+            )
+            assert l10n.format_value(message_id)[0] == expected
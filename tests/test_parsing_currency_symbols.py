@@ -0,0 +1,102 @@
+"""Tests for trie-based currency symbol detection.
+
+CurrencySymbolMatcher must find the same span as the reference alternation
+regex from _get_currency_pattern(): leftmost position, ISO code first, then
+the longest symbol.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from babel import localedata
+from babel.numbers import format_currency
+
+from ftllexengine.parsing import clear_currency_caches, parse_currency
+from ftllexengine.parsing.currency import _get_currency_pattern
+from ftllexengine.parsing.currency_symbols import (
+    CurrencySymbolMatcher,
+    _get_currency_symbol_matcher,
+)
+
+
+def _reference_span(value: str) -> tuple[int, int] | None:
+    match = _get_currency_pattern().search(value)
+    return match.span(1) if match is not None else None
+
+
+class TestCurrencySymbolMatcher:
+    """Matching rules on small symbol sets."""
+
+    def test_longest_symbol_wins(self) -> None:
+        """Multi-char symbols are preferred over their prefixes."""
+        matcher = CurrencySymbolMatcher(["R", "Rs", "kr", "kr.", "$", "$AU"])
+
+        assert matcher.search("Rs100") == (0, 2)
+        assert matcher.search("R100") == (0, 1)
+        assert matcher.search("500 kr.") == (4, 7)
+        assert matcher.search("500 kr") == (4, 6)
+        assert matcher.search("$AU 5") == (0, 3)
+
+    def test_falls_back_to_shorter_symbol_on_partial_path(self) -> None:
+        """A longer symbol's prefix that does not complete yields the shorter symbol."""
+        matcher = CurrencySymbolMatcher(["a", "abcd"])
+
+        assert matcher.search("abc") == (0, 1)
+
+    def test_leftmost_position_wins(self) -> None:
+        """The earliest marker is found even when a longer one follows."""
+        matcher = CurrencySymbolMatcher(["$", "US$"])
+
+        assert matcher.search("5 $ US$") == (2, 3)
+
+    def test_iso_code_precedes_symbols(self) -> None:
+        """Three uppercase letters match as an ISO code before any symbol."""
+        matcher = CurrencySymbolMatcher(["F", "FFFF"])
+
+        assert matcher.search("FFFF 5") == (0, 3)
+        assert matcher.search("FF 5") == (0, 1)
+
+    def test_regex_metacharacters_are_literal(self) -> None:
+        """Symbols are matched literally."""
+        matcher = CurrencySymbolMatcher(["S/", "R$", "[x]", "."])
+
+        assert matcher.search("S/ 10") == (0, 2)
+        assert matcher.search("10 R$") == (3, 5)
+        assert matcher.search("[x]") == (0, 3)
+        assert matcher.search("1 ab") is None
+
+    def test_no_symbols_matches_iso_codes_only(self) -> None:
+        """An empty symbol set still detects ISO codes."""
+        matcher = CurrencySymbolMatcher([""])
+
+        assert matcher.search("USD 5") == (0, 3)
+        assert matcher.search("€5") is None
+
+
+class TestMatchesReferencePattern:
+    """The CLDR matcher agrees with the reference alternation regex."""
+
+    def test_cldr_formatted_amounts_in_all_locales(self) -> None:
+        """Spans match for amounts formatted by Babel in every locale."""
+        matcher = _get_currency_symbol_matcher()
+        for locale_code in localedata.locale_identifiers():
+            for currency in ("USD", "EUR", "GBP", "INR", "SEK", "BRL"):
+                value = format_currency(1234.5, currency, locale=locale_code)
+                assert matcher.search(value) == _reference_span(value), (locale_code, value)
+
+    def test_edge_inputs(self) -> None:
+        """Spans match for inputs without markers and with adjacent markers."""
+        matcher = _get_currency_symbol_matcher()
+        for value in ["", "1234", "no currency", "kr.kr", "Rs.R", "$$", "US$AU", "EURO 5"]:
+            assert matcher.search(value) == _reference_span(value), value
+
+    def test_matcher_cache_is_cleared(self) -> None:
+        """clear_currency_caches() drops the cached matcher."""
+        first = _get_currency_symbol_matcher()
+        assert _get_currency_symbol_matcher() is first
+
+        clear_currency_caches()
+
+        assert _get_currency_symbol_matcher.cache_info().currsize == 0
+        assert parse_currency("€5", "en_US")[0] is not None
@@ -0,0 +1,193 @@
+"""Tests for regex-compiled date pattern matching and parse_dates().
+
+_CompiledDatePatterns must return exactly what trying datetime.strptime()
+with each pattern in order returns, without raising on misses.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, date, datetime, timedelta, timezone
+
+import pytest
+
+from ftllexengine.diagnostics import ErrorCategory
+from ftllexengine.parsing import clear_date_caches, parse_date, parse_dates
+from ftllexengine.parsing.date_patterns import (
+    _compile_patterns,
+    _CompiledDatePatterns,
+    _get_date_matcher,
+    _get_date_patterns,
+    _get_datetime_patterns,
+    _preprocess_datetime_input,
+)
+
+
+def _strptime_loop(
+    value: str, locale_code: str, patterns: tuple[tuple[str, bool], ...]
+) -> datetime | None:
+    """Reference: the sequential strptime loop the compiled matcher replaces."""
+    for pattern, has_era in patterns:
+        try:
+            return datetime.strptime(
+                _preprocess_datetime_input(value, locale_code, has_era=has_era), pattern
+            )
+        except ValueError:
+            continue
+    return None
+
+
+PATTERN_CASES: list[tuple[tuple[str, ...], str]] = [
+    (("%m/%d/%y", "%m/%d/%Y"), "1/28/25"),
+    (("%m/%d/%y", "%m/%d/%Y"), "1/28/2025"),
+    (("%m/%d/%y",), "12/31/69"),
+    (("%d.%m.%Y",), " 5.01.2025"),
+    (("%b %d, %Y",), "JAN 28, 2025"),
+    (("%A, %B %d, %Y",), "Tuesday, January 28, 2025"),
+    (("%I:%M %p",), "12:05 AM"),
+    (("%I:%M %p",), "12:05 pm"),
+    (("%I:%M",), "12:05"),
+    (("%H:%M:%S.%f",), "14:30:05.25"),
+    (("%Y-%m-%d %H:%M %z",), "2025-01-28 14:30 +05:30"),
+    (("%Y-%m-%d %H:%M %z",), "2025-01-28 14:30 -0800"),
+    (("%Y-%m-%d %H:%M %z",), "2025-01-28 14:30 Z"),
+    (("%Y-%m-%d %H:%M %z",), "2025-01-28 14:30 +01:3045"),
+    (("%Y-%m-%d %H:%M %z",), "2025-01-28 14:30 +99:00"),
+    (("%Y-%m-%d",), "2025-02-29"),
+    (("%Y-%m-%d",), "2024-02-29"),
+    (("%H:%M:%S",), "23:59:60"),
+    (("%Y.%m.%d",), "2025x01x28"),
+    (("%d %m %Y",), "28 \t 01   2025"),
+    (("%Y %%d",), "2025 %d"),
+    (("%d/%m/%Y", "%m/%d/%Y"), "02/03/2025"),
+    (("%d%m%y", "%y%m%d"), "310401"),
+    (("%Y %j",), "2025 032"),
+    (("%d/%m/%Y",), "not a date"),
+]
+
+
+class TestCompiledDatePatterns:
+    """Compiled matching is equivalent to the sequential strptime loop."""
+
+    @pytest.mark.parametrize(("patterns", "value"), PATTERN_CASES)
+    def test_matches_strptime_loop(self, patterns: tuple[str, ...], value: str) -> None:
+        """Each case yields the strptime loop's result."""
+        pattern_set = tuple((pattern, False) for pattern in patterns)
+
+        actual = _CompiledDatePatterns(pattern_set).match(value, "en_US")
+        expected = _strptime_loop(value, "en_US", pattern_set)
+
+        assert actual == expected
+        assert (actual and actual.tzinfo) == (expected and expected.tzinfo)
+
+    def test_first_pattern_wins(self) -> None:
+        """Ambiguous input resolves to the earliest matching pattern."""
+        matcher = _CompiledDatePatterns((("%d/%m/%Y", False), ("%m/%d/%Y", False)))
+
+        assert matcher.match("02/03/2025", "en_US") == datetime(2025, 3, 2)
+
+    def test_invalid_calendar_date_falls_through_to_later_pattern(self) -> None:
+        """A textual match that is not a real date continues with later patterns."""
+        matcher = _CompiledDatePatterns((("%d%m%y", False), ("%y%m%d", False)))
+
+        assert matcher.match("310401", "en_US") == datetime(2031, 4, 1)
+
+    def test_era_patterns_match_stripped_input(self) -> None:
+        """Era patterns see era-stripped input; plain patterns see it as given."""
+        matcher = _CompiledDatePatterns((("%Y-%m-%d", False), ("%d %b %Y", True)))
+
+        assert matcher.match("28 Jan 2025 AD", "en_US") == datetime(2025, 1, 28)
+        assert matcher.match("2025-01-28", "en_US") == datetime(2025, 1, 28)
+
+    def test_utc_offset_builds_fixed_timezone(self) -> None:
+        """%z produces the same fixed-offset tzinfo as strptime."""
+        matcher = _CompiledDatePatterns((("%H:%M %z", False),))
+
+        parsed = matcher.match("14:30 -05:30", "en_US")
+
+        assert parsed is not None
+        assert parsed.tzinfo == timezone(-timedelta(hours=5, minutes=30))
+        utc = matcher.match("14:30 Z", "en_US")
+        assert utc is not None
+        assert utc.tzinfo is UTC
+
+    def test_repeated_directive_never_matches(self) -> None:
+        """Patterns strptime cannot compile are skipped instead of raising."""
+        matcher = _CompiledDatePatterns((("%Y-%p %I %p", False), ("%Y", False)))
+
+        assert matcher.match("2025", "en_US") == datetime(2025, 1, 1)
+        with pytest.raises(re.error):
+            datetime.strptime("2025-AM 1 AM", "%Y-%p %I %p")
+        assert matcher.match("2025-AM 1 AM", "en_US") is None
+
+    @pytest.mark.parametrize("locale_code", ["en_US", "de_DE", "lv_LV", "ja_JP", "ar_EG"])
+    def test_locale_patterns_match_strptime_loop(self, locale_code: str) -> None:
+        """Real CLDR pattern sets agree with the strptime loop."""
+        values = [
+            "1/28/25",
+            "28.01.25",
+            "28.01.2025",
+            "2025/01/28",
+            "Jan 28, 2025",
+            "January 28, 2025 2:30 PM",
+            "28.01.2025 14:30:05",
+            "2/30/25",
+        ]
+        for patterns in (_get_date_patterns(locale_code), _get_datetime_patterns(locale_code)):
+            matcher = _CompiledDatePatterns(patterns)
+            for value in values:
+                assert matcher.match(value, locale_code) == _strptime_loop(
+                    value, locale_code, patterns
+                )
+
+    def test_compiled_patterns_are_cached_and_cleared(self) -> None:
+        """Matchers are cached per pattern set and dropped by clear_date_caches()."""
+        clear_date_caches()
+        first = _get_date_matcher("en_US")
+
+        assert first is not None
+        assert _get_date_matcher("en_US") is first
+        assert _get_date_matcher("xx_INVALID") is None
+
+        clear_date_caches()
+
+        assert _compile_patterns.cache_info().currsize == 0
+        assert _get_date_matcher("en_US") is not first
+
+
+class TestParseDates:
+    """parse_dates() parses a batch with parse_date() semantics."""
+
+    def test_results_match_parse_date_in_order(self) -> None:
+        """Each result equals parse_date() for the same value."""
+        values = ["1/28/25", "2025-01-29", "Jan 30, 2025", "invalid", "2/30/25"]
+
+        results = parse_dates(values, "en_US")
+
+        assert [result for result, _ in results] == [
+            date(2025, 1, 28),
+            date(2025, 1, 29),
+            date(2025, 1, 30),
+            None,
+            None,
+        ]
+        assert results == tuple(parse_date(value, "en_US") for value in values)
+
+    def test_accepts_any_iterable(self) -> None:
+        """Generators are consumed once; empty input gives an empty tuple."""
+        assert parse_dates((value for value in ["28.01.25"]), "de_DE") == (
+            (date(2025, 1, 28), ()),
+        )
+        assert parse_dates([], "en_US") == ()
+
+    def test_unknown_locale_reports_each_value(self) -> None:
+        """Non-ISO values in an unknown locale each carry a parse error."""
+        results = parse_dates(["2025-01-28", "28.01.25"], "xx_INVALID")
+
+        assert results[0] == (date(2025, 1, 28), ())
+        result, errors = results[1]
+        assert result is None
+        assert len(errors) == 1
+        assert errors[0].category == ErrorCategory.PARSE
@@ -0,0 +1,179 @@
+"""Tests for bulk number and currency parsing.
+
+parse_decimals()/iter_decimals() and parse_currencies()/iter_currencies()
+must return exactly what parse_decimal() and parse_currency() return per
+value, whether a value takes the precompiled fast path or the per-value path.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from types import GeneratorType
+from typing import Any
+
+import pytest
+
+from ftllexengine.diagnostics import ErrorCategory
+from ftllexengine.parsing import (
+    clear_number_caches,
+    iter_currencies,
+    iter_decimals,
+    parse_currencies,
+    parse_currency,
+    parse_decimal,
+    parse_decimals,
+)
+from ftllexengine.parsing.numbers import _get_number_fast_path
+
+NUMBER_VALUES = [
+    "1,234.56",
+    "1.234,56",
+    "1 234,56",
+    "1\u00a0234,56",
+    "1\u202f234,56",
+    "12,34",
+    "1,2,3",
+    "12,34,567.8",
+    "-5",
+    "+5",
+    "1234",
+    ".5",
+    "5.",
+    "1e5",
+    "NaN",
+    "  12 ",
+    "abc",
+    "",
+]
+
+CURRENCY_VALUES = [
+    "EUR 1,234.56",
+    "1.234,56 €",
+    "$100",
+    "100 $",
+    "£1,2,3",
+    "kr 12,50",
+    "XYZ 5",
+    "R$ 1 234,56",
+    "no currency",
+    "€",
+]
+
+LOCALES = ["en_US", "de_DE", "lv_LV", "fr_FR", "de_CH", "hi_IN", "ar_EG", "xx_INVALID", "en/US"]
+
+
+def _same(actual: Any, expected: Any) -> bool:
+    """Compare results by repr so Decimal('NaN') equals itself."""
+    return repr(actual) == repr(expected)
+
+
+class TestParseDecimals:
+    """parse_decimals() matches parse_decimal() value by value."""
+
+    @pytest.mark.parametrize("locale_code", LOCALES)
+    def test_matches_parse_decimal(self, locale_code: str) -> None:
+        """Results and errors equal the per-value function in every locale."""
+        results, errors = parse_decimals(NUMBER_VALUES, locale_code)
+
+        assert len(results) == len(errors) == len(NUMBER_VALUES)
+        for value, result, value_errors in zip(NUMBER_VALUES, results, errors, strict=True):
+            assert _same((result, value_errors), parse_decimal(value, locale_code))
+
+    def test_fast_path_respects_group_positions(self) -> None:
+        """Plain digit strings convert directly; misplaced groups are rejected."""
+        results, errors = parse_decimals(["1,234,567.25", "-0.5", "12,34"], "en_US")
+
+        assert results == (Decimal("1234567.25"), Decimal("-0.5"), None)
+        assert errors[:2] == ((), ())
+        assert errors[2][0].category == ErrorCategory.PARSE
+
+    def test_indian_grouping(self) -> None:
+        """Secondary grouping sizes are honoured by the compiled pattern."""
+        results, _ = parse_decimals(["12,34,567.8", "1,234,567.8"], "hi_IN")
+
+        assert results == (Decimal("1234567.8"), None)
+
+    def test_accepts_any_iterable(self) -> None:
+        """Generators are consumed once; empty input gives empty sequences."""
+        assert parse_decimals((value for value in ["1 234,56"]), "lv_LV") == (
+            (Decimal("1234.56"),),
+            ((),),
+        )
+        assert parse_decimals([], "en_US") == ((), ())
+
+    def test_iter_decimals_is_lazy(self) -> None:
+        """iter_decimals() yields one result per value as it is consumed."""
+        consumed: list[str] = []
+
+        def source() -> Any:
+            for value in ["1", "2", "3"]:
+                consumed.append(value)
+                yield value
+
+        stream = iter_decimals(source(), "en_US")
+
+        assert isinstance(stream, GeneratorType)
+        assert next(stream) == (Decimal(1), ())
+        assert consumed == ["1"]
+        assert list(stream) == [(Decimal(2), ()), (Decimal(3), ())]
+
+    def test_fast_path_is_cached_and_cleared(self) -> None:
+        """Per-locale patterns are cached and dropped by clear_number_caches()."""
+        clear_number_caches()
+        first = _get_number_fast_path("en_US")
+
+        assert first is not None
+        assert _get_number_fast_path("en_US") is first
+        assert _get_number_fast_path("xx_INVALID") is None
+
+        clear_number_caches()
+
+        assert _get_number_fast_path.cache_info().currsize == 0
+
+
+class TestParseCurrencies:
+    """parse_currencies() matches parse_currency() value by value."""
+
+    @pytest.mark.parametrize("locale_code", LOCALES)
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"default_currency": "CAD"}, {"default_currency": "bad"}, {"infer_from_locale": True}],
+    )
+    def test_matches_parse_currency(self, locale_code: str, options: dict[str, Any]) -> None:
+        """Results and errors equal the per-value function for every option set."""
+        results, errors = parse_currencies(CURRENCY_VALUES, locale_code, **options)
+
+        assert len(results) == len(errors) == len(CURRENCY_VALUES)
+        for value, result, value_errors in zip(CURRENCY_VALUES, results, errors, strict=True):
+            assert _same(
+                (result, value_errors), parse_currency(value, locale_code, **options)
+            )
+
+    def test_ledger_column(self) -> None:
+        """A column of amounts parses to (Decimal, ISO code) pairs."""
+        results, errors = parse_currencies(
+            ["100,50 EUR", "1 234,00 €", "€ 7"], "lv_LV"
+        )
+
+        assert results == (
+            (Decimal("100.50"), "EUR"),
+            (Decimal("1234.00"), "EUR"),
+            (Decimal(7), "EUR"),
+        )
+        assert errors == ((), (), ())
+
+    def test_non_string_value_reports_error(self) -> None:
+        """Non-string values get parse_currency()'s type error."""
+        results, errors = parse_currencies([100], "en_US")  # type: ignore[list-item]
+
+        assert results == (None,)
+        assert "Expected string" in errors[0][0].message
+
+    def test_iter_currencies_yields_results(self) -> None:
+        """iter_currencies() is a generator over parse_currency() results."""
+        stream = iter_currencies(["$5", "USD 5"], "en_US", infer_from_locale=True)
+
+        assert isinstance(stream, GeneratorType)
+        assert list(stream) == [((Decimal(5), "USD"), ()), ((Decimal(5), "USD"), ())]
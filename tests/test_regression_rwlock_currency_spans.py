@@ -165,7 +165,7 @@ class TestPluralRoundingMode:
         """Verify quantize call uses ROUND_HALF_EVEN (matches Babel's default)."""
         from ftllexengine.runtime import plural_rules
 
-        source = inspect.getsource(plural_rules.select_plural_category)
+        source = inspect.getsource(plural_rules.PluralSelector._compute)
         assert "ROUND_HALF_EVEN" in source
 
     def test_half_even_rounding_applied(self) -> None:
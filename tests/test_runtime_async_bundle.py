@@ -11,11 +11,14 @@ Covers:
 - for_system_locale classmethod (patched to avoid env dependency)
 - Strict-mode error propagation
 - Concurrent format operations (multiple tasks)
+- Adaptive format mode (inline cheap calls) and custom executors
 """
 
 from __future__ import annotations
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any
 from unittest.mock import patch
@@ -25,6 +28,7 @@ import pytest
 from ftllexengine import AsyncFluentBundle
 from ftllexengine.integrity import FormattingIntegrityError, SyntaxIntegrityError
 from ftllexengine.runtime import CacheConfig
+from ftllexengine.runtime.resolver import FluentResolver
 from ftllexengine.syntax.ast import Message, Term
 
 # ---------------------------------------------------------------------------
@@ -276,6 +280,24 @@ class TestAddResourceStream:
         junk = asyncio.run(run())
         assert junk == ()
 
+    def test_stream_from_async_byte_chunks(self) -> None:
+        """An async iterable of UTF-8 chunks is read on the loop and parsed in a thread."""
+        data = "msg = Grüße\n\nother = { msg }!\n".encode()
+
+        async def chunks() -> Any:
+            for start in range(0, len(data), 3):
+                await asyncio.sleep(0)
+                yield data[start : start + 3]
+
+        async def run() -> tuple[Any, ...]:
+            async with AsyncFluentBundle("en_US", use_isolating=False) as bundle:
+                junk = await bundle.add_resource_stream(chunks(), batch_size=1)
+                result, errors = await bundle.format_pattern("other")
+                assert (result, errors) == ("Grüße!", ())
+                return junk
+
+        assert asyncio.run(run()) == ()
+
 
 # ---------------------------------------------------------------------------
 # format_pattern
@@ -527,6 +549,211 @@ class TestCacheOperations:
         assert bundle.get_cache_audit_log() is None
 
 
+# ---------------------------------------------------------------------------
+# Adaptive format mode and executor
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveFormatMode:
+    """format_mode="adaptive" formats cheap calls inline, the rest in a thread."""
+
+    _FTL = (
+        "-brand = Acme\n"
+        "hello = Hello, { $name }, from { -brand }!\n"
+        "static = Static text\n"
+        "custom = { SHOUT($name) }\n"
+    )
+
+    def _bundle(self, **kwargs: Any) -> AsyncFluentBundle:
+        bundle = AsyncFluentBundle("en_US", use_isolating=False, format_mode="adaptive", **kwargs)
+        bundle._bundle.add_resource(self._FTL)
+        bundle._bundle.add_function("SHOUT", lambda value: str(value).upper())
+        return bundle
+
+    def test_cheap_calls_skip_the_thread_pool(self) -> None:
+        """Static, plain, and cached calls never reach asyncio.to_thread()."""
+        bundle = self._bundle(cache=CacheConfig())
+
+        async def run() -> list[Any]:
+            with patch("asyncio.to_thread", side_effect=AssertionError("offloaded")):
+                return [
+                    await bundle.format_pattern("static"),
+                    await bundle.format_pattern("hello", {"name": "Ann"}),
+                    await bundle.format_pattern("hello", {"name": "Ann"}),
+                ]
+
+        assert asyncio.run(run()) == [
+            ("Static text", ()),
+            ("Hello, Ann, from Acme!", ()),
+            ("Hello, Ann, from Acme!", ()),
+        ]
+
+    def test_custom_functions_are_offloaded(self) -> None:
+        """Messages calling custom functions still run in a worker thread."""
+        bundle = self._bundle()
+        calls: list[str] = []
+        to_thread = asyncio.to_thread
+
+        async def recording_to_thread(func: Any, /, *args: Any, **kwargs: Any) -> Any:
+            calls.append(args[0] if args else func.__name__)
+            return await to_thread(func, *args, **kwargs)
+
+        async def run() -> tuple[str, tuple[Any, ...]]:
+            with patch("asyncio.to_thread", recording_to_thread):
+                return await bundle.format_pattern("custom", {"name": "ann"})
+
+        assert asyncio.run(run()) == ("ANN", ())
+        assert calls == ["custom"]
+
+    def test_results_match_offload_mode(self) -> None:
+        """Both modes return identical results, including strict errors."""
+        adaptive = self._bundle()
+        offload = AsyncFluentBundle("en_US", use_isolating=False)
+        offload._bundle.add_resource(self._FTL)
+        offload._bundle.add_function("SHOUT", lambda value: str(value).upper())
+        requests: list[tuple[str, dict[str, Any] | None]] = [
+            ("hello", {"name": "Ann"}),
+            ("static", None),
+            ("custom", {"name": "x"}),
+            ("hello", {"name": "Bo"}),
+        ]
+
+        async def run(bundle: AsyncFluentBundle) -> Any:
+            single = [await bundle.format_pattern(mid, args) for mid, args in requests]
+            return single, await bundle.format_many(requests)
+
+        assert asyncio.run(run(adaptive)) == asyncio.run(run(offload))
+
+        async def missing(bundle: AsyncFluentBundle) -> None:
+            with pytest.raises(FormattingIntegrityError):
+                await bundle.format_pattern("hello")
+
+        asyncio.run(missing(adaptive))
+
+    def test_cache_misses_counted_once_per_request(self) -> None:
+        """A miss is looked up once, inline or offloaded, exactly as in offload mode."""
+        requests: list[tuple[str, dict[str, Any] | None]] = [
+            ("hello", {"name": "Ann"}),
+            ("custom", {"name": "x"}),
+            ("hello", {"name": "Ann"}),
+            ("custom", {"name": "x"}),
+        ]
+
+        async def run(bundle: AsyncFluentBundle) -> None:
+            for message_id, args in requests:
+                await bundle.format_pattern(message_id, args)
+            await bundle.format_many([("custom", {"name": "y"}), ("hello", {"name": "Bo"})])
+
+        def audit_trail(format_mode: str) -> tuple[tuple[int, int], list[str]]:
+            bundle = AsyncFluentBundle(
+                "en_US",
+                use_isolating=False,
+                format_mode=format_mode,  # type: ignore[arg-type]
+                cache=CacheConfig(enable_audit=True),
+            )
+            bundle._bundle.add_resource(self._FTL)
+            bundle._bundle.add_function("SHOUT", lambda value: str(value).upper())
+            asyncio.run(run(bundle))
+            stats = bundle.get_cache_stats()
+            audit_log = bundle.get_cache_audit_log()
+            assert stats is not None
+            assert audit_log is not None
+            return (stats["hits"], stats["misses"]), [entry.operation for entry in audit_log]
+
+        adaptive = audit_trail("adaptive")
+
+        assert adaptive[0] == (2, 4)
+        assert adaptive == audit_trail("offload")
+
+    def test_errors_while_formatting_inline_propagate(self) -> None:
+        """Only a busy lock defers to the thread path; formatting errors still raise."""
+        bundle = self._bundle()
+
+        async def run() -> None:
+            with (
+                patch("asyncio.to_thread", side_effect=AssertionError("offloaded")),
+                patch.object(FluentResolver, "resolve_message", side_effect=TimeoutError),
+                pytest.raises(TimeoutError),
+            ):
+                await bundle.format_pattern("hello", {"name": "Ann"})
+
+        asyncio.run(run())
+
+    def test_classification_reset_after_add_function(self) -> None:
+        """Rebinding a function through the wrapper reclassifies messages."""
+        bundle = AsyncFluentBundle("en_US", use_isolating=False, format_mode="adaptive")
+        bundle._bundle.add_resource("num = { NUMBER($n) }\n")
+
+        async def run() -> None:
+            await bundle.format_pattern("num", {"n": 1})
+            assert bundle._inline_cheap == {("num", None): True}
+            await bundle.add_function("NUMBER", lambda value: f"n={value}")
+            assert bundle._inline_cheap == {}
+            assert await bundle.format_pattern("num", {"n": 1}) == ("n=1", ())
+            assert bundle._inline_cheap == {("num", None): False}
+
+        asyncio.run(run())
+
+    def test_missing_ids_are_not_memoized(self) -> None:
+        """Unknown messages and attributes format inline without growing the memo."""
+        bundle = self._bundle(strict=False)
+
+        async def run() -> list[tuple[str, tuple[Any, ...]]]:
+            with patch("asyncio.to_thread", side_effect=AssertionError("offloaded")):
+                results = [await bundle.format_pattern(f"nope-{index}") for index in range(50)]
+                results.append(await bundle.format_pattern("static", attribute="nope"))
+                return results
+
+        results = asyncio.run(run())
+
+        assert results[0][0] == "{nope-0}"
+        assert results[-1][0] == "{static.nope}"
+        assert bundle._inline_cheap == {}
+
+    def test_clear_cache_resets_classification(self) -> None:
+        """clear_cache() also drops the inline classification memo."""
+        bundle = self._bundle()
+        asyncio.run(bundle.format_pattern("hello", {"name": "Ann"}))
+        assert bundle._inline_cheap
+
+        bundle.clear_cache()
+
+        assert bundle._inline_cheap == {}
+
+    def test_lazy_messages_are_materialized_off_loop(self) -> None:
+        """Lazily indexed messages take the thread path on first use."""
+        bundle = AsyncFluentBundle("en_US", lazy=True, format_mode="adaptive")
+
+        async def run() -> tuple[str, tuple[Any, ...]]:
+            await bundle.add_resource("greet = Hi { $who }\n")
+            return await bundle.format_pattern("greet", {"who": "you"})
+
+        assert asyncio.run(run()) == ("Hi \u2068you\u2069", ())
+
+    def test_invalid_format_mode_rejected(self) -> None:
+        """Unknown format modes raise ValueError."""
+        with pytest.raises(ValueError, match="format_mode"):
+            AsyncFluentBundle("en_US", format_mode="inline")  # type: ignore[arg-type]
+
+    def test_custom_executor_runs_offloaded_work(self) -> None:
+        """Offloaded calls run on the given executor."""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="fluent-test") as executor:
+            bundle = AsyncFluentBundle("en_US", executor=executor)
+            thread_names: list[str] = []
+
+            def record(value: Any) -> str:
+                thread_names.append(threading.current_thread().name)
+                return str(value)
+
+            async def run() -> tuple[str, tuple[Any, ...]]:
+                await bundle.add_function("RECORD", record)
+                await bundle.add_resource("msg = { RECORD($x) }\n")
+                return await bundle.format_pattern("msg", {"x": 5})
+
+            assert asyncio.run(run())[0] == "\u20685\u2069"
+        assert thread_names[0].startswith("fluent-test")
+
+
 # ---------------------------------------------------------------------------
 # for_system_locale classmethod
 # ---------------------------------------------------------------------------
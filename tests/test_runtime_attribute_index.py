@@ -0,0 +1,133 @@
+"""Tests for registration-time attribute tables.
+
+FluentBundle indexes the attributes of every registered message and term by
+name. Lookups through the tables must keep last-wins semantics for duplicate
+attribute names and follow redefinitions in every registration mode.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ftllexengine.localization import FluentLocalization
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime.attribute_index import find_attribute, index_attributes
+from ftllexengine.runtime.function_bridge import FunctionRegistry
+from ftllexengine.runtime.resolver import FluentResolver
+from ftllexengine.syntax import Message, Term, parse
+
+SOURCE = """
+-brand = Acme
+    .short = AC
+    .short = { $x } Acme
+field = Field
+    .label = { $x } first
+    .placeholder = { $x } hint
+    .label = { $x } last
+plain = Plain
+uses = { -brand.short(x: 5) } / { field.label } / { -brand.missing }
+"""
+
+
+def _bundle(**options: object) -> FluentBundle:
+    bundle = FluentBundle("en", use_isolating=False, strict=False, **options)  # type: ignore[arg-type]
+    bundle.add_resource(SOURCE)
+    return bundle
+
+
+class TestAttributeTables:
+    """Which entries are indexed, and what the tables hold."""
+
+    def test_tables_keep_the_last_duplicate(self) -> None:
+        """Duplicate attribute names resolve to their last definition."""
+        entry = parse(SOURCE).entries[1]
+        assert isinstance(entry, Message)
+
+        (table,) = index_attributes([entry]).values()
+
+        assert table[0] is entry
+        assert table[1]["label"] is entry.attributes[2].value
+        assert list(table[1]) == ["label", "placeholder"]
+
+    def test_entries_without_attributes_are_not_indexed(self) -> None:
+        """Only entries with attributes get a table."""
+        bundle = _bundle()
+
+        indexed = {table[0].id.name for table in bundle._attributes.values()}
+
+        assert indexed == {"brand", "field"}
+
+    def test_unindexed_entries_are_scanned(self) -> None:
+        """Entries missing from the tables fall back to a last-wins scan."""
+        entry = parse(SOURCE).entries[0]
+        assert isinstance(entry, Term)
+
+        assert find_attribute(None, entry, "short") is entry.attributes[1].value
+        assert find_attribute({}, entry, "nope") is None
+
+    def test_foreign_message_with_same_name_is_scanned(self) -> None:
+        """A table is only used for the exact entry object it indexes."""
+        bundle = _bundle()
+        other = parse("field = Other\n    .label = Foreign\n").entries[0]
+        assert isinstance(other, Message)
+        resolver = FluentResolver(
+            "en",
+            bundle._messages,
+            bundle._terms,
+            function_registry=FunctionRegistry(),
+            use_isolating=False,
+            attributes=bundle._attributes,
+        )
+
+        assert resolver.resolve_message(other, attribute="label") == ("Foreign", ())
+
+
+class TestAttributeLookup:
+    """Formatting through the tables matches the Fluent semantics."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"compiled": True}, {"compact": True}, {"lazy": True}, {"concurrency": "snapshot"}],
+    )
+    def test_message_and_term_attributes(self, options: dict[str, object]) -> None:
+        """Attribute formatting and references use the last definition."""
+        bundle = _bundle(**options)
+
+        assert bundle.format_pattern("field", {"x": 1}, attribute="label") == ("1 last", ())
+        result, errors = bundle.format_pattern("uses", {"x": 1})
+
+        assert result == "5 Acme / 1 last / {-brand.missing}"
+        assert len(errors) == 1
+
+    @pytest.mark.parametrize("options", [{}, {"lazy": True}, {"concurrency": "snapshot"}])
+    def test_redefinition_replaces_table(self, options: dict[str, object]) -> None:
+        """Redefined entries are re-indexed and their old tables dropped."""
+        bundle = _bundle(**options)
+        bundle.format_pattern("field", {"x": 1}, attribute="label")
+        old_field = bundle._messages["field"]
+
+        bundle.add_resource("field = New\n    .title = { $x } title\n")
+
+        assert id(old_field) not in bundle._attributes
+        assert bundle.format_pattern("field", {"x": 2}, attribute="title") == ("2 title", ())
+        result, errors = bundle.format_pattern("field", {"x": 2}, attribute="label")
+        assert result == "{field.label}"
+        assert len(errors) == 1
+
+    def test_redefinition_without_attributes_drops_table(self) -> None:
+        """An entry redefined without attributes has no table left."""
+        bundle = _bundle()
+
+        bundle.add_resource("-brand = Globex\n")
+
+        assert {table[0].id.name for table in bundle._attributes.values()} == {"field"}
+        assert bundle.format_pattern("uses", {"x": 1})[0].startswith("{-brand.short}")
+
+    def test_localization_attributes(self) -> None:
+        """FluentLocalization attribute formatting goes through the same tables."""
+        l10n = FluentLocalization(["de", "en"], use_isolating=False, strict=False)
+        l10n.add_resource("en", SOURCE)
+
+        assert l10n.format_pattern("field", {"x": 3}, attribute="label") == ("3 last", ())
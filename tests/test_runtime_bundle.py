@@ -563,7 +563,7 @@ class TestFluentBundleMockedErrors:
         Internal errors are no longer caught.
         """
         bundle = FluentBundle("en_US")
-        bundle.add_resource("msg = Hello")
+        bundle.add_resource("msg = Hello { $name }")
 
         # Patch the resolver instance directly; resolver is eagerly initialized.
         mock_resolver = Mock()
@@ -581,7 +581,7 @@ class TestFluentBundleMockedErrors:
         Internal errors are no longer caught.
         """
         bundle = FluentBundle("en_US")
-        bundle.add_resource("msg = Hello")
+        bundle.add_resource("msg = Hello { $name }")
 
         # Patch the resolver instance directly; resolver is eagerly initialized.
         mock_resolver = Mock()
@@ -600,7 +600,7 @@ class TestFluentBundleMockedErrors:
         are part of the normal error handling flow.
         """
         bundle = FluentBundle("en_US")
-        bundle.add_resource("msg = Hello")
+        bundle.add_resource("msg = Hello { $name }")
 
         # Patch the resolver instance directly; resolver is eagerly initialized.
         mock_resolver = Mock()
@@ -1120,14 +1120,16 @@ class TestBundleResourceManagement:
         )
         assert bundle is not None
 
-    def test_add_resource_clears_cache(self) -> None:
-        """add_resource clears cache when enabled."""
+    def test_add_resource_invalidates_redefined_entries(self) -> None:
+        """add_resource evicts cached results of redefined messages only."""
         bundle = FluentBundle("en", cache=CacheConfig())
-        bundle.add_resource("first = First")
+        bundle.add_resource("first = First\nsecond = Second")
         bundle.format_pattern("first")
-        assert bundle.get_cache_stats()["size"] > 0  # type: ignore[index]
-        bundle.add_resource("second = Second")
-        assert bundle.get_cache_stats()["size"] == 0  # type: ignore[index]
+        bundle.format_pattern("second")
+        assert bundle.get_cache_stats()["size"] == 2  # type: ignore[index]
+        bundle.add_resource("first = Changed")
+        assert bundle.get_cache_stats()["size"] == 1  # type: ignore[index]
+        assert bundle.format_pattern("first")[0] == "Changed"
 
     def test_duplicate_terms_overwrite(self, caplog: Any) -> None:
         """Duplicate term definitions produce overwrite warning."""
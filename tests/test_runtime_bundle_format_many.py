@@ -0,0 +1,118 @@
+"""Tests for batch formatting via format_many."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from ftllexengine.diagnostics import ErrorCategory
+from ftllexengine.integrity import FormattingIntegrityError
+from ftllexengine.localization import FluentLocalization
+from ftllexengine.runtime import AsyncFluentBundle, CacheConfig, FluentBundle
+
+FTL = """
+static = Invoice
+line = { $qty } x { $item }
+total = Total: { $amount }
+"""
+
+REQUESTS: list[tuple[str, dict[str, Any] | None]] = [
+    ("static", None),
+    ("line", {"qty": 2, "item": "Widget"}),
+    ("total", {"amount": "10.00"}),
+    ("static", {}),
+    ("missing", None),
+    ("line", None),
+]
+
+
+class TestBundleFormatMany:
+    """FluentBundle.format_many matches per-call format_pattern."""
+
+    @pytest.mark.parametrize("cache", [None, CacheConfig()])
+    def test_matches_format_pattern(self, cache: CacheConfig | None) -> None:
+        """Every result equals the corresponding format_pattern call."""
+        bundle = FluentBundle("en_US", use_isolating=False, strict=False, cache=cache)
+        bundle.add_resource(FTL)
+
+        expected = tuple(bundle.format_pattern(mid, args) for mid, args in REQUESTS)
+
+        assert bundle.format_many(REQUESTS) == expected
+
+    def test_accepts_generator_and_preserves_order(self) -> None:
+        """Generators are consumed once and results keep request order."""
+        bundle = FluentBundle("en_US", use_isolating=False)
+        bundle.add_resource(FTL)
+
+        results = bundle.format_many(("total", {"amount": n}) for n in range(5))
+
+        assert [text for text, _ in results] == [f"Total: {n}" for n in range(5)]
+
+    def test_empty_batch(self) -> None:
+        """An empty batch returns an empty tuple."""
+        assert FluentBundle("en_US").format_many([]) == ()
+
+    def test_invalid_requests_use_validating_path(self) -> None:
+        """Invalid ids and args are reported per request, not short-circuited."""
+        bundle = FluentBundle("en_US", strict=False)
+        bundle.add_resource(FTL)
+
+        results = bundle.format_many([(None, None), ("static", ["bad"])])  # type: ignore[list-item]
+
+        assert results[0][1][0].category == ErrorCategory.REFERENCE
+        assert results[1][1][0].category == ErrorCategory.RESOLUTION
+
+    def test_strict_raises_on_first_failure(self) -> None:
+        """Strict bundles raise on the first failing request."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource(FTL)
+
+        with pytest.raises(FormattingIntegrityError):
+            bundle.format_many([("static", None), ("missing", None)])
+
+
+class TestAsyncBundleFormatMany:
+    """AsyncFluentBundle.format_many delegates to the sync batch."""
+
+    def test_async_format_many(self) -> None:
+        """Async results equal the sync batch results."""
+
+        async def run() -> tuple[tuple[str, tuple[Any, ...]], ...]:
+            bundle = AsyncFluentBundle("en_US", use_isolating=False, strict=False)
+            await bundle.add_resource(FTL)
+            return await bundle.format_many(iter(REQUESTS))
+
+        sync_bundle = FluentBundle("en_US", use_isolating=False, strict=False)
+        sync_bundle.add_resource(FTL)
+
+        assert asyncio.run(run()) == sync_bundle.format_many(REQUESTS)
+
+
+class TestLocalizationFormatMany:
+    """FluentLocalization.format_many keeps fallback-chain semantics."""
+
+    def test_matches_format_pattern_with_fallback(self) -> None:
+        """Batch results and fallback events equal per-call formatting."""
+        events: list[Any] = []
+        l10n = FluentLocalization(
+            ["de", "en"], use_isolating=False, strict=False, on_fallback=events.append
+        )
+        l10n.add_resource("de", "static = Rechnung\n")
+        l10n.add_resource("en", FTL)
+
+        expected = tuple(l10n.format_pattern(mid, args) for mid, args in REQUESTS)
+        expected_events = list(events)
+        events.clear()
+
+        assert l10n.format_many(REQUESTS) == expected
+        assert events == expected_events
+
+    def test_strict_localization_raises(self) -> None:
+        """Strict localizations raise on the first missing message."""
+        l10n = FluentLocalization(["en"])
+        l10n.add_resource("en", FTL)
+
+        with pytest.raises(FormattingIntegrityError):
+            l10n.format_many([("missing", None)])
@@ -0,0 +1,256 @@
+"""Tests for lazy per-entry parsing in FluentBundle."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+from ftllexengine.integrity import SyntaxIntegrityError
+from ftllexengine.runtime import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime.lazy_index import index_resource
+from ftllexengine.runtime.resource_cache import ResourceCache
+
+SOURCE = """
+### Resource comment
+
+# Brand name
+-brand = Firefox
+    .gender = masculine
+
+## Group comment
+# Greeting comment
+# spans two lines
+greeting = Hello, { $name }!
+    .title = Greeting for { $name }
+ref = See { greeting } on { -brand }
+select = { $count ->
+    [one] one item
+   *[other] { $count } items
+}
+gendered = { -brand.gender ->
+    [masculine] he
+   *[other] they
+}
+# Standalone comment
+
+plain = Just text
+"""
+
+BROKEN = """
+ok = Fine
+broken = { unclosed
+!!! junk line
+after = Still fine
+"""
+
+
+def _bundle(**options: Any) -> FluentBundle:
+    bundle = FluentBundle("en_US", strict=False, **options)
+    bundle.add_resource(SOURCE)
+    return bundle
+
+
+class TestIndexResource:
+    """index_resource() maps entry IDs to their defining source slices."""
+
+    def test_indexes_messages_and_terms(self) -> None:
+        """Every message and term is indexed; comments and Junk are not."""
+        index = index_resource(SOURCE)
+
+        assert list(index) == [
+            "term:brand",
+            "msg:greeting",
+            "msg:ref",
+            "msg:select",
+            "msg:gendered",
+            "msg:plain",
+        ]
+        assert "msg:broken" in index_resource(BROKEN)
+        assert "msg:junk" not in index_resource(BROKEN)
+
+    def test_slice_includes_attached_comment_and_continuations(self) -> None:
+        """Adjacent single-hash comments and continuation lines belong to the entry."""
+        index = index_resource(SOURCE)
+
+        assert index["msg:greeting"].text == (
+            "# Greeting comment\n# spans two lines\n"
+            "greeting = Hello, { $name }!\n    .title = Greeting for { $name }\n"
+        )
+        assert index["msg:select"].text.endswith("items\n}\n")
+        assert index["msg:gendered"].text.startswith("gendered")
+
+    def test_later_definition_wins(self) -> None:
+        """A redefined ID maps to its last definition."""
+        index = index_resource("a = one\na = two\n")
+
+        assert index["msg:a"].text == "a = two\n"
+
+
+class TestLazyBundle:
+    """Lazy bundles defer parsing and behave like eager bundles on use.
+
+    Formatting equivalence with eager bundles is covered by
+    test_runtime_bundle_modes.
+    """
+
+    def test_add_resource_parses_nothing(self) -> None:
+        """add_resource() only indexes; the first use parses an entry and its references."""
+        bundle = _bundle(lazy=True)
+
+        assert bundle.lazy is True
+        assert bundle._messages == {}
+        assert bundle._terms == {}
+
+        bundle.format_pattern("ref", {"name": "Ada"})
+
+        assert set(bundle._messages) == {"ref", "greeting"}
+        assert set(bundle._terms) == {"brand"}
+        assert bundle._lazy_entries is not None
+        assert set(bundle._lazy_entries) == {"msg:select", "msg:gendered", "msg:plain"}
+
+    def test_queries_parse_on_demand(self) -> None:
+        """Per-message queries parse one entry; catalog-wide queries parse all."""
+        bundle = _bundle(lazy=True)
+
+        assert bundle.has_message("plain")
+        assert bundle.has_attribute("greeting", "title")
+        assert bundle.get_message_variables("select") == frozenset({"count"})
+        term = bundle.get_term("brand")
+        assert term is not None
+        assert term.id.name == "brand"
+        message = bundle.get_message("greeting")
+        assert message is not None
+        assert message.comment is not None
+        assert message.comment.content == "Greeting comment\nspans two lines"
+        assert bundle.get_message_ids() == [
+            "plain",
+            "greeting",
+            "select",
+            "ref",
+            "gendered",
+        ]
+        assert bundle._lazy_entries == {}
+
+    def test_format_many_parses_batch(self) -> None:
+        """format_many() parses every requested entry before formatting."""
+        eager = _bundle()
+        lazy = _bundle(lazy=True)
+        requests = [("greeting", {"name": "Ada"}), ("plain", None), ("missing", None)]
+
+        assert lazy.format_many(requests) == eager.format_many(requests)
+
+    def test_redefinition_replaces_parsed_entry(self) -> None:
+        """A lazily added redefinition of a parsed entry takes effect immediately."""
+        bundle = FluentBundle("en_US", use_isolating=False, lazy=True, cache=None)
+        bundle.add_resource("greeting = Hello\nref = { greeting }!\n")
+        assert bundle.format_pattern("ref") == ("Hello!", ())
+
+        bundle.add_resource("greeting = Hi\n")
+
+        assert bundle.format_pattern("ref") == ("Hi!", ())
+        assert bundle.format_pattern("greeting") == ("Hi", ())
+
+    def test_new_definition_of_missing_reference_is_parsed(self) -> None:
+        """Entries referenced by parsed entries are parsed when they are added."""
+        bundle = FluentBundle("en_US", use_isolating=False, strict=False, lazy=True)
+        bundle.add_resource("ref = { later }!\n")
+        assert bundle.format_pattern("ref")[1] != ()
+
+        bundle.add_resource("later = Now\n")
+
+        assert "later" in bundle._messages
+        assert bundle.format_pattern("ref") == ("Now!", ())
+
+    def test_eager_registration_supersedes_indexed_entry(self) -> None:
+        """add_resource_stream() overrides a still-unparsed lazy definition."""
+        bundle = FluentBundle("en_US", use_isolating=False, lazy=True)
+        bundle.add_resource("greeting = Old\n")
+        bundle.add_resource_stream(["greeting = New\n"])
+
+        assert bundle.format_pattern("greeting") == ("New", ())
+
+    def test_syntax_errors_are_logged_not_raised(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Strict lazy bundles skip Junk detection until validate()."""
+        bundle = FluentBundle("en_US", use_isolating=False, lazy=True)
+
+        assert bundle.add_resource(BROKEN, source_path="broken.ftl") == ()
+        with caplog.at_level(logging.WARNING, logger="ftllexengine.runtime.bundle"):
+            assert bundle.has_message("broken") is False
+        assert "broken.ftl" in caplog.text
+        assert bundle.format_pattern("after") == ("Still fine", ())
+
+        with pytest.raises(SyntaxIntegrityError) as exc_info:
+            bundle.validate()
+        assert exc_info.value.source_path == "broken.ftl"
+
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("msg = {\nother }\nother = O\n", "O"),
+            ("msg = {\n-term }\n-term = T\n", "T"),
+            ('-brand = B\nmsg = { -brand(\ncase: "x") }!\nlast = { msg }\n', "B!"),
+        ],
+    )
+    def test_placeable_continued_in_column_one(self, source: str, expected: str) -> None:
+        """A slice cut inside a multiline placeable falls back to a full parse."""
+        bundle = FluentBundle("en_US", use_isolating=False, lazy=True)
+        bundle.add_resource(source)
+
+        assert bundle.has_message("msg")
+        assert bundle.format_pattern("msg") == (expected, ())
+        assert bundle.validate() == ()
+        eager = FluentBundle("en_US", use_isolating=False)
+        eager.add_resource(source)
+        assert sorted(bundle.get_message_ids()) == sorted(eager.get_message_ids())
+
+    def test_validate_returns_junk_in_non_strict_mode(self) -> None:
+        """Non-strict validate() returns Junk from every lazily added resource."""
+        bundle = FluentBundle("en_US", strict=False, lazy=True)
+        bundle.add_resource(BROKEN)
+        bundle.add_resource(SOURCE)
+
+        junk = bundle.validate()
+
+        assert len(junk) == 1
+        assert "unclosed" in junk[0].content
+
+    def test_eager_bundle_validate_is_empty(self) -> None:
+        """Eager bundles report Junk from add_resource(), not validate()."""
+        bundle = FluentBundle("en_US", strict=False)
+
+        assert len(bundle.add_resource(BROKEN)) == 1
+        assert bundle.validate() == ()
+
+    def test_validate_resource_sees_indexed_entries(self) -> None:
+        """validate_resource() resolves references against lazily indexed entries."""
+        bundle = _bundle(lazy=True)
+
+        result = bundle.validate_resource("new = { greeting } { -brand }\n")
+
+        assert result.is_valid
+        assert not result.warnings
+
+    def test_lazy_rejects_resource_cache(self, tmp_path: Any) -> None:
+        """Lazy bundles cannot use a parsed resource cache."""
+        with pytest.raises(ValueError, match="resource_cache"):
+            FluentBundle("en_US", lazy=True, resource_cache=ResourceCache(tmp_path))
+
+    def test_source_size_limit_applies(self) -> None:
+        """max_source_size is enforced at add_resource() time."""
+        bundle = FluentBundle("en_US", lazy=True, max_source_size=10)
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            bundle.add_resource("greeting = Hello, World!\n")
+
+    def test_async_bundle_forwards_lazy(self) -> None:
+        """AsyncFluentBundle passes lazy through and exposes validate()."""
+
+        async def run() -> tuple[bool, int]:
+            bundle = AsyncFluentBundle("en_US", strict=False, lazy=True)
+            await bundle.add_resource(BROKEN)
+            return bundle.lazy, len(await bundle.validate())
+
+        assert asyncio.run(run()) == (True, 1)
@@ -0,0 +1,139 @@
+"""Equivalence of FluentBundle storage and resolution modes.
+
+Compiled plans, compact storage, and lazy parsing change how a bundle
+stores and resolves entries, never what it formats. Every mode must produce
+the same output and errors as a default bundle for the same corpus.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from ftllexengine.runtime import FluentBundle
+
+FTL_CORPUS = """
+# Brand name
+-brand = Firefox
+    .gender = masculine
+-possessive = { $case ->
+    [genitive] Firefoxes
+   *[nominative] Firefox
+}
+
+## Group comment
+# Greeting comment
+greeting = Hello, { $name }!
+shared = Hello, { $name }!
+plain = Just text
+literal = Value { "quoted" } and { 42 }
+nested = Outer { { $name } } end
+select = { $count ->
+    [0] no items
+    [one] one item
+   *[other] { $count } items
+}
+gendered = { -brand.gender ->
+    [masculine] he
+   *[other] they
+}
+msg-ref = Ref: { plain }
+chain = See { msg-ref } and { greeting }
+term-ref = About { -brand } for { $name }
+term-args = Of { -possessive(case: "genitive") }
+term-positional = Bad { -brand("x") }
+func = Total: { NUMBER($amount, minimumFractionDigits: 2) }
+func-select = { NUMBER({ $n ->
+    [one] 1
+   *[other] 2
+}) }
+with-attrs = Base
+    .title = Title { $name }
+    .title = Last { $name }
+attr-only =
+    .label = Label only
+cycle-a = { cycle-b }
+cycle-b = { cycle-a }
+missing-ref = { nope } and { -nope }
+"""
+
+CASES: list[tuple[str, dict[str, Any] | None, str | None]] = [
+    ("greeting", {"name": "Ada"}, None),
+    ("greeting", None, None),
+    ("shared", None, None),
+    ("plain", None, None),
+    ("literal", None, None),
+    ("nested", {"name": "Ada"}, None),
+    ("select", {"count": 0}, None),
+    ("select", {"count": 1}, None),
+    ("select", {"count": Decimal("5.5")}, None),
+    ("select", None, None),
+    ("gendered", None, None),
+    ("msg-ref", None, None),
+    ("chain", {"name": "Ada"}, None),
+    ("term-ref", {"name": "Ada"}, None),
+    ("term-args", None, None),
+    ("term-positional", None, None),
+    ("func", {"amount": Decimal("12.5")}, None),
+    ("func", {"amount": "bad"}, None),
+    ("func-select", {"n": 1}, None),
+    ("with-attrs", {"name": "Ada"}, "title"),
+    ("with-attrs", None, "missing"),
+    ("attr-only", None, "label"),
+    ("attr-only", None, None),
+    ("cycle-a", None, None),
+    ("missing-ref", None, None),
+    ("missing", None, None),
+]
+
+MODES = [
+    pytest.param({"compiled": True}, id="compiled"),
+    pytest.param({"compact": True}, id="compact"),
+    pytest.param({"compact": True, "compiled": True}, id="compact-compiled"),
+    pytest.param({"compact": True, "concurrency": "snapshot"}, id="compact-snapshot"),
+    pytest.param({"lazy": True}, id="lazy"),
+    pytest.param({"lazy": True, "concurrency": "snapshot"}, id="lazy-snapshot"),
+    pytest.param({"lazy": True, "compact": True, "compiled": True}, id="lazy-compact-compiled"),
+]
+
+
+def _bundle(**options: Any) -> FluentBundle:
+    bundle = FluentBundle("en_US", strict=False, **options)
+    bundle.add_resource(FTL_CORPUS)
+    return bundle
+
+
+class TestModeEquivalence:
+    """Every mode formats exactly like a default bundle."""
+
+    @pytest.mark.parametrize("options", MODES)
+    @pytest.mark.parametrize("use_isolating", [True, False])
+    @pytest.mark.parametrize(("message_id", "args", "attribute"), CASES)
+    def test_format_pattern_matches_default(
+        self,
+        message_id: str,
+        args: dict[str, Any] | None,
+        attribute: str | None,
+        use_isolating: bool,
+        options: dict[str, Any],
+    ) -> None:
+        """Output and errors equal those of a default bundle."""
+        expected = _bundle(use_isolating=use_isolating).format_pattern(
+            message_id, args, attribute=attribute
+        )
+        actual = _bundle(use_isolating=use_isolating, **options).format_pattern(
+            message_id, args, attribute=attribute
+        )
+
+        assert actual == expected
+
+    @pytest.mark.parametrize("options", MODES)
+    def test_format_many_matches_default(self, options: dict[str, Any]) -> None:
+        """Batch formatting of every case equals a default bundle."""
+        requests = [(message_id, args) for message_id, args, attribute in CASES if not attribute]
+
+        assert _bundle(**options).format_many(requests) == _bundle().format_many(requests)
@@ -0,0 +1,198 @@
+"""Tests for FluentBundle snapshot concurrency mode."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ftllexengine.runtime import AsyncFluentBundle, CacheConfig, FluentBundle
+from ftllexengine.runtime.rwlock import RWLock, SnapshotLock
+
+
+class TestSnapshotConfiguration:
+    """Constructor validation and introspection."""
+
+    def test_default_mode_is_rwlock(self) -> None:
+        """Bundles default to the RWLock read path."""
+        bundle = FluentBundle("en_US")
+        assert bundle.concurrency == "rwlock"
+        assert isinstance(bundle._rwlock, RWLock)
+
+    def test_snapshot_mode_uses_snapshot_lock(self) -> None:
+        """Snapshot mode installs the writer-only lock."""
+        bundle = FluentBundle("en_US", concurrency="snapshot")
+        assert bundle.concurrency == "snapshot"
+        assert isinstance(bundle._rwlock, SnapshotLock)
+
+    def test_invalid_mode_rejected(self) -> None:
+        """Unknown concurrency modes raise ValueError."""
+        with pytest.raises(ValueError, match="concurrency must be"):
+            FluentBundle("en_US", concurrency="optimistic")  # type: ignore[arg-type]
+
+    def test_for_system_locale_forwards_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """for_system_locale passes concurrency through."""
+        monkeypatch.setenv("LC_ALL", "en_US.UTF-8")
+        assert FluentBundle.for_system_locale(concurrency="snapshot").concurrency == "snapshot"
+
+    def test_async_bundle_forwards_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AsyncFluentBundle mirrors the concurrency kwarg and property."""
+        monkeypatch.setenv("LC_ALL", "en_US.UTF-8")
+        assert AsyncFluentBundle("en_US", concurrency="snapshot").concurrency == "snapshot"
+        factory = AsyncFluentBundle.for_system_locale(concurrency="snapshot")
+        assert factory.concurrency == "snapshot"
+
+
+class TestSnapshotPublication:
+    """Writers publish new registries instead of mutating published ones."""
+
+    def test_add_resource_publishes_new_registries(self) -> None:
+        """Previously published dicts and resolver are left untouched."""
+        bundle = FluentBundle("en_US", use_isolating=False, concurrency="snapshot")
+        bundle.add_resource("first = One\n-brand = Acme\n")
+        old_messages = bundle._messages
+        old_terms = bundle._terms
+        old_static = bundle._static_patterns
+        old_resolver = bundle._resolver
+
+        bundle.add_resource("second = Two { -brand }\nfirst = Uno\n")
+
+        assert set(old_messages) == {"first"}
+        assert set(old_terms) == {"brand"}
+        assert old_static == {("first", None): "One"}
+        assert bundle._resolver is not old_resolver
+        assert bundle._resolver._messages is bundle._messages
+        assert bundle.format_pattern("first") == ("Uno", ())
+        assert bundle.format_pattern("second") == ("Two Acme", ())
+        assert bundle._msg_deps["second"] == frozenset({"term:brand"})
+
+    def test_compiled_plans_are_copied(self) -> None:
+        """The previous resolver keeps its own plan table."""
+        bundle = FluentBundle(
+            "en_US", use_isolating=False, compiled=True, concurrency="snapshot"
+        )
+        bundle.add_resource("a = { $x }\n")
+        old_plans = bundle._plans
+        assert old_plans is not None
+        old_size = len(old_plans)
+
+        bundle.add_resource("b = { $y }\n")
+
+        assert len(old_plans) == old_size
+        assert bundle._resolver._plans is bundle._plans
+        assert bundle.format_pattern("b", {"y": 1}) == ("1", ())
+
+    def test_add_function_publishes_registry_copy(self) -> None:
+        """add_function never mutates a registry readers may hold."""
+        bundle = FluentBundle("en_US", use_isolating=False, concurrency="snapshot")
+        bundle.add_resource("msg = { SHOUT($v) }\n")
+        bundle.add_function("SHOUT", lambda value: str(value).upper())
+        first_registry = bundle.function_registry
+
+        bundle.add_function("WHISPER", lambda value: str(value).lower())
+
+        assert bundle.function_registry is not first_registry
+        assert "WHISPER" not in first_registry
+        assert bundle.format_pattern("msg", {"v": "hi"}) == ("HI", ())
+
+    def test_writer_inside_read_drops_stale_cache_entry(self) -> None:
+        """A write published mid-resolution invalidates the result just cached."""
+        bundle = FluentBundle(
+            "en_US", use_isolating=False, cache=CacheConfig(), concurrency="snapshot"
+        )
+
+        def publish(value: object) -> str:
+            bundle.add_function("OTHER", lambda inner: inner)
+            return str(value)
+
+        bundle.add_function("PUBLISH", publish)
+        bundle.add_resource("msg = { PUBLISH($v) }\n")
+
+        assert bundle.format_pattern("msg", {"v": "x"}) == ("x", ())
+        assert bundle.cache_usage == 0
+
+    def test_concurrent_readers_during_writes(self) -> None:
+        """Readers always see complete results while writers publish."""
+        bundle = FluentBundle("en_US", use_isolating=False, concurrency="snapshot")
+        bundle.add_resource("base = Base { $n }\n")
+        stop = threading.Event()
+        failures: list[object] = []
+
+        def reader() -> None:
+            while not stop.is_set():
+                result = bundle.format_pattern("base", {"n": 1})
+                if result != ("Base 1", ()):
+                    failures.append(result)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(reader) for _ in range(4)]
+            for index in range(50):
+                bundle.add_resource(f"extra-{index} = Extra {index}\n")
+            stop.set()
+            for future in futures:
+                future.result()
+
+        assert failures == []
+        assert bundle.has_message("extra-49")
+
+
+class TestSnapshotLock:
+    """SnapshotLock serializes writers and never blocks readers."""
+
+    def test_read_is_free_during_write(self) -> None:
+        """Readers enter while a writer holds the lock."""
+        lock = SnapshotLock()
+        with lock.write(), lock.read(timeout=0.0):
+            pass
+
+    def test_write_reentrancy_rejected(self) -> None:
+        """Nested write acquisition raises RuntimeError."""
+        lock = SnapshotLock()
+        with (
+            lock.write(),
+            pytest.raises(RuntimeError, match="already holding"),
+            lock.write(),
+        ):
+            pass  # pragma: no cover
+
+    def test_negative_timeout_rejected(self) -> None:
+        """Negative timeouts raise ValueError."""
+        lock = SnapshotLock()
+        with pytest.raises(ValueError, match="non-negative"), lock.write(timeout=-1):
+            pass  # pragma: no cover
+
+    def test_write_timeout(self) -> None:
+        """A contended writer times out."""
+        lock = SnapshotLock()
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def holder() -> None:
+            with lock.write():
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        acquired.wait()
+        try:
+            with pytest.raises(TimeoutError), lock.write(timeout=0.01):
+                pass  # pragma: no cover
+        finally:
+            release.set()
+            thread.join()
+
+        with lock.write(timeout=1.0):
+            pass
+
+    def test_async_snapshot_formatting(self) -> None:
+        """Async wrappers format through the snapshot read path."""
+
+        async def run() -> tuple[str, tuple[object, ...]]:
+            bundle = AsyncFluentBundle("en_US", use_isolating=False, concurrency="snapshot")
+            await bundle.add_resource("msg = Hi { $n }\n")
+            return await bundle.format_pattern("msg", {"n": 2})
+
+        assert asyncio.run(run()) == ("Hi 2", ())
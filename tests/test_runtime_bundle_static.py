@@ -0,0 +1,151 @@
+"""Tests for pre-rendered placeable-free messages in FluentBundle."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from ftllexengine.diagnostics import ErrorCategory
+from ftllexengine.integrity import FormattingIntegrityError
+from ftllexengine.runtime import CacheConfig, FluentBundle
+from ftllexengine.syntax import (
+    Attribute,
+    Identifier,
+    Message,
+    Pattern,
+    Resource,
+    TextElement,
+)
+
+FTL = """
+hello = Hello, World!
+    .title = Greeting
+    .tooltip = Dynamic { $x }
+dynamic = Hi { $name }
+empty-attr-dynamic = Value
+    .label = First
+    .label = Second { $x }
+no-value =
+    .label = Only attribute
+"""
+
+
+@pytest.fixture
+def bundle() -> FluentBundle:
+    """Create a bundle with static and dynamic messages."""
+    bundle = FluentBundle("en_US", use_isolating=False, strict=False)
+    bundle.add_resource(FTL)
+    return bundle
+
+
+class TestStaticPatternCollection:
+    """Registration records only patterns that need no resolution."""
+
+    def test_static_value_and_attribute_recorded(self, bundle: FluentBundle) -> None:
+        """Placeable-free value and attributes are pre-rendered."""
+        assert bundle._static_patterns[("hello", None)] == "Hello, World!"
+        assert bundle._static_patterns[("hello", "title")] == "Greeting"
+        assert ("hello", "tooltip") not in bundle._static_patterns
+        assert ("dynamic", None) not in bundle._static_patterns
+
+    def test_duplicate_attribute_last_wins(self, bundle: FluentBundle) -> None:
+        """A later dynamic duplicate attribute shadows an earlier static one."""
+        assert ("empty-attr-dynamic", "label") not in bundle._static_patterns
+        assert bundle.format_pattern("empty-attr-dynamic", {"x": 1}, attribute="label") == (
+            "Second 1",
+            (),
+        )
+
+    def test_attribute_only_message_matches_resolver(self, bundle: FluentBundle) -> None:
+        """Attribute-only messages render the same as the resolver would."""
+        message = bundle._messages["no-value"]
+        assert bundle.format_pattern("no-value", attribute="label") == ("Only attribute", ())
+        assert bundle.format_pattern("no-value") == bundle._resolver.resolve_message(message)
+
+    def test_programmatic_message_without_value(self) -> None:
+        """Messages built without a value only pre-render their attributes."""
+        message = Message(
+            id=Identifier("msg"),
+            value=None,
+            attributes=(
+                Attribute(
+                    id=Identifier("label"),
+                    value=Pattern(elements=(TextElement(value="Label"),)),
+                ),
+            ),
+        )
+        bundle = FluentBundle("en_US", strict=False)
+        bundle._register_resource(Resource(entries=(message,)), None)
+
+        assert bundle._static_patterns == {("msg", "label"): "Label"}
+
+    def test_over_budget_text_left_to_resolver(self) -> None:
+        """Text longer than max_expansion_size still reports the budget error."""
+        bundle = FluentBundle("en_US", strict=False, max_expansion_size=5)
+        bundle.add_resource("long = 0123456789\n")
+
+        assert ("long", None) not in bundle._static_patterns
+        _, errors = bundle.format_pattern("long")
+        assert errors[0].category == ErrorCategory.RESOLUTION
+
+    def test_cached_bundle_skips_static_patterns(self) -> None:
+        """Cached bundles keep every lookup in cache statistics."""
+        bundle = FluentBundle("en_US", cache=CacheConfig())
+        bundle.add_resource("hello = Hello\n")
+
+        assert bundle._static_patterns == {}
+        bundle.format_pattern("hello")
+        bundle.format_pattern("hello")
+        assert bundle.get_cache_stats()["hits"] == 1  # type: ignore[index]
+
+    def test_duplicate_message_in_one_resource(self) -> None:
+        """The last definition of a message in one resource wins."""
+        bundle = FluentBundle("en_US", use_isolating=False, strict=False)
+        bundle.add_resource("msg = Static\n    .a = A\nmsg = Dynamic { $x }\n")
+
+        assert ("msg", None) not in bundle._static_patterns
+        assert ("msg", "a") not in bundle._static_patterns
+        assert bundle.format_pattern("msg", {"x": 1}) == ("Dynamic 1", ())
+
+    def test_overwrite_replaces_static_patterns(self, bundle: FluentBundle) -> None:
+        """Re-registering a message drops stale pre-rendered text."""
+        bundle.add_resource("hello = Now { $x }\n")
+
+        assert ("hello", None) not in bundle._static_patterns
+        assert ("hello", "title") not in bundle._static_patterns
+        assert bundle.format_pattern("hello", {"x": 1}) == ("Now 1", ())
+        _, errors = bundle.format_pattern("hello", attribute="title")
+        assert errors[0].category == ErrorCategory.REFERENCE
+
+
+class TestStaticPatternFormatting:
+    """format_pattern returns pre-rendered text only for valid requests."""
+
+    def test_static_result_matches_resolver(self, bundle: FluentBundle) -> None:
+        """Pre-rendered text equals resolver output."""
+        assert bundle.format_pattern("hello") == ("Hello, World!", ())
+        assert bundle.format_pattern("hello", {}, attribute="title") == ("Greeting", ())
+        resolved = bundle._resolver.resolve_message(bundle._messages["hello"])
+        assert resolved == ("Hello, World!", ())
+
+    def test_non_dict_mapping_uses_validating_path(self, bundle: FluentBundle) -> None:
+        """Mapping subclasses other than dict still format correctly."""
+        assert bundle.format_pattern("hello", OrderedDict()) == ("Hello, World!", ())
+
+    def test_invalid_args_still_rejected(self, bundle: FluentBundle) -> None:
+        """Invalid args types are reported even for static messages."""
+        _, errors = bundle.format_pattern("hello", ["not", "a", "mapping"])  # type: ignore[arg-type]
+        assert errors[0].category == ErrorCategory.RESOLUTION
+
+    def test_invalid_attribute_still_rejected(self, bundle: FluentBundle) -> None:
+        """Non-string attributes are reported even for static messages."""
+        _, errors = bundle.format_pattern("hello", attribute=1)  # type: ignore[arg-type]
+        assert errors[0].category == ErrorCategory.RESOLUTION
+
+    def test_invalid_message_id_still_rejected(self) -> None:
+        """Non-string message IDs raise in strict mode."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource("hello = Hello\n")
+        with pytest.raises(FormattingIntegrityError):
+            bundle.format_pattern(None)  # type: ignore[arg-type]
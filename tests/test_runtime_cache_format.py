@@ -148,8 +148,8 @@ class TestCacheEnabled:
 class TestCacheInvalidation:
     """Test cache invalidation on bundle mutations."""
 
-    def test_cache_cleared_on_add_resource(self) -> None:
-        """Cache is cleared when add_resource is called."""
+    def test_unrelated_entries_survive_add_resource(self) -> None:
+        """Adding unrelated messages keeps every cached result."""
         bundle = FluentBundle("en", cache=CacheConfig(), use_isolating=False)
         bundle.add_resource("msg = Hello")
 
@@ -159,13 +159,104 @@ class TestCacheInvalidation:
         assert stats is not None
         assert stats["size"] == 1
 
-        # Add new resource - entries cleared; metrics are cumulative (not reset)
+        # Add unrelated resource - entry kept and served from cache
         bundle.add_resource("msg2 = World")
+        bundle.format_pattern("msg")
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["invalidated_entries"] == 0
+        assert stats["retained_entries"] == 1
+
+    def test_redefinition_evicts_transitive_dependents(self) -> None:
+        """Redefining a term evicts every message that reaches it, and only those."""
+        bundle = FluentBundle("en", cache=CacheConfig(), use_isolating=False, strict=False)
+        bundle.add_resource(
+            "-brand = Acme\n"
+            "-product = { -brand } Cloud\n"
+            "title = { -product }\n"
+            "    .tooltip = Try { -brand }\n"
+            "welcome = Welcome to { title }\n"
+            "aside = See { welcome.missing }\n"
+            "other = Unrelated\n"
+        )
+        for message_id in ("title", "welcome", "aside", "other"):
+            bundle.format_pattern(message_id)
+        bundle.format_pattern("title", attribute="tooltip")
+
+        bundle.add_resource("-brand = Globex\n")
+
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["invalidated_entries"] == 4
+        assert stats["retained_entries"] == 1
+        assert bundle.format_pattern("welcome")[0] == "Welcome to Globex Cloud"
+        assert bundle.format_pattern("title", attribute="tooltip")[0] == "Try Globex"
+        assert bundle.format_pattern("other")[0] == "Unrelated"
+        assert bundle.get_cache_stats()["hits"] == 1  # type: ignore[index]
+
+    def test_new_definition_evicts_cached_fallbacks(self) -> None:
+        """Defining a previously missing entry evicts its referrers' fallbacks."""
+        bundle = FluentBundle("en", cache=CacheConfig(), use_isolating=False, strict=False)
+        bundle.add_resource("msg = Hello { name }\nother = Other\n")
+        assert bundle.format_pattern("msg")[0] == "Hello {name}"
+        bundle.format_pattern("other")
+
+        bundle.add_resource("name = World\n")
+
+        assert bundle.format_pattern("msg") == ("Hello World", ())
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["invalidated_entries"] == 1
+        assert stats["retained_entries"] == 1
+
+    def test_changed_references_are_reindexed(self) -> None:
+        """A redefined message stops depending on entries it no longer references."""
+        bundle = FluentBundle("en", cache=CacheConfig(), use_isolating=False)
+        bundle.add_resource("-a = A\n-b = B\nmsg = { -a }\n")
+        bundle.add_resource("msg = { -b }\n")
+        bundle.format_pattern("msg")
+
+        bundle.add_resource("-a = Changed\n")
+        assert bundle.get_cache_stats()["size"] == 1  # type: ignore[index]
+
+        bundle.add_resource("-b = Changed\n")
+        assert bundle.get_cache_stats()["size"] == 0  # type: ignore[index]
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"lazy": True}, {"concurrency": "snapshot"}],
+        ids=["lazy", "snapshot"],
+    )
+    def test_targeted_invalidation_in_all_modes(self, options: dict[str, object]) -> None:
+        """Lazy and snapshot bundles invalidate the same way."""
+        bundle = FluentBundle(
+            "en", cache=CacheConfig(), use_isolating=False, **options  # type: ignore[arg-type]
+        )
+        bundle.add_resource("-brand = Acme\nmsg = { -brand }\nother = Other\n")
+        bundle.format_pattern("msg")
+        bundle.format_pattern("other")
+
+        bundle.add_resource("-brand = Globex\n")
+
+        assert bundle.get_cache_stats()["size"] == 1  # type: ignore[index]
+        assert bundle.format_pattern("msg")[0] == "Globex"
+
+    def test_sharded_cache_invalidates_across_shards(self) -> None:
+        """Sharded caches evict the stale entries from every shard."""
+        bundle = FluentBundle("en", cache=CacheConfig(shards=4), use_isolating=False)
+        bundle.add_resource("-brand = Acme\nmsg = { -brand } { $n }\nother = Other\n")
+        for n in range(8):
+            bundle.format_pattern("msg", {"n": n})
+        bundle.format_pattern("other")
+
+        bundle.add_resource("-brand = Globex\n")
+
         stats = bundle.get_cache_stats()
         assert stats is not None
-        assert stats["size"] == 0  # Entries cleared
-        assert stats["hits"] == 0  # No hits ever occurred
-        assert stats["misses"] == 1  # Pre-clear miss preserved (cumulative)
+        assert stats["size"] == 1
+        assert stats["invalidated_entries"] == 8
 
     def test_cache_cleared_on_add_function(self) -> None:
         """Cache is cleared when add_function is called."""
@@ -106,7 +106,7 @@ class TestMakeHashableTypes:
         assert isinstance(result, tuple)
 
     def test_make_hashable_datetime_naive(self) -> None:
-        """_make_hashable type-tags naive datetime with isoformat and '__naive__'.
+        """_make_hashable type-tags naive datetime with '__naive__' and its fold.
 
         Two datetimes representing the same UTC instant with different tzinfo
         compare equal but format differently. Including tz_key prevents collision.
@@ -114,25 +114,25 @@ class TestMakeHashableTypes:
         """
         dt = datetime(2024, 1, 1, 12, 0, 0)  # noqa: DTZ001 - naive datetime by design
         result = IntegrityCache._make_hashable(dt)
-        assert result == ("__datetime__", "2024-01-01T12:00:00", "__naive__")
+        assert result == ("__datetime__", dt, "__naive__", 0)
         assert isinstance(result, tuple)
 
     def test_make_hashable_datetime_aware(self) -> None:
-        """_make_hashable type-tags aware datetime with UTC timezone string.
+        """_make_hashable type-tags aware datetime with its tzinfo.
 
-        Aware datetime includes the tzinfo string to prevent collisions between
+        Aware datetime includes the tzinfo object to prevent collisions between
         identical times expressed in different timezones.
         """
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
         result = IntegrityCache._make_hashable(dt)
-        assert result == ("__datetime__", "2024-01-01T12:00:00+00:00", "UTC")
+        assert result == ("__datetime__", dt, UTC, 0)
         assert isinstance(result, tuple)
 
     def test_make_hashable_date(self) -> None:
-        """_make_hashable type-tags date with isoformat."""
+        """_make_hashable type-tags date."""
         d = date(2024, 1, 1)
         result = IntegrityCache._make_hashable(d)
-        assert result == ("__date__", "2024-01-01")
+        assert result == ("__date__", d)
         assert isinstance(result, tuple)
 
     def test_make_hashable_fluent_number(self) -> None:
@@ -428,6 +428,57 @@ class TestMakeKey:
         )
         assert result is None
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "text",
+            0,
+            -7,
+            True,
+            None,
+            Decimal("1.50"),
+            Decimal("NaN"),
+            datetime(2024, 1, 1, tzinfo=UTC),
+            date(2024, 1, 1),
+        ],
+    )
+    def test_scalar_fast_path_matches_make_hashable(self, value: FluentValue) -> None:
+        """Scalar arguments skip the recursive converter but build the same key."""
+        key = IntegrityCache._make_key("msg", {"v": value}, None, "en", use_isolating=True)
+        assert key is not None
+        assert key[1] == (("v", IntegrityCache._make_hashable(value)),)
+
+    def test_scalar_subclass_takes_recursive_path(self) -> None:
+        """Subclasses of scalar types are converted by make_hashable."""
+
+        class Label(str):
+            __slots__ = ()
+
+        key = IntegrityCache._make_key("msg", {"v": Label("x")}, None, "en", use_isolating=True)
+        assert key == ("msg", (("v", "x"),), None, "en", True)
+
+    def test_datetime_fold_distinguishes_keys(self) -> None:
+        """Datetimes equal under same-tzinfo comparison but differing in fold stay distinct."""
+        first = datetime(2024, 11, 3, 1, 30, tzinfo=UTC)
+        second = first.replace(fold=1)
+        assert first == second
+        assert IntegrityCache._make_hashable(first) != IntegrityCache._make_hashable(second)
+
+    def test_key_hash_binds_key(self) -> None:
+        """Key binding hashes are 8 bytes, stable per key, and differ across keys."""
+        key_a = IntegrityCache._make_key("a", {"n": 1}, None, "en", use_isolating=True)
+        key_a_again = IntegrityCache._make_key("a", {"n": 1}, None, "en", use_isolating=True)
+        key_b = IntegrityCache._make_key("b", {"n": 1}, None, "en", use_isolating=True)
+        assert key_a is not None
+        assert key_a_again is not None
+        assert key_b is not None
+
+        hash_a = IntegrityCache._compute_key_hash(key_a)
+
+        assert len(hash_a) == 8
+        assert hash_a == IntegrityCache._compute_key_hash(key_a_again)
+        assert hash_a != IntegrityCache._compute_key_hash(key_b)
+
 
 # ============================================================================
 # SECTION 5: NaN NORMALIZATION
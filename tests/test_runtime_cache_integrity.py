@@ -1067,7 +1067,7 @@ class TestDatetimeTimezoneCollisionPrevention:
         assert isinstance(key_naive, tuple)
         assert isinstance(key_aware, tuple)
         assert key_naive[2] == "__naive__"
-        assert key_aware[2] == "UTC"
+        assert key_aware[2] is UTC
 
 
 class TestDecimalNegativeZeroCollisionPrevention:
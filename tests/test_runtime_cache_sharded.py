@@ -0,0 +1,239 @@
+"""Tests for ShardedIntegrityCache and CacheConfig(shards=...)."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ftllexengine.integrity import CacheCorruptionError, WriteConflictError
+from ftllexengine.localization import FluentLocalization
+from ftllexengine.runtime import CacheConfig, FluentBundle
+from ftllexengine.runtime.cache import IntegrityCache, IntegrityCacheEntry
+from ftllexengine.runtime.cache_sharded import ShardedIntegrityCache
+
+
+def _fill(cache: ShardedIntegrityCache, count: int) -> None:
+    """Store ``count`` distinct messages."""
+    for index in range(count):
+        cache.put(
+            f"msg-{index}", None, None, "en", use_isolating=False, formatted=str(index), errors=()
+        )
+
+
+class TestShardedCacheConfiguration:
+    """Construction, validation, and bundle wiring."""
+
+    def test_capacity_split_across_shards(self) -> None:
+        """The remainder of maxsize goes to the first shards, one entry each."""
+        cache = ShardedIntegrityCache(maxsize=10, shards=4)
+        assert cache.shard_count == 4
+        assert cache.maxsize == 10
+        assert [stats["maxsize"] for stats in cache.get_shard_stats()] == [3, 3, 2, 2]
+
+    @pytest.mark.parametrize(("size", "shards"), [(1, 1), (7, 7), (10, 3), (100, 8), (1000, 16)])
+    def test_total_capacity_equals_configured_size(self, size: int, shards: int) -> None:
+        """A sharded bundle cache holds exactly the configured number of entries."""
+        bundle = FluentBundle("en_US", cache=CacheConfig(size=size, shards=shards))
+
+        stats = bundle.get_cache_stats()
+
+        assert stats is not None
+        assert stats["maxsize"] == size
+
+    def test_more_shards_than_entries_rejected(self) -> None:
+        """Every shard must hold at least one entry."""
+        with pytest.raises(ValueError, match="shards must not exceed size"):
+            CacheConfig(size=3, shards=4)
+        with pytest.raises(ValueError, match="shards must not exceed maxsize"):
+            ShardedIntegrityCache(maxsize=3, shards=4)
+
+    @pytest.mark.parametrize("shards", [0, -2])
+    def test_non_positive_shards_rejected(self, shards: int) -> None:
+        """CacheConfig rejects zero or negative shard counts."""
+        with pytest.raises(ValueError, match="shards"):
+            CacheConfig(shards=shards)
+
+    def test_bool_shards_rejected(self) -> None:
+        """CacheConfig rejects bool shard counts."""
+        with pytest.raises(TypeError, match="shards"):
+            CacheConfig(shards=True)
+
+    def test_non_positive_maxsize_rejected(self) -> None:
+        """Shard limits are validated by IntegrityCache."""
+        with pytest.raises(ValueError, match="maxsize"):
+            ShardedIntegrityCache(maxsize=0, shards=2)
+
+    def test_bundle_uses_sharded_cache_only_when_requested(self) -> None:
+        """shards=1 keeps the single IntegrityCache."""
+        single = FluentBundle("en_US", cache=CacheConfig())
+        sharded = FluentBundle("en_US", cache=CacheConfig(shards=8))
+        assert isinstance(single._cache, IntegrityCache)
+        assert isinstance(sharded._cache, ShardedIntegrityCache)
+        assert sharded._cache.shard_count == 8
+
+
+class TestShardedCacheOperations:
+    """Per-shard LRU behavior with aggregated statistics."""
+
+    def test_put_get_round_trip(self) -> None:
+        """Entries are found in the shard that stored them."""
+        cache = ShardedIntegrityCache(maxsize=100, shards=4)
+        _fill(cache, 20)
+
+        for index in range(20):
+            entry = cache.get(f"msg-{index}", None, None, "en", use_isolating=False)
+            assert entry is not None
+            assert entry.as_result() == (str(index), ())
+        assert len(cache) == cache.size == 20
+        assert sum(stats["size"] for stats in cache.get_shard_stats()) == 20
+
+    def test_stats_are_aggregated(self) -> None:
+        """get_stats sums shard counters and recomputes the hit rate."""
+        cache = ShardedIntegrityCache(maxsize=100, shards=4, write_once=True, strict=False)
+        assert cache.get_stats()["hit_rate"] == 0.0
+        _fill(cache, 8)
+        for index in range(8):
+            cache.get(f"msg-{index}", None, None, "en", use_isolating=False)
+        cache.get("absent", None, None, "en", use_isolating=False)
+        cache.put("big", None, None, "en", use_isolating=False, formatted="x" * 20_000, errors=())
+
+        stats = cache.get_stats()
+        assert stats["size"] == 8
+        assert stats["maxsize"] == 100
+        assert stats["hits"] == 8
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 88.89
+        assert stats["oversize_skips"] == 1
+        assert stats["sequence"] == 8
+        assert stats["write_once"] is True
+        assert stats["strict"] is False
+        assert (cache.hits, cache.misses, cache.strict) == (8, 1, False)
+
+    def test_unhashable_args_bypass_first_shard(self) -> None:
+        """Unhashable arguments are counted once and never cached."""
+        cache = ShardedIntegrityCache(maxsize=10, shards=3)
+        args: dict[str, object] = {"value": object()}
+
+        cache.put("msg", args, None, "en", use_isolating=False, formatted="x", errors=())  # type: ignore[arg-type]
+        assert cache.get("msg", args, None, "en", use_isolating=False) is None  # type: ignore[arg-type]
+
+        assert cache.get_stats()["unhashable_skips"] == 2
+        assert cache.get_shard_stats()[0]["unhashable_skips"] == 2
+        assert cache.size == 0
+
+    def test_clear_empties_every_shard_and_keeps_metrics(self) -> None:
+        """clear() drops entries but preserves cumulative counters."""
+        cache = ShardedIntegrityCache(maxsize=100, shards=4)
+        _fill(cache, 10)
+
+        cache.clear()
+
+        assert cache.size == 0
+        assert cache.get_stats()["sequence"] == 10
+
+    def test_lru_eviction_is_per_shard(self) -> None:
+        """A full shard evicts its own oldest entry, bounded by shard capacity."""
+        cache = ShardedIntegrityCache(maxsize=4, shards=2)
+        _fill(cache, 50)
+
+        assert all(stats["size"] <= 2 for stats in cache.get_shard_stats())
+        assert cache.size <= 4
+
+    def test_write_once_conflict_detected_per_shard(self) -> None:
+        """Write-once violations still raise in strict mode."""
+        cache = ShardedIntegrityCache(maxsize=10, shards=4, write_once=True)
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="A", errors=())
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="A", errors=())
+
+        with pytest.raises(WriteConflictError):
+            cache.put("msg", None, None, "en", use_isolating=False, formatted="B", errors=())
+        assert cache.get_stats()["idempotent_writes"] == 1
+
+    def test_corruption_detected_in_shard(self) -> None:
+        """Checksum verification runs in the owning shard."""
+        cache = ShardedIntegrityCache(maxsize=10, shards=4)
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hello", errors=())
+        shard = next(shard for shard in cache._shards if shard.size)
+        key, entry = next(iter(shard._cache.items()))
+        shard._cache[key] = IntegrityCacheEntry(
+            formatted="Tampered",
+            errors=entry.errors,
+            checksum=entry.checksum,
+            created_at=entry.created_at,
+            sequence=entry.sequence,
+            key_hash=entry.key_hash,
+        )
+
+        with pytest.raises(CacheCorruptionError):
+            cache.get("msg", None, None, "en", use_isolating=False)
+        assert cache.get_stats()["corruption_detected"] == 1
+
+    def test_audit_log_merged_and_bounded(self) -> None:
+        """Shard audit logs merge in timestamp order up to max_audit_entries."""
+        cache = ShardedIntegrityCache(
+            maxsize=100, shards=4, enable_audit=True, max_audit_entries=5
+        )
+        _fill(cache, 10)
+
+        log = cache.get_audit_log()
+        stats = cache.get_stats()
+
+        assert len(log) == 5
+        assert [entry.timestamp for entry in log] == sorted(entry.timestamp for entry in log)
+        assert stats["audit_enabled"] is True
+        assert stats["audit_entries"] == 5
+
+
+class TestShardedCacheThroughBundles:
+    """Bundles and localizations format identically with a sharded cache."""
+
+    def test_bundle_hits_and_stats(self) -> None:
+        """Repeated formatting hits the sharded cache."""
+        bundle = FluentBundle("en_US", use_isolating=False, cache=CacheConfig(shards=4))
+        bundle.add_resource("msg = Hello { $name }\n")
+
+        for _ in range(3):
+            assert bundle.format_pattern("msg", {"name": "Ann"}) == ("Hello Ann", ())
+
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert bundle.cache_usage == 1
+
+        bundle.add_resource("other = Other\n")
+        assert bundle.cache_usage == 1
+        bundle.add_resource("msg = Hi { $name }\n")
+        assert bundle.cache_usage == 0
+
+    def test_localization_aggregates_sharded_bundles(self) -> None:
+        """FluentLocalization sums sharded bundle statistics."""
+        l10n = FluentLocalization(["en"], cache=CacheConfig(size=64, shards=4))
+        l10n.add_resource("en", "msg = Hi\n")
+        l10n.format_value("msg")
+
+        stats = l10n.get_cache_stats()
+        assert stats is not None
+        assert stats["maxsize"] == 64
+        assert stats["misses"] == 1
+
+    def test_concurrent_formatting(self) -> None:
+        """Concurrent readers agree with single-threaded results."""
+        bundle = FluentBundle("en_US", use_isolating=False, cache=CacheConfig(shards=8))
+        bundle.add_resource("msg = Value { $n }\n")
+        barrier = threading.Barrier(8)
+
+        def worker(offset: int) -> list[str]:
+            barrier.wait()
+            return [bundle.format_pattern("msg", {"n": (offset + i) % 16})[0] for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(worker, range(8)))
+
+        for offset, texts in enumerate(results):
+            assert texts == [f"Value {(offset + i) % 16}" for i in range(200)]
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["size"] == 16
@@ -0,0 +1,191 @@
+"""Tests for IntegrityCache hit-verification tiers."""
+
+from __future__ import annotations
+
+import pytest
+
+from ftllexengine.integrity import CacheCorruptionError
+from ftllexengine.localization import FluentLocalization
+from ftllexengine.runtime import CacheConfig, FluentBundle
+from ftllexengine.runtime.cache import IntegrityCache, IntegrityCacheEntry
+from ftllexengine.runtime.cache_sharded import ShardedIntegrityCache
+
+
+def _tamper(cache: IntegrityCache) -> None:
+    """Replace the only cached entry with one whose checksum no longer matches."""
+    key, entry = next(iter(cache._cache.items()))
+    cache._cache[key] = IntegrityCacheEntry(
+        formatted="Tampered",
+        errors=entry.errors,
+        checksum=entry.checksum,
+        created_at=entry.created_at,
+        sequence=entry.sequence,
+        key_hash=entry.key_hash,
+    )
+
+
+def _hit(cache: IntegrityCache | ShardedIntegrityCache, count: int) -> None:
+    """Perform ``count`` lookups of the stored ``msg`` entry."""
+    for _ in range(count):
+        cache.get("msg", None, None, "en", use_isolating=False)
+
+
+class TestVerificationConfig:
+    """CacheConfig and IntegrityCache validate the tier settings."""
+
+    def test_defaults_verify_every_hit(self) -> None:
+        """The default tier keeps full verification."""
+        config = CacheConfig()
+        assert config.verification == "always"
+        assert config.verification_interval == 16
+
+    def test_unknown_tier_rejected(self) -> None:
+        """Unknown tiers raise ValueError in both config and cache."""
+        with pytest.raises(ValueError, match="verification must be one of"):
+            CacheConfig(verification="never")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="verification must be one of"):
+            IntegrityCache(verification="never")  # type: ignore[arg-type]
+
+    def test_non_positive_interval_rejected(self) -> None:
+        """Sampling intervals must be positive."""
+        with pytest.raises(ValueError, match="verification_interval"):
+            CacheConfig(verification_interval=0)
+        with pytest.raises(ValueError, match="verification_interval"):
+            IntegrityCache(verification_interval=0)
+
+
+class TestVerificationTiers:
+    """Each tier verifies the expected share of hits and counts them."""
+
+    @pytest.mark.parametrize(
+        ("verification", "verified", "skipped"),
+        [("always", 10, 0), ("sampled", 3, 7), ("on_write", 0, 10)],
+    )
+    def test_hit_counters(self, verification: str, verified: int, skipped: int) -> None:
+        """verifications + verification_skips equals the number of hits."""
+        cache = IntegrityCache(
+            verification=verification,  # type: ignore[arg-type]
+            verification_interval=3,
+        )
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hi", errors=())
+        cache.get("missing", None, None, "en", use_isolating=False)
+        _hit(cache, 10)
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 10
+        assert stats["verification"] == verification
+        assert cache.verifications == stats["verifications"] == verified
+        assert cache.verification_skips == stats["verification_skips"] == skipped
+
+    def test_sampled_tier_detects_corruption_on_sample(self) -> None:
+        """Sampled hits pass until the next verified hit raises."""
+        cache = IntegrityCache(verification="sampled", verification_interval=4)
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hi", errors=())
+        _tamper(cache)
+
+        _hit(cache, 3)
+        with pytest.raises(CacheCorruptionError):
+            _hit(cache, 1)
+        assert cache.corruption_detected == 1
+
+    def test_on_write_tier_serves_unverified_hits(self) -> None:
+        """on_write still checksums entries but trusts them on hits."""
+        cache = IntegrityCache(verification="on_write")
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hi", errors=())
+        entry = next(iter(cache._cache.values()))
+        assert entry.verify()
+        _tamper(cache)
+
+        hit = cache.get("msg", None, None, "en", use_isolating=False)
+
+        assert hit is not None
+        assert hit.formatted == "Tampered"
+        assert cache.corruption_detected == 0
+
+    def test_always_tier_non_strict_evicts(self) -> None:
+        """Full verification keeps the non-strict eviction behaviour."""
+        cache = IntegrityCache(strict=False)
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hi", errors=())
+        _tamper(cache)
+
+        assert cache.get("msg", None, None, "en", use_isolating=False) is None
+        assert cache.size == 0
+        assert cache.get_stats()["verifications"] == 1
+
+    def test_sharded_cache_aggregates_counters(self) -> None:
+        """Shards sample independently and sum their counters."""
+        cache = ShardedIntegrityCache(shards=4, verification="on_write")
+        cache.put("msg", None, None, "en", use_isolating=False, formatted="Hi", errors=())
+        _hit(cache, 5)
+
+        stats = cache.get_stats()
+        assert stats["verification"] == "on_write"
+        assert stats["verifications"] == 0
+        assert stats["verification_skips"] == 5
+
+
+class TestVerificationThroughBundles:
+    """CacheConfig tiers reach bundle and localization caches."""
+
+    def test_bundle_uses_configured_tier(self) -> None:
+        """Bundle caches report the configured tier and counters."""
+        bundle = FluentBundle(
+            "en_US",
+            use_isolating=False,
+            cache=CacheConfig(verification="sampled", verification_interval=2),
+        )
+        bundle.add_resource("msg = Hi { $n }\n")
+        for _ in range(5):
+            assert bundle.format_pattern("msg", {"n": 1}) == ("Hi 1", ())
+
+        stats = bundle.get_cache_stats()
+        assert stats is not None
+        assert stats["verifications"] == 2
+        assert stats["verification_skips"] == 2
+
+    def test_localization_aggregates_counters(self) -> None:
+        """FluentLocalization sums verification counters across bundles."""
+        l10n = FluentLocalization(["en", "de"], cache=CacheConfig(verification="on_write"))
+        assert l10n.get_cache_stats() == {
+            **dict.fromkeys(
+                (
+                    "size",
+                    "max_entry_weight",
+                    "max_errors_per_entry",
+                    "hits",
+                    "misses",
+                    "unhashable_skips",
+                    "oversize_skips",
+                    "error_bloat_skips",
+                    "combined_weight_skips",
+                    "corruption_detected",
+                    "idempotent_writes",
+                    "write_once_conflicts",
+                    "sequence",
+                    "audit_entries",
+                    "verifications",
+                    "verification_skips",
+                    "invalidated_entries",
+                    "retained_entries",
+                    "bundle_count",
+                    "maxsize",
+                ),
+                0,
+            ),
+            "hit_rate": 0.0,
+            "write_once": False,
+            "strict": False,
+            "audit_enabled": False,
+            "verification": "on_write",
+        }
+
+        l10n.add_resource("en", "msg = Hi\n")
+        l10n.add_resource("de", "msg = Hallo\n")
+        for _ in range(3):
+            l10n.format_value("msg")
+
+        stats = l10n.get_cache_stats()
+        assert stats is not None
+        assert stats["verification"] == "on_write"
+        assert stats["verifications"] == 0
+        assert stats["verification_skips"] == 2
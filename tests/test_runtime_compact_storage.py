@@ -0,0 +1,175 @@
+"""Tests for compact entry storage in FluentBundle."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from ftllexengine.integrity import SyntaxIntegrityError
+from ftllexengine.runtime import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime.compact_storage import EntryCompactor
+from ftllexengine.syntax import Message, Placeable, Term
+from ftllexengine.syntax.parser import FluentParserV1
+
+SOURCE = """
+# Brand name
+-brand = Firefox
+    .gender = masculine
+## Group comment
+# Greeting comment
+greeting = Hello, { $name }!
+shared = Hello, { $name }!
+select = { $count ->
+    [one] one item
+   *[other] { $count } items
+}
+term-ref = About { -brand } for { $name }
+func = Total: { NUMBER($amount, minimumFractionDigits: 2) }
+with-attrs = Base
+    .title = Title { $name }
+"""
+
+
+def _bundle(**options: Any) -> FluentBundle:
+    bundle = FluentBundle("en_US", strict=False, **options)
+    bundle.add_resource(SOURCE)
+    return bundle
+
+
+def _parsed_entry(entry_id: str) -> Message | Term:
+    resource = FluentParserV1().parse(SOURCE)
+    return next(
+        entry
+        for entry in resource.entries
+        if isinstance(entry, (Message, Term)) and entry.id.name == entry_id
+    )
+
+
+class TestCompactStorage:
+    """Compact bundles restore full entries on demand.
+
+    Formatting equivalence with default storage is covered by
+    test_runtime_bundle_modes.
+    """
+
+    @pytest.mark.parametrize("concurrency", ["rwlock", "snapshot"])
+    def test_get_message_restores_spans_and_comment(self, concurrency: str) -> None:
+        """get_message() and get_term() equal the parsed entries."""
+        bundle = _bundle(compact=True, concurrency=concurrency)
+
+        assert bundle.get_message("greeting") == _parsed_entry("greeting")
+        assert bundle.get_message("select") == _parsed_entry("select")
+        assert bundle.get_term("brand") == _parsed_entry("brand")
+        assert bundle.get_message("missing") is None
+
+    def test_stored_entries_are_span_free_and_share_subtrees(self) -> None:
+        """Stored entries drop spans and comments; equal placeables are one object."""
+        bundle = _bundle(compact=True)
+        greeting = bundle._messages["greeting"]
+        shared = bundle._messages["shared"]
+
+        assert greeting.span is None
+        assert greeting.comment is None
+        assert greeting.value is not shared.value
+        greeting_placeable = greeting.value.elements[1]  # type: ignore[union-attr]
+        assert isinstance(greeting_placeable, Placeable)
+        assert greeting_placeable is shared.value.elements[1]  # type: ignore[union-attr]
+
+    def test_introspection_matches_default_storage(self) -> None:
+        """Introspection sees the restored entry."""
+        default = _bundle()
+        compact = _bundle(compact=True)
+
+        assert compact.introspect_message("term-ref") == default.introspect_message("term-ref")
+        assert compact.introspect_term("brand") == default.introspect_term("brand")
+        assert compact.get_message_variables("select") == frozenset({"count"})
+
+    def test_overwrite_restores_latest_entry(self) -> None:
+        """Re-registered entries restore to the newest definition."""
+        bundle = _bundle(compact=True)
+        bundle.add_resource("greeting = Hi { $name }\ngreeting = Hey { $name }\n")
+
+        restored = bundle.get_message("greeting")
+        assert restored is not None
+        assert restored.span is not None
+        assert bundle.format_pattern("greeting", {"name": "Ada"})[0] == "Hey \u2068Ada\u2069"
+        assert len(bundle._entry_trivia) == len(bundle._messages) + len(bundle._terms)
+
+    @pytest.mark.parametrize("concurrency", ["rwlock", "snapshot"])
+    def test_reloads_keep_intern_table_bounded(self, concurrency: str) -> None:
+        """Redefining an entry releases the subtrees only the old definition used."""
+        bundle = _bundle(compact=True, concurrency=concurrency)
+        compactor = bundle._compactor
+        assert compactor is not None
+        baseline = compactor.interned_count
+
+        for version in range(200):
+            bundle.add_resource(f"hot = v{version} {{ $arg{version} }}\nhot = {{ $name }}!\n")
+            bundle.add_resource(f"hot = v{version} {{ $arg{version} }}\n")
+
+        assert compactor.interned_count == baseline + 5  # hot, "v199 ", arg199, $arg199, {}
+        assert bundle.format_pattern("greeting", {"name": "Ada"})[0] == "Hello, \u2068Ada\u2069!"
+        assert bundle.format_pattern("hot", {"arg199": 1})[0] == "v199 \u20681\u2069"
+
+    def test_strict_junk_releases_uncommitted_entries(self) -> None:
+        """A resource rejected for syntax errors leaves the intern table unchanged."""
+        bundle = FluentBundle("en_US", compact=True)
+        compactor = bundle._compactor
+        assert compactor is not None
+
+        with pytest.raises(SyntaxIntegrityError):
+            bundle.add_resource("ok = { $value }\n!!! junk\n")
+
+        assert compactor.interned_count == 0
+
+    def test_default_storage_keeps_parsed_entries(self) -> None:
+        """Without compact, stored entries are the parsed nodes and no trivia is kept."""
+        bundle = _bundle()
+
+        assert bundle.compact is False
+        assert bundle._messages["greeting"].span is not None
+        assert bundle._entry_trivia == {}
+
+    def test_async_bundle_forwards_compact(self) -> None:
+        """AsyncFluentBundle passes compact through to its bundle."""
+        bundle = AsyncFluentBundle("en_US", compact=True)
+        assert bundle.compact is True
+
+
+class TestEntryCompactor:
+    """EntryCompactor round-trips entries through compact form."""
+
+    @pytest.mark.parametrize(
+        "entry_id", ["brand", "greeting", "select", "term-ref", "func", "with-attrs"]
+    )
+    def test_restore_round_trips(self, entry_id: str) -> None:
+        """restore(compact(entry)) equals the original entry."""
+        entry = _parsed_entry(entry_id)
+        compact_entry, trivia = EntryCompactor().compact(entry)
+
+        assert compact_entry.span is None
+        assert trivia.entry is compact_entry
+        assert EntryCompactor.restore(trivia) == entry
+
+    def test_release_drops_unused_subtrees(self) -> None:
+        """Released subtrees leave the table once no compacted entry uses them."""
+        compactor = EntryCompactor()
+        greeting, _ = compactor.compact(_parsed_entry("greeting"))
+        count = compactor.interned_count
+        shared, _ = compactor.compact(_parsed_entry("shared"))
+
+        compactor.release(greeting)
+        assert compactor.interned_count == count  # "shared" replaced "greeting"
+        compactor.release(shared)
+        assert compactor.interned_count == 0
+
+    def test_interned_count_tracks_distinct_subtrees(self) -> None:
+        """Compacting the same entry twice adds no new shared subtrees."""
+        compactor = EntryCompactor()
+        compactor.compact(_parsed_entry("greeting"))
+        count = compactor.interned_count
+        compactor.compact(_parsed_entry("shared"))
+
+        assert count > 0
+        assert compactor.interned_count == count + 1  # only the "shared" identifier
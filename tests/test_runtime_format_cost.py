@@ -0,0 +1,99 @@
+"""Tests for static format-cost classification (is_cheap_to_format).
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime.format_cost import INLINE_FORMAT_BUDGET, is_cheap_to_format
+from ftllexengine.syntax import Message
+
+
+def _classify(bundle: FluentBundle, message_id: str, attribute: str | None = None) -> bool:
+    message = bundle.get_message(message_id)
+    assert isinstance(message, Message)
+    return is_cheap_to_format(
+        message,
+        attribute,
+        messages=bundle._messages,
+        terms=bundle._terms,
+        registry=bundle._function_registry,
+    )
+
+
+class TestIsCheapToFormat:
+    """Messages are cheap unless they call custom functions or expand too far."""
+
+    def test_variables_references_and_builtins_are_cheap(self) -> None:
+        """Variables, term and message references, and NUMBER() stay inline."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource(
+            "-brand = Acme\n"
+            "base = { -brand }\n"
+            "msg = { base }: { NUMBER($count) } for { $name }\n"
+            "    .title = { -brand }\n"
+            "loop = { loop }\n"
+            "missing = { nowhere }\n"
+        )
+
+        assert _classify(bundle, "msg")
+        assert _classify(bundle, "msg", "title")
+        assert _classify(bundle, "loop")
+        assert _classify(bundle, "missing")
+
+    def test_custom_function_is_expensive(self) -> None:
+        """A registered custom function, even nested in a reference, is offloaded."""
+        bundle = FluentBundle("en_US")
+        bundle.add_function("SLOW", lambda value: value)
+        bundle.add_resource("inner = { SLOW($x) }\nouter = Hi { inner }\n")
+
+        assert not _classify(bundle, "inner")
+        assert not _classify(bundle, "outer")
+
+    def test_overridden_builtin_is_expensive(self) -> None:
+        """A built-in name rebound to a custom callable no longer counts as cheap."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource("msg = { NUMBER($n) }\n")
+        assert _classify(bundle, "msg")
+
+        bundle.add_function("NUMBER", lambda value: value)
+
+        assert not _classify(bundle, "msg")
+
+    def test_large_select_exceeds_budget(self) -> None:
+        """Select expressions spend one budget unit per variant."""
+        variants = "".join(f"    [k{index}] V{index}\n" for index in range(INLINE_FORMAT_BUDGET))
+        bundle = FluentBundle("en_US")
+        bundle.add_resource(
+            f"big = {{ $key ->\n{variants}   *[other] Other\n}}\n"
+            "small = { $key ->\n    [a] A\n   *[b] B\n}\n"
+        )
+
+        assert not _classify(bundle, "big")
+        assert _classify(bundle, "small")
+
+    def test_custom_function_behind_visited_entry_attribute(self) -> None:
+        """An attribute of an entry already walked for its value is still classified."""
+        bundle = FluentBundle("en_US")
+        bundle.add_function("SLOW", lambda value: value)
+        bundle.add_resource(
+            '-t = plain\n    .a = { SLOW("x") }\n'
+            "m = { -t } { -t.a }\n"
+            "n = { -t } { -t }\n"
+        )
+
+        assert not _classify(bundle, "m")
+        assert _classify(bundle, "n")
+
+    def test_repeated_references_are_charged_each_time(self) -> None:
+        """Each reference to the same entry spends budget for its full expansion."""
+        third = INLINE_FORMAT_BUDGET // 3
+        body = " ".join(f"{{ $v{index} }}" for index in range(third))
+        bundle = FluentBundle("en_US")
+        bundle.add_resource(
+            f"-big = {body}\nonce = {{ -big }}\nthrice = {{ -big }} {{ -big }} {{ -big }}\n"
+        )
+
+        assert _classify(bundle, "once")
+        assert not _classify(bundle, "thrice")
@@ -218,6 +218,11 @@ class TestFormatCacheHitRate:
             "strict",
             "audit_enabled",
             "audit_entries",
+            "verification",
+            "verifications",
+            "verification_skips",
+            "invalidated_entries",
+            "retained_entries",
         }
         assert set(stats.keys()) == expected_keys
 
@@ -1,7 +1,7 @@
 """Tests for runtime.functions formatting precision and error handling.
 
 Covers _compute_visible_precision with max_fraction_digits capping,
-exception handling in number_format and currency_format for malformed patterns,
+custom pattern metadata reuse in number_format and currency_format,
 and is_builtin_with_locale_requirement function.
 - get_shared_registry and _create_shared_registry functions
 - FluentBundle functions parameter validation (dict rejection)
@@ -16,8 +16,8 @@ from decimal import Decimal
 from typing import Literal, cast
 from unittest.mock import MagicMock, patch
 
+import babel.numbers as babel_numbers
 import pytest
-from babel.numbers import NumberPattern
 from hypothesis import event, given
 from hypothesis import strategies as st
 
@@ -33,6 +33,7 @@ from ftllexengine.runtime.functions import (
     is_builtin_with_locale_requirement,
     number_format,
 )
+from ftllexengine.runtime.locale_context import LocaleContext
 from ftllexengine.runtime.plural_rules import select_plural_category
 
 
@@ -118,11 +119,11 @@ class TestComputeVisiblePrecisionCapping:
         assert result <= frac_digits
 
 
-class TestNumberFormatPatternExceptionHandling:
-    """Tests for number_format pattern parsing exception handling.
+class TestNumberFormatPatternMetadata:
+    """Tests for number_format custom pattern metadata extraction.
 
-    Tests lines 205-209: Exception handling when parse_pattern fails during
-    max_frac extraction (line 202), not during formatting.
+    The custom pattern is parsed once per LocaleContext and reused both for
+    formatting and for the max_frac precision cap.
     """
 
     def test_number_format_with_custom_pattern_succeeds(self) -> None:
@@ -144,73 +145,18 @@ class TestNumberFormatPatternExceptionHandling:
         # Precision should be capped at 2 (from pattern metadata)
         assert result.precision == 2
 
-    def test_number_format_with_pattern_parse_exception_falls_back(self) -> None:
-        """Verify parse_pattern exception during max_frac extraction is handled.
+    def test_number_format_parses_custom_pattern_once(self) -> None:
+        """Formatting and metadata extraction share one cached parse."""
+        LocaleContext.clear_cache()
+        original_parse = babel_numbers.parse_pattern
 
-        The call sequence for a custom pattern is:
-        1. babel.format_decimal: internal pattern parsing for formatting (parse_pattern)
-        2. functions.number_format: precision metadata extraction (parse_pattern)
-        Call 1 must succeed for formatting to complete; only call 2 fails.
-        """
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
-
-        call_count = 0
-        error_msg = "Metadata extraction failed"
-
-        def parse_pattern_side_effect(pattern: str) -> NumberPattern:
-            nonlocal call_count
-            call_count += 1
-            # Call 1 (format_decimal internal): succeed
-            if call_count <= 1:
-                return original_parse(pattern)
-            # Call 2 (functions.py metadata extraction): fail
-            raise ValueError(error_msg)
-
-        with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
-            # The format should still succeed
-            result = number_format(
-                Decimal("123.456"),
-                "en-US",
-                pattern="#,##0.00",
-                minimum_fraction_digits=2,
-            )
+        with patch("babel.numbers.parse_pattern", side_effect=original_parse) as mock_parse:
+            first = number_format(Decimal("1.5"), "en-US", pattern="#,##0.000")
+            second = number_format(Decimal("2.5"), "en-US", pattern="#,##0.000")
 
-            # Should return FluentNumber with formatted value
-            assert isinstance(result, FluentNumber)
-            assert "123" in str(result)
-            # parse_pattern was called twice (format_decimal internal + metadata extraction)
-            assert call_count == 2
-
-    def test_number_format_pattern_exception_with_various_errors(self) -> None:
-        """Verify exception handling works for ValueError and AttributeError.
-
-        The call sequence for a custom pattern is:
-        1. babel.format_decimal: internal pattern parsing for formatting
-        2. functions.number_format: precision metadata extraction (this call fails)
-        """
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
-        error_msg = "Test error"
-
-        # Test that (ValueError, AttributeError) catch works for documented error types
-        for exception_class in (ValueError, AttributeError):
-            call_count = 0
-
-            def parse_pattern_side_effect(
-                pattern: str,
-                exc_class: type[Exception] = exception_class,  # Bind via default arg
-            ) -> NumberPattern:
-                nonlocal call_count
-                call_count += 1
-                # Call 1 (format_decimal internal): succeeds
-                if call_count <= 1:
-                    return original_parse(pattern)
-                raise exc_class(error_msg)
-
-            with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
-                result = number_format(Decimal("100.5"), "en-US", pattern="#,##0.00")
-
-                assert isinstance(result, FluentNumber)
-                assert "100" in str(result)
+        assert (first.formatted, second.formatted) == ("1.500", "2.500")
+        assert first.precision == second.precision == 3
+        assert [call.args[0] for call in mock_parse.call_args_list] == ["#,##0.000"]
 
     @given(
         st.decimals(
@@ -218,37 +164,17 @@ class TestNumberFormatPatternExceptionHandling:
             min_value=Decimal(-1000000), max_value=Decimal(1000000),
         ),
     )
-    def test_number_format_pattern_exception_property(self, value: Decimal) -> None:
-        """Property: number_format succeeds even when metadata extraction fails."""
+    def test_number_format_pattern_precision_property(self, value: Decimal) -> None:
+        """Property: precision always matches the custom pattern's fraction digits."""
         event(f"value={type(value).__name__}")
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
-
-        call_count = 0
-        error_msg = "Metadata extraction failed"
-
-        def parse_pattern_side_effect(pattern: str) -> NumberPattern:
-            nonlocal call_count
-            call_count += 1
-            # Call 1 (format_decimal internal): succeeds
-            if call_count <= 1:
-                return original_parse(pattern)
-            raise ValueError(error_msg)
-
-        with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
-            result = number_format(value, "en-US", pattern="#,##0.00")
-
-            # Should always return FluentNumber
-            assert isinstance(result, FluentNumber)
-            # Should have formatted string
-            assert len(str(result)) > 0
+        result = number_format(value, "en-US", pattern="#,##0.00")
 
+        assert isinstance(result, FluentNumber)
+        assert result.precision == 2
 
-class TestCurrencyFormatPatternExceptionHandling:
-    """Tests for currency_format pattern parsing exception handling.
 
-    Tests lines 372-376: Exception handling when parse_pattern fails during
-    max_frac extraction (line 373), not during formatting.
-    """
+class TestCurrencyFormatPatternMetadata:
+    """Tests for currency_format custom pattern metadata extraction."""
 
     def test_currency_format_with_custom_pattern_succeeds(self) -> None:
         """Verify currency_format with custom pattern extracts max_frac correctly.
@@ -270,73 +196,24 @@ class TestCurrencyFormatPatternExceptionHandling:
         # Precision should be capped at 2 (from pattern metadata)
         assert result.precision == 2
 
-    def test_currency_format_with_pattern_parse_exception_falls_back(self) -> None:
-        """Verify parse_pattern exception during max_frac extraction is handled.
 
-        The call sequence for a custom pattern is:
-        1. babel.format_currency: internal pattern parsing for formatting (parse_pattern)
-        2. functions.currency_format: precision metadata extraction (parse_pattern)
-        Call 1 must succeed for formatting to complete; only call 2 fails.
-        """
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
+    def test_currency_format_parses_custom_pattern_once(self) -> None:
+        """Formatting and metadata extraction share one cached parse."""
+        LocaleContext.clear_cache()
+        original_parse = babel_numbers.parse_pattern
 
-        call_count = 0
-        error_msg = "Metadata extraction failed"
-
-        def parse_pattern_side_effect(pattern: str) -> NumberPattern:
-            nonlocal call_count
-            call_count += 1
-            # Call 1 (format_currency internal): succeed
-            if call_count <= 1:
-                return original_parse(pattern)
-            # Call 2 (functions.py metadata extraction): fail
-            raise ValueError(error_msg)
-
-        with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
+        with patch("babel.numbers.parse_pattern", side_effect=original_parse) as mock_parse:
+            currency_format(Decimal("100.50"), "en-US", currency="USD", pattern="¤ #,##0.00")
             result = currency_format(
-                Decimal("100.50"),
-                "en-US",
-                currency="USD",
-                pattern="¤ #,##0.00",
+                Decimal("50.25"), "en-US", currency="EUR", pattern="¤ #,##0.00"
             )
 
-            assert isinstance(result, FluentNumber)
-            assert "100" in str(result) or "USD" in str(result)
-            # parse_pattern was called twice (format_currency internal + metadata extraction)
-            assert call_count == 2
-
-    def test_currency_format_pattern_exception_with_various_errors(self) -> None:
-        """Verify exception handling works for documented exception types.
-
-        The call sequence for a custom pattern is:
-        1. locale_context.format_currency: ROUND_HALF_UP pre-quantization
-        2. babel.format_currency: internal pattern parsing for formatting
-        3. functions.currency_format: precision metadata extraction (this call fails)
-        """
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
-        error_msg = "Test error"
-
-        for exception_class in (ValueError, AttributeError):
-            call_count = 0
-
-            def parse_pattern_side_effect(
-                pattern: str,
-                exc_class: type[Exception] = exception_class,  # Bind via default arg
-            ) -> NumberPattern:
-                nonlocal call_count
-                call_count += 1
-                # Calls 1-2 (pre-quantization + format_currency internal): succeed
-                if call_count <= 2:
-                    return original_parse(pattern)
-                raise exc_class(error_msg)
-
-            with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
-                result = currency_format(
-                    Decimal("50.25"), "en-US", currency="EUR", pattern="¤ #,##0.00"
-                )
-
-                assert isinstance(result, FluentNumber)
-                assert "50" in str(result) or "EUR" in str(result)
+        assert "50.25" in str(result)
+        # Babel re-enters parse_pattern with the NumberPattern itself (a no-op).
+        parsed_strings = [
+            call.args[0] for call in mock_parse.call_args_list if isinstance(call.args[0], str)
+        ]
+        assert parsed_strings == ["¤ #,##0.00"]
 
     @given(
         st.decimals(
@@ -345,31 +222,15 @@ class TestCurrencyFormatPatternExceptionHandling:
         ),
         st.sampled_from(["USD", "EUR", "GBP", "JPY", "CHF", "BHD"]),
     )
-    def test_currency_format_pattern_exception_property(
+    def test_currency_format_pattern_precision_property(
         self, value: Decimal, currency: str
     ) -> None:
-        """Property: currency_format succeeds even when metadata extraction fails."""
+        """Property: custom pattern precision is capped by the pattern, not ISO 4217."""
         event(f"currency={currency}")
-        original_parse = __import__("babel.numbers", fromlist=["parse_pattern"]).parse_pattern
-
-        call_count = 0
-        error_msg = "Metadata extraction failed"
+        result = currency_format(value, "en-US", currency=currency, pattern="¤ #,##0.00")
 
-        def parse_pattern_side_effect(pattern: str) -> NumberPattern:
-            nonlocal call_count
-            call_count += 1
-            # Calls 1-2 (pre-quantization + format_currency internal): succeed
-            if call_count <= 2:
-                return original_parse(pattern)
-            raise ValueError(error_msg)
-
-        with patch("babel.numbers.parse_pattern", side_effect=parse_pattern_side_effect):
-            result = currency_format(
-                value, "en-US", currency=currency, pattern="¤ #,##0.00"
-            )
-
-            assert isinstance(result, FluentNumber)
-            assert len(str(result)) > 0
+        assert isinstance(result, FluentNumber)
+        assert result.precision == 2
 
 
 class TestIsBuiltinWithLocaleRequirement:
@@ -32,7 +32,7 @@ from babel import dates as babel_dates
 from babel import numbers as babel_numbers
 
 import ftllexengine.core.babel_compat as _bc
-from ftllexengine.constants import MAX_LOCALE_CACHE_SIZE
+from ftllexengine.constants import MAX_LOCALE_CACHE_SIZE, MAX_NUMBER_PATTERN_CACHE_SIZE
 from ftllexengine.core.babel_compat import BabelImportError
 from ftllexengine.core.locale_utils import normalize_locale
 from ftllexengine.diagnostics import ErrorCategory, FrozenFluentError
@@ -584,16 +584,17 @@ class TestFormatNumber:
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """format_number() raises FrozenFluentError on error."""
-        def mock_format_decimal(
+        def mock_apply(
             *_args: object, **_kwargs: object
         ) -> None:
             msg = "Mocked format error"
             raise ValueError(msg)
 
+        # format_number applies the cached NumberPattern directly.
         monkeypatch.setattr(
-            babel_numbers,
-            "format_decimal",
-            mock_format_decimal,
+            babel_numbers.NumberPattern,
+            "apply",
+            mock_apply,
         )
 
         ctx = LocaleContext.create("en-US")
@@ -1456,11 +1457,11 @@ class TestLocaleContextUnexpectedErrorPropagation:
         """RuntimeError in format_number propagates for debugging."""
         ctx = LocaleContext.create_or_raise("en_US")
 
-        def mock_format_decimal(*_args: object, **_kwargs: object) -> str:
+        def mock_apply(*_args: object, **_kwargs: object) -> str:
             msg = "Mocked RuntimeError for testing"
             raise RuntimeError(msg)
 
-        monkeypatch.setattr(babel_numbers, "format_decimal", mock_format_decimal)
+        monkeypatch.setattr(babel_numbers.NumberPattern, "apply", mock_apply)
 
         with pytest.raises(RuntimeError, match="Mocked RuntimeError"):
             ctx.format_number(Decimal("123.45"))
@@ -1580,3 +1581,62 @@ class TestLocaleContextCurrencyCodeFallback:
             assert isinstance(result, str)
         finally:
             object.__setattr__(ctx, "_babel_locale", original_babel_locale)
+
+
+class TestLocaleContextFormatterCaches:
+    """Parsed number patterns and decimal symbols are cached per context."""
+
+    @pytest.fixture
+    def ctx(self) -> LocaleContext:
+        """Fresh en_US context with empty formatter caches."""
+        LocaleContext.clear_cache()
+        return LocaleContext.create_or_raise("en_US")
+
+    def test_number_options_reuse_parsed_pattern(self, ctx: LocaleContext) -> None:
+        """Repeated options share one parsed pattern; new options add one."""
+        assert ctx.format_number(Decimal("1.5"), minimum_fraction_digits=2) == "1.50"
+        parsed = ctx.parse_number_pattern("#,##0.00#")
+        assert ctx.format_number(Decimal("2.5"), minimum_fraction_digits=2) == "2.50"
+        assert ctx.format_number(Decimal(3), use_grouping=False) == "3"
+
+        assert ctx.parse_number_pattern("#,##0.00#") is parsed
+        assert set(ctx._number_patterns) == {"#,##0.00#", "0.###"}
+
+    def test_currency_patterns_cached(self, ctx: LocaleContext) -> None:
+        """Custom and ISO-code currency patterns go through the same cache."""
+        ctx.format_currency(Decimal(5), currency="USD", pattern="#,##0.00 \xa4")
+        ctx.format_currency(Decimal(5), currency="USD", currency_display="code")
+
+        assert set(ctx._number_patterns) == {"#,##0.00 \xa4", "\xa4\xa4#,##0.00"}
+
+    def test_pattern_cache_is_bounded(self, ctx: LocaleContext) -> None:
+        """Patterns beyond the limit are parsed without being cached."""
+        for width in range(MAX_NUMBER_PATTERN_CACHE_SIZE + 10):
+            parsed = ctx.parse_number_pattern("#" * width + "0")
+            assert parsed.int_prec[0] == 1
+
+        assert len(ctx._number_patterns) == MAX_NUMBER_PATTERN_CACHE_SIZE
+
+    def test_decimal_symbol_cached_per_numbering_system(self) -> None:
+        """Decimal symbols are looked up once per numbering system."""
+        LocaleContext.clear_cache()
+        ctx = LocaleContext.create_or_raise("ar_EG")
+
+        assert ctx.get_decimal_symbol() == "."
+        assert ctx.get_decimal_symbol("arab") == "\u066b"
+        with patch.object(babel_numbers, "get_decimal_symbol", side_effect=AssertionError):
+            assert ctx.get_decimal_symbol("arab") == "\u066b"
+        assert set(ctx._decimal_symbols) == {"latn", "arab"}
+
+    def test_create_or_raise_skips_parse_for_cached_context(self, ctx: LocaleContext) -> None:
+        """Cached valid contexts are returned without re-validating via Babel."""
+        with patch.object(Locale, "parse", side_effect=AssertionError):
+            assert LocaleContext.create_or_raise("en-US") is ctx
+
+    def test_create_or_raise_revalidates_fallback_context(self) -> None:
+        """Cached fallback contexts still make create_or_raise raise."""
+        LocaleContext.clear_cache()
+        assert LocaleContext.create("xx_UNKNOWN").is_fallback
+
+        with pytest.raises(ValueError, match="Unknown locale identifier"):
+            LocaleContext.create_or_raise("xx_UNKNOWN")
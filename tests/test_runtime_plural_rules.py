@@ -26,7 +26,12 @@ from hypothesis import assume, event, example, given
 from hypothesis import strategies as st
 
 import ftllexengine.core.babel_compat as _bc
-from ftllexengine.runtime.plural_rules import select_plural_category
+from ftllexengine import clear_module_caches
+from ftllexengine.runtime.plural_rules import (
+    PluralSelector,
+    get_plural_selector,
+    select_plural_category,
+)
 
 # ============================================================================
 # Hypothesis Strategies
@@ -1058,3 +1063,61 @@ class TestOrdinalPluralRules:
         assert len(results) >= 2
         valid = {"zero", "one", "two", "few", "many", "other"}
         assert results <= valid
+
+
+# ============================================================================
+# Per-Locale Selector Memo
+# ============================================================================
+
+
+class TestPluralSelector:
+    """get_plural_selector() shares one memoizing selector per locale."""
+
+    def test_selector_cached_per_locale(self) -> None:
+        """The same locale code returns the same selector instance."""
+        assert get_plural_selector("pl") is get_plural_selector("pl")
+        assert get_plural_selector("pl") is not get_plural_selector("en")
+
+    def test_repeated_operands_hit_memo(self) -> None:
+        """Repeated selections are served from the memo with identical results."""
+        selector = PluralSelector("ru")
+
+        first = [selector.select(n) for n in (1, 3, 5, 21)]
+        second = [selector.select(n) for n in (1, 3, 5, 21)]
+
+        assert first == second == ["one", "few", "many", "one"]
+        info = selector._categorize.cache_info()
+        assert info.misses == 4
+        assert info.hits == 4
+
+    def test_memo_distinguishes_decimal_fraction_digits(self) -> None:
+        """Equal Decimals with different v operands are memoized separately."""
+        selector = PluralSelector("en")
+
+        assert selector.select(Decimal(1)) == "one"
+        assert selector.select(Decimal("1.0")) == "other"
+        assert selector.select(1, 2) == "other"
+        assert selector.select(1) == "one"
+
+    def test_memo_distinguishes_ordinal(self) -> None:
+        """Cardinal and ordinal selections of the same operand do not collide."""
+        selector = PluralSelector("en")
+
+        assert selector.select(2) == "other"
+        assert selector.select(2, ordinal=True) == "two"
+
+    def test_non_finite_bypasses_memo(self) -> None:
+        """NaN and Infinity return 'other' without populating the memo."""
+        selector = PluralSelector("en")
+
+        assert selector.select(Decimal("NaN")) == "other"
+        assert selector.select(Decimal("-Infinity")) == "other"
+        assert selector._categorize.cache_info().currsize == 0
+
+    def test_clear_module_caches_drops_selectors(self) -> None:
+        """The 'runtime.plural' component clears cached selectors."""
+        selector = get_plural_selector("lv")
+
+        clear_module_caches(frozenset({"runtime.plural"}))
+
+        assert get_plural_selector("lv") is not selector
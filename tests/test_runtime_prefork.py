@@ -0,0 +1,64 @@
+"""Tests for pre-fork preparation of bundles and localizations."""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Iterator
+
+import pytest
+
+from ftllexengine.localization import FluentLocalization
+from ftllexengine.runtime import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime.locale_context import LocaleContext
+from ftllexengine.runtime.plural_rules import _get_plural_selector_cached
+from ftllexengine.runtime.prefork import freeze_heap, warm_locale_data
+
+
+@pytest.fixture(autouse=True)
+def _unfreeze() -> Iterator[None]:
+    """Return frozen objects to the collector after each test."""
+    yield
+    gc.unfreeze()
+
+
+class TestPrefork:
+    """prepare_for_fork() builds lazy state and freezes the heap."""
+
+    def test_warm_locale_data_fills_caches(self) -> None:
+        """Locale context, number pattern, and plural selector are cached."""
+        LocaleContext.clear_cache()
+        _get_plural_selector_cached.cache_clear()
+
+        warm_locale_data("lv_LV")
+
+        assert "lv_lv" in LocaleContext.cache_info()["locales"]  # type: ignore[operator]
+        assert LocaleContext.create_or_raise("lv_LV")._number_patterns
+        assert _get_plural_selector_cached.cache_info().currsize == 1
+
+    def test_freeze_heap_moves_objects_to_permanent_generation(self) -> None:
+        """freeze_heap() leaves live objects frozen."""
+        gc.unfreeze()
+        freeze_heap()
+        assert gc.get_freeze_count() > 0
+
+    def test_bundle_prepare_for_fork(self) -> None:
+        """Bundles freeze by default and skip freezing on request."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource("msg = Hello\n")
+
+        bundle.prepare_for_fork(freeze=False)
+        assert gc.get_freeze_count() == 0
+        AsyncFluentBundle("en_US").prepare_for_fork()
+        assert gc.get_freeze_count() > 0
+
+    def test_localization_materializes_fallback_bundles(self) -> None:
+        """Every locale in the chain gets a bundle before the fork."""
+        l10n = FluentLocalization(["lv", "en", "de"])
+        l10n.add_resource("en", "msg = Hello\n")
+        assert tuple(l10n._bundles) == ("en",)
+
+        l10n.prepare_for_fork()
+
+        assert tuple(l10n._bundles) == ("en", "lv", "de")
+        assert gc.get_freeze_count() > 0
+        l10n.prepare_for_fork(freeze=False)
@@ -0,0 +1,198 @@
+"""Tests for compiled resolution plans in FluentResolver and FluentBundle."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ftllexengine.diagnostics import ErrorCategory, FrozenFluentError
+from ftllexengine.diagnostics.codes import FrozenErrorContext
+from ftllexengine.runtime import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime.resolution_context import ResolutionContext
+from ftllexengine.runtime.resolver import FluentResolver
+from ftllexengine.runtime.resolver_compiled import (
+    PatternPlan,
+    PlaceableStep,
+    iter_entry_patterns,
+)
+from ftllexengine.syntax import Attribute, Identifier, Message, Pattern, TextElement
+from ftllexengine.syntax.parser import FluentParserV1
+
+
+class TestCompiledEquivalence:
+    """Compiled plans must match interpreter output and errors exactly.
+
+    Formatting of a shared corpus in every bundle mode is covered by
+    test_runtime_bundle_modes.
+    """
+
+    @pytest.mark.parametrize("limit", [3, 8, 12, 40])
+    def test_expansion_budget_matches_interpreter(self, limit: int) -> None:
+        """Budget overflow truncates at the same point in both modes."""
+        source = "long = abc { $x } def { $y } ghi\nref = { long } tail\n"
+        results = []
+        for compiled in (False, True):
+            bundle = FluentBundle(
+                "en_US",
+                strict=False,
+                use_isolating=False,
+                compiled=compiled,
+                max_expansion_size=limit,
+            )
+            bundle.add_resource(source)
+            results.append(
+                (
+                    bundle.format_pattern("long", {"x": "12345", "y": "67890"}),
+                    bundle.format_pattern("ref", {"x": "12345", "y": "67890"}),
+                )
+            )
+        assert results[0] == results[1]
+
+    def test_formatting_error_fallback_value(self) -> None:
+        """FORMATTING errors with fallback_value use it in compiled mode."""
+
+        def explode(_value: object) -> str:
+            msg = "boom"
+            raise FrozenFluentError(
+                msg,
+                ErrorCategory.FORMATTING,
+                context=FrozenErrorContext(fallback_value="FALLBACK"),
+            )
+
+        bundle = FluentBundle("en_US", strict=False, use_isolating=False, compiled=True)
+        bundle.add_function("EXPLODE", explode)
+        bundle.add_resource("msg = A { EXPLODE($v) } B\n")
+
+        result, errors = bundle.format_pattern("msg", {"v": 1})
+
+        assert result == "A FALLBACK B"
+        assert errors[0].category == ErrorCategory.FORMATTING
+
+
+class TestCompiledBundleState:
+    """Plan lifecycle on FluentBundle."""
+
+    def test_compiled_property(self) -> None:
+        """compiled reflects the constructor flag."""
+        assert FluentBundle("en_US").compiled is False
+        assert FluentBundle("en_US", compiled=True).compiled is True
+
+    def test_add_resource_builds_plans(self) -> None:
+        """Every reachable pattern gets a plan after add_resource."""
+        bundle = FluentBundle("en_US", compiled=True)
+        bundle.add_resource("msg = { $n ->\n    [one] one\n   *[other] many\n}\n    .a = attr\n")
+
+        plans = bundle._plans
+        assert plans is not None
+        assert len(plans) == 4
+        for plan in plans.values():
+            assert isinstance(plan, PatternPlan)
+
+    def test_interpreted_bundle_has_no_plans(self) -> None:
+        """Default bundles keep the interpreter and no plan table."""
+        bundle = FluentBundle("en_US")
+        bundle.add_resource("msg = hi\n")
+        assert bundle._plans is None
+
+    def test_overwrite_prunes_previous_plans(self) -> None:
+        """Replacing an entry drops the plans of its old patterns."""
+        bundle = FluentBundle("en_US", strict=False, use_isolating=False, compiled=True)
+        bundle.add_resource("msg = old\n-term = old term\n")
+        old_message = bundle._messages["msg"]
+        old_term = bundle._terms["term"]
+
+        bundle.add_resource("msg = new { -term }\n-term = new term\n")
+
+        plans = bundle._plans
+        assert plans is not None
+        for entry in (old_message, old_term):
+            for pattern in iter_entry_patterns(entry):
+                assert id(pattern) not in plans or plans[id(pattern)].pattern is not pattern
+        assert bundle.format_pattern("msg") == ("new new term", ())
+
+    def test_add_function_keeps_plans(self) -> None:
+        """Resolver recreation after add_function keeps using the plan table."""
+        bundle = FluentBundle("en_US", use_isolating=False, compiled=True)
+        bundle.add_resource("msg = { UPPER($v) }\n")
+        bundle.add_function("UPPER", lambda value: str(value).upper())
+
+        assert bundle._resolver._plans is bundle._plans
+        assert bundle.format_pattern("msg", {"v": "abc"}) == ("ABC", ())
+
+    def test_for_system_locale_forwards_compiled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """for_system_locale passes compiled through to the constructor."""
+        monkeypatch.setenv("LC_ALL", "en_US.UTF-8")
+        assert FluentBundle.for_system_locale(compiled=True).compiled is True
+
+
+class TestCompiledResolverInternals:
+    """Direct checks of plan lookup and compilation edge cases."""
+
+    def test_stale_plan_for_other_pattern_is_ignored(self) -> None:
+        """A plan whose pattern is not the requested pattern is not used."""
+        pattern = Pattern(elements=(TextElement(value="real"),))
+        stale = PatternPlan(Pattern(elements=(TextElement(value="stale"),)), ("stale",))
+        message = Message(id=Identifier("msg"), value=pattern, attributes=())
+        resolver = FluentResolver(
+            "en_US",
+            {"msg": message},
+            {},
+            function_registry=FluentBundle("en_US").function_registry,
+            plans={id(pattern): stale},
+        )
+
+        assert resolver.resolve_message(message) == ("real", ())
+
+    def test_unknown_expression_delegates_to_interpreter(self) -> None:
+        """Unknown expression types fall back to generic dispatch and its error."""
+        evaluate = FluentResolver._compile_expression(object())  # type: ignore[arg-type]
+        resolver = FluentResolver(
+            "en_US", {}, {}, function_registry=FluentBundle("en_US").function_registry
+        )
+
+        with pytest.raises(FrozenFluentError):
+            evaluate(resolver, {}, [], ResolutionContext())
+
+    def test_compile_entry_covers_term_positional_args(self) -> None:
+        """Patterns nested in positional call arguments are compiled."""
+        resource = FluentParserV1().parse(
+            "msg = { -t({ $x ->\n    [a] A\n   *[b] B\n}) }\n"
+        )
+        message = resource.entries[0]
+        assert isinstance(message, Message)
+
+        plans = FluentResolver.compile_entry(message)
+
+        assert len(plans) == 3
+        steps = next(iter(plans.values())).steps
+        assert isinstance(steps[0], PlaceableStep)
+
+
+    def test_iter_entry_patterns_attribute_only(self) -> None:
+        """Messages without a value still yield their attribute patterns."""
+        attr_pattern = Pattern(elements=(TextElement(value="label"),))
+        message = Message(
+            id=Identifier("msg"),
+            value=None,
+            attributes=(Attribute(id=Identifier("label"), value=attr_pattern),),
+        )
+
+        assert list(iter_entry_patterns(message)) == [attr_pattern]
+
+
+class TestCompiledAsyncBundle:
+    """AsyncFluentBundle forwards the compiled flag."""
+
+    def test_async_compiled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """compiled is mirrored by AsyncFluentBundle and its factory."""
+        monkeypatch.setenv("LC_ALL", "en_US.UTF-8")
+
+        async def run() -> tuple[str, tuple[FrozenFluentError, ...]]:
+            bundle = AsyncFluentBundle("en_US", use_isolating=False, compiled=True)
+            assert bundle.compiled is True
+            assert AsyncFluentBundle.for_system_locale(compiled=True).compiled is True
+            await bundle.add_resource("msg = Hi { $n }\n")
+            return await bundle.format_pattern("msg", {"n": "there"})
+
+        assert asyncio.run(run()) == ("Hi there", ())
@@ -262,12 +262,12 @@ class TestFluentResolverBabelFallback:
         """Select expression falls through to default when Babel not installed."""
         resolver, message = self._make_select_message("count", "many items")
 
-        def mock_select_raises(*_args: object, **_kwargs: object) -> str:
+        def mock_selector_raises(*_args: object, **_kwargs: object) -> object:
             msg = "test_feature"
             raise BabelImportError(msg)
 
         with patch(
-            "ftllexengine.runtime.resolver.select_plural_category", mock_select_raises
+            "ftllexengine.runtime.resolver.get_plural_selector", mock_selector_raises
         ):
             result, errors = resolver.resolve_message(message, {"count": 5})
 
@@ -281,12 +281,12 @@ class TestFluentResolverBabelFallback:
         """Select expression uses default variant when Babel unavailable."""
         resolver, message = self._make_select_message("num", "default-fallback")
 
-        def mock_select_raises(*_args: object, **_kwargs: object) -> str:
+        def mock_selector_raises(*_args: object, **_kwargs: object) -> object:
             msg = "plural_rules"
             raise BabelImportError(msg)
 
         with patch(
-            "ftllexengine.runtime.resolver.select_plural_category", mock_select_raises
+            "ftllexengine.runtime.resolver.get_plural_selector", mock_selector_raises
         ):
             result, errors = resolver.resolve_message(message, {"num": 42})
 
@@ -320,12 +320,12 @@ class TestFluentResolverBabelFallback:
             value=Pattern(elements=(Placeable(expression=select_expr),)),
         )
 
-        def mock_select_raises(*_args: object, **_kwargs: object) -> str:
+        def mock_selector_raises(*_args: object, **_kwargs: object) -> object:
             msg = "babel_feature"
             raise BabelImportError(msg)
 
         with patch(
-            "ftllexengine.runtime.resolver.select_plural_category", mock_select_raises
+            "ftllexengine.runtime.resolver.get_plural_selector", mock_selector_raises
         ):
             result, errors = resolver.resolve_message(message, {})
 
@@ -0,0 +1,229 @@
+"""Tests for the persistent on-disk ResourceCache."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ftllexengine.integrity import CacheCorruptionError
+from ftllexengine.localization import FluentLocalization, LocalizationBootConfig
+from ftllexengine.runtime import AsyncFluentBundle, FluentBundle
+from ftllexengine.runtime.resource_cache import CompiledResource, ResourceCache
+from ftllexengine.syntax.parser import FluentParserV1
+
+SOURCE = """\
+### Resource comment
+
+# Greeting comment
+-brand = Firefox
+welcome = Welcome to { -brand }, { $name }!
+    .title = { welcome } title
+count = { $n ->
+    [one] One item
+   *[other] { NUMBER($n, minimumFractionDigits: 1.5) } items
+}
+"""
+
+
+def _cache_files(cache: ResourceCache) -> list[Path]:
+    """Return the cache files currently on disk."""
+    return sorted(cache.directory.glob("*.ftlc"))
+
+
+def _corrupt(path: Path) -> None:
+    """Flip the last byte of a cache file."""
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
+class TestResourceCacheRoundTrip:
+    """Misses parse and persist; hits restore an equal compiled resource."""
+
+    def test_hit_restores_equal_resource(self, tmp_path: Path) -> None:
+        """A second load reads the file instead of parsing."""
+        parser = FluentParserV1()
+        cache = ResourceCache(tmp_path / "ftl")
+
+        first = cache.load_or_parse(SOURCE, parser)
+        with patch.object(FluentParserV1, "parse", side_effect=AssertionError("parsed")):
+            second = ResourceCache(tmp_path / "ftl").load_or_parse(SOURCE, parser)
+
+        assert second == first == CompiledResource.from_resource(parser.parse(SOURCE))
+        assert first.dependencies[0] is None
+        assert first.dependencies[1] == frozenset()
+        assert first.dependencies[2] == frozenset({"msg:welcome", "term:brand"})
+        assert len(_cache_files(cache)) == 1
+        assert cache.get_stats() == {
+            "hits": 0,
+            "misses": 1,
+            "writes": 1,
+            "write_errors": 0,
+            "corruption_detected": 0,
+            "strict": True,
+        }
+
+    def test_key_covers_source_and_parser_limits(self, tmp_path: Path) -> None:
+        """Different sources or limits select different files."""
+        cache = ResourceCache(tmp_path)
+        parser = FluentParserV1()
+        key = cache.make_key(SOURCE, parser)
+
+        assert cache.make_key(SOURCE, FluentParserV1(scanner="offset")) == key
+        assert cache.make_key(SOURCE + "\n", parser) != key
+        assert cache.make_key(SOURCE, FluentParserV1(max_nesting_depth=10)) != key
+        assert cache.make_key(SOURCE, FluentParserV1(max_source_size=1000)) != key
+        assert cache.make_key(SOURCE, FluentParserV1(max_parse_errors=0)) != key
+        assert cache.make_key("bad = \ud800", parser) != key
+
+    def test_clear_removes_files(self, tmp_path: Path) -> None:
+        """clear() deletes every cache file and reports the count."""
+        cache = ResourceCache(tmp_path)
+        cache.load_or_parse("a = A", FluentParserV1())
+        cache.load_or_parse("b = B", FluentParserV1())
+
+        assert cache.clear() == 2
+        assert _cache_files(cache) == []
+
+    def test_clear_spares_writes_in_progress(self, tmp_path: Path) -> None:
+        """clear() during a write neither deletes nor counts its temporary file."""
+        cache = ResourceCache(tmp_path)
+        cache.load_or_parse("a = A", FluentParserV1())
+        replace = Path.replace
+        cleared: list[int] = []
+
+        def clear_then_replace(path: Path, target: Path) -> Path:
+            cleared.append(cache.clear())
+            return replace(path, target)
+
+        with patch.object(Path, "replace", clear_then_replace):
+            cache.load_or_parse("b = B", FluentParserV1())
+
+        assert cleared == [1]
+        assert cache.get_stats()["writes"] == 2
+        assert cache.get_stats()["write_errors"] == 0
+        assert len(_cache_files(cache)) == 1
+
+    def test_write_failure_is_counted(self, tmp_path: Path) -> None:
+        """Unwritable directories degrade to parsing on every load."""
+        cache = ResourceCache(tmp_path)
+        with patch.object(Path, "replace", side_effect=PermissionError("read-only")):
+            compiled = cache.load_or_parse(SOURCE, FluentParserV1())
+
+        assert compiled.resource.entries
+        assert cache.get_stats()["write_errors"] == 1
+        assert _cache_files(cache) == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_directory_is_counted(self, tmp_path: Path) -> None:
+        """A directory removed after construction also counts as a write error."""
+        cache = ResourceCache(tmp_path / "gone", strict=False)
+        (tmp_path / "gone").rmdir()
+
+        cache.load_or_parse(SOURCE, FluentParserV1())
+
+        assert not cache.strict
+        assert cache.get_stats()["write_errors"] == 1
+
+
+class TestResourceCacheIntegrity:
+    """Corrupted or hostile files follow the IntegrityCache corruption model."""
+
+    def test_strict_cache_raises_on_corruption(self, tmp_path: Path) -> None:
+        """A digest mismatch raises CacheCorruptionError with context."""
+        cache = ResourceCache(tmp_path)
+        cache.load_or_parse(SOURCE, FluentParserV1())
+        _corrupt(_cache_files(cache)[0])
+
+        with pytest.raises(CacheCorruptionError) as exc_info:
+            cache.load_or_parse(SOURCE, FluentParserV1())
+
+        assert exc_info.value.context is not None
+        assert exc_info.value.context.component == "resource_cache"
+        assert cache.get_stats()["corruption_detected"] == 1
+
+    def test_non_strict_cache_reparses(self, tmp_path: Path) -> None:
+        """Non-strict caches discard the file, re-parse, and rewrite it."""
+        cache = ResourceCache(tmp_path, strict=False)
+        expected = cache.load_or_parse(SOURCE, FluentParserV1())
+        _corrupt(_cache_files(cache)[0])
+
+        assert cache.load_or_parse(SOURCE, FluentParserV1()) == expected
+        assert cache.load_or_parse(SOURCE, FluentParserV1()) == expected
+        stats = cache.get_stats()
+        assert (stats["misses"], stats["hits"], stats["corruption_detected"]) == (2, 1, 1)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [pickle.dumps(print), pickle.dumps(("not", "compiled")), b"truncated"],
+    )
+    def test_foreign_payloads_rejected(self, tmp_path: Path, payload: bytes) -> None:
+        """Correctly keyed files are still rejected unless they decode to AST types."""
+        cache = ResourceCache(tmp_path, strict=False)
+        parser = FluentParserV1()
+        cache.load_or_parse(SOURCE, parser)
+        key = cache.make_key(SOURCE, parser)
+        empty = CompiledResource.from_resource(parser.parse(""))
+        with patch("ftllexengine.runtime.resource_cache.pickle.dumps", return_value=payload):
+            cache._store(key, _cache_files(cache)[0], empty)
+
+        assert cache.load_or_parse(SOURCE, parser).resource == parser.parse(SOURCE)
+        assert cache.get_stats()["corruption_detected"] == 1
+
+
+class TestResourceCacheIntegration:
+    """Bundles, localizations, and boot configs share the cache."""
+
+    def test_bundle_formats_from_cached_resource(self, tmp_path: Path) -> None:
+        """A bundle booted from the cache formats like a freshly parsed one."""
+        cache = ResourceCache(tmp_path)
+        FluentBundle("en_US", resource_cache=cache).add_resource(SOURCE)
+
+        bundle = FluentBundle("en_US", use_isolating=False, resource_cache=cache)
+        bundle.add_resource(SOURCE)
+
+        assert bundle.resource_cache is cache
+        assert bundle.format_pattern("welcome", {"name": "Anna"}) == (
+            "Welcome to Firefox, Anna!",
+            (),
+        )
+        assert bundle._msg_deps["welcome"] == frozenset({"msg:welcome", "term:brand"})
+        assert cache.get_stats()["hits"] == 1
+
+    def test_async_and_system_locale_bundles_forward_cache(self, tmp_path: Path) -> None:
+        """AsyncFluentBundle and for_system_locale accept the cache."""
+        cache = ResourceCache(tmp_path)
+        async_bundle = AsyncFluentBundle("en_US", resource_cache=cache)
+        with patch("ftllexengine.runtime.bundle_lifecycle.get_system_locale", return_value="en_US"):
+            system_bundle = FluentBundle.for_system_locale(resource_cache=cache)
+        with patch("ftllexengine.runtime.async_bundle.get_system_locale", return_value="en_US"):
+            async_system = AsyncFluentBundle.for_system_locale(resource_cache=cache)
+
+        assert async_bundle._bundle.resource_cache is cache
+        assert system_bundle.resource_cache is cache
+        assert async_system._bundle.resource_cache is cache
+
+    def test_boot_config_uses_cache(self, tmp_path: Path) -> None:
+        """LocalizationBootConfig threads the cache to every bundle."""
+        for locale in ("en", "lv"):
+            (tmp_path / locale).mkdir()
+            (tmp_path / locale / "main.ftl").write_text(f"hello = Hello {locale}\n")
+        cache = ResourceCache(tmp_path / "cache")
+        config = LocalizationBootConfig.from_path(
+            locales=("lv", "en"),
+            resource_ids=("main.ftl",),
+            base_path=tmp_path / "{locale}",
+            resource_cache=cache,
+        )
+
+        l10n, _, _ = config.boot()
+        rebooted = FluentLocalization(["lv", "en"], resource_cache=cache)
+        rebooted.add_resource("lv", "hello = Hello lv\n")
+
+        assert l10n.resource_cache is cache
+        assert l10n.format_value("hello") == rebooted.format_value("hello")
+        assert cache.get_stats()["misses"] == 2
+        assert cache.get_stats()["hits"] == 1
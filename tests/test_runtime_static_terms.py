@@ -0,0 +1,151 @@
+"""Tests for pre-resolved argument-free terms.
+
+FluentBundle renders static terms once at registration and the resolver
+answers argument-free references from that memo. Results, errors, and limit
+handling must match resolving the term patterns on every reference.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import pytest
+from hypothesis import event, given
+from hypothesis import strategies as st
+
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime.static_terms import StaticTerm
+
+SOURCE = """
+-brand = Acme
+-product = { -brand } Cloud { "v" }{ 2 }
+    .short = { -brand }
+-nested = { { -product.short } }
+-cycle = { -cycle-back }
+-cycle-back = { -cycle }
+-variable = { $x } { -brand }
+-uses-variable = { -variable }
+-missing = { -nowhere }
+-wide = { -product }{ -product }{ -product }
+msg = { -brand } / { -product } / { -product.short } / { -nested }
+args = { -brand() } { -brand(case: "x") } { -product("p") }
+cycle = { -cycle }
+dynamic = { -uses-variable } { -missing } { -product.nope }
+wide = { -wide }{ -wide }
+"""
+
+MESSAGE_IDS = ("msg", "args", "cycle", "dynamic", "wide")
+
+
+def _format_all(bundle: FluentBundle) -> list[tuple[str, tuple[str, ...]]]:
+    results = []
+    for message_id in MESSAGE_IDS:
+        result, errors = bundle.format_pattern(message_id, {"x": 1})
+        results.append((result, tuple(str(error) for error in errors)))
+    return results
+
+
+def _make_bundle(*, memo: bool, **options: object) -> FluentBundle:
+    bundle = FluentBundle("en", strict=False, **options)  # type: ignore[arg-type]
+    bundle.add_resource(SOURCE)
+    if not memo:
+        bundle._resolver._static_terms = None
+    return bundle
+
+
+class TestStaticTermMemo:
+    """Which terms are pre-resolved, and what is recorded for them."""
+
+    def test_static_terms_are_rendered(self) -> None:
+        """Literal-only terms and references to them are memoized."""
+        bundle = _make_bundle(memo=True, use_isolating=False)
+
+        assert bundle._static_terms[("brand", None)] == StaticTerm("Acme", 4, 1, 0)
+        assert bundle._static_terms[("product", None)] == StaticTerm("Acme Cloud v2", 17, 2, 1)
+        assert bundle._static_terms[("product", "short")].text == "Acme"
+        assert bundle._static_terms[("nested", None)].expression_depth == 3
+
+    def test_dynamic_terms_are_not_rendered(self) -> None:
+        """Variables, cycles, and missing references keep terms dynamic."""
+        bundle = _make_bundle(memo=True)
+
+        for term_id in ("cycle", "cycle-back", "variable", "uses-variable", "missing"):
+            assert (term_id, None) not in bundle._static_terms
+
+    def test_isolation_marks_are_part_of_the_text(self) -> None:
+        """Nested placeables are isolated exactly as the resolver would."""
+        bundle = _make_bundle(memo=True)
+
+        text = bundle._static_terms[("product", None)].text
+        assert text == "\u2068Acme\u2069 Cloud \u2068v\u2069\u20682\u2069"
+
+    def test_redefinition_rerenders_dependent_terms(self) -> None:
+        """Redefining a term re-renders every term that references it."""
+        bundle = _make_bundle(memo=True, use_isolating=False)
+
+        bundle.add_resource("-brand = Globex\n")
+
+        assert bundle._static_terms[("nested", None)].text == "Globex"
+        assert bundle.format_pattern("msg")[0] == "Globex / Globex Cloud v2 / Globex / Globex"
+
+    def test_definition_can_make_a_term_static(self) -> None:
+        """Defining a missing reference turns its referrers static."""
+        bundle = _make_bundle(memo=True, use_isolating=False)
+
+        bundle.add_resource("-nowhere = Here\n")
+
+        assert bundle._static_terms[("missing", None)].text == "Here"
+
+    def test_dropped_attribute_is_forgotten(self) -> None:
+        """A redefinition without an attribute removes its memo entry."""
+        bundle = _make_bundle(memo=True, use_isolating=False)
+
+        bundle.add_resource("-product = Product\n")
+
+        assert ("product", "short") not in bundle._static_terms
+        result = bundle.format_pattern("msg")[0]
+        assert result == "Acme / Product / {-product.short} / {-product.short}"
+
+    @pytest.mark.parametrize("options", [{"concurrency": "snapshot"}, {"lazy": True}])
+    def test_other_registration_modes(self, options: dict[str, object]) -> None:
+        """Snapshot and lazy bundles keep the memo current as well."""
+        bundle = _make_bundle(memo=True, use_isolating=False, **options)
+        assert bundle.format_pattern("msg")[0] == "Acme / Acme Cloud v2 / Acme / Acme"
+
+        bundle.add_resource("-brand = Globex\n")
+
+        assert bundle.format_pattern("msg")[0] == "Globex / Globex Cloud v2 / Globex / Globex"
+        assert bundle._static_terms[("brand", None)].text == "Globex"
+
+
+class TestStaticTermEquivalence:
+    """Memo hits are indistinguishable from resolving the term."""
+
+    @pytest.mark.parametrize("use_isolating", [True, False])
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_unlimited_results_match(self, use_isolating: bool, compiled: bool) -> None:
+        """Without limits in play, outputs and errors are identical."""
+        options = {"use_isolating": use_isolating, "compiled": compiled}
+
+        assert _format_all(_make_bundle(memo=True, **options)) == _format_all(
+            _make_bundle(memo=False, **options)
+        )
+
+    @given(
+        max_nesting_depth=st.integers(min_value=4, max_value=8),
+        max_expansion_size=st.integers(min_value=1, max_value=200),
+        use_isolating=st.booleans(),
+    )
+    def test_limits_match(
+        self, max_nesting_depth: int, max_expansion_size: int, use_isolating: bool
+    ) -> None:
+        """Depth and expansion-budget errors are reported the same way."""
+        options = {
+            "max_nesting_depth": max_nesting_depth,
+            "max_expansion_size": max_expansion_size,
+            "use_isolating": use_isolating,
+        }
+        memoized = _format_all(_make_bundle(memo=True, **options))
+        event(f"budget_errors={sum('budget' in str(errors) for _, errors in memoized)}")
+
+        assert memoized == _format_all(_make_bundle(memo=False, **options))
@@ -0,0 +1,158 @@
+"""Tests for indexed select-expression variant lookup.
+
+The resolver selects variants through a VariantIndex built once per
+SelectExpression. Lookups must return exactly the variant a front-to-back
+scan in Fluent's matching order would, and the index must live exactly as
+long as its AST node.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+import gc
+from decimal import Decimal
+
+from hypothesis import event, given
+from hypothesis import strategies as st
+
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime import variant_index as variant_index_module
+from ftllexengine.runtime.variant_index import variant_index
+from ftllexengine.syntax import (
+    Identifier,
+    NumberLiteral,
+    Pattern,
+    SelectExpression,
+    TextElement,
+    VariableReference,
+    Variant,
+)
+
+
+def _variant(key: Identifier | NumberLiteral, text: str, *, default: bool = False) -> Variant:
+    return Variant(key=key, value=Pattern(elements=(TextElement(value=text),)), default=default)
+
+
+def _number(raw: str) -> NumberLiteral:
+    return NumberLiteral(value=Decimal(raw), raw=raw)
+
+
+def _select(*variants: Variant) -> SelectExpression:
+    return SelectExpression(selector=VariableReference(id=Identifier(name="x")), variants=variants)
+
+
+def _scan(
+    variants: tuple[Variant, ...], selector_str: str, selector_number: Decimal | None
+) -> Variant | None:
+    """Reference front-to-back exact match."""
+    for variant in variants:
+        match variant.key:
+            case Identifier(name=name) if name == selector_str:
+                return variant
+            case NumberLiteral(raw=raw) if selector_number is not None and (
+                Decimal(raw) == selector_number
+            ):
+                return variant
+    return None
+
+
+class TestVariantIndexLookup:
+    """Index lookups agree with scanning the variants."""
+
+    def test_first_duplicate_key_wins(self) -> None:
+        """Repeated identifier and numeric keys resolve to their first variant."""
+        expr = _select(
+            _variant(Identifier(name="a"), "first a"),
+            _variant(_number("1"), "first 1"),
+            _variant(Identifier(name="a"), "second a"),
+            _variant(_number("1.0"), "second 1"),
+            _variant(Identifier(name="other"), "other", default=True),
+        )
+        index = variant_index(expr)
+
+        assert index.exact("a", None) is expr.variants[0]
+        assert index.exact("1", Decimal("1.00")) is expr.variants[1]
+        assert index.named("a") is expr.variants[0]
+        assert index.default is expr.variants[4]
+
+    def test_earlier_position_wins_across_key_kinds(self) -> None:
+        """When both a name and a number match, the earlier variant is chosen."""
+        expr = _select(
+            _variant(_number("5"), "number"),
+            _variant(Identifier(name="five"), "name", default=True),
+        )
+
+        assert variant_index(expr).exact("five", Decimal(5)) is expr.variants[0]
+
+    def test_non_finite_selectors_never_match_numbers(self) -> None:
+        """NaN, infinities, and signaling NaN fall through to the next pass."""
+        expr = _select(_variant(_number("0"), "zero", default=True))
+        index = variant_index(expr)
+
+        for special in ("NaN", "sNaN", "Infinity", "-Infinity"):
+            assert index.exact(special, Decimal(special)) is None
+
+    @given(
+        keys=st.lists(
+            st.one_of(
+                st.sampled_from(["one", "few", "other", "k1"]).map(lambda n: Identifier(name=n)),
+                st.sampled_from(["0", "1", "1.0", "-0", "2.50", "10"]).map(_number),
+            ),
+            min_size=1,
+            max_size=12,
+        ),
+        selector=st.sampled_from(["one", "other", "k1", "0", "1", "2.5", "3"]),
+        numeric=st.booleans(),
+    )
+    def test_matches_linear_scan(
+        self, keys: list[Identifier | NumberLiteral], selector: str, numeric: bool
+    ) -> None:
+        """Exact lookup returns the same variant object as a linear scan."""
+        variants = tuple(
+            _variant(key, str(position), default=position == 0)
+            for position, key in enumerate(keys)
+        )
+        selector_number = Decimal(selector) if numeric and selector[0].isdigit() else None
+
+        found = variant_index(_select(*variants)).exact(selector, selector_number)
+        event(f"matched={found is not None}")
+
+        assert found is _scan(variants, selector, selector_number)
+
+
+class TestVariantIndexCache:
+    """Indexes are cached per node identity and released with the node."""
+
+    def test_index_is_built_once_per_node(self) -> None:
+        """The same node reuses its index; an equal node gets its own."""
+        variants = (_variant(Identifier(name="other"), "x", default=True),)
+        expr = _select(*variants)
+        equal = _select(*variants)
+
+        assert expr == equal
+        assert variant_index(expr) is variant_index(expr)
+        assert variant_index(equal) is not variant_index(expr)
+
+    def test_index_is_evicted_with_its_node(self) -> None:
+        """Collecting the AST removes the cache entry."""
+        expr = _select(_variant(Identifier(name="other"), "x", default=True))
+        variant_index(expr)
+        key = id(expr)
+        assert key in variant_index_module._indexes
+
+        del expr
+        gc.collect()
+
+        assert key not in variant_index_module._indexes
+
+    def test_large_selects_format_every_variant(self) -> None:
+        """Every key of a 200-variant selector is reachable through the index."""
+        body = "".join(f"    [{index}] N{index}\n" for index in range(199))
+        bundle = FluentBundle("en", use_isolating=False)
+        bundle.add_resource(f"msg = {{ $n ->\n{body}   *[other] Other\n}}\n")
+
+        for index in (0, 1, 99, 198):
+            assert bundle.format_pattern("msg", {"n": index}) == (f"N{index}", ())
+        assert bundle.format_pattern("msg", {"n": 500}) == ("Other", ())
+        assert bundle.format_pattern("msg", {"n": Decimal("99.0")}) == ("N99", ())
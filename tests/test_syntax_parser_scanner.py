@@ -0,0 +1,156 @@
+"""Offset scanner parser mode: configuration, AST equivalence, and fallback.
+
+Tests for ``ftllexengine.syntax.parser.scanner`` and the ``scanner="offset"``
+mode of ``FluentParserV1``. Equivalence with the cursor parser is checked on
+focused grammar cases and on every seed of the Atheris fuzz corpus.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ftllexengine.constants import MAX_IDENTIFIER_LENGTH
+from ftllexengine.diagnostics import DiagnosticCode
+from ftllexengine.syntax.ast import (
+    Identifier,
+    Junk,
+    MessageReference,
+    Placeable,
+    Span,
+    Term,
+    VariableReference,
+)
+from ftllexengine.syntax.cursor import Cursor
+from ftllexengine.syntax.parser import FluentParserV1, ParseContext
+from ftllexengine.syntax.parser.rules import parse_message
+from ftllexengine.syntax.parser.scanner import scan_entry, scan_message, scan_term
+
+SEED_ROOT = Path(__file__).resolve().parent.parent / "fuzz_atheris" / "seeds"
+
+CURSOR = FluentParserV1()
+OFFSET = FluentParserV1(scanner="offset")
+
+
+def _assert_same_resource(source: str) -> None:
+    """Both scanner modes produce the same Resource (spans included)."""
+    assert OFFSET.parse(source) == CURSOR.parse(source)
+
+
+class TestScannerMode:
+    """Scanner mode selection on FluentParserV1."""
+
+    def test_default_is_cursor(self) -> None:
+        """The cursor grammar remains the default."""
+        assert FluentParserV1().scanner == "cursor"
+        assert OFFSET.scanner == "offset"
+
+    def test_unknown_mode_rejected(self) -> None:
+        """Unknown scanner modes raise ValueError."""
+        with pytest.raises(ValueError, match="scanner must be 'cursor' or 'offset'"):
+            FluentParserV1(scanner="regex")  # type: ignore[arg-type]
+
+
+class TestScannerEquivalence:
+    """Offset scanner output matches the cursor parser entry for entry."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "hello = Hello, World!",
+            "greeting = Hello, { $name }!\n",
+            "ref = { other }\nother = x\n",
+            "spaced = {\n  $name\n  }\n",
+            'term-ref = { -brand } and { -brand.short } and { -brand(case: "acc") }\n',
+            "attr-ref = { msg.title }\nfunc = { NUMBER($n, minimumFractionDigits: 2) }\n",
+            "-brand = Firefox\n    .short = Fx\n",
+            "msg =\n    Line one\n      indented\n\n    Line three\n",
+            "msg = First\n  second { $x }\n   third\n",
+            "msg =\n    a\n      { $x }\n",
+            "msg =\n    a\n      ",
+            "msg = { $n ->\n    [one] one\n   *[other] many\n}\n",
+            "empty =\n    .title = Only attribute\n",
+            "# Attached\nmsg = Value\n\n## Group\n\n# Standalone\n\nmsg2 = v\n",
+            "# Attached to term\n-brand = Fx\n",
+            "msg = Value\n    .a = A\n\n    .b = B\n    .c = { $c }\n",
+            "msg = Value\n    .bad\nnext = ok\n",
+            "msg = Value\n    .a = { $x\nnext = ok\n",
+            "bare =\n-empty =\n-novalue\n  indented = junk\n}\n",
+            "msg = tail spaces   \nmsg2 = x\r\nmsg3 = y\r\n",
+            "msg = { { { $deep } } }\nmsg2 = { $x ->\n *[a] { -t }\n}\n",
+            "msg = {$long\n",
+            "-term = { $x\nmsg = ok\n",
+            f"{'a' * MAX_IDENTIFIER_LENGTH} = ok\n",
+            f"{'a' * (MAX_IDENTIFIER_LENGTH + 1)} = too long\n",
+            f"msg = {{ ${'v' * (MAX_IDENTIFIER_LENGTH + 1)} }}\n",
+            f"msg = ok\n    .{'a' * (MAX_IDENTIFIER_LENGTH + 1)} = too long\n",
+        ],
+    )
+    def test_grammar_cases(self, source: str) -> None:
+        """Focused grammar cases produce identical resources."""
+        _assert_same_resource(source)
+
+    def test_nesting_depth_junk_matches(self) -> None:
+        """Depth-limit failures fall back to the cursor rules and keep the diagnostic."""
+        source = "msg = { { { $x } } }\n"
+        cursor_resource = FluentParserV1(max_nesting_depth=2).parse(source)
+        offset_resource = FluentParserV1(max_nesting_depth=2, scanner="offset").parse(source)
+
+        assert offset_resource == cursor_resource
+        junk = offset_resource.entries[0]
+        assert isinstance(junk, Junk)
+        assert junk.annotations[0].code == DiagnosticCode.PARSE_NESTING_DEPTH_EXCEEDED.name
+
+    @pytest.mark.parametrize(
+        "seed_dir",
+        sorted(path.name for path in SEED_ROOT.iterdir() if path.is_dir()),
+    )
+    def test_fuzz_corpus(self, seed_dir: str) -> None:
+        """Every Atheris seed, decoded as source text, parses identically."""
+        for seed in sorted((SEED_ROOT / seed_dir).iterdir()):
+            source = seed.read_bytes().decode("utf-8", errors="replace")
+            assert OFFSET.parse(source) == CURSOR.parse(source), seed.name
+
+
+class TestScanFunctions:
+    """Direct calls into the offset scanner entry points."""
+
+    def test_scan_message_matches_parse_message(self) -> None:
+        """scan_message returns the same node and end offset as parse_message."""
+        source = "msg = A { $x } B { ref }\n    .title = T\nnext = n"
+        result = scan_message(source, 0, ParseContext())
+        expected = parse_message(Cursor(source, 0), ParseContext())
+
+        assert result is not None
+        assert expected is not None
+        assert result == (expected.value, expected.cursor.pos)
+        elements = result[0].value.elements  # type: ignore[union-attr]
+        assert isinstance(elements[1], Placeable)
+        assert elements[1].expression == VariableReference(
+            id=Identifier("x", span=Span(start=11, end=12)), span=Span(start=10, end=12)
+        )
+        assert isinstance(elements[3], Placeable)
+        assert isinstance(elements[3].expression, MessageReference)
+        assert elements[3].expression.span == Span(start=19, end=22)
+
+    def test_scan_entry_dispatches_terms(self) -> None:
+        """A leading hyphen selects the term rule."""
+        result = scan_entry("-brand = Fx", 0, ParseContext())
+
+        assert result is not None
+        assert isinstance(result[0], Term)
+        assert result[0].id.span == Span(start=1, end=6)
+
+    def test_scan_term_rejects_empty_value(self) -> None:
+        """Terms without a value fail like parse_term."""
+        assert scan_term("-brand =\n", 0, ParseContext()) is None
+        assert scan_term("-brand Fx\n", 0, ParseContext()) is None
+        assert scan_term("-1 = Fx\n", 0, ParseContext()) is None
+
+    def test_exhausted_depth_marks_context(self) -> None:
+        """Simple placeables still honour an exhausted nesting budget."""
+        context = ParseContext(max_nesting_depth=0)
+
+        assert scan_message("msg = { $x }", 0, context) is None
+        assert context.was_depth_exceeded()
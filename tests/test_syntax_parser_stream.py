@@ -0,0 +1,190 @@
+"""Tests for streaming source ingestion.
+
+parse_stream() with absolute_spans=True must yield exactly the entries that
+parse() returns for the same source, whether the stream is a sequence of
+text lines or of arbitrary UTF-8 byte chunks. FluentBundle.add_resource_stream()
+registers those entries, optionally in bounded batches.
+
+Python 3.13+.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from hypothesis import event, given
+from hypothesis import strategies as st
+
+from ftllexengine.integrity import SyntaxIntegrityError
+from ftllexengine.runtime import FluentBundle
+from ftllexengine.runtime.rwlock import RWLock
+from ftllexengine.syntax import Message, parse, parse_stream
+from ftllexengine.syntax.ast import Span
+from ftllexengine.syntax.parser.stream import iter_source_lines, rebase_spans
+
+SOURCE = (
+    "### Resource comment\n"
+    "\n"
+    "# Attached comment\n"
+    "hello = Hello, { $name }!\n"
+    "    .title = Greeting\n"
+    "\n"
+    "\n"
+    "-brand = Fluent\n"
+    "\n"
+    "multiline =\n"
+    "    first line\n"
+    "\n"
+    "    after a blank line\n"
+    "\n"
+    "bad = {\n"
+    "\n"
+    "select = { $count ->\n"
+    "    [one] One item\n"
+    "\n"
+    "   *[other] Many items — Grüße\n"
+    "}\n"
+    "crlf = Windows\r\n"
+)
+
+
+def _chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+class TestIterSourceLines:
+    """iter_source_lines() decodes and splits without buffering the source."""
+
+    def test_text_items_keep_terminators(self) -> None:
+        """Each str item is a line; embedded newlines split it further."""
+        assert list(iter_source_lines(["a\n", "b", "c\nd\n", ""])) == [
+            "a\n",
+            "b",
+            "c\n",
+            "d\n",
+            "",
+        ]
+
+    def test_byte_chunks_split_inside_characters(self) -> None:
+        """Multi-byte characters split across chunks are decoded intact."""
+        data = "ä = ö\nü".encode()
+
+        assert list(iter_source_lines(_chunked(data, 1))) == ["ä = ö\n", "ü"]
+
+    def test_invalid_utf8_raises(self) -> None:
+        """Undecodable bytes raise UnicodeDecodeError."""
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_source_lines([b"a = \xff\n"]))
+
+
+class TestAbsoluteSpans:
+    """Streamed entries with absolute spans equal parse() entries."""
+
+    @pytest.mark.parametrize("source", [SOURCE, SOURCE.rstrip("\n"), "\n\n" + SOURCE, ""])
+    def test_lines_match_parse(self, source: str) -> None:
+        """Line input yields the same entries, spans, and Junk content."""
+        streamed = list(parse_stream(source.splitlines(keepends=True), absolute_spans=True))
+
+        assert tuple(streamed) == parse(source).entries
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 4096])
+    def test_byte_chunks_match_parse(self, size: int) -> None:
+        """Byte input in any chunk size yields the same entries."""
+        streamed = list(parse_stream(_chunked(SOURCE.encode(), size), absolute_spans=True))
+
+        assert tuple(streamed) == parse(SOURCE).entries
+
+    def test_relative_spans_by_default(self) -> None:
+        """Without absolute_spans, each chunk's spans start at zero."""
+        entries = list(parse_stream(["a = 1\n", "\n", "b = 2\n"]))
+
+        assert [entry.span for entry in entries] == [Span(start=0, end=7), Span(start=0, end=6)]
+
+    def test_rebase_spans_shifts_nested_nodes(self) -> None:
+        """rebase_spans() moves every span in the subtree."""
+        message = parse("key = value\n    .attr = x\n").entries[0]
+        assert isinstance(message, Message)
+
+        moved = rebase_spans(message, 100)
+
+        assert moved.span == Span(start=100, end=message.span.end + 100)  # type: ignore[union-attr]
+        assert moved.id.span == Span(start=100, end=103)
+        assert moved.attributes[0].span.start == message.attributes[0].span.start + 100  # type: ignore[union-attr]
+
+    @given(
+        blocks=st.lists(
+            st.sampled_from(
+                [
+                    "msg = Value\n",
+                    "-term = Term\n",
+                    "# comment\n",
+                    "\n",
+                    "    indented continuation\n",
+                    "junk }\n",
+                    "sel = { $n ->\n *[other] x\n\n}\n",
+                ]
+            ),
+            max_size=12,
+        )
+    )
+    def test_random_documents_match_parse(self, blocks: list[str]) -> None:
+        """Arbitrary entry and blank-line sequences stream like parse()."""
+        source = "".join(blocks)
+        event(f"blocks={len(blocks)}")
+
+        streamed = list(parse_stream(_chunked(source.encode(), 5), absolute_spans=True))
+
+        assert tuple(streamed) == parse(source).entries
+
+
+class TestBatchedRegistration:
+    """FluentBundle.add_resource_stream(batch_size=...) registers in batches."""
+
+    def test_batches_register_all_entries(self) -> None:
+        """Every entry is registered and all Junk is returned."""
+        bundle = FluentBundle("en_US", strict=False, use_isolating=False)
+
+        junk = bundle.add_resource_stream(_chunked(SOURCE.encode(), 3), batch_size=2)
+
+        assert [entry.content for entry in junk] == ["bad = {\n\n"]
+        assert bundle.format_pattern("hello", {"name": "Ann"}) == ("Hello, Ann!", ())
+        assert bundle.format_pattern("select", {"count": 5})[0] == "Many items — Grüße"
+
+    def test_each_batch_takes_the_write_lock(self) -> None:
+        """One write-lock section per batch."""
+        bundle = FluentBundle("en_US")
+        lines = [f"msg{index} = {index}\n\n" for index in range(5)]
+
+        with patch.object(RWLock, "write", autospec=True, side_effect=RWLock.write) as write:
+            bundle.add_resource_stream(lines, batch_size=2)
+
+        assert write.call_count == 3
+        assert bundle.get_message_ids() == [f"msg{index}" for index in range(5)]
+
+    def test_strict_mode_keeps_earlier_batches(self) -> None:
+        """Junk raises at its batch; batches before it stay registered."""
+        bundle = FluentBundle("en_US", strict=True)
+
+        with pytest.raises(SyntaxIntegrityError):
+            bundle.add_resource_stream(["a = 1\n", "\n", "b = {\n", "\n", "c = 3\n"], batch_size=1)
+
+        assert bundle.has_message("a")
+        assert not bundle.has_message("c")
+
+    def test_invalid_batch_size_rejected(self) -> None:
+        """batch_size must be positive and is checked before reading."""
+        bundle = FluentBundle("en_US")
+
+        with pytest.raises(ValueError, match="batch_size"):
+            bundle.add_resource_stream(iter(["a = 1\n"]), batch_size=0)
+
+    def test_absolute_spans_forwarded(self) -> None:
+        """Stored entries carry stream offsets when requested."""
+        bundle = FluentBundle("en_US")
+
+        bundle.add_resource_stream(["a = 1\n", "\n", "b = 2\n"], absolute_spans=True, batch_size=1)
+
+        message = bundle.get_message("b")
+        assert message is not None
+        assert message.span == Span(start=7, end=13)